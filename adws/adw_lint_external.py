@@ -106,7 +106,9 @@ def run_external_lint_check(
         "--json-input", json.dumps({
             "target": target,
             "fix_mode": fix_mode,
-            "changed_files_only": changed_files_only
+            "changed_files_only": changed_files_only,
+            "adw_id": adw_id,  # Pass adw_id for tool tracking
+            "issue_number": state.get("issue_number", 0)  # Pass issue_number for tool tracking
         })
     ]
 
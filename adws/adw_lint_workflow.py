@@ -25,7 +25,9 @@ Input Schema:
     {
         "target": "frontend" | "backend" | "both",
         "fix_mode": bool (default: False),
-        "changed_files_only": bool (default: False)
+        "changed_files_only": bool (default: False),
+        "adw_id": Optional[str] (for tool tracking),
+        "issue_number": Optional[int] (for tool tracking)
     }
 
 Output Schema:
@@ -62,6 +64,7 @@ from typing import Dict, Any
 sys.path.insert(0, str(Path(__file__).parent))
 
 from adw_modules.lint_checker import LintChecker, result_to_dict
+from adw_modules.tool_call_tracker import ToolCallTracker
 
 
 def parse_args():
@@ -112,19 +115,29 @@ def run_workflow(params: Dict[str, Any]) -> Dict[str, Any]:
     target = params.get("target", "both")
     fix_mode = params.get("fix_mode", False)
     changed_files_only = params.get("changed_files_only", False)
+    adw_id = params.get("adw_id", "unknown")
+    issue_number = params.get("issue_number", 0)
 
     # Get project root (2 levels up from this file)
     project_root = Path(__file__).parent.parent
 
-    # Initialize lint checker
-    checker = LintChecker(project_root)
-
-    # Execute checks
-    results = checker.check_all(
-        target=target,
-        fix_mode=fix_mode,
-        changed_files_only=changed_files_only
-    )
+    # Use ToolCallTracker so lint runs and result cache hits land in task_logs
+    with ToolCallTracker(
+        adw_id=adw_id,
+        issue_number=int(issue_number) if issue_number else 0,
+        phase_name="Lint",
+        phase_number=4,
+        workflow_template="adw_lint_workflow"
+    ) as tracker:
+        # Initialize lint checker with tracker
+        checker = LintChecker(project_root, tracker=tracker)
+
+        # Execute checks
+        results = checker.check_all(
+            target=target,
+            fix_mode=fix_mode,
+            changed_files_only=changed_files_only
+        )
 
     # Combine results
     all_errors = []
@@ -15,12 +15,15 @@ Key Features:
 import json
 import re
 import subprocess
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from adw_modules.phase_result_cache import PhaseResultCache
 from adw_modules.tool_call_tracker import ToolCallTracker
 
+MYPY_MISSING_STEP = "mypy not installed, skipping Python type checks"
+
 
 @dataclass
 class BuildError:
@@ -51,6 +54,8 @@ class BuildResult:
     summary: BuildSummary
     errors: List[BuildError]
     next_steps: List[str]
+    # The tool ran and reported on the code (not serialized; see _is_cacheable)
+    tool_reported: bool = field(default=False, compare=False)
 
 
 class BuildChecker:
@@ -70,6 +75,7 @@ class BuildChecker:
         """
         self.project_root = Path(project_root)
         self.tracker = tracker
+        self.cache = PhaseResultCache(self.project_root, tracker=tracker)
 
     def check_frontend_types(self, strict_mode: bool = True) -> BuildResult:
         """
@@ -81,6 +87,13 @@ class BuildChecker:
         Returns:
             BuildResult with type errors only
         """
+        return self.cache.cached(
+            "tsc", {"strict_mode": strict_mode}, lambda: self._run_tsc(strict_mode),
+            result_to_dict, result_from_dict, cacheable=_is_cacheable
+        )
+
+    def _run_tsc(self, strict_mode: bool) -> BuildResult:
+        """Run TypeScript (uncached)."""
         frontend_path = self.project_root / "app" / "client"
 
         # Run tsc with --noEmit (type check only, no build)
@@ -134,7 +147,8 @@ class BuildChecker:
                 success=success,
                 summary=summary,
                 errors=errors,
-                next_steps=next_steps
+                next_steps=next_steps,
+                tool_reported=_tool_reported(result.returncode, errors)
             )
 
         except subprocess.TimeoutExpired:
@@ -197,6 +211,7 @@ class BuildChecker:
         Returns:
             BuildResult with build errors only
         """
+        # Not cached: a hit would leave the worktree without the dist/ output the build writes
         frontend_path = self.project_root / "app" / "client"
 
         cmd = ["bun", "run", "build"]
@@ -310,6 +325,13 @@ class BuildChecker:
         Returns:
             BuildResult with type errors
         """
+        return self.cache.cached(
+            "mypy", {}, self._run_mypy,
+            result_to_dict, result_from_dict, cacheable=_is_cacheable
+        )
+
+    def _run_mypy(self) -> BuildResult:
+        """Run mypy (uncached)."""
         backend_path = self.project_root / "app" / "server"
 
         # Check if mypy is installed
@@ -326,7 +348,7 @@ class BuildChecker:
                 success=True,
                 summary=BuildSummary(total_errors=0, type_errors=0, build_errors=0, warnings=0),
                 errors=[],
-                next_steps=["mypy not installed, skipping Python type checks"]
+                next_steps=[MYPY_MISSING_STEP]
             )
 
         # Run mypy
@@ -376,7 +398,8 @@ class BuildChecker:
                 success=success,
                 summary=summary,
                 errors=errors,
-                next_steps=next_steps
+                next_steps=next_steps,
+                tool_reported=_tool_reported(result.returncode, errors)
             )
 
         except subprocess.TimeoutExpired:
@@ -471,6 +494,32 @@ def result_to_dict(result: BuildResult) -> Dict[str, Any]:
     }
 
 
+def result_from_dict(data: Dict[str, Any]) -> BuildResult:
+    """Rebuild a BuildResult from result_to_dict output."""
+    return BuildResult(
+        success=data["success"],
+        summary=BuildSummary(**data["summary"]),
+        errors=[BuildError(**e) for e in data["errors"]],
+        next_steps=data["next_steps"]
+    )
+
+
+def _tool_reported(returncode: int, errors: List[BuildError]) -> bool:
+    """
+    Whether tsc/mypy ran and reported on the code.
+
+    Both exit 0 when clean and 1 when they found errors. Anything else (a
+    missing node_modules exits 127, mypy crashes with 2), or a 1 without
+    parseable errors, means the tool did not check the code.
+    """
+    return returncode == 0 or (returncode == 1 and bool(errors))
+
+
+def _is_cacheable(result: BuildResult) -> bool:
+    """Only results of a tool that actually ran are reused (not timeouts, crashes or a missing mypy)."""
+    return result.tool_reported
+
+
 # Example usage
 if __name__ == "__main__":
     from pathlib import Path
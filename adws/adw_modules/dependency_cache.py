@@ -0,0 +1,314 @@
+"""Content-addressed cache of installed dependency trees for worktrees.
+
+A dependency tree (app/server/.venv or app/client/node_modules) is identified
+by the hash of the lockfiles it was installed from. Instead of reinstalling,
+a worktree gets a copy of a matching tree from:
+
+1. itself, when its stamp already matches (nothing to do)
+2. the shared cache (~/.cache/tac-webbuilder/deps, ADW_DEPS_CACHE_DIR)
+3. the parent repo, when its lockfiles are byte-identical
+
+Copies are reflinks (copy-on-write) where the filesystem supports them and
+hardlinks otherwise. A virtualenv embeds its absolute path in bin/ scripts
+and .pth files, so .venv copies are relocated after cloning.
+
+Usage:
+    from adw_modules.dependency_cache import cached_install
+
+    success, error = cached_install("frontend", worktree_path, run_bun_install, logger)
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DependencySpec:
+    """Where a dependency tree lives and which files determine it."""
+
+    project_dir: str  # relative to the worktree root
+    install_dir: str  # relative to project_dir
+    lockfiles: Tuple[str, ...]
+    relocate: bool = False  # tree embeds its own absolute path
+
+
+DEPENDENCY_SPECS = {
+    "backend": DependencySpec("app/server", ".venv", ("pyproject.toml", "uv.lock"), relocate=True),
+    "frontend": DependencySpec(
+        "app/client", "node_modules", ("package.json", "package-lock.json", "bun.lockb", "bun.lock")
+    ),
+}
+
+# Written inside .venv / node_modules after a successful install
+LOCK_STAMP_FILE = ".adw-lock-hash"
+# Absolute project_dir the tree was installed for (used to relocate copies)
+ORIGIN_FILE = ".adw-origin"
+
+DEPS_CACHE_DIR = Path(
+    os.getenv("ADW_DEPS_CACHE_DIR", str(Path.home() / ".cache" / "tac-webbuilder" / "deps"))
+)
+DEPS_CACHE_KEEP = 3  # cached trees kept per kind (old lockfile versions are pruned)
+
+# Top-level entries regenerated per worktree, never shared
+_CACHE_IGNORE = {".vite", ".cache"}
+
+
+def lockfile_hash(directory: str, lockfiles: Iterable[str]) -> str:
+    """Hash the lockfiles present in a directory.
+
+    Args:
+        directory: Directory containing the lockfiles
+        lockfiles: Lockfile names to include (missing ones are skipped)
+
+    Returns:
+        Hex digest identifying the dependency set
+    """
+    digest = hashlib.sha256()
+    for name in lockfiles:
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            digest.update(name.encode() + b"\0")
+            with open(path, "rb") as f:
+                digest.update(f.read())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cached_install(
+    kind: str,
+    worktree_path: str,
+    install: Callable[[], Tuple[bool, Optional[str]]],
+    logger: logging.Logger,
+    parent_repo: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Make a worktree's dependency tree match its lockfiles, installing only on a miss.
+
+    Args:
+        kind: Key of DEPENDENCY_SPECS ("backend" or "frontend")
+        worktree_path: Worktree root
+        install: Runs the real install (uv sync / bun install) in the worktree
+        logger: Logger instance
+        parent_repo: Repo whose tree may be reused if its lockfiles are identical
+
+    Returns:
+        Tuple of (success, error_message)
+    """
+    spec = DEPENDENCY_SPECS[kind]
+    project_dir = os.path.join(worktree_path, spec.project_dir)
+    install_dir = os.path.join(project_dir, spec.install_dir)
+    lock_hash = lockfile_hash(project_dir, spec.lockfiles)
+
+    # A tree moved here with its worktree (leased from the warm pool) still
+    # points at its old location until relocated
+    if _in_place(spec, install_dir, project_dir, logger) and _stamp_matches(install_dir, lock_hash):
+        logger.info(f"{spec.install_dir} up to date (lockfiles unchanged), skipping install")
+        return True, None
+
+    cached = _cache_entry(spec, lock_hash)
+    if _stamp_matches(str(cached), lock_hash) and _restore(spec, str(cached), project_dir, logger):
+        logger.info(f"Restored {spec.install_dir} from shared cache {cached}")
+        return True, None
+
+    if parent_repo:
+        parent_project = os.path.join(parent_repo, spec.project_dir)
+        parent_install = os.path.join(parent_project, spec.install_dir)
+        if (
+            os.path.realpath(parent_project) != os.path.realpath(project_dir)
+            and os.path.isdir(parent_install)
+            and lockfile_hash(parent_project, spec.lockfiles) == lock_hash
+            and _restore(spec, parent_install, project_dir, logger, origin=parent_project)
+        ):
+            _write_marker(install_dir, LOCK_STAMP_FILE, lock_hash)
+            _store_in_cache(spec, lock_hash, install_dir, logger)
+            logger.info(f"Restored {spec.install_dir} from parent repo (identical lockfiles)")
+            return True, None
+
+    # A stale tree may share inodes with the cache; never let the installer modify it in place
+    if _is_shared(install_dir):
+        shutil.rmtree(install_dir)
+
+    success, error = install()
+    if not success:
+        return False, error
+
+    if os.path.isdir(install_dir):
+        _write_marker(install_dir, LOCK_STAMP_FILE, lock_hash)
+        _write_marker(install_dir, ORIGIN_FILE, project_dir)
+        _store_in_cache(spec, lock_hash, install_dir, logger)
+    return True, None
+
+
+def clone_tree(source: str, destination: str) -> None:
+    """Copy a directory tree as reflinks, falling back to hardlinks (or plain copies across filesystems)."""
+    if _reflink_tree(source, destination):
+        return
+
+    def link_or_copy(src: str, dst: str) -> None:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    def ignore(directory: str, names: list) -> set:
+        return _CACHE_IGNORE.intersection(names) if directory == source else set()
+
+    shutil.copytree(source, destination, symlinks=True, copy_function=link_or_copy, ignore=ignore)
+
+
+def _reflink_tree(source: str, destination: str) -> bool:
+    if sys.platform == "darwin":
+        cmd = ["cp", "-cR", source, destination]  # APFS clonefile
+    elif sys.platform.startswith("linux"):
+        cmd = ["cp", "-a", "--reflink=always", source, destination]
+    else:
+        return False
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError:
+        return False
+    if proc.returncode != 0:
+        shutil.rmtree(destination, ignore_errors=True)
+        return False
+    for name in _CACHE_IGNORE:
+        shutil.rmtree(os.path.join(destination, name), ignore_errors=True)
+    return True
+
+
+def _restore(
+    spec: DependencySpec,
+    source: str,
+    project_dir: str,
+    logger: logging.Logger,
+    origin: Optional[str] = None
+) -> bool:
+    """Clone a tree into project_dir, relocating it if needed. Returns True on success."""
+    install_dir = os.path.join(project_dir, spec.install_dir)
+    try:
+        if os.path.lexists(install_dir):
+            shutil.rmtree(install_dir)
+        clone_tree(source, install_dir)
+        if spec.relocate:
+            old_project = origin or _read_marker(source, ORIGIN_FILE)
+            if not old_project:
+                raise OSError(f"unknown origin for {source}")
+            _relocate(install_dir, old_project, project_dir)
+            _write_marker(install_dir, ORIGIN_FILE, project_dir)
+    except OSError as e:
+        logger.warning(f"Could not restore {spec.install_dir} from {source}: {e}")
+        shutil.rmtree(install_dir, ignore_errors=True)
+        return False
+    return True
+
+
+def _in_place(spec: DependencySpec, install_dir: str, project_dir: str, logger: logging.Logger) -> bool:
+    """Whether an existing tree belongs to project_dir, relocating it if it was moved there."""
+    if not spec.relocate or not os.path.isdir(install_dir):
+        return True
+    origin = _read_marker(install_dir, ORIGIN_FILE)
+    if origin == project_dir:
+        return True
+    if not origin:
+        return False
+    try:
+        _relocate(install_dir, origin, project_dir)
+        _write_marker(install_dir, ORIGIN_FILE, project_dir)
+    except OSError as e:
+        logger.warning(f"Could not relocate {spec.install_dir} from {origin}: {e}")
+        return False
+    logger.info(f"Relocated {spec.install_dir} from {origin}")
+    return True
+
+
+def _relocate(venv_dir: str, old_project: str, new_project: str) -> None:
+    """Rewrite absolute paths in a cloned virtualenv (bin/ scripts, .pth and editable finders)."""
+    if old_project == new_project:
+        return
+    old, new = old_project.encode(), new_project.encode()
+
+    candidates = []
+    bin_dir = os.path.join(venv_dir, "Scripts" if os.name == "nt" else "bin")
+    if os.path.isdir(bin_dir):
+        candidates += [os.path.join(bin_dir, name) for name in os.listdir(bin_dir)]
+    for site_packages in Path(venv_dir).glob("lib/python*/site-packages"):
+        candidates += [
+            str(p) for p in site_packages.iterdir()
+            if p.suffix in (".pth", ".egg-link") or p.name.startswith("__editable__")
+        ]
+
+    for path in candidates:
+        if os.path.islink(path) or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        if old not in data:
+            continue
+        # Write a new file instead of editing in place: the clone may share inodes
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data.replace(old, new))
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _cache_entry(spec: DependencySpec, lock_hash: str) -> Path:
+    return DEPS_CACHE_DIR / f"{spec.install_dir.lstrip('.')}-{lock_hash[:16]}"
+
+
+def _store_in_cache(spec: DependencySpec, lock_hash: str, install_dir: str, logger: logging.Logger) -> None:
+    """Publish an installed tree to the shared cache (best effort)."""
+    cached = _cache_entry(spec, lock_hash)
+    if cached.exists():
+        return
+    staging = DEPS_CACHE_DIR / f".{cached.name}.{uuid.uuid4().hex[:8]}"
+    try:
+        DEPS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        clone_tree(install_dir, str(staging))
+        os.rename(staging, cached)  # atomic publish; loses harmlessly to a concurrent writer
+        logger.info(f"Stored {spec.install_dir} in shared cache {cached}")
+    except OSError as e:
+        logger.debug(f"Not caching {spec.install_dir}: {e}")
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+
+    # Drop trees for older lockfiles
+    prefix = cached.name.rsplit("-", 1)[0]
+    entries = sorted(DEPS_CACHE_DIR.glob(f"{prefix}-*"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[DEPS_CACHE_KEEP:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+def _stamp_matches(install_dir: str, lock_hash: str) -> bool:
+    return _read_marker(install_dir, LOCK_STAMP_FILE) == lock_hash
+
+
+def _is_shared(install_dir: str) -> bool:
+    """True if the tree was hardlinked from elsewhere (its stamp has other links)."""
+    try:
+        return os.stat(os.path.join(install_dir, LOCK_STAMP_FILE)).st_nlink > 1
+    except OSError:
+        return False
+
+
+def _read_marker(directory: str, name: str) -> Optional[str]:
+    try:
+        with open(os.path.join(directory, name), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_marker(directory: str, name: str, value: str) -> None:
+    # Unlink first: the marker may be hardlinked to a cached tree's copy
+    path = os.path.join(directory, name)
+    if os.path.lexists(path):
+        os.unlink(path)
+    with open(path, "w") as f:
+        f.write(value + "\n")
@@ -3,10 +3,13 @@
 Provides centralized git operations that build on top of github.py module.
 """
 
+import fcntl
+import os
 import subprocess
 import json
 import logging
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
 
 # Import GitHub functions from existing module
 from adw_modules.github import get_repo_url, extract_repo_path, make_issue_comment
@@ -23,16 +26,39 @@ def get_current_branch(cwd: Optional[str] = None) -> str:
     return result.stdout.strip()
 
 
+@contextmanager
+def worktree_git_lock(cwd: Optional[str] = None) -> Iterator[None]:
+    """Serialize git writes to one worktree across processes.
+
+    Concurrent phases of an ADW (lint and test) share a worktree; without
+    this their stage/commit/push sequences interleave and fail on index.lock.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--absolute-git-dir"], capture_output=True, text=True, cwd=cwd
+    )
+    git_dir = result.stdout.strip()
+    if result.returncode != 0 or not git_dir:
+        yield  # Not a repository; the git command itself will report the error
+        return
+    with open(os.path.join(git_dir, "adw-git.lock"), "a") as lock_handle:
+        fcntl.flock(lock_handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_handle, fcntl.LOCK_UN)
+
+
 def push_branch(
     branch_name: str, cwd: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Push current branch to remote. Returns (success, error_message)."""
-    result = subprocess.run(
-        ["git", "push", "-u", "origin", branch_name],
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
+    with worktree_git_lock(cwd):
+        result = subprocess.run(
+            ["git", "push", "-u", "origin", branch_name],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
     if result.returncode != 0:
         return False, result.stderr
     return True, None
@@ -98,27 +124,28 @@ def commit_changes(
     message: str, cwd: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Stage all changes and commit. Returns (success, error_message)."""
-    # Check if there are changes to commit
-    result = subprocess.run(
-        ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=cwd
-    )
-    if not result.stdout.strip():
-        return True, None  # No changes to commit
+    with worktree_git_lock(cwd):
+        # Check if there are changes to commit
+        result = subprocess.run(
+            ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=cwd
+        )
+        if not result.stdout.strip():
+            return True, None  # No changes to commit
 
-    # Stage all changes
-    result = subprocess.run(
-        ["git", "add", "-A"], capture_output=True, text=True, cwd=cwd
-    )
-    if result.returncode != 0:
-        return False, result.stderr
+        # Stage all changes
+        result = subprocess.run(
+            ["git", "add", "-A"], capture_output=True, text=True, cwd=cwd
+        )
+        if result.returncode != 0:
+            return False, result.stderr
 
-    # Commit
-    result = subprocess.run(
-        ["git", "commit", "-m", message], capture_output=True, text=True, cwd=cwd
-    )
-    if result.returncode != 0:
-        return False, result.stderr
-    return True, None
+        # Commit
+        result = subprocess.run(
+            ["git", "commit", "-m", message], capture_output=True, text=True, cwd=cwd
+        )
+        if result.returncode != 0:
+            return False, result.stderr
+        return True, None
 
 
 def get_pr_number(branch_name: str) -> Optional[str]:
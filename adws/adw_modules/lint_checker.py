@@ -15,10 +15,13 @@ Key Features:
 import json
 import re
 import subprocess
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from adw_modules.phase_result_cache import PhaseResultCache
+from adw_modules.tool_call_tracker import ToolCallTracker
+
 
 @dataclass
 class LintError:
@@ -50,19 +53,28 @@ class LintResult:
     summary: LintSummary
     errors: List[LintError]
     next_steps: List[str]
+    # The tool ran and reported on the code (not serialized; see _is_cacheable)
+    tool_reported: bool = field(default=False, compare=False)
 
 
 class LintChecker:
     """Execute lint checks and return compact results."""
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        tracker: Optional[ToolCallTracker] = None
+    ):
         """
         Initialize lint checker.
 
         Args:
             project_root: Path to project root directory
+            tracker: Optional ToolCallTracker for observability
         """
         self.project_root = Path(project_root)
+        self.tracker = tracker
+        self.cache = PhaseResultCache(self.project_root, tracker=tracker)
 
     def get_changed_files(self, base_branch: str = "main") -> Dict[str, List[str]]:
         """
@@ -114,6 +126,16 @@ class LintChecker:
         Returns:
             LintResult with lint errors only
         """
+        if fix_mode or changed_files_only:
+            # Fixes modify the tree, and changed-file runs depend on the base branch
+            return self._run_eslint(fix_mode, changed_files_only)
+        return self.cache.cached(
+            "eslint", {}, lambda: self._run_eslint(fix_mode, changed_files_only),
+            result_to_dict, result_from_dict, cacheable=_is_cacheable
+        )
+
+    def _run_eslint(self, fix_mode: bool, changed_files_only: bool) -> LintResult:
+        """Run ESLint (uncached)."""
         frontend_path = self.project_root / "app" / "client"
 
         # Get changed files if requested
@@ -183,7 +205,8 @@ class LintChecker:
                 success=success,
                 summary=summary,
                 errors=errors,
-                next_steps=next_steps
+                next_steps=next_steps,
+                tool_reported=_tool_reported(result.returncode, result.stdout, errors)
             )
 
         except subprocess.TimeoutExpired:
@@ -267,6 +290,16 @@ class LintChecker:
         Returns:
             LintResult with lint errors
         """
+        if fix_mode or changed_files_only:
+            # Fixes modify the tree, and changed-file runs depend on the base branch
+            return self._run_ruff(fix_mode, changed_files_only)
+        return self.cache.cached(
+            "ruff", {}, lambda: self._run_ruff(fix_mode, changed_files_only),
+            result_to_dict, result_from_dict, cacheable=_is_cacheable
+        )
+
+    def _run_ruff(self, fix_mode: bool, changed_files_only: bool) -> LintResult:
+        """Run Ruff (uncached)."""
         backend_path = self.project_root / "app" / "server"
 
         # Get changed files if requested
@@ -337,7 +370,8 @@ class LintChecker:
                 success=success,
                 summary=summary,
                 errors=errors,
-                next_steps=next_steps
+                next_steps=next_steps,
+                tool_reported=_tool_reported(result.returncode, result.stdout, errors)
             )
 
         except subprocess.TimeoutExpired:
@@ -449,6 +483,40 @@ def result_to_dict(result: LintResult) -> Dict[str, Any]:
     }
 
 
+def result_from_dict(data: Dict[str, Any]) -> LintResult:
+    """Rebuild a LintResult from result_to_dict output."""
+    return LintResult(
+        success=data["success"],
+        summary=LintSummary(**data["summary"]),
+        errors=[LintError(**e) for e in data["errors"]],
+        next_steps=data["next_steps"]
+    )
+
+
+def _tool_reported(returncode: int, output: str, errors: List[LintError]) -> bool:
+    """
+    Whether ruff/eslint ran and reported on the code.
+
+    Both exit 0 when clean and 1 when they found violations, and print a JSON
+    array. Anything else (a missing node_modules exits 127, a config error
+    exits 2), unparseable output, or a 1 without violations means the tool
+    did not check the code.
+    """
+    if returncode not in (0, 1):
+        return False
+    try:
+        if not isinstance(json.loads(output), list):
+            return False
+    except ValueError:
+        return False
+    return returncode == 0 or bool(errors)
+
+
+def _is_cacheable(result: LintResult) -> bool:
+    """Only results of a tool that actually ran are reused (not timeouts or crashes)."""
+    return result.tool_reported
+
+
 # Example usage
 if __name__ == "__main__":
     from pathlib import Path
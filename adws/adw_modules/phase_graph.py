@@ -0,0 +1,229 @@
+"""Concurrent phase execution for the SDLC orchestrators.
+
+Phases run as separate `uv run adw_*_iso.py` processes. Some of them only
+need an earlier phase's output and not each other, so running them one after
+another wastes wall time. This module runs phases as a dependency graph
+(task_graph's run_task_graph): each phase starts as soon as its dependencies
+are done. Phases that write to the worktree must depend on each other - lint
+commits its auto-fixes and test's resolver edits code, so Test depends on
+Lint; only read-only phases belong side by side.
+
+- Idempotency: before a phase is started, a caller-supplied check (resume
+  tracker, utils/idempotency) can skip it without spawning a process
+- Resource limits: each phase process (and everything it spawns) runs under
+  its own nice level, data-size and CPU-time limits (PhaseLimits)
+- Shared state: phases write adw_state.json through ADWState.save, which
+  merges under a file lock, and commit through git_ops, which serializes
+  git writes per worktree
+- Makespan: the returned PhaseGraphReport compares the graph's wall time with
+  the sum of phase durations (what a sequential run would have taken)
+
+Configuration:
+    ADW_PARALLEL_PHASES          max phases running at once (default 2, 1 = sequential)
+    ADW_<PHASE>_NICE             e.g. ADW_LINT_NICE=10
+    ADW_<PHASE>_MAX_MEMORY_MB    data segment limit per process
+    ADW_<PHASE>_MAX_CPU_SECONDS  CPU time limit per process
+
+Usage:
+    phases = [GraphPhase("Lint", lint_cmd), GraphPhase("Test", test_cmd, depends_on=("Lint",))]
+    report = run_phase_graph(phases, run_phase, logger, should_skip=already_complete)
+    if report.failed_phases():
+        ...
+"""
+
+import logging
+import os
+import shlex
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from adw_modules.task_graph import SetupTask, run_task_graph
+
+DEFAULT_MAX_PARALLEL = 2
+
+
+@dataclass(frozen=True)
+class PhaseLimits:
+    """Per-process limits for a phase, inherited by every process it starts."""
+
+    nice: int = 0
+    max_memory_mb: Optional[int] = None  # RLIMIT_DATA, enforced on Linux
+    max_cpu_seconds: Optional[int] = None  # RLIMIT_CPU
+
+    @classmethod
+    def from_env(cls, phase_name: str, default: Optional["PhaseLimits"] = None) -> "PhaseLimits":
+        """Limits for a phase, with ADW_<PHASE>_* environment overrides applied to default."""
+        default = default or cls()
+        prefix = f"ADW_{phase_name.upper()}_"
+
+        def read(name: str, fallback: Optional[int]) -> Optional[int]:
+            value = os.getenv(prefix + name)
+            if value is None or value.strip() == "":
+                return fallback
+            try:
+                return int(value)
+            except ValueError:
+                return fallback
+
+        return cls(
+            nice=read("NICE", default.nice) or 0,
+            max_memory_mb=read("MAX_MEMORY_MB", default.max_memory_mb),
+            max_cpu_seconds=read("MAX_CPU_SECONDS", default.max_cpu_seconds),
+        )
+
+    def wrap(self, cmd: List[str]) -> List[str]:
+        """Return a command that applies the limits and then execs cmd.
+
+        Uses sh's ulimit and nice rather than a preexec_fn, which is unsafe
+        when phases are started from several threads.
+        """
+        setup = []
+        if self.max_memory_mb:
+            setup.append(f"ulimit -d {int(self.max_memory_mb) * 1024}")
+        if self.max_cpu_seconds:
+            setup.append(f"ulimit -t {int(self.max_cpu_seconds)}")
+        launch = f"exec nice -n {int(self.nice)} \"$@\"" if self.nice else "exec \"$@\""
+        if not setup and not self.nice:
+            return list(cmd)
+        return ["sh", "-c", " && ".join(setup + [launch]), "sh", *cmd]
+
+    def describe(self) -> str:
+        parts = []
+        if self.nice:
+            parts.append(f"nice {self.nice}")
+        if self.max_memory_mb:
+            parts.append(f"{self.max_memory_mb}MB data")
+        if self.max_cpu_seconds:
+            parts.append(f"{self.max_cpu_seconds}s CPU")
+        return ", ".join(parts) or "no limits"
+
+
+@dataclass
+class GraphPhase:
+    """One phase process in the graph."""
+
+    name: str
+    cmd: List[str]
+    depends_on: Tuple[str, ...] = ()
+    max_retries: int = 2
+    critical: bool = True  # A failed critical phase skips its dependants
+    limits: PhaseLimits = field(default_factory=PhaseLimits)
+
+    def command(self) -> List[str]:
+        """The phase command with its resource limits applied."""
+        return self.limits.wrap(self.cmd)
+
+
+@dataclass
+class PhaseGraphReport:
+    """Outcome and timing of a phase graph run."""
+
+    phases: List[GraphPhase]
+    exit_codes: Dict[str, int] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def sequential_seconds(self) -> float:
+        """Time the executed phases would have taken one after another."""
+        return sum(self.durations.values())
+
+    @property
+    def saved_seconds(self) -> float:
+        return max(0.0, self.sequential_seconds - self.wall_seconds)
+
+    def failed_phases(self) -> List[GraphPhase]:
+        """Critical phases that did not succeed (including ones skipped after a failure)."""
+        return [
+            phase for phase in self.phases
+            if phase.critical and phase.name not in self.skipped and self.exit_codes.get(phase.name, 1) != 0
+        ]
+
+    def summary(self) -> str:
+        ran = [f"{name} {self.durations[name]:.0f}s" for name in self.durations]
+        text = f"{' | '.join(ran) or 'nothing ran'} -> {self.wall_seconds:.0f}s wall"
+        if self.saved_seconds:
+            text += f" ({self.saved_seconds:.0f}s saved vs sequential {self.sequential_seconds:.0f}s)"
+        return text
+
+
+def get_max_parallel() -> int:
+    """Configured number of phases allowed to run at once (at least 1)."""
+    try:
+        return max(1, int(os.getenv("ADW_PARALLEL_PHASES", DEFAULT_MAX_PARALLEL)))
+    except ValueError:
+        return DEFAULT_MAX_PARALLEL
+
+
+def run_phase_graph(
+    phases: List[GraphPhase],
+    run_phase: Callable[[GraphPhase], int],
+    logger: logging.Logger,
+    should_skip: Optional[Callable[[GraphPhase], bool]] = None,
+    on_start: Optional[Callable[[GraphPhase], None]] = None,
+    on_complete: Optional[Callable[[GraphPhase, int], None]] = None,
+    max_parallel: Optional[int] = None
+) -> PhaseGraphReport:
+    """Run phases concurrently, each as soon as its dependencies have finished.
+
+    Args:
+        phases: Phases with unique names; depends_on must name other phases
+        run_phase: Runs one phase (with retries) and returns its exit code;
+            called from worker threads
+        logger: Logger instance
+        should_skip: Returns True for phases that are already complete (no side effects)
+        on_start: Called with each phase about to be started (not skipped ones);
+            calls are serialized
+        on_complete: Called with each finished phase and its exit code (0 when
+            skipped as complete); calls are serialized
+        max_parallel: Phases running at once (default: ADW_PARALLEL_PHASES)
+
+    Returns:
+        PhaseGraphReport with exit codes and timings
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    report = PhaseGraphReport(phases=list(phases))
+    callback_lock = threading.Lock()
+    max_parallel = max_parallel or get_max_parallel()
+
+    def task_for(phase: GraphPhase) -> SetupTask:
+        def run() -> Tuple[bool, Optional[str]]:
+            if should_skip and should_skip(phase):
+                logger.info(f"{phase.name} phase already complete, not starting it")
+                exit_code = 0
+                with callback_lock:
+                    report.skipped.append(phase.name)
+            else:
+                if on_start:
+                    with callback_lock:
+                        on_start(phase)
+                logger.info(
+                    f"Starting {phase.name} phase ({phase.limits.describe()}): {shlex.join(phase.cmd)}"
+                )
+                started = time.perf_counter()
+                exit_code = run_phase(phase)
+                with callback_lock:
+                    report.durations[phase.name] = time.perf_counter() - started
+
+            with callback_lock:
+                report.exit_codes[phase.name] = exit_code
+                if on_complete:
+                    on_complete(phase, exit_code)
+
+            if exit_code != 0 and phase.critical:
+                return False, f"{phase.name} phase exited with {exit_code}"
+            return True, None
+
+        return SetupTask(phase.name, run, depends_on=phase.depends_on)
+
+    started = time.perf_counter()
+    run_task_graph([task_for(phase) for phase in phases], logger, max_workers=max_parallel)
+    report.wall_seconds = time.perf_counter() - started
+
+    logger.info(f"Phase graph finished: {report.summary()}")
+    return report
@@ -0,0 +1,249 @@
+"""
+Phase Result Cache - Reuse lint/type-check/test results for unchanged code
+
+Retried phases and ADWs on the same base commit re-run ruff, tsc, mypy, eslint,
+pytest and vitest over trees that have not changed. This cache stores each
+check's result under a key derived from:
+
+- the git tree hash of the paths the check reads, computed from the working
+  tree (uncommitted and untracked files included, .gitignore respected)
+- the check's parameters (strict mode, test path, ...)
+
+Tool versions and configuration are covered because they live in those paths
+(uv.lock / package-lock.json pin ruff, mypy, pytest, eslint, tsc and vitest;
+pyproject.toml, tsconfig.json, eslint.config.js hold their config).
+
+The store is shared between ADWs: ~/.cache/tac-webbuilder/phase_results
+(ADW_PHASE_CACHE_DIR to move it, ADW_PHASE_CACHE=0 to disable).
+
+Usage:
+    cache = PhaseResultCache(project_root, tracker=tracker)
+    result = cache.cached("ruff", {"fix_mode": False}, run_ruff, result_to_dict, result_from_dict)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from adw_modules.tool_call_tracker import ToolCallTracker
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_VERSION = 1
+
+# Paths (relative to the project root) whose content determines each check's result
+CHECK_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "ruff": ("app/server", "ruff.toml", ".ruff.toml", "pyproject.toml"),
+    "mypy": ("app/server", "mypy.ini", "setup.cfg"),
+    "pytest": ("app/server",),
+    "eslint": ("app/client",),
+    "tsc": ("app/client",),
+    "vitest": ("app/client",),
+}
+
+# Files the checks themselves write into the tree (not ignored by git), never part of a key
+ARTIFACT_EXCLUDES = (
+    ".pytest_report.json", ".vitest_report.json", "coverage.json", ".coverage", "*.db", "*.log"
+)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "tac-webbuilder" / "phase_results"
+MAX_ENTRIES = 500
+
+
+class PhaseResultCache:
+    """Content-addressed store of check results for one project tree."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        cache_dir: Optional[Path] = None,
+        tracker: Optional["ToolCallTracker"] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            project_root: Tree the checks run against (a repo or worktree root)
+            cache_dir: Store location (default: ADW_PHASE_CACHE_DIR or ~/.cache/...)
+            tracker: Optional ToolCallTracker to record hits and misses in task_logs
+            enabled: Force on/off (default: off when ADW_PHASE_CACHE=0)
+        """
+        self.project_root = Path(project_root)
+        self.cache_dir = Path(cache_dir or os.getenv("ADW_PHASE_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.tracker = tracker
+        self.enabled = os.getenv("ADW_PHASE_CACHE", "1") != "0" if enabled is None else enabled
+        self.hits = 0
+        self.misses = 0
+
+    def cached(
+        self,
+        check: str,
+        params: Dict[str, Any],
+        compute: Callable[[], T],
+        to_dict: Callable[[T], Dict[str, Any]],
+        from_dict: Callable[[Dict[str, Any]], T],
+        cacheable: Callable[[T], bool] = lambda result: True
+    ) -> T:
+        """
+        Return the stored result for this check and tree, or compute and store it.
+
+        Args:
+            check: Key of CHECK_INPUTS
+            params: Parameters that change the result
+            compute: Runs the check
+            to_dict / from_dict: Serialize the result
+            cacheable: False for results that must not be reused (timeouts, tool crashes)
+
+        Returns:
+            The check result
+        """
+        key = self.key(check, params) if self.enabled else None
+        if key is None:
+            return compute()
+
+        stored = self._load(key)
+        if stored is not None:
+            try:
+                result = from_dict(stored)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"[PhaseCache] Discarding unreadable entry {key[:12]}: {e}")
+            else:
+                self._record(check, key, hit=True)
+                logger.info(f"[PhaseCache] {check}: reusing result for unchanged tree ({key[:12]})")
+                return result
+
+        self._record(check, key, hit=False)
+        result = compute()
+        if cacheable(result):
+            self._store(key, check, to_dict(result))
+        return result
+
+    def key(self, check: str, params: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a check on the current working tree, or None outside git."""
+        trees = self.tree_hashes(CHECK_INPUTS[check])
+        if trees is None:
+            return None
+        material = json.dumps(
+            {"version": CACHE_VERSION, "check": check, "params": params, "trees": trees},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def tree_hashes(self, paths: Tuple[str, ...]) -> Optional[Dict[str, str]]:
+        """
+        Git object ids of the given paths as they are in the working tree.
+
+        Stages the working tree into a throwaway copy of the index, so the real
+        index is untouched and unchanged files are not rehashed.
+
+        Returns:
+            {path: object id} ("" for missing paths), or None if git is unavailable
+        """
+        existing = [p for p in paths if (self.project_root / p).exists()]
+        if not existing:
+            return {p: "" for p in paths}
+
+        index_path = self._git("rev-parse", "--git-path", "index")
+        if index_path is None:
+            return None
+        index_path = self.project_root / index_path
+
+        fd, tmp_index = tempfile.mkstemp(prefix="adw-phase-cache-index-")
+        os.close(fd)
+        try:
+            try:
+                shutil.copyfile(index_path, tmp_index)
+            except FileNotFoundError:
+                os.remove(tmp_index)
+            except OSError as e:
+                logger.debug(f"[PhaseCache] Could not copy index {index_path}: {e}")
+                return None
+            env = {**os.environ, "GIT_INDEX_FILE": tmp_index}
+            excludes = [f":(exclude,glob)**/{pattern}" for pattern in ARTIFACT_EXCLUDES]
+            if self._git("add", "-A", "--", *existing, *excludes, env=env) is None:
+                return None
+            tree = self._git("write-tree", env=env)
+            if tree is None:
+                return None
+            listing = self._git("ls-tree", tree, "--", *existing, env=env)
+            if listing is None:
+                return None
+        finally:
+            if os.path.exists(tmp_index):
+                os.remove(tmp_index)
+
+        hashes = {p: "" for p in paths}
+        for line in listing.splitlines():
+            meta, _, path = line.partition("\t")
+            hashes[path] = meta.split()[2]
+        return hashes
+
+    def _git(self, *args: str, env: Optional[Dict[str, str]] = None) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                env=env,
+                timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"[PhaseCache] git {args[0]} failed: {e}")
+            return None
+        if result.returncode != 0:
+            logger.debug(f"[PhaseCache] git {args[0]} failed: {result.stderr.strip()}")
+            return None
+        return result.stdout.strip()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_path(key), "r") as f:
+                return json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _store(self, key: str, check: str, result: Dict[str, Any]) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"check": check, "stored_at": time.time(), "result": result}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"[PhaseCache] Could not store {check} result: {e}")
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        """Keep the newest MAX_ENTRIES results."""
+        entries = list(self.cache_dir.glob("*/*.json"))
+        if len(entries) <= MAX_ENTRIES:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for stale in entries[: len(entries) - MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+
+    def _record(self, check: str, key: str, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.tracker:
+            self.tracker.record_cache_lookup(check, hit, key[:12])
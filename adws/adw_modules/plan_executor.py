@@ -12,7 +12,15 @@ import hashlib
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 
+from .dependency_cache import cached_install
 from .plan_parser import WorkflowConfig
+from .task_graph import SetupTask, run_task_graph
+
+# Setup actions that must wait for other actions (when those are in the plan)
+ACTION_DEPENDENCIES = {
+    'copy_env_files': ('create_ports_env',),
+    'setup_database': ('install_backend',),
+}
 
 
 class ExecutionResult:
@@ -164,36 +172,39 @@ def execute_worktree_setup(
     logger.info(f"Setting up worktree at {worktree_path}")
     logger.info(f"Ports: backend={backend_port}, frontend={frontend_port}")
 
-    # Execute each setup step
+    handlers = {
+        'create_ports_env': lambda step: _create_ports_env(worktree_path, backend_port, frontend_port, logger, result),
+        'copy_env_files': lambda step: _copy_env_files(worktree_path, backend_port, frontend_port, step, logger, result),
+        'copy_mcp_files': lambda step: _copy_mcp_files(worktree_path, step, logger, result),
+        'install_backend': lambda step: _install_backend(worktree_path, step, logger, result),
+        'install_frontend': lambda step: _install_frontend(worktree_path, step, logger, result),
+        'setup_database': lambda step: _setup_database(worktree_path, step, logger, result),
+    }
+
+    # Build the task graph: independent steps run concurrently
+    tasks = []
     for step in steps:
         action = step.get('action')
-        logger.info(f"Executing step: {action}")
-
-        try:
-            if action == 'create_ports_env':
-                _create_ports_env(worktree_path, backend_port, frontend_port, logger, result)
-
-            elif action == 'copy_env_files':
-                _copy_env_files(worktree_path, backend_port, frontend_port, step, logger, result)
-
-            elif action == 'copy_mcp_files':
-                _copy_mcp_files(worktree_path, step, logger, result)
-
-            elif action == 'install_backend':
-                _install_backend(worktree_path, step, logger, result)
-
-            elif action == 'install_frontend':
-                _install_frontend(worktree_path, step, logger, result)
-
-            elif action == 'setup_database':
-                _setup_database(worktree_path, step, logger, result)
-
-            else:
-                result.add_warning(f"Unknown action: {action}")
-
-        except Exception as e:
-            result.add_error(f"Step '{action}' failed: {e}")
-            return False
+        if action not in handlers:
+            result.add_warning(f"Unknown action: {action}")
+            continue
+        if any(task.name == action for task in tasks):
+            result.add_warning(f"Duplicate action ignored: {action}")
+            continue
+        tasks.append(SetupTask(action, _step_runner(handlers[action], step)))
+
+    planned = {task.name for task in tasks}
+    tasks = [
+        SetupTask(task.name, task.run, tuple(d for d in ACTION_DEPENDENCIES.get(task.name, ()) if d in planned))
+        for task in tasks
+    ]
+
+    logger.info(f"Executing steps: {', '.join(task.name for task in tasks)}")
+    failure = run_task_graph(tasks, logger)
+    if failure:
+        task, error = failure
+        result.add_error(f"Step '{task.name}' failed: {error}")
+        return False
 
     logger.info("Worktree setup completed successfully")
     result.metadata['worktree_path'] = worktree_path
@@ -203,6 +214,14 @@ def execute_worktree_setup(
     return True
 
 
+def _step_runner(handler, step: Dict[str, Any]):
+    """Adapt a raising step handler to the (success, error) task interface."""
+    def run() -> Tuple[bool, Optional[str]]:
+        handler(step)
+        return True, None
+    return run
+
+
 def _create_ports_env(
     worktree_path: str,
     backend_port: int,
@@ -356,7 +375,7 @@ def _install_backend(
     logger: logging.Logger,
     result: ExecutionResult
 ):
-    """Install backend dependencies with uv."""
+    """Install backend dependencies with uv (skipped or restored from cache when uv.lock matches)."""
     command = step.get('command', 'cd app/server && uv sync --all-extras')
     working_dir = step.get('working_dir', 'app/server')
 
@@ -364,31 +383,34 @@ def _install_backend(
 
     logger.info(f"Installing backend dependencies in {full_path}")
 
-    try:
-        proc = subprocess.run(
-            ["uv", "sync", "--all-extras"],
-            cwd=full_path,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+    def uv_sync() -> Tuple[bool, Optional[str]]:
+        try:
+            proc = subprocess.run(
+                ["uv", "sync", "--all-extras"],
+                cwd=full_path,
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minute timeout
+            )
+        except subprocess.TimeoutExpired:
+            return False, "Backend installation timed out after 5 minutes"
 
         if proc.returncode != 0:
-            raise subprocess.CalledProcessError(
-                proc.returncode, command, proc.stdout, proc.stderr
-            )
+            return False, f"Backend installation failed: {proc.stderr}"
+        return True, None
 
-        logger.info("Backend dependencies installed successfully")
-        result.commands_executed.append({
-            "command": command,
-            "working_dir": full_path,
-            "success": True
-        })
+    success, error = cached_install(
+        "backend", worktree_path, uv_sync, logger, parent_repo=str(Path(worktree_path).parent.parent)
+    )
+    if not success:
+        raise Exception(error)
 
-    except subprocess.TimeoutExpired:
-        raise Exception("Backend installation timed out after 5 minutes")
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"Backend installation failed: {e.stderr}")
+    logger.info("Backend dependencies installed successfully")
+    result.commands_executed.append({
+        "command": command,
+        "working_dir": full_path,
+        "success": True
+    })
 
 
 def _install_frontend(
@@ -397,7 +419,7 @@ def _install_frontend(
     logger: logging.Logger,
     result: ExecutionResult
 ):
-    """Install frontend dependencies with bun."""
+    """Install frontend dependencies with bun (skipped or restored from cache when the lockfiles match)."""
     command = step.get('command', 'cd app/client && bun install')
     working_dir = step.get('working_dir', 'app/client')
 
@@ -405,31 +427,34 @@ def _install_frontend(
 
     logger.info(f"Installing frontend dependencies in {full_path}")
 
-    try:
-        proc = subprocess.run(
-            ["bun", "install"],
-            cwd=full_path,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-
-        if proc.returncode != 0:
-            raise subprocess.CalledProcessError(
-                proc.returncode, command, proc.stdout, proc.stderr
+    def bun_install() -> Tuple[bool, Optional[str]]:
+        try:
+            proc = subprocess.run(
+                ["bun", "install"],
+                cwd=full_path,
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minute timeout
             )
+        except subprocess.TimeoutExpired:
+            return False, "Frontend installation timed out after 5 minutes"
 
-        logger.info("Frontend dependencies installed successfully")
-        result.commands_executed.append({
-            "command": command,
-            "working_dir": full_path,
-            "success": True
-        })
+        if proc.returncode != 0:
+            return False, f"Frontend installation failed: {proc.stderr}"
+        return True, None
 
-    except subprocess.TimeoutExpired:
-        raise Exception("Frontend installation timed out after 5 minutes")
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"Frontend installation failed: {e.stderr}")
+    success, error = cached_install(
+        "frontend", worktree_path, bun_install, logger, parent_repo=str(Path(worktree_path).parent.parent)
+    )
+    if not success:
+        raise Exception(error)
+
+    logger.info("Frontend dependencies installed successfully")
+    result.commands_executed.append({
+        "command": command,
+        "working_dir": full_path,
+        "success": True
+    })
 
 
 def _setup_database(
@@ -6,9 +6,15 @@ Manages allocation and release of backend/frontend port pairs for concurrent ADW
 Prevents port collisions via reservation system with persistence.
 
 Architecture:
-- Backend pool: 9100-9199 (100 slots)
-- Frontend pool: 9200-9299 (100 slots)
+- Backend pool: 9100-9199 (100 slots by default, ADW_PORT_POOL_SIZE to change)
+- Frontend pool: 9200-9299 (moves up automatically for pools above 100 slots)
 - Persistence: agents/port_allocations.json
+- Cross-process safety: every operation holds an fcntl lock on
+  agents/port_allocations.json.lock, since each ADW phase is its own process
+- Free slots are tracked in a bitmap; the file is only re-read when another
+  process has changed it
+- Owner PIDs are recorded; slots whose owner died without a worktree are
+  reclaimed when the pool runs out
 - Auto-cleanup on workflow completion
 
 Usage:
@@ -22,21 +28,27 @@ Usage:
     pool.release("adw-abc123")
 """
 
+import fcntl
 import json
 import logging
+import os
 import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for "persistence file never read"
+_NOT_LOADED = object()
+
 
 class PortPool:
     """
-    Thread-safe port pool for ADW worktree isolation.
+    Thread- and process-safe port pool for ADW worktree isolation.
 
-    Manages 100 backend/frontend port pairs with automatic persistence.
+    Manages backend/frontend port pairs (100 by default) with automatic persistence.
     """
 
     # Port ranges
@@ -44,21 +56,67 @@ class PortPool:
     BACKEND_PORT_END = 9199
     FRONTEND_PORT_START = 9200
     FRONTEND_PORT_END = 9299
+    DEFAULT_POOL_SIZE = 100
 
     # Persistence
     PROJECT_ROOT = Path(__file__).parent.parent.parent  # tac-webbuilder/
     PERSISTENCE_FILE = PROJECT_ROOT / "agents" / "port_allocations.json"
+    TREES_DIR = PROJECT_ROOT / "trees"
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        backend_start: Optional[int] = None,
+        frontend_start: Optional[int] = None,
+    ):
+        """
+        Initialize port pool and load existing allocations.
+
+        Args:
+            size: Number of port pairs (default: ADW_PORT_POOL_SIZE or 100)
+            backend_start: First backend port (default: ADW_BACKEND_PORT_START or 9100)
+            frontend_start: First frontend port (default: ADW_FRONTEND_PORT_START,
+                else 9200, or right after the backend range for larger pools)
+
+        Raises:
+            ValueError: If the size is not positive or the two ranges overlap
+        """
+        self.size = size or int(os.getenv("ADW_PORT_POOL_SIZE", self.DEFAULT_POOL_SIZE))
+        self.backend_start = backend_start or int(os.getenv("ADW_BACKEND_PORT_START", self.BACKEND_PORT_START))
+        default_offset = max(self.size, self.FRONTEND_PORT_START - self.BACKEND_PORT_START)
+        self.frontend_start = frontend_start or int(
+            os.getenv("ADW_FRONTEND_PORT_START", self.backend_start + default_offset)
+        )
+
+        if self.size < 1:
+            raise ValueError(f"Port pool size must be positive, got {self.size}")
+        if abs(self.frontend_start - self.backend_start) < self.size:
+            raise ValueError(
+                f"Backend ports {self.backend_start}+{self.size} overlap "
+                f"frontend ports {self.frontend_start}+{self.size}"
+            )
+
+        # Resolved once so later patches of the class attributes do not move the pool
+        self._persistence_file = Path(self.PERSISTENCE_FILE)
+        self._lock_file = self._persistence_file.with_name(self._persistence_file.name + ".lock")
+        self._trees_dir = Path(self.TREES_DIR)
 
-    def __init__(self):
-        """Initialize port pool and load existing allocations."""
         self._lock = threading.Lock()
-        self._allocations: Dict[str, Dict] = {}  # adw_id -> {"backend": int, "frontend": int, "allocated_at": str}
-        self._load_allocations()
+        self._allocations: Dict[str, Dict] = {}  # adw_id -> {"backend", "frontend", "allocated_at", "pid"}
+        self._used = 0  # bit n set = slot n allocated
+        self._full = (1 << self.size) - 1
+        self._file_key = _NOT_LOADED  # (inode, mtime_ns, size) of the file last read or written
+
+        with self._locked():
+            pass
 
     def reserve(self, adw_id: str) -> Tuple[int, int]:
         """
         Reserve a backend/frontend port pair for an ADW workflow.
 
+        Reserving again from another process (a later phase) returns the same
+        pair and makes that process the owner.
+
         Args:
             adw_id: Unique ADW identifier (e.g., "adw-abc123")
 
@@ -66,51 +124,52 @@ class PortPool:
             Tuple of (backend_port, frontend_port)
 
         Raises:
-            RuntimeError: If pool is exhausted (all 100 slots allocated)
+            RuntimeError: If pool is exhausted (all slots allocated)
 
-        Thread-safe: Yes
+        Thread-safe: Yes (and safe across processes)
         """
-        with self._lock:
+        with self._locked():
             # Check if already allocated
             if adw_id in self._allocations:
                 allocation = self._allocations[adw_id]
+                if allocation.get("pid") != os.getpid():
+                    allocation["pid"] = os.getpid()
+                    self._save_allocations()
                 logger.debug(
                     f"[PortPool] ADW {adw_id} already has ports: "
                     f"backend={allocation['backend']}, frontend={allocation['frontend']}"
                 )
                 return allocation["backend"], allocation["frontend"]
 
-            # Find available slot
-            used_backend_ports = {a["backend"] for a in self._allocations.values()}
+            slot = self._first_free_slot()
+            if slot is None and self._reclaim_dead():
+                slot = self._first_free_slot()
 
-            for slot in range(100):
-                backend_port = self.BACKEND_PORT_START + slot
-                frontend_port = self.FRONTEND_PORT_START + slot
-
-                if backend_port not in used_backend_ports:
-                    # Reserve this slot
-                    self._allocations[adw_id] = {
-                        "backend": backend_port,
-                        "frontend": frontend_port,
-                        "allocated_at": datetime.now().isoformat()
-                    }
-
-                    self._save_allocations()
-
-                    logger.info(
-                        f"[PortPool] Reserved ports for {adw_id}: "
-                        f"backend={backend_port}, frontend={frontend_port} "
-                        f"(slot {slot}/100)"
-                    )
+            if slot is None:
+                raise RuntimeError(
+                    f"Port pool exhausted! All {self.size} slots allocated. "
+                    f"Current allocations: {list(self._allocations.keys())}"
+                )
 
-                    return backend_port, frontend_port
+            backend_port = self.backend_start + slot
+            frontend_port = self.frontend_start + slot
+            self._allocations[adw_id] = {
+                "backend": backend_port,
+                "frontend": frontend_port,
+                "allocated_at": datetime.now().isoformat(),
+                "pid": os.getpid(),
+            }
+            self._used |= 1 << slot
+            self._save_allocations()
 
-            # Pool exhausted
-            raise RuntimeError(
-                f"Port pool exhausted! All 100 slots allocated. "
-                f"Current allocations: {list(self._allocations.keys())}"
+            logger.info(
+                f"[PortPool] Reserved ports for {adw_id}: "
+                f"backend={backend_port}, frontend={frontend_port} "
+                f"(slot {slot}/{self.size})"
             )
 
+            return backend_port, frontend_port
+
     def release(self, adw_id: str) -> bool:
         """
         Release ports allocated to an ADW workflow.
@@ -121,14 +180,14 @@ class PortPool:
         Returns:
             True if ports were released, False if not allocated
 
-        Thread-safe: Yes
+        Thread-safe: Yes (and safe across processes)
         """
-        with self._lock:
+        with self._locked():
             if adw_id not in self._allocations:
                 logger.warning(f"[PortPool] Attempted to release {adw_id} but not allocated")
                 return False
 
-            allocation = self._allocations.pop(adw_id)
+            allocation = self._remove(adw_id)
             self._save_allocations()
 
             logger.info(
@@ -150,7 +209,7 @@ class PortPool:
 
         Thread-safe: Yes
         """
-        with self._lock:
+        with self._locked():
             if adw_id in self._allocations:
                 allocation = self._allocations[adw_id]
                 return allocation["backend"], allocation["frontend"]
@@ -165,17 +224,17 @@ class PortPool:
 
         Thread-safe: Yes
         """
-        with self._lock:
+        with self._locked():
             allocated = len(self._allocations)
-            total = 100
-            available = total - allocated
+            total = self.size
+            available = total - self._used.bit_count()
 
             return {
                 "allocated": allocated,
                 "available": available,
                 "total": total,
                 "utilization_percent": (allocated / total) * 100,
-                "allocations": dict(self._allocations)  # Deep copy
+                "allocations": {adw_id: dict(a) for adw_id, a in self._allocations.items()}
             }
 
     def cleanup_stale(self, max_age_hours: int = 24) -> int:
@@ -192,7 +251,7 @@ class PortPool:
 
         Thread-safe: Yes
         """
-        with self._lock:
+        with self._locked():
             from datetime import timedelta
 
             now = datetime.now()
@@ -205,7 +264,7 @@ class PortPool:
                     stale_adw_ids.append(adw_id)
 
             for adw_id in stale_adw_ids:
-                allocation = self._allocations.pop(adw_id)
+                allocation = self._remove(adw_id)
                 logger.warning(
                     f"[PortPool] Cleaned up stale allocation: {adw_id} "
                     f"(allocated {allocation['allocated_at']}, "
@@ -217,42 +276,141 @@ class PortPool:
 
             return len(stale_adw_ids)
 
-    def _load_allocations(self):
-        """Load allocations from persistence file."""
-        if not self.PERSISTENCE_FILE.exists():
-            logger.debug(f"[PortPool] No persistence file found at {self.PERSISTENCE_FILE}")
-            return
+    def reclaim_dead(self) -> int:
+        """
+        Release allocations whose owner process died without leaving a worktree.
 
-        try:
-            with open(self.PERSISTENCE_FILE, 'r') as f:
-                self._allocations = json.load(f)
+        Reservations outlive the process that made them (each ADW phase is a
+        separate process), so a dead owner alone is not enough: the slot is
+        only reclaimed when trees/<adw_id> does not exist either, i.e. the
+        workflow crashed before creating its worktree or after removing it.
+        This also runs automatically when the pool is exhausted.
 
-            logger.info(
-                f"[PortPool] Loaded {len(self._allocations)} allocations from "
-                f"{self.PERSISTENCE_FILE}"
+        Returns:
+            Number of allocations reclaimed
+
+        Thread-safe: Yes
+        """
+        with self._locked():
+            return self._reclaim_dead()
+
+    def _reclaim_dead(self) -> int:
+        dead = [
+            adw_id for adw_id, allocation in self._allocations.items()
+            if allocation.get("pid") and not _pid_alive(allocation["pid"])
+            and not (self._trees_dir / adw_id).exists()
+        ]
+        for adw_id in dead:
+            allocation = self._remove(adw_id)
+            logger.warning(
+                f"[PortPool] Reclaimed ports of {adw_id} from dead process {allocation['pid']}: "
+                f"{allocation['backend']}/{allocation['frontend']}"
             )
-        except Exception as e:
-            logger.error(f"[PortPool] Failed to load allocations: {e}")
+        if dead:
+            self._save_allocations()
+        return len(dead)
+
+    def _first_free_slot(self) -> Optional[int]:
+        """Lowest free slot, from the bitmap."""
+        free = ~self._used & self._full
+        if not free:
+            return None
+        return (free & -free).bit_length() - 1
+
+    def _slot_of(self, allocation: Dict) -> Optional[int]:
+        slot = allocation["backend"] - self.backend_start
+        return slot if 0 <= slot < self.size else None
+
+    def _remove(self, adw_id: str) -> Dict:
+        allocation = self._allocations.pop(adw_id)
+        slot = self._slot_of(allocation)
+        if slot is not None and not any(self._slot_of(a) == slot for a in self._allocations.values()):
+            self._used &= ~(1 << slot)
+        return allocation
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the thread lock and the inter-process file lock, with allocations up to date."""
+        with self._lock:
+            self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_file, "a") as lock_handle:
+                fcntl.flock(lock_handle, fcntl.LOCK_EX)
+                try:
+                    self._load_allocations()
+                    yield
+                finally:
+                    fcntl.flock(lock_handle, fcntl.LOCK_UN)
+
+    def _stat_key(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self._persistence_file.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _load_allocations(self):
+        """Load allocations from persistence file if another process changed it."""
+        key = self._stat_key()
+        if key == self._file_key:
+            return
+        self._file_key = key
+
+        if key is None:
+            logger.debug(f"[PortPool] No persistence file found at {self._persistence_file}")
             self._allocations = {}
+        else:
+            try:
+                with open(self._persistence_file, 'r') as f:
+                    self._allocations = json.load(f)
+
+                logger.debug(
+                    f"[PortPool] Loaded {len(self._allocations)} allocations from "
+                    f"{self._persistence_file}"
+                )
+            except Exception as e:
+                logger.error(f"[PortPool] Failed to load allocations: {e}")
+                self._allocations = {}
+
+        self._used = 0
+        for allocation in self._allocations.values():
+            slot = self._slot_of(allocation)
+            if slot is not None:
+                self._used |= 1 << slot
 
     def _save_allocations(self):
-        """Save allocations to persistence file."""
+        """Save allocations to persistence file (atomically, so readers never see a partial file)."""
         try:
             # Ensure directory exists
-            self.PERSISTENCE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self._persistence_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Write with pretty formatting for debugging
-            with open(self.PERSISTENCE_FILE, 'w') as f:
+            tmp_file = self._persistence_file.with_name(f"{self._persistence_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
                 json.dump(self._allocations, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self._persistence_file)
+            self._file_key = self._stat_key()
 
             logger.debug(
                 f"[PortPool] Saved {len(self._allocations)} allocations to "
-                f"{self.PERSISTENCE_FILE}"
+                f"{self._persistence_file}"
             )
         except Exception as e:
             logger.error(f"[PortPool] Failed to save allocations: {e}")
 
 
+def _pid_alive(pid: int) -> bool:
+    """True if a process with this PID exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    except OSError:
+        return False
+    return True
+
+
 # Singleton instance
 _pool_instance: Optional[PortPool] = None
 _pool_lock = threading.Lock()
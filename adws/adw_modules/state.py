@@ -4,11 +4,14 @@ Provides persistent state management via file storage and
 transient state passing between scripts via stdin/stdout.
 """
 
+import copy
+import fcntl
 import json
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
 from adw_modules.data_types import ADWStateData
 
 
@@ -29,6 +32,8 @@ class ADWState:
         self.adw_id = adw_id
         # Start with minimal state
         self.data: Dict[str, Any] = {"adw_id": self.adw_id}
+        # Data as last read from or written to disk; save() only writes keys that differ
+        self._persisted: Dict[str, Any] = {}
         self.logger = logging.getLogger(__name__)
 
     def update(self, **kwargs):
@@ -101,6 +106,14 @@ class ADWState:
     def save(self, workflow_step: Optional[str] = None) -> None:
         """Save state to file in agents/{adw_id}/adw_state.json.
 
+        Phases of one ADW can run concurrently (see phase_graph), each
+        holding its own copy of the state. Saving merges instead of
+        overwriting: under a file lock, the file is re-read and only the keys
+        this instance changed since it was loaded are applied, then the result
+        is written atomically and becomes this instance's data. Lists and
+        dicts changed on both sides are merged (e.g. two phases appending to
+        all_adws keep both IDs); other values take this instance's change.
+
         IMPORTANT: Does NOT save 'status' or 'current_phase' - these belong in database.
         See docs/adw/state-management-ssot.md for complete SSoT rules.
         """
@@ -152,9 +165,27 @@ class ADWState:
                     continue  # Skip forbidden fields silently
                 save_data[key] = value
 
-        # Save as JSON
-        with open(state_path, "w") as f:
-            json.dump(save_data, f, indent=2)
+        with _file_lock(state_path + ".lock"):
+            merged = self._read_file(state_path) or {}
+            for key, value in save_data.items():
+                changed = key in self.data and (
+                    key not in self._persisted or self.data[key] != self._persisted[key]
+                )
+                if key not in merged:
+                    merged[key] = value
+                elif changed:
+                    merged[key] = _merge_value(self._persisted.get(key, _MISSING), value, merged[key])
+            for key in set(self._persisted) - set(self.data):
+                merged.pop(key, None)
+
+            # Save as JSON (atomic replace: readers never see a partial file)
+            tmp_path = f"{state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(merged, f, indent=2)
+            os.replace(tmp_path, state_path)
+
+        self.data = merged
+        self._persisted = copy.deepcopy(merged)
 
         self.logger.info(f"Saved state to {state_path}")
         if workflow_step:
@@ -185,6 +216,7 @@ class ADWState:
             state = cls(state_data.adw_id)
             # Use full data to preserve extra fields (like external_build_results)
             state.data = data
+            state._persisted = copy.deepcopy(data)
 
             if logger:
                 logger.info(f"🔍 Found existing state from {state_path}")
@@ -196,6 +228,14 @@ class ADWState:
                 logger.error(f"Failed to load state from {state_path}: {e}")
             return None
 
+    @staticmethod
+    def _read_file(state_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(state_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
     @classmethod
     def from_stdin(cls) -> Optional["ADWState"]:
         """Read state from stdin if available (for piped input).
@@ -233,3 +273,50 @@ class ADWState:
             "all_adws": self.data.get("all_adws", []),
         }
         print(json.dumps(output_data, indent=2))
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """Exclusive cross-process lock held for the duration of the block."""
+    with open(lock_path, "a") as lock_handle:
+        fcntl.flock(lock_handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_handle, fcntl.LOCK_UN)
+
+
+_MISSING = object()
+
+
+def _merge_value(base: Any, ours: Any, theirs: Any) -> Any:
+    """Three-way merge of one state value.
+
+    Args:
+        base: Value when this instance loaded or last saved (_MISSING if absent)
+        ours: This instance's value
+        theirs: Value currently on disk
+    """
+    if ours == base:
+        return theirs
+    if theirs == base:
+        return ours
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in list(theirs) + [k for k in ours if k not in theirs]:
+            if key not in ours:
+                if key not in base:
+                    merged[key] = theirs[key]  # Added by the other writer; removed keys are dropped
+            elif key not in theirs:
+                if key not in base or ours[key] != base[key]:
+                    merged[key] = ours[key]
+            else:
+                merged[key] = _merge_value(base.get(key, _MISSING), ours[key], theirs[key])
+        return merged
+    if isinstance(ours, list) and isinstance(theirs, list):
+        base = base if isinstance(base, list) else []
+        removed = [item for item in base if item not in ours]
+        added = [item for item in ours if item not in base and item not in theirs]
+        return [item for item in theirs if item not in removed] + added
+    return ours
@@ -0,0 +1,107 @@
+"""Dependency-ordered concurrent task runner.
+
+Runs a list of named tasks on a thread pool, starting each one as soon as
+the tasks it depends on have succeeded. Used for worktree setup (copies and
+installs), plan execution and SDLC phase graphs.
+
+Usage:
+    failure = run_task_graph([
+        SetupTask("install backend", install_backend),
+        SetupTask("setup database", setup_database, depends_on=("install backend",)),
+    ], logger)
+    if failure:
+        task, error = failure
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SetupTask:
+    """One node of a task graph: a named step and the steps it waits for."""
+
+    name: str
+    run: Callable[[], Tuple[bool, Optional[str]]]
+    depends_on: Tuple[str, ...] = ()
+
+
+def run_task_graph(
+    tasks: List[SetupTask],
+    logger: logging.Logger,
+    max_workers: int = 4
+) -> Optional[Tuple[SetupTask, str]]:
+    """Run tasks concurrently, each as soon as its dependencies have succeeded.
+
+    A failed task skips everything that depends on it, but independent tasks
+    still run to completion so no install is left half-done.
+
+    Args:
+        tasks: Tasks with unique names; depends_on must name other tasks
+        logger: Logger instance
+        max_workers: Maximum tasks running at once
+
+    Returns:
+        (task, error_message) of the first failed task in list order, or None
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    names = {task.name for task in tasks}
+    for task in tasks:
+        unknown = set(task.depends_on) - names
+        if unknown:
+            raise ValueError(f"Task '{task.name}' depends on unknown tasks: {sorted(unknown)}")
+
+    outcomes: Dict[str, Tuple[bool, Optional[str]]] = {}
+    pending = list(tasks)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            progressed = True
+            while progressed:
+                progressed = False
+                for task in list(pending):
+                    deps = [outcomes.get(name) for name in task.depends_on]
+                    if any(outcome is not None and not outcome[0] for outcome in deps):
+                        logger.warning(f"Skipping {task.name}: a dependency failed")
+                        outcomes[task.name] = (False, None)
+                    elif all(outcome is not None for outcome in deps):
+                        running[executor.submit(_run_task, task, logger)] = task
+                    else:
+                        continue
+                    pending.remove(task)
+                    progressed = True
+
+            if not running:
+                if pending:
+                    raise ValueError(f"Task graph has a cycle: {[task.name for task in pending]}")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcomes[running.pop(future).name] = future.result()
+
+    for task in tasks:
+        success, error = outcomes[task.name]
+        if not success and error is not None:
+            return task, error
+    return None
+
+
+def _run_task(task: SetupTask, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
+    started = time.perf_counter()
+    try:
+        success, error = task.run()
+    except Exception as e:
+        success, error = False, str(e)
+    if success:
+        logger.info(f"{task.name} finished in {time.perf_counter() - started:.1f}s")
+    else:
+        error = error or "failed"
+        logger.error(f"{task.name} failed after {time.perf_counter() - started:.1f}s: {error}")
+    return success, error
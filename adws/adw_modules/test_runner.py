@@ -15,11 +15,15 @@ Key Features:
 import json
 import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import os
 
+from adw_modules.phase_result_cache import PhaseResultCache
+from adw_modules.tool_call_tracker import ToolCallTracker
+
 
 @dataclass
 class TestFailure:
@@ -63,19 +67,28 @@ class TestResult:
     failures: List[TestFailure]
     coverage: Optional[Coverage]
     next_steps: List[str]
+    # The runner produced a report with at least one test (see _is_cacheable)
+    tool_reported: bool = field(default=False, compare=False)
 
 
 class TestRunner:
     """Executes tests and returns compact results."""
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        tracker: Optional[ToolCallTracker] = None
+    ):
         """
         Initialize test runner.
 
         Args:
             project_root: Path to project root directory
+            tracker: Optional ToolCallTracker for observability
         """
         self.project_root = Path(project_root)
+        self.tracker = tracker
+        self.cache = PhaseResultCache(self.project_root, tracker=tracker)
 
     def run_pytest(
         self,
@@ -96,6 +109,25 @@ class TestRunner:
         Returns:
             TestResult with failures only
         """
+        params = {
+            "test_path": test_path,
+            "coverage_threshold": coverage_threshold,
+            "fail_fast": fail_fast,
+            "verbose": verbose
+        }
+        return self.cache.cached(
+            "pytest", params, lambda: self._run_pytest(test_path, coverage_threshold, fail_fast, verbose),
+            result_to_dict, result_from_dict, cacheable=_is_cacheable
+        )
+
+    def _run_pytest(
+        self,
+        test_path: Optional[str],
+        coverage_threshold: float,
+        fail_fast: bool,
+        verbose: bool
+    ) -> TestResult:
+        """Run pytest (uncached)."""
         # Build pytest command
         pytest_path = self.project_root / "app" / "server"
         cmd = ["uv", "run", "pytest"]
@@ -124,6 +156,7 @@ class TestRunner:
             env = os.environ.copy()
             env['PYTHONPATH'] = str(self.project_root)
 
+            started = time.time()
             result = subprocess.run(
                 cmd,
                 cwd=pytest_path,
@@ -150,6 +183,9 @@ class TestRunner:
         # Parse JSON report
         failures = []
         summary = TestSummary(total=0, passed=0, failed=0)
+        # A report left by an earlier run must not count as this run's
+        # (1s slack for coarse filesystem timestamps)
+        report_produced = json_report_path.exists() and json_report_path.stat().st_mtime >= started - 1
 
         if json_report_path.exists():
             with open(json_report_path) as f:
@@ -245,7 +281,8 @@ class TestRunner:
             summary=summary,
             failures=failures,
             coverage=coverage,
-            next_steps=next_steps if next_steps else ["All tests passed!"]
+            next_steps=next_steps if next_steps else ["All tests passed!"],
+            tool_reported=_tool_reported(result.returncode, report_produced, summary)
         )
 
     def run_vitest(
@@ -265,6 +302,19 @@ class TestRunner:
         Returns:
             TestResult with failures only
         """
+        params = {"test_path": test_path, "coverage_threshold": coverage_threshold, "fail_fast": fail_fast}
+        return self.cache.cached(
+            "vitest", params, lambda: self._run_vitest(test_path, coverage_threshold, fail_fast),
+            result_to_dict, result_from_dict, cacheable=_is_cacheable
+        )
+
+    def _run_vitest(
+        self,
+        test_path: Optional[str],
+        coverage_threshold: float,
+        fail_fast: bool
+    ) -> TestResult:
+        """Run vitest (uncached)."""
         # Build vitest command
         vitest_path = self.project_root / "app" / "client"
         json_report_path = vitest_path / ".vitest_report.json"
@@ -312,10 +362,12 @@ class TestRunner:
         # Parse vitest output
         failures = []
         summary = TestSummary(total=0, passed=0, failed=0)
+        report_produced = False
 
         try:
             # Parse JSON output
             report = json.loads(output)
+            report_produced = isinstance(report, dict)
 
             # Vitest JSON format: {testResults: [...], numTotalTests, numPassedTests, numFailedTests}
             summary = TestSummary(
@@ -366,7 +418,8 @@ class TestRunner:
             summary=summary,
             failures=failures,
             coverage=coverage,
-            next_steps=next_steps if next_steps else ["All tests passed!"]
+            next_steps=next_steps if next_steps else ["All tests passed!"],
+            tool_reported=_tool_reported(result.returncode, report_produced, summary)
         )
 
     def run_all(
@@ -418,6 +471,41 @@ def result_to_dict(result: TestResult) -> Dict[str, Any]:
     }
 
 
+def result_from_dict(data: Dict[str, Any]) -> TestResult:
+    """
+    Rebuild a TestResult from result_to_dict output.
+
+    Args:
+        data: Dictionary representation
+
+    Returns:
+        TestResult object
+    """
+    return TestResult(
+        success=data["success"],
+        summary=TestSummary(**data["summary"]),
+        failures=[TestFailure(**f) for f in data["failures"]],
+        coverage=Coverage(**data["coverage"]) if data["coverage"] else None,
+        next_steps=data["next_steps"]
+    )
+
+
+def _tool_reported(returncode: int, report_produced: bool, summary: TestSummary) -> bool:
+    """Whether the test runner actually ran tests and reported on them.
+
+    pytest and vitest exit 0 (all passed) or 1 (some failed) after a real
+    run. Anything else, a missing report (e.g. --json-report unavailable,
+    broken .venv) or zero collected tests leaves success=True without
+    anything having been tested.
+    """
+    return returncode in (0, 1) and report_produced and summary.total > 0
+
+
+def _is_cacheable(result: TestResult) -> bool:
+    """Only passing runs that really ran tests are reused; a failure may be flaky and deserves a rerun on retry."""
+    return result.success and result.tool_reported
+
+
 # Example usage
 if __name__ == "__main__":
     import sys
@@ -214,6 +214,27 @@ class ToolCallTracker:
             capture_result=True,
         )
 
+    def record_cache_lookup(self, check: str, hit: bool, key: str) -> None:
+        """
+        Record a phase result cache lookup as a zero-duration tool call.
+
+        Args:
+            check: Check name (e.g., "ruff", "pytest")
+            hit: Whether a stored result was reused
+            key: Short cache key, for correlating runs
+        """
+        now = datetime.now().isoformat()
+        self.tool_calls.append({
+            "tool_name": "phase_result_cache",
+            "started_at": now,
+            "completed_at": now,
+            "duration_ms": 0,
+            "success": True,
+            "error_message": None,
+            "parameters": {"check": check, "key": key},
+            "result_summary": "hit" if hit else "miss",
+        })
+
     def get_summary(self) -> dict:
         """
         Get summary of all tracked tool calls.
@@ -226,12 +247,16 @@ class ToolCallTracker:
         failed_calls = total_calls - successful_calls
         total_duration_ms = sum(tc["duration_ms"] for tc in self.tool_calls)
 
+        cache_lookups = [tc for tc in self.tool_calls if tc["tool_name"] == "phase_result_cache"]
+
         return {
             "total_calls": total_calls,
             "successful_calls": successful_calls,
             "failed_calls": failed_calls,
             "total_duration_ms": total_duration_ms,
             "tools_used": list({tc["tool_name"] for tc in self.tool_calls}),
+            "cache_lookups": len(cache_lookups),
+            "cache_hits": sum(1 for tc in cache_lookups if tc["result_summary"] == "hit"),
         }
 
     def __enter__(self):
@@ -272,6 +297,13 @@ class ToolCallTracker:
             phase_status = "completed"
             error_message = None
 
+        log_message = f"{self.phase_name} phase tracked {summary['total_calls']} tool calls"
+        if summary["cache_lookups"]:
+            log_message += (
+                f", phase result cache {summary['cache_hits']}/{summary['cache_lookups']} hits "
+                f"({summary['cache_hits'] / summary['cache_lookups']:.0%})"
+            )
+
         # Log to observability system
         try:
             log_task_completion(
@@ -280,7 +312,7 @@ class ToolCallTracker:
                 phase_name=self.phase_name,
                 phase_number=self.phase_number,
                 phase_status=phase_status,
-                log_message=f"{self.phase_name} phase tracked {summary['total_calls']} tool calls",
+                log_message=log_message,
                 workflow_template=self.workflow_template,
                 error_message=error_message,
                 started_at=self._phase_start_time,
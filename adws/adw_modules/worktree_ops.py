@@ -11,6 +11,7 @@ import socket
 from typing import Tuple, Optional, TYPE_CHECKING
 from adw_modules.state import ADWState
 from adw_modules.port_pool import get_port_pool
+from adw_modules.worktree_pool import lease_worktree
 
 if TYPE_CHECKING:
     from adw_modules.tool_call_tracker import ToolCallTracker
@@ -18,6 +19,9 @@ if TYPE_CHECKING:
 
 def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger, tracker: Optional["ToolCallTracker"] = None) -> Tuple[str, Optional[str]]:
     """Create a git worktree for isolated ADW execution.
+
+    Takes a pre-installed worktree from the warm pool when one is ready and
+    falls back to git worktree add otherwise.
     
     Args:
         adw_id: The ADW ID for this worktree
@@ -44,6 +48,11 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger, track
     if os.path.exists(worktree_path):
         logger.warning(f"Worktree already exists at {worktree_path}")
         return worktree_path, None
+
+    # Prefer a warm worktree (dependencies already installed)
+    leased_path, error = lease_worktree(adw_id, branch_name, logger, tracker)
+    if leased_path or error:
+        return leased_path, error
     
     # First, fetch latest changes from origin
     logger.info("Fetching latest changes from origin")
@@ -232,7 +241,8 @@ def get_ports_for_adw(adw_id: str) -> Tuple[int, int]:
     """Reserve ports from the port pool for an ADW workflow.
 
     Uses the PortPool reservation system to allocate unique backend/frontend
-    port pairs. Supports up to 100 concurrent workflows.
+    port pairs. Supports up to ADW_PORT_POOL_SIZE (default 100) concurrent
+    workflows, shared safely across ADW processes.
 
     Args:
         adw_id: The ADW ID
@@ -241,7 +251,7 @@ def get_ports_for_adw(adw_id: str) -> Tuple[int, int]:
         Tuple of (backend_port, frontend_port)
 
     Raises:
-        RuntimeError: If port pool is exhausted (all 100 slots allocated)
+        RuntimeError: If port pool is exhausted (all slots allocated and none reclaimable)
     """
     pool = get_port_pool()
     return pool.reserve(adw_id)
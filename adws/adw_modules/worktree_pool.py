@@ -0,0 +1,309 @@
+"""Warm worktree pool for fast ADW startup.
+
+Creating a worktree and installing its dependencies takes minutes, all of it
+before the first agent call. The pool keeps a few worktrees on origin/main
+with dependencies already installed, so a new ADW only has to rename one and
+check out its branch.
+
+Layout:
+- Warm worktrees: trees/.warm/warm-<id> (detached HEAD at origin/main)
+- Markers: trees/.warm/warm-<id>.ready once installed, warm-<id>.filling
+  (containing the filling process PID) while being prepared
+- Lock: trees/.warm/.lock (fcntl) around leasing and marker bookkeeping
+
+Pool size comes from ADW_WARM_POOL_SIZE (default 0, so the pool is opt-in).
+Each warm worktree is a full checkout with its own .venv and node_modules, and
+every lease triggers a background refill (python -m adw_modules.worktree_pool
+fill) that runs `git worktree add` and both installs, so size it to the disk
+and CPU the host can spare.
+
+Usage:
+    from adw_modules.worktree_pool import lease_worktree
+
+    worktree_path, error = lease_worktree(adw_id, branch_name, logger)
+    if worktree_path is None and error is None:
+        ...  # pool empty, create the worktree normally
+"""
+
+import fcntl
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from adw_modules.worktree_setup import install_dependencies
+
+if TYPE_CHECKING:
+    from adw_modules.tool_call_tracker import ToolCallTracker
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TREES_DIR = os.path.join(PROJECT_ROOT, "trees")
+WARM_DIR = os.path.join(TREES_DIR, ".warm")
+
+DEFAULT_POOL_SIZE = 0
+READY_SUFFIX = ".ready"
+FILLING_SUFFIX = ".filling"
+
+
+def get_pool_size() -> int:
+    """Configured number of warm worktrees (0 disables the pool)."""
+    try:
+        return max(0, int(os.getenv("ADW_WARM_POOL_SIZE", DEFAULT_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def lease_worktree(
+    adw_id: str,
+    branch_name: str,
+    logger: logging.Logger,
+    tracker: Optional["ToolCallTracker"] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """Take a warm worktree for an ADW and check out a fresh branch in it.
+
+    The warm worktree is moved to trees/<adw_id>, updated to the latest
+    origin/main and switched to branch_name. Installed dependencies (ignored
+    by git) are kept. A background refill is requested afterwards.
+
+    Args:
+        adw_id: The ADW ID for this worktree
+        branch_name: The branch name to create in the worktree
+        logger: Logger instance
+        tracker: Optional ToolCallTracker for recording subprocess calls
+
+    Returns:
+        Tuple of (worktree_path, error_message). Both are None when the pool
+        is disabled or has no ready worktree.
+    """
+    if get_pool_size() == 0:
+        return None, None
+
+    worktree_path = os.path.join(TREES_DIR, adw_id)
+    leased = None
+
+    with _pool_lock():
+        for name in _ready_names():
+            os.remove(os.path.join(WARM_DIR, name + READY_SUFFIX))
+            result = _git(
+                ["worktree", "move", os.path.join(WARM_DIR, name), worktree_path],
+                PROJECT_ROOT, tracker, "git_worktree_move"
+            )
+            if result.returncode == 0:
+                leased = name
+                break
+            logger.warning(f"Discarding warm worktree {name}: {result.stderr.strip()}")
+            _discard(name)
+
+    request_refill(logger)
+
+    if leased is None:
+        logger.info("No warm worktree available, creating one from scratch")
+        return None, None
+
+    logger.info(f"Leased warm worktree {leased} for {adw_id}")
+
+    fetch_result = _git(["fetch", "origin"], worktree_path, tracker, "git_fetch")
+    if fetch_result.returncode != 0:
+        logger.warning(f"Failed to fetch from origin: {fetch_result.stderr}")
+
+    result = _git(["checkout", "-b", branch_name, "origin/main"], worktree_path, tracker, "git_checkout_branch")
+    if result.returncode != 0 and "already exists" in result.stderr:
+        result = _git(["checkout", branch_name], worktree_path, tracker, "git_checkout_branch_retry")
+    if result.returncode != 0:
+        error_msg = f"Failed to check out {branch_name} in leased worktree: {result.stderr}"
+        logger.error(error_msg)
+        return None, error_msg
+
+    # Drop untracked leftovers; ignored files (.venv, node_modules) stay
+    _git(["clean", "-fd"], worktree_path, tracker, "git_clean")
+
+    logger.info(f"Created worktree at {worktree_path} for branch {branch_name} (warm pool)")
+    return worktree_path, None
+
+
+def fill_pool(logger: logging.Logger, size: Optional[int] = None) -> int:
+    """Create and install warm worktrees until the pool is full.
+
+    Concurrent fills coordinate through the .filling markers, so running this
+    from several processes never overshoots the pool size.
+
+    Args:
+        logger: Logger instance
+        size: Target pool size (default: ADW_WARM_POOL_SIZE)
+
+    Returns:
+        Number of warm worktrees added
+    """
+    size = get_pool_size() if size is None else size
+    os.makedirs(WARM_DIR, exist_ok=True)
+
+    with _pool_lock():
+        _remove_abandoned(logger)
+        missing = size - len(_ready_names()) - len(_filling_names())
+        names = [f"warm-{uuid.uuid4().hex[:8]}" for _ in range(max(0, missing))]
+        for name in names:
+            with open(os.path.join(WARM_DIR, name + FILLING_SUFFIX), "w") as f:
+                f.write(str(os.getpid()))
+
+    if not names:
+        return 0
+
+    fetch_result = _git(["fetch", "origin"], PROJECT_ROOT)
+    if fetch_result.returncode != 0:
+        logger.warning(f"Failed to fetch from origin: {fetch_result.stderr}")
+
+    added = 0
+    for name in names:
+        path = os.path.join(WARM_DIR, name)
+        result = _git(["worktree", "add", "--detach", path, "origin/main"], PROJECT_ROOT)
+        success, error = (result.returncode == 0, result.stderr)
+        if success:
+            success, error = install_dependencies(path, logger, parent_repo=PROJECT_ROOT)
+
+        with _pool_lock():
+            os.remove(os.path.join(WARM_DIR, name + FILLING_SUFFIX))
+            if success:
+                open(os.path.join(WARM_DIR, name + READY_SUFFIX), "w").close()
+                added += 1
+                logger.info(f"Warm worktree ready: {path}")
+            else:
+                logger.error(f"Failed to prepare warm worktree {name}: {error}")
+                _discard(name)
+
+    return added
+
+
+def drain_pool(logger: logging.Logger) -> int:
+    """Remove all ready warm worktrees.
+
+    Returns:
+        Number of warm worktrees removed
+    """
+    with _pool_lock():
+        names = _ready_names()
+        for name in names:
+            os.remove(os.path.join(WARM_DIR, name + READY_SUFFIX))
+            _discard(name)
+            logger.info(f"Removed warm worktree {name}")
+    return len(names)
+
+
+def request_refill(logger: Optional[logging.Logger] = None) -> None:
+    """Start a detached background process that refills the pool."""
+    if get_pool_size() == 0:
+        return
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "adw_modules.worktree_pool", "fill"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # Outlive the ADW phase that leased
+        )
+    except OSError as e:
+        if logger:
+            logger.warning(f"Could not start warm pool refill: {e}")
+
+
+def _ready_names() -> List[str]:
+    return _marker_names(READY_SUFFIX)
+
+
+def _filling_names() -> List[str]:
+    return _marker_names(FILLING_SUFFIX)
+
+
+def _marker_names(suffix: str) -> List[str]:
+    """Warm worktree names with the given marker, oldest first."""
+    try:
+        entries = [e for e in os.scandir(WARM_DIR) if e.name.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    return [e.name[: -len(suffix)] for e in entries]
+
+
+def _remove_abandoned(logger: logging.Logger) -> None:
+    """Remove worktrees whose filling process died and unmarked leftovers. Call with the lock held."""
+    for name in _filling_names():
+        marker = os.path.join(WARM_DIR, name + FILLING_SUFFIX)
+        try:
+            with open(marker) as f:
+                pid = int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            pid = 0
+        if pid and _pid_alive(pid):
+            continue
+        logger.warning(f"Removing abandoned warm worktree {name}")
+        os.remove(marker)
+        _discard(name)
+
+    known = set(_ready_names()) | set(_filling_names())
+    for entry in os.scandir(WARM_DIR):
+        if entry.is_dir() and entry.name not in known:
+            _discard(entry.name)
+
+
+def _discard(name: str) -> None:
+    path = os.path.join(WARM_DIR, name)
+    _git(["worktree", "remove", "--force", path], PROJECT_ROOT)
+    shutil.rmtree(path, ignore_errors=True)
+    _git(["worktree", "prune"], PROJECT_ROOT)
+
+
+@contextmanager
+def _pool_lock() -> Iterator[None]:
+    os.makedirs(WARM_DIR, exist_ok=True)
+    with open(os.path.join(WARM_DIR, ".lock"), "a") as lock_handle:
+        fcntl.flock(lock_handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_handle, fcntl.LOCK_UN)
+
+
+def _git(
+    args: List[str],
+    cwd: str,
+    tracker: Optional["ToolCallTracker"] = None,
+    tool_name: str = "git"
+) -> subprocess.CompletedProcess:
+    cmd = ["git"] + args
+    if tracker:
+        return tracker.track_bash(tool_name=tool_name, command=cmd, cwd=cwd)
+    return subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the warm ADW worktree pool")
+    parser.add_argument("command", choices=["fill", "drain", "status"])
+    parser.add_argument("--size", type=int, default=None, help="Target pool size for fill")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    pool_logger = logging.getLogger("worktree_pool")
+
+    if args.command == "fill":
+        print(f"Added {fill_pool(pool_logger, args.size)} warm worktrees")
+    elif args.command == "drain":
+        print(f"Removed {drain_pool(pool_logger)} warm worktrees")
+    else:
+        print(f"Ready: {len(_ready_names())}, filling: {len(_filling_names())}, target: {get_pool_size()}")
@@ -11,6 +11,9 @@ import json
 import shutil
 from typing import Tuple, Optional, Dict, Any
 
+from adw_modules.dependency_cache import cached_install
+from adw_modules.task_graph import SetupTask, run_task_graph
+
 
 def setup_worktree_complete(
     worktree_path: str,
@@ -23,13 +26,16 @@ def setup_worktree_complete(
     This replaces the /install_worktree slash command with deterministic Python operations.
     Performs all setup steps without requiring AI calls.
 
-    Steps:
+    Steps (run as a task graph, independent steps concurrently):
     1. Create .ports.env file
-    2. Copy and merge .env files from parent repo
+    2. Copy and merge .env files from parent repo (after 1)
     3. Copy and configure MCP files with absolute paths
     4. Install backend dependencies (uv sync)
     5. Install frontend dependencies (bun install)
-    6. Setup database (reset_db.sh)
+    6. Setup database (reset_db.sh, after 4)
+
+    Installs are skipped or restored from the dependency cache when the
+    lockfiles match a previous install or the parent repo.
 
     Args:
         worktree_path: Absolute path to the worktree directory
@@ -43,48 +49,39 @@ def setup_worktree_complete(
     try:
         # Get parent repo path (one level up from trees/<adw_id>)
         parent_repo = os.path.dirname(os.path.dirname(worktree_path))
+        ports_env_path = os.path.join(worktree_path, ".ports.env")
 
         logger.info(f"Setting up worktree at {worktree_path}")
         logger.info(f"Ports: Backend={backend_port}, Frontend={frontend_port}")
 
-        # Step 1: Create .ports.env file
-        logger.info("Step 1: Creating .ports.env file")
-        ports_env_path = os.path.join(worktree_path, ".ports.env")
-        with open(ports_env_path, "w") as f:
-            f.write(f"BACKEND_PORT={backend_port}\n")
-            f.write(f"FRONTEND_PORT={frontend_port}\n")
-            f.write(f"VITE_BACKEND_URL=http://localhost:{backend_port}\n")
-        logger.info(f"Created {ports_env_path}")
-
-        # Step 2: Copy and merge .env files
-        logger.info("Step 2: Setting up .env files")
-        success, error = _setup_env_files(worktree_path, parent_repo, ports_env_path, logger)
-        if not success:
-            return False, f"Failed to setup .env files: {error}"
-
-        # Step 3: Copy and configure MCP files
-        logger.info("Step 3: Configuring MCP files")
-        success, error = _setup_mcp_files(worktree_path, parent_repo, logger)
-        if not success:
-            return False, f"Failed to setup MCP files: {error}"
-
-        # Step 4: Install backend dependencies
-        logger.info("Step 4: Installing backend dependencies")
-        success, error = _install_backend(worktree_path, logger)
-        if not success:
-            return False, f"Failed to install backend: {error}"
-
-        # Step 5: Install frontend dependencies
-        logger.info("Step 5: Installing frontend dependencies")
-        success, error = _install_frontend(worktree_path, logger)
-        if not success:
-            return False, f"Failed to install frontend: {error}"
-
-        # Step 6: Setup database
-        logger.info("Step 6: Setting up database")
-        success, error = _setup_database(worktree_path, logger)
-        if not success:
-            return False, f"Failed to setup database: {error}"
+        def create_ports_env() -> Tuple[bool, Optional[str]]:
+            with open(ports_env_path, "w") as f:
+                f.write(f"BACKEND_PORT={backend_port}\n")
+                f.write(f"FRONTEND_PORT={frontend_port}\n")
+                f.write(f"VITE_BACKEND_URL=http://localhost:{backend_port}\n")
+            logger.info(f"Created {ports_env_path}")
+            return True, None
+
+        failure = run_task_graph([
+            SetupTask("create .ports.env", create_ports_env),
+            SetupTask(
+                "setup .env files",
+                lambda: _setup_env_files(worktree_path, parent_repo, ports_env_path, logger),
+                depends_on=("create .ports.env",)
+            ),
+            SetupTask("setup MCP files", lambda: _setup_mcp_files(worktree_path, parent_repo, logger)),
+            SetupTask("install backend", lambda: _install_backend(worktree_path, logger, parent_repo)),
+            SetupTask("install frontend", lambda: _install_frontend(worktree_path, logger, parent_repo)),
+            SetupTask(
+                "setup database",
+                lambda: _setup_database(worktree_path, logger),
+                depends_on=("install backend",)
+            ),
+        ], logger)
+
+        if failure:
+            task, error = failure
+            return False, f"Failed to {task.name}: {error}"
 
         logger.info("✅ Worktree setup complete")
         return True, None
@@ -243,66 +240,112 @@ def _setup_mcp_files(
     return True, None
 
 
+def install_dependencies(
+    worktree_path: str,
+    logger: logging.Logger,
+    parent_repo: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Install backend and frontend dependencies into a worktree concurrently.
+
+    Used by the warm worktree pool to prepare worktrees ahead of time.
+
+    Args:
+        worktree_path: Worktree directory path
+        logger: Logger instance
+        parent_repo: Repo whose installed trees may be reused
+
+    Returns:
+        Tuple of (success, error_message)
+    """
+    failure = run_task_graph([
+        SetupTask("install backend", lambda: _install_backend(worktree_path, logger, parent_repo)),
+        SetupTask("install frontend", lambda: _install_frontend(worktree_path, logger, parent_repo)),
+    ], logger)
+    if failure:
+        return False, failure[1]
+    return True, None
+
+
 def _install_backend(
     worktree_path: str,
-    logger: logging.Logger
+    logger: logging.Logger,
+    parent_repo: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Install backend dependencies using uv.
 
+    Skipped or restored from the dependency cache when uv.lock matches a
+    known install; uv itself hardlinks packages from its own cache.
+
     Args:
         worktree_path: Worktree directory path
         logger: Logger instance
+        parent_repo: Repo whose .venv may be reused
 
     Returns:
         Tuple of (success, error_message)
     """
     backend_path = os.path.join(worktree_path, "app", "server")
 
-    result = subprocess.run(
-        ["uv", "sync", "--all-extras"],
-        cwd=backend_path,
-        capture_output=True,
-        text=True
-    )
+    def uv_sync() -> Tuple[bool, Optional[str]]:
+        env = os.environ.copy()
+        env.setdefault("UV_LINK_MODE", "hardlink")
 
-    if result.returncode != 0:
-        error_msg = f"Backend install failed: {result.stderr}"
-        logger.error(error_msg)
-        return False, error_msg
+        result = subprocess.run(
+            ["uv", "sync", "--all-extras"],
+            cwd=backend_path,
+            capture_output=True,
+            text=True,
+            env=env
+        )
 
-    logger.info("Backend dependencies installed successfully")
-    return True, None
+        if result.returncode != 0:
+            error_msg = f"Backend install failed: {result.stderr}"
+            logger.error(error_msg)
+            return False, error_msg
+
+        logger.info("Backend dependencies installed successfully")
+        return True, None
+
+    return cached_install("backend", worktree_path, uv_sync, logger, parent_repo)
 
 
 def _install_frontend(
     worktree_path: str,
-    logger: logging.Logger
+    logger: logging.Logger,
+    parent_repo: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Install frontend dependencies using bun.
 
+    Skipped or restored from the dependency cache when the lockfiles match
+    a known install.
+
     Args:
         worktree_path: Worktree directory path
         logger: Logger instance
+        parent_repo: Repo whose node_modules may be reused
 
     Returns:
         Tuple of (success, error_message)
     """
     frontend_path = os.path.join(worktree_path, "app", "client")
 
-    result = subprocess.run(
-        ["bun", "install"],
-        cwd=frontend_path,
-        capture_output=True,
-        text=True
-    )
+    def bun_install() -> Tuple[bool, Optional[str]]:
+        result = subprocess.run(
+            ["bun", "install"],
+            cwd=frontend_path,
+            capture_output=True,
+            text=True
+        )
 
-    if result.returncode != 0:
-        error_msg = f"Frontend install failed: {result.stderr}"
-        logger.error(error_msg)
-        return False, error_msg
+        if result.returncode != 0:
+            error_msg = f"Frontend install failed: {result.stderr}"
+            logger.error(error_msg)
+            return False, error_msg
 
-    logger.info("Frontend dependencies installed successfully")
-    return True, None
+        logger.info("Frontend dependencies installed successfully")
+        return True, None
+
+    return cached_install("frontend", worktree_path, bun_install, logger, parent_repo)
 
 
 def _setup_database(
@@ -28,6 +28,7 @@ import json
 import logging
 import os
 import sys
+import time
 from datetime import datetime
 
 from adw_modules.data_types import GitHubIssue
@@ -217,6 +218,7 @@ def main():
     # Create ToolCallTracker context for Plan phase
     with ToolCallTracker(adw_id=adw_id, issue_number=int(issue_number), phase_name="Plan") as tracker:
         # Create worktree if it doesn't exist
+        worktree_started = time.perf_counter()
         if not valid:
             logger.info(f"Creating worktree for {adw_id}")
             worktree_path, error = create_worktree(adw_id, branch_name, logger, tracker)
@@ -246,11 +248,16 @@ def main():
 
             logger.info("✅ Worktree environment setup complete (deterministic Python)")
 
+        # Time from here to the first agent call in the worktree (build_plan)
+        worktree_seconds = time.perf_counter() - worktree_started
+        logger.info(f"Worktree ready in {worktree_seconds:.1f}s")
+
         # Post worktree info comment (non-critical)
         safe_comment(
             issue_number,
             format_issue_message(adw_id, "ops", f"✅ Working in isolated worktree: {worktree_path}\n"
-                               f"🔌 Ports - Backend: {backend_port}, Frontend: {frontend_port}"),
+                               f"🔌 Ports - Backend: {backend_port}, Frontend: {frontend_port}\n"
+                               f"⏱️ Worktree ready in {worktree_seconds:.1f}s"),
             logger
         )
 
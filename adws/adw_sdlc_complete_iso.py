@@ -31,11 +31,16 @@ Flags:
 
 The scripts are chained together via persistent state (adw_state.json).
 Each phase runs in its own git worktree with dedicated ports.
+
+Lint and Test (phases 4-5) run as a phase graph (adw_modules/phase_graph.py)
+with per-phase resource limits. Test depends on Lint: lint commits its
+auto-fixes to the worktree the tests run in.
 """
 
 import subprocess
 import sys
 import os
+import time
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -48,11 +53,16 @@ from adw_modules.state import ADWState
 from adw_modules.preflight_checks import run_all_preflight_checks
 from adw_modules.rate_limit import RateLimitError
 from adw_modules.phase_tracker import PhaseTracker
+from adw_modules.phase_graph import GraphPhase, PhaseLimits, run_phase_graph
+from utils.idempotency import is_phase_complete
 
 # Circuit breaker: Detect repetitive patterns indicating a loop
 MAX_RECENT_COMMENTS_TO_CHECK = 20  # Look at last N comments
 MAX_LOOP_MARKERS = 12  # If 🔁 appears 12+ times in recent comments = stuck loop (workflow-wide catch-all)
 
+# Quality gates run after Build as a phase graph (see adw_modules/phase_graph.py)
+GATE_NUMBERS = {"Lint": 4, "Test": 5}
+
 
 def check_for_loop(issue_number: str, logger, adw_id: str = None) -> None:
     """
@@ -122,7 +132,8 @@ def run_phase_with_retry(
     adw_id: str,
     logger,
     max_retries: int = 2,
-    critical: bool = True
+    critical: bool = True,
+    exit_on_failure: bool = True
 ) -> int:
     """
     Run a phase with automatic retry on crash (leveraging idempotency).
@@ -135,12 +146,16 @@ def run_phase_with_retry(
         logger: Logger instance
         max_retries: Maximum number of retry attempts (default: 2)
         critical: If True, fail the workflow on error; if False, log warning and continue
+        exit_on_failure: If False, a failed critical phase returns its exit code
+            instead of cleaning up and exiting (for phases run concurrently,
+            where the caller fails the workflow once all of them are done)
 
     Returns:
         Exit code of the phase (0 = success)
     """
     logger.info(f"Running {phase_name} phase with up to {max_retries} retries")
 
+    exit_code = 1  # Reported if every attempt crashes before the phase exits
     for attempt in range(max_retries + 1):  # +1 to include initial attempt
         try:
             logger.info(f"{'='*60}")
@@ -189,7 +204,9 @@ def run_phase_with_retry(
             else:
                 logger.error(f"{phase_name} phase crashed after {max_retries + 1} attempts")
 
-                if critical:
+                if critical and not exit_on_failure:
+                    return exit_code
+                elif critical:
                     # For critical phases, fail the workflow
                     cleanup_failed_workflow(
                         adw_id=adw_id,
@@ -208,7 +225,10 @@ def run_phase_with_retry(
                     return exit_code
 
     # If we get here, all retries failed
-    if critical:
+    if critical and not exit_on_failure:
+        logger.error(f"{phase_name} phase failed after all retries")
+        return exit_code
+    elif critical:
         logger.error(f"{phase_name} phase failed after all retries")
         cleanup_failed_workflow(
             adw_id=adw_id,
@@ -228,6 +248,8 @@ def run_phase_with_retry(
 
 def main():
     """Main entry point."""
+    workflow_started = time.perf_counter()
+
     # Check for flags
     skip_e2e = "--skip-e2e" in sys.argv
     skip_resolution = "--skip-resolution" in sys.argv
@@ -581,89 +603,93 @@ def main():
         logger.info("✅ Build phase marked as completed")
 
     # ========================================
-    # PHASE 4: LINT
+    # PHASES 4-5: LINT + TEST (quality gates)
     # ========================================
-    if phase_tracker.should_skip_phase("Lint", resume_mode):
-        print(f"\n{'='*60}")
-        print(f"PHASE 4/10: LINT - ⏭️  SKIPPED (already completed)")
-        print(f"{'='*60}")
-        logger.info("Skipping Lint phase (already completed)")
-    else:
+    # Lint rewrites and commits files (ruff/eslint --fix) and Test's resolver
+    # edits and commits too, so Test waits for Lint rather than racing it.
+    lint_cmd = [
+        "uv",
+        "run",
+        os.path.join(script_dir, "adw_lint_iso.py"),
+        issue_number,
+        adw_id,
+    ]
+    test_cmd = [
+        "uv",
+        "run",
+        os.path.join(script_dir, "adw_test_iso.py"),
+        issue_number,
+        adw_id,
+        "--skip-e2e",  # Always skip E2E in SDLC workflows
+    ]
+    if not use_external:
+        lint_cmd.append("--no-external")
+        test_cmd.append("--no-external")
+
+    quality_gates = [
+        GraphPhase("Lint", lint_cmd, limits=PhaseLimits.from_env("Lint")),
+        GraphPhase("Test", test_cmd, depends_on=("Lint",), limits=PhaseLimits.from_env("Test")),
+    ]
+
+    def gate_already_complete(phase: GraphPhase) -> bool:
+        if phase_tracker.should_skip_phase(phase.name, resume_mode):
+            print(f"PHASE {GATE_NUMBERS[phase.name]}/10: {phase.name.upper()} - ⏭️  SKIPPED (already completed)")
+            return True
+        if is_phase_complete(phase.name.lower(), int(issue_number), logger):
+            print(f"PHASE {GATE_NUMBERS[phase.name]}/10: {phase.name.upper()} - ⏭️  SKIPPED (outputs already valid)")
+            return True
+        return False
+
+    def gate_started(phase: GraphPhase) -> None:
         # Event-driven broadcast - immediate WebSocket notification (0ms latency)
-        broadcast_phase_update(adw_id, "Lint", "running", logger=logger)
-        phase_tracker.set_current_phase("Lint")
-
-        lint_cmd = [
-            "uv",
-            "run",
-            os.path.join(script_dir, "adw_lint_iso.py"),
-            issue_number,
-            adw_id,
-        ]
-        if not use_external:
-            lint_cmd.append("--no-external")
-
+        broadcast_phase_update(adw_id, phase.name, "running", logger=logger)
+        phase_tracker.set_current_phase(phase.name)
         print(f"\n{'='*60}")
-        print(f"PHASE 4/10: LINT")
+        print(f"PHASE {GATE_NUMBERS[phase.name]}/10: {phase.name.upper()}")
         print(f"{'='*60}")
-        logger.info(f"Starting PHASE 4: LINT with command: {' '.join(lint_cmd)}")
 
-        exit_code = run_phase_with_retry(
-            cmd=lint_cmd,
-            phase_name="Lint",
+    def run_gate(phase: GraphPhase) -> int:
+        return run_phase_with_retry(
+            cmd=phase.command(),
+            phase_name=phase.name,
             issue_number=issue_number,
             adw_id=adw_id,
             logger=logger,
-            max_retries=2,  # Allow 2 retries (3 total attempts)
-            critical=True   # Fail workflow if all retries fail
+            max_retries=phase.max_retries,
+            critical=phase.critical,
+            exit_on_failure=False  # Reported through the gate report; fail below
         )
 
-        # Mark phase as completed
-        phase_tracker.mark_phase_completed("Lint")
-        logger.info("✅ Lint phase marked as completed")
-
-    # ========================================
-    # PHASE 5: TEST
-    # ========================================
-    if phase_tracker.should_skip_phase("Test", resume_mode):
-        print(f"\n{'='*60}")
-        print(f"PHASE 5/10: TEST - ⏭️  SKIPPED (already completed)")
-        print(f"{'='*60}")
-        logger.info("Skipping Test phase (already completed)")
-    else:
-        # Event-driven broadcast - immediate WebSocket notification (0ms latency)
-        broadcast_phase_update(adw_id, "Test", "running", logger=logger)
-        phase_tracker.set_current_phase("Test")
-
-        test_cmd = [
-            "uv",
-            "run",
-            os.path.join(script_dir, "adw_test_iso.py"),
-            issue_number,
-            adw_id,
-            "--skip-e2e",  # Always skip E2E in SDLC workflows
-        ]
-        if not use_external:
-            test_cmd.append("--no-external")
-
-        print(f"\n{'='*60}")
-        print(f"PHASE 5/10: TEST")
-        print(f"{'='*60}")
-        logger.info(f"Starting PHASE 5: TEST with command: {' '.join(test_cmd)}")
+    def gate_finished(phase: GraphPhase, exit_code: int) -> None:
+        if exit_code == 0:
+            # Mark phase as completed
+            phase_tracker.mark_phase_completed(phase.name)
+            logger.info(f"✅ {phase.name} phase marked as completed")
+
+    gate_report = run_phase_graph(
+        quality_gates,
+        run_gate,
+        logger,
+        should_skip=gate_already_complete,
+        on_start=gate_started,
+        on_complete=gate_finished
+    )
+    print(f"Quality gates: {gate_report.summary()}")
 
-        exit_code = run_phase_with_retry(
-            cmd=test_cmd,
-            phase_name="Test",
-            issue_number=issue_number,
+    failed_gates = gate_report.failed_phases()
+    if failed_gates:
+        failed_names = ", ".join(phase.name for phase in failed_gates)
+        logger.error(f"Quality gate(s) failed after all retries: {failed_names}")
+        cleanup_failed_workflow(
             adw_id=adw_id,
-            logger=logger,
-            max_retries=2,  # Allow 2 retries (3 total attempts)
-            critical=True   # Fail workflow if all retries fail
+            issue_number=issue_number,
+            branch_name=None,
+            phase_name=failed_gates[0].name.lower(),
+            error_details=f"{failed_names} phase(s) failed after all retries",
+            logger=logger
         )
-
-        # Mark phase as completed
-        phase_tracker.mark_phase_completed("Test")
-        logger.info("✅ Test phase marked as completed")
+        print(f"❌ {failed_names} phase(s) failed after all retries")
+        sys.exit(1)
 
     # ========================================
     # PHASE 6: REVIEW
@@ -910,6 +936,18 @@ def main():
     print(f"All 10 phases completed successfully!")
     print(f"✅ Code has been shipped to production and verified!")
 
+    # Makespan: overlap of the quality gates is the only concurrency, so the
+    # sequential estimate is the measured time plus what the overlap saved
+    makespan = time.perf_counter() - workflow_started
+    sequential_estimate = makespan + gate_report.saved_seconds
+    makespan_msg = (
+        f"⏱️ Makespan: {makespan / 60:.1f} min "
+        f"(sequential estimate {sequential_estimate / 60:.1f} min, "
+        f"{gate_report.saved_seconds / sequential_estimate:.0%} saved by concurrent quality gates)"
+    )
+    print(makespan_msg)
+    logger.info(makespan_msg)
+
     # Record workflow end_time (status is in database)
     logger.info("Recording workflow end_time")
     state = ADWState.load(adw_id, logger)
@@ -942,6 +980,7 @@ def main():
             "✅ Phase 8: Ship completed\n"
             "✅ Phase 9: Cleanup completed\n"
             "✅ Phase 10: Verify completed ✨\n\n"
+            f"{makespan_msg}\n\n"
             "🚢 **Code has been shipped to production and verified!**",
         )
     except:
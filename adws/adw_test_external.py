@@ -93,7 +93,9 @@ def run_external_tests(
             "test_type": test_type,
             "coverage_threshold": coverage_threshold,
             "fail_fast": False,
-            "verbose": True
+            "verbose": True,
+            "adw_id": adw_id,  # Pass adw_id for tool tracking
+            "issue_number": state.get("issue_number", 0)  # Pass issue_number for tool tracking
         })
     ]
 
@@ -27,7 +27,9 @@ Input Schema:
         "test_type": "pytest" | "vitest" | "all",
         "coverage_threshold": float (default: 80.0),
         "fail_fast": bool (default: False),
-        "verbose": bool (default: True)
+        "verbose": bool (default: True),
+        "adw_id": Optional[str] (for tool tracking),
+        "issue_number": Optional[int] (for tool tracking)
     }
 
 Output Schema:
@@ -65,6 +67,7 @@ from typing import Dict, Any
 sys.path.insert(0, str(Path(__file__).parent))
 
 from adw_modules.test_runner import TestRunner, result_to_dict
+from adw_modules.tool_call_tracker import ToolCallTracker
 
 
 def parse_args():
@@ -128,93 +131,103 @@ def run_workflow(params: Dict[str, Any]) -> Dict[str, Any]:
     coverage_threshold = params.get("coverage_threshold", 80.0)
     fail_fast = params.get("fail_fast", False)
     verbose = params.get("verbose", True)
+    adw_id = params.get("adw_id", "unknown")
+    issue_number = params.get("issue_number", 0)
 
     # Get project root (2 levels up from this file)
     project_root = Path(__file__).parent.parent
 
-    # Initialize test runner
-    runner = TestRunner(project_root)
-
-    # Execute tests based on type
-    if test_type == "pytest":
-        result = runner.run_pytest(
-            test_path=test_path,
-            coverage_threshold=coverage_threshold,
-            fail_fast=fail_fast,
-            verbose=verbose
-        )
-        return result_to_dict(result)
-
-    elif test_type == "vitest":
-        result = runner.run_vitest(
-            test_path=test_path,
-            coverage_threshold=coverage_threshold,
-            fail_fast=fail_fast
-        )
-        return result_to_dict(result)
-
-    elif test_type == "all":
-        results = runner.run_all(
-            test_path=test_path,
-            coverage_threshold=coverage_threshold,
-            fail_fast=fail_fast
-        )
-
-        # Combine results
-        total_tests = (results["pytest"].summary.total +
-                      results["vitest"].summary.total)
-        total_passed = (results["pytest"].summary.passed +
-                       results["vitest"].summary.passed)
-        total_failed = (results["pytest"].summary.failed +
-                       results["vitest"].summary.failed)
-        total_duration = (results["pytest"].summary.duration_seconds +
-                         results["vitest"].summary.duration_seconds)
-
-        all_failures = results["pytest"].failures + results["vitest"].failures
-
-        # Use pytest coverage (more comprehensive)
-        coverage = results["pytest"].coverage
-
-        # Combine next steps
-        next_steps = []
-        if results["pytest"].failures:
-            next_steps.extend([f"[pytest] {step}" for step in results["pytest"].next_steps[:2]])
-        if results["vitest"].failures:
-            next_steps.extend([f"[vitest] {step}" for step in results["vitest"].next_steps[:2]])
-        if not next_steps:
-            next_steps = ["All tests passed!"]
-
-        success = total_failed == 0 and (not coverage or coverage.percentage >= coverage_threshold)
-
-        return {
-            "success": success,
-            "summary": {
-                "total": total_tests,
-                "passed": total_passed,
-                "failed": total_failed,
-                "skipped": 0,
-                "duration_seconds": total_duration
-            },
-            "failures": [asdict(f) for f in all_failures],
-            "coverage": {
-                "percentage": coverage.percentage if coverage else 0.0,
-                "lines_covered": coverage.lines_covered if coverage else 0,
-                "lines_total": coverage.lines_total if coverage else 0,
-                "missing_files": coverage.missing_files if coverage else []
-            } if coverage else None,
-            "next_steps": next_steps
-        }
-
-    else:
-        return {
-            "success": False,
-            "error": {
-                "type": "InvalidInputError",
-                "message": f"Invalid test_type: {test_type}",
-                "details": "Must be 'pytest', 'vitest', or 'all'"
-            },
-            "next_steps": ["Fix test_type parameter"]
-        }
+    # Use ToolCallTracker so test runs and result cache hits land in task_logs
+    with ToolCallTracker(
+        adw_id=adw_id,
+        issue_number=int(issue_number) if issue_number else 0,
+        phase_name="Test",
+        phase_number=5,
+        workflow_template="adw_test_workflow"
+    ) as tracker:
+        # Initialize test runner with tracker
+        runner = TestRunner(project_root, tracker=tracker)
+
+        # Execute tests based on type
+        if test_type == "pytest":
+            result = runner.run_pytest(
+                test_path=test_path,
+                coverage_threshold=coverage_threshold,
+                fail_fast=fail_fast,
+                verbose=verbose
+            )
+            return result_to_dict(result)
+
+        elif test_type == "vitest":
+            result = runner.run_vitest(
+                test_path=test_path,
+                coverage_threshold=coverage_threshold,
+                fail_fast=fail_fast
+            )
+            return result_to_dict(result)
+
+        elif test_type == "all":
+            results = runner.run_all(
+                test_path=test_path,
+                coverage_threshold=coverage_threshold,
+                fail_fast=fail_fast
+            )
+
+            # Combine results
+            total_tests = (results["pytest"].summary.total +
+                          results["vitest"].summary.total)
+            total_passed = (results["pytest"].summary.passed +
+                           results["vitest"].summary.passed)
+            total_failed = (results["pytest"].summary.failed +
+                           results["vitest"].summary.failed)
+            total_duration = (results["pytest"].summary.duration_seconds +
+                             results["vitest"].summary.duration_seconds)
+
+            all_failures = results["pytest"].failures + results["vitest"].failures
+
+            # Use pytest coverage (more comprehensive)
+            coverage = results["pytest"].coverage
+
+            # Combine next steps
+            next_steps = []
+            if results["pytest"].failures:
+                next_steps.extend([f"[pytest] {step}" for step in results["pytest"].next_steps[:2]])
+            if results["vitest"].failures:
+                next_steps.extend([f"[vitest] {step}" for step in results["vitest"].next_steps[:2]])
+            if not next_steps:
+                next_steps = ["All tests passed!"]
+
+            success = total_failed == 0 and (not coverage or coverage.percentage >= coverage_threshold)
+
+            return {
+                "success": success,
+                "summary": {
+                    "total": total_tests,
+                    "passed": total_passed,
+                    "failed": total_failed,
+                    "skipped": 0,
+                    "duration_seconds": total_duration
+                },
+                "failures": [asdict(f) for f in all_failures],
+                "coverage": {
+                    "percentage": coverage.percentage if coverage else 0.0,
+                    "lines_covered": coverage.lines_covered if coverage else 0,
+                    "lines_total": coverage.lines_total if coverage else 0,
+                    "missing_files": coverage.missing_files if coverage else []
+                } if coverage else None,
+                "next_steps": next_steps
+            }
+
+        else:
+            return {
+                "success": False,
+                "error": {
+                    "type": "InvalidInputError",
+                    "message": f"Invalid test_type: {test_type}",
+                    "details": "Must be 'pytest', 'vitest', or 'all'"
+                },
+                "next_steps": ["Fix test_type parameter"]
+            }
 
 
 def main():
@@ -37,6 +37,12 @@ from adw_modules.build_checker import (
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def disable_phase_result_cache(monkeypatch):
+    """Keep mocked subprocess calls to the checks themselves."""
+    monkeypatch.setenv("ADW_PHASE_CACHE", "0")
+
+
 @pytest.fixture
 def project_root(tmp_path):
     """Create a temporary project structure for testing."""
@@ -49,6 +49,7 @@ setup_database_imports()
 
 from core.adw_lock import acquire_lock
 from core.api_quota import can_start_adw, log_quota_warning
+from core.process_table import get_process_table
 
 # Lightweight webhook validation (no heavy dependencies)
 from webhook_validator import WebhookValidationError, validate_webhook
@@ -162,7 +163,11 @@ def count_active_worktrees() -> int:
             "trees"
         )
         if os.path.exists(trees_dir):
-            return len([d for d in os.listdir(trees_dir) if os.path.isdir(os.path.join(trees_dir, d))])
+            # Dot-directories (e.g. the .warm worktree pool) are not active workflows
+            return len([
+                d for d in os.listdir(trees_dir)
+                if not d.startswith(".") and os.path.isdir(os.path.join(trees_dir, d))
+            ])
         return 0
     except Exception:
         return 0
@@ -466,6 +471,22 @@ async def process_webhook_background(
             # Use provided ADW ID for continuing workflow
             adw_id = provided_adw_id
 
+            # Don't start a second process for an ADW that is still running
+            running_pids = get_process_table().adw_pids(adw_id)
+            if running_pids:
+                print(f"❌ ADW {adw_id} is already running (pid {', '.join(map(str, running_pids))})")
+                try:
+                    make_issue_comment(
+                        str(issue_number),
+                        f"⚠️ **ADW Already Running**\n\n"
+                        f"ADW `{adw_id}` still has a running workflow process.\n\n"
+                        f"Please wait for it to finish before continuing it with `{workflow}`.\n\n"
+                        f"{ADW_BOT_IDENTIFIER}",
+                    )
+                except Exception as e:
+                    print(f"Failed to post already-running comment: {e}")
+                return
+
         # Build GitHub URL for this issue
         repo_url = get_repo_url()
         repo_path = extract_repo_path(repo_url)
@@ -37,6 +37,12 @@ def pytest_configure(config):
     )
 
 
+@pytest.fixture(autouse=True)
+def disable_phase_result_cache(monkeypatch):
+    """Keep checker tests from reusing (or writing) cached results in ~/.cache."""
+    monkeypatch.setenv("ADW_PHASE_CACHE", "0")
+
+
 # ============================================================================
 # Path Fixtures
 # ============================================================================
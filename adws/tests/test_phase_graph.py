@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent phase execution and the shared-state safety it relies on.
+
+Run with:
+    cd adws
+    pytest tests/test_phase_graph.py -v
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adw_modules.git_ops import commit_changes
+from adw_modules.phase_graph import GraphPhase, PhaseLimits, run_phase_graph
+from adw_modules.state import ADWState
+
+
+logger = logging.getLogger("test_phase_graph")
+
+
+class TestPhaseGraph:
+    """Dependency-ordered, concurrent phase runs."""
+
+    def test_independent_phases_overlap(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run(phase):
+            barrier.wait()  # BrokenBarrierError if the phases ran one after another
+            return 0
+
+        report = run_phase_graph([GraphPhase("Lint", ["lint"]), GraphPhase("Test", ["test"])], run, logger)
+
+        assert report.exit_codes == {"Lint": 0, "Test": 0}
+        assert report.failed_phases() == []
+
+    def test_sequential_when_limited_to_one(self):
+        order = []
+
+        def run(phase):
+            order.append(f"start {phase.name}")
+            order.append(f"end {phase.name}")
+            return 0
+
+        run_phase_graph([GraphPhase("Lint", ["lint"]), GraphPhase("Test", ["test"])], run, logger, max_parallel=1)
+
+        assert order == ["start Lint", "end Lint", "start Test", "end Test"]
+
+    def test_complete_phases_are_not_started(self):
+        started, finished = [], []
+
+        report = run_phase_graph(
+            [GraphPhase("Lint", ["lint"]), GraphPhase("Test", ["test"])],
+            lambda phase: started.append(phase.name) or 0,
+            logger,
+            should_skip=lambda phase: phase.name == "Lint",
+            on_complete=lambda phase, code: finished.append((phase.name, code))
+        )
+
+        assert started == ["Test"]
+        assert sorted(finished) == [("Lint", 0), ("Test", 0)]
+        assert report.skipped == ["Lint"]
+        assert "Lint" not in report.durations
+
+    def test_on_start_runs_before_each_started_phase(self):
+        events = []
+
+        run_phase_graph(
+            [GraphPhase("Lint", ["lint"]), GraphPhase("Test", ["test"], depends_on=("Lint",))],
+            lambda phase: events.append(f"run {phase.name}") or 0,
+            logger,
+            should_skip=lambda phase: phase.name == "Lint",
+            on_start=lambda phase: events.append(f"start {phase.name}")
+        )
+
+        assert events == ["start Test", "run Test"]
+
+    def test_critical_failure_skips_dependants(self):
+        started = []
+
+        def run(phase):
+            started.append(phase.name)
+            return 1 if phase.name == "Test" else 0
+
+        report = run_phase_graph([
+            GraphPhase("Test", ["test"]),
+            GraphPhase("Review", ["review"], depends_on=("Test",)),
+            GraphPhase("Lint", ["lint"]),
+        ], run, logger)
+
+        assert sorted(started) == ["Lint", "Test"]
+        assert [phase.name for phase in report.failed_phases()] == ["Test", "Review"]
+
+    def test_non_critical_failure_does_not_block(self):
+        report = run_phase_graph([
+            GraphPhase("Validate", ["validate"], critical=False),
+            GraphPhase("Build", ["build"], depends_on=("Validate",)),
+        ], lambda phase: 1 if phase.name == "Validate" else 0, logger)
+
+        assert report.exit_codes == {"Validate": 1, "Build": 0}
+        assert report.failed_phases() == []
+
+    def test_report_timings(self):
+        report = run_phase_graph([GraphPhase("Lint", ["lint"])], lambda phase: 0, logger)
+        report.durations = {"Lint": 60.0, "Test": 100.0}
+        report.wall_seconds = 100.0
+
+        assert report.sequential_seconds == 160.0
+        assert report.saved_seconds == 60.0
+        assert "60s saved" in report.summary()
+
+
+class TestPhaseLimits:
+    """Resource limits applied through sh."""
+
+    def test_no_limits_leaves_command_unchanged(self):
+        assert PhaseLimits().wrap(["uv", "run", "x.py"]) == ["uv", "run", "x.py"]
+
+    def test_limits_apply_to_the_process(self):
+        cmd = PhaseLimits(nice=5, max_cpu_seconds=120, max_memory_mb=4096).wrap(
+            ["sh", "-c", "ulimit -t; ulimit -d; nice"]
+        )
+
+        output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout.split()
+
+        assert output[0] == "120"
+        assert output[1] == str(4096 * 1024)
+        assert int(output[2]) >= 5
+
+    def test_environment_overrides(self):
+        with patch.dict(os.environ, {"ADW_TEST_NICE": "3", "ADW_TEST_MAX_MEMORY_MB": "bogus"}):
+            limits = PhaseLimits.from_env("Test", PhaseLimits(nice=10, max_memory_mb=2048))
+
+        assert limits == PhaseLimits(nice=3, max_memory_mb=2048)
+
+
+@pytest.fixture
+def adw_id():
+    """A unique ADW ID whose agents/ directory is removed afterwards."""
+    adw_id = f"t{uuid.uuid4().hex[:7]}"
+    yield adw_id
+    shutil.rmtree(os.path.dirname(ADWState(adw_id).get_state_path()), ignore_errors=True)
+
+
+class TestConcurrentStateSaves:
+    """Phases saving their own copies of adw_state.json."""
+
+    def test_saves_merge_instead_of_overwriting(self, adw_id):
+        state = ADWState(adw_id)
+        state.update(issue_number="42", branch_name="feat-42")
+        state.save()
+
+        lint_state = ADWState.load(adw_id)
+        test_state = ADWState.load(adw_id)
+        lint_state.update(external_lint_results={"success": True})
+        test_state.update(external_test_results={"success": False})
+        lint_state.save()
+        test_state.save()
+
+        saved = ADWState.load(adw_id)
+        assert saved.get("external_lint_results") == {"success": True}
+        assert saved.get("external_test_results") == {"success": False}
+        assert saved.get("branch_name") == "feat-42"
+        # The saving instance sees the merged result
+        assert test_state.get("external_lint_results") == {"success": True}
+
+    def test_lists_and_dicts_changed_by_both_are_merged(self, adw_id):
+        state = ADWState(adw_id)
+        state.update(all_adws=["plan"], estimated_cost_breakdown={"plan": 1.0})
+        state.save()
+
+        lint_state = ADWState.load(adw_id)
+        test_state = ADWState.load(adw_id)
+        lint_state.append_adw_id("adw_lint_iso")
+        lint_state.data["estimated_cost_breakdown"]["lint"] = 0.2
+        test_state.append_adw_id("adw_test_iso")
+        test_state.data["estimated_cost_breakdown"]["test"] = 0.5
+        lint_state.save()
+        test_state.save()
+
+        saved = ADWState.load(adw_id)
+        assert saved.get("all_adws") == ["plan", "adw_lint_iso", "adw_test_iso"]
+        assert saved.get("estimated_cost_breakdown") == {"plan": 1.0, "lint": 0.2, "test": 0.5}
+
+    def test_concurrent_saves_lose_nothing(self, adw_id):
+        ADWState(adw_id).save()
+
+        def save(n):
+            state = ADWState.load(adw_id)
+            state.data[f"result_{n}"] = n
+            state.append_adw_id(f"adw_{n}")
+            state.save()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(save, range(16)))
+
+        saved = ADWState.load(adw_id)
+        assert all(saved.get(f"result_{n}") == n for n in range(16))
+        assert sorted(saved.get("all_adws")) == sorted(f"adw_{n}" for n in range(16))
+
+
+def test_concurrent_commits_in_one_worktree(tmp_path):
+    """Test that commits from concurrent phases do not collide on the index lock."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=tmp_path, check=True)
+
+    def commit(n):
+        (tmp_path / f"file_{n}.txt").write_text(str(n))
+        return commit_changes(f"change {n}", cwd=str(tmp_path))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(commit, range(8)))
+
+    assert all(success for success, _ in results)
+    status = subprocess.run(["git", "status", "--porcelain"], cwd=tmp_path, capture_output=True, text=True)
+    assert status.stdout.strip() == ""
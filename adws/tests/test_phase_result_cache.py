@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed phase result cache.
+
+Run with:
+    cd adws
+    pytest tests/test_phase_result_cache.py -v
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adw_modules.build_checker import BuildChecker
+from adw_modules.lint_checker import LintChecker, LintError, LintResult, LintSummary, result_from_dict, result_to_dict
+from adw_modules.phase_result_cache import PhaseResultCache
+from adw_modules.test_runner import TestRunner
+
+
+def _git(*args, cwd):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+def _lint_result(rule="F401"):
+    return LintResult(
+        success=False,
+        summary=LintSummary(total_errors=1, style_errors=0, quality_errors=1, warnings=0),
+        errors=[LintError(file="main.py", line=1, column=1, rule=rule, severity="error", message="unused")],
+        next_steps=["Fix main.py"]
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A committed project with app/server and app/client."""
+    root = tmp_path / "project"
+    (root / "app" / "server").mkdir(parents=True)
+    (root / "app" / "client").mkdir(parents=True)
+    _git("init", "-q", cwd=root)
+    _git("config", "user.email", "test@example.com", cwd=root)
+    _git("config", "user.name", "Test", cwd=root)
+    (root / "app" / "server" / "main.py").write_text("import os\n")
+    (root / "app" / "client" / "App.tsx").write_text("export {}\n")
+    (root / "README.md").write_text("docs\n")
+    _git("add", ".", cwd=root)
+    _git("commit", "-q", "-m", "initial", cwd=root)
+    return root
+
+
+@pytest.fixture
+def make_cache(repo, tmp_path):
+    def make(root=repo, **kwargs):
+        return PhaseResultCache(root, cache_dir=tmp_path / "cache", enabled=True, **kwargs)
+    return make
+
+
+class Counter:
+    """Compute function that counts its runs."""
+
+    def __init__(self, result_factory=_lint_result):
+        self.calls = 0
+        self.result_factory = result_factory
+
+    def __call__(self):
+        self.calls += 1
+        return self.result_factory()
+
+
+def _run(cache, compute, check="ruff", params=None, **kwargs):
+    return cache.cached(check, params or {}, compute, result_to_dict, result_from_dict, **kwargs)
+
+
+def test_hit_on_unchanged_tree(make_cache, repo):
+    """Test that a second run on the same content reuses the result, across cache instances."""
+    compute = Counter()
+
+    first = _run(make_cache(), compute)
+    second_cache = make_cache()
+    second = _run(second_cache, compute)
+
+    assert compute.calls == 1
+    assert second == first
+    assert (second_cache.hits, second_cache.misses) == (1, 0)
+
+
+def test_unrelated_changes_keep_hits(make_cache, repo):
+    """Test that docs and frontend edits do not invalidate a backend check."""
+    compute = Counter()
+    _run(make_cache(), compute)
+
+    (repo / "README.md").write_text("new docs\n")
+    (repo / "app" / "client" / "App.tsx").write_text("export const x = 1\n")
+    _run(make_cache(), compute)
+
+    assert compute.calls == 1
+
+
+def test_miss_after_content_change(make_cache, repo):
+    """Test that uncommitted and untracked edits under the checked paths invalidate the result."""
+    compute = Counter()
+    _run(make_cache(), compute)
+
+    (repo / "app" / "server" / "main.py").write_text("import sys\n")
+    _run(make_cache(), compute)
+
+    (repo / "app" / "server" / "new_module.py").write_text("x = 1\n")
+    _run(make_cache(), compute)
+
+    assert compute.calls == 3
+
+
+def test_params_are_part_of_the_key(make_cache):
+    """Test that different parameters are cached separately."""
+    compute = Counter()
+    cache = make_cache()
+
+    _run(cache, compute, check="tsc", params={"strict_mode": True})
+    _run(cache, compute, check="tsc", params={"strict_mode": False})
+    _run(cache, compute, check="tsc", params={"strict_mode": True})
+
+    assert compute.calls == 2
+
+
+def test_check_artifacts_are_ignored(make_cache, repo):
+    """Test that reports written by the checks themselves do not change the key."""
+    compute = Counter()
+    _run(make_cache(), compute, check="pytest")
+
+    (repo / "app" / "server" / ".pytest_report.json").write_text("{}")
+    (repo / "app" / "server" / "coverage.json").write_text("{}")
+    _run(make_cache(), compute, check="pytest")
+
+    assert compute.calls == 1
+
+
+def test_real_index_is_untouched(make_cache, repo):
+    """Test that hashing the working tree does not stage anything."""
+    (repo / "app" / "server" / "new_module.py").write_text("x = 1\n")
+
+    _run(make_cache(), Counter())
+
+    status = subprocess.run(["git", "status", "--porcelain"], cwd=repo, capture_output=True, text=True)
+    assert status.stdout.strip() == "?? app/server/new_module.py"
+
+
+def test_uncacheable_results_are_not_stored(make_cache):
+    """Test that results rejected by the cacheable predicate are recomputed."""
+    compute = Counter(lambda: _lint_result(rule="TimeoutError"))
+    not_timeout = lambda result: all(e.rule != "TimeoutError" for e in result.errors)
+
+    _run(make_cache(), compute, cacheable=not_timeout)
+    _run(make_cache(), compute, cacheable=not_timeout)
+
+    assert compute.calls == 2
+
+
+def test_tracker_records_lookups(make_cache):
+    """Test that hits and misses are reported to the ToolCallTracker."""
+    tracker = MagicMock()
+    cache = make_cache(tracker=tracker)
+
+    _run(cache, Counter())
+    _run(cache, Counter())
+
+    assert [c.args[:2] for c in tracker.record_cache_lookup.call_args_list] == [("ruff", False), ("ruff", True)]
+
+
+def test_disabled_outside_git_or_by_env(make_cache, tmp_path, monkeypatch):
+    """Test that the cache falls back to running the check."""
+    plain = tmp_path / "plain"
+    (plain / "app" / "server").mkdir(parents=True)
+    (plain / "app" / "server" / "main.py").write_text("x = 1\n")
+    compute = Counter()
+
+    _run(make_cache(root=plain), compute)
+    _run(make_cache(root=plain), compute)
+    assert compute.calls == 2
+
+    monkeypatch.setenv("ADW_PHASE_CACHE", "0")
+    cache = PhaseResultCache(plain, cache_dir=tmp_path / "cache")
+    assert cache.enabled is False
+
+
+@pytest.mark.parametrize("returncode, stdout, cached", [
+    (0, "[]", True),
+    (127, "", False),  # npx/uv could not start the tool
+    (2, "", False),  # configuration error
+    (0, "Resolved 12 packages", False),  # not the JSON report
+    (1, "[]", False),  # exit 1 without any violation
+])
+def test_only_reported_lint_runs_are_stored(make_cache, returncode, stdout, cached):
+    """Test that a lint run where ruff never checked the code is not stored as a clean pass."""
+    checker = LintChecker(Path("."))
+    checker.project_root = make_cache().project_root
+    checker.cache = make_cache()
+    real_run = subprocess.run
+    tool_runs = []
+
+    def fake_run(cmd, *args, **kwargs):
+        if cmd[0] == "git":
+            return real_run(cmd, *args, **kwargs)
+        tool_runs.append(cmd)
+        return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr="")
+
+    with patch("subprocess.run", side_effect=fake_run):
+        checker.check_backend_lint()
+        checker.check_backend_lint()
+
+    assert len(tool_runs) == (1 if cached else 2)
+
+
+@pytest.mark.parametrize("returncode, summary, cached", [
+    (0, {"total": 3, "passed": 3}, True),
+    (0, None, False),  # no report: --json-report unavailable or a broken .venv
+    (0, {"total": 0}, False),  # nothing collected
+    (4, {"total": 3, "passed": 3}, False),  # usage error, report is not from a real run
+])
+def test_only_reported_pytest_runs_are_stored(make_cache, returncode, summary, cached):
+    """Test that a pytest run that did not report on any test is not stored as a pass."""
+    cache = make_cache()
+    runner = TestRunner(cache.project_root)
+    runner.cache = cache
+    report_path = cache.project_root / "app" / "server" / ".pytest_report.json"
+    real_run = subprocess.run
+    tool_runs = []
+
+    def fake_run(cmd, *args, **kwargs):
+        if cmd[0] == "git":
+            return real_run(cmd, *args, **kwargs)
+        tool_runs.append(cmd)
+        if summary is not None:
+            report_path.write_text(json.dumps({"summary": summary, "tests": []}))
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="")
+
+    with patch("subprocess.run", side_effect=fake_run):
+        assert runner.run_pytest().success
+        runner.run_pytest()
+
+    assert len(tool_runs) == (1 if cached else 2)
+
+
+def test_frontend_build_is_not_cached(make_cache):
+    """Test that the build always runs, since later phases need its dist/ output."""
+    checker = BuildChecker(Path("."))
+    checker.cache = make_cache()
+
+    with patch("subprocess.run", return_value=subprocess.CompletedProcess([], 0, stdout="", stderr="")) as run:
+        checker.check_frontend_build()
+        checker.check_frontend_build()
+
+    assert run.call_count == 2
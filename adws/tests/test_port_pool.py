@@ -9,6 +9,7 @@ Run with:
 
 import pytest
 import json
+import os
 import tempfile
 import shutil
 from pathlib import Path
@@ -234,3 +235,123 @@ def test_thread_safety():
     # All should be unique
     backends = [b for b, f in results.values()]
     assert len(backends) == len(set(backends))  # No duplicates
+
+
+def _reserve_in_subprocess(persistence_file, trees_dir, adw_ids, queue):
+    """Reserve ports from a separate process sharing the persistence file."""
+    PortPool.PERSISTENCE_FILE = persistence_file
+    PortPool.TREES_DIR = trees_dir
+    pool = PortPool()
+    queue.put([pool.reserve(adw_id) for adw_id in adw_ids])
+
+
+def test_cross_process_uniqueness(temp_persistence_dir):
+    """Test that pools in separate processes never hand out the same slot."""
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    persistence_file = temp_persistence_dir / "port_allocations.json"
+    processes = [
+        ctx.Process(
+            target=_reserve_in_subprocess,
+            args=(persistence_file, temp_persistence_dir / "trees", [f"adw-p{p}-{i}" for i in range(10)], queue),
+        )
+        for p in range(4)
+    ]
+    for process in processes:
+        process.start()
+    results = [pair for _ in processes for pair in queue.get(timeout=30)]
+    for process in processes:
+        process.join()
+
+    assert len(results) == 40
+    assert len({backend for backend, _ in results}) == 40
+
+    with open(persistence_file) as f:
+        assert len(json.load(f)) == 40
+
+
+def test_sees_reservations_from_other_instances(temp_persistence_dir):
+    """Test that a second pool on the same file picks up changes from the first."""
+    with patch.object(PortPool, 'PERSISTENCE_FILE', temp_persistence_dir / "port_allocations.json"):
+        pool_a = PortPool()
+        pool_b = PortPool()
+
+    backend_a, _ = pool_a.reserve("adw-a")
+    backend_b, _ = pool_b.reserve("adw-b")
+
+    assert backend_b == backend_a + 1
+    assert pool_a.get_allocation("adw-b") == pool_b.get_allocation("adw-b")
+
+    pool_b.release("adw-a")
+    assert pool_a.get_allocation("adw-a") is None
+
+
+def test_reclaim_dead(temp_persistence_dir):
+    """Test that slots of dead owners without a worktree are reclaimed."""
+    trees_dir = temp_persistence_dir / "trees"
+    (trees_dir / "adw-has-tree").mkdir(parents=True)
+
+    with patch.object(PortPool, 'PERSISTENCE_FILE', temp_persistence_dir / "port_allocations.json"), \
+         patch.object(PortPool, 'TREES_DIR', trees_dir):
+        pool = PortPool()
+
+    for adw_id in ["adw-alive", "adw-dead", "adw-has-tree"]:
+        pool.reserve(adw_id)
+    pool._allocations["adw-dead"]["pid"] = 999999999
+    pool._allocations["adw-has-tree"]["pid"] = 999999999
+
+    assert pool.reclaim_dead() == 1
+    assert pool.get_allocation("adw-dead") is None
+    assert pool.get_allocation("adw-alive") is not None
+    assert pool.get_allocation("adw-has-tree") is not None
+
+
+def test_exhaustion_reclaims_dead_slots(temp_persistence_dir):
+    """Test that a full pool reclaims crashed allocations before failing."""
+    with patch.object(PortPool, 'PERSISTENCE_FILE', temp_persistence_dir / "port_allocations.json"), \
+         patch.object(PortPool, 'TREES_DIR', temp_persistence_dir / "trees"):
+        pool = PortPool(size=3)
+
+    for i in range(3):
+        pool.reserve(f"adw-test{i}")
+    pool._allocations["adw-test1"]["pid"] = 999999999
+
+    backend, frontend = pool.reserve("adw-new")
+
+    assert (backend, frontend) == (9101, 9201)
+    assert pool.get_allocation("adw-test1") is None
+
+
+def test_reserve_adopts_existing_allocation(port_pool):
+    """Test that re-reserving from a later phase takes ownership of the slot."""
+    port_pool.reserve("adw-test1")
+    port_pool._allocations["adw-test1"]["pid"] = 999999999
+
+    port_pool.reserve("adw-test1")
+
+    assert port_pool.get_pool_status()["allocations"]["adw-test1"]["pid"] == os.getpid()
+    assert port_pool.reclaim_dead() == 0
+
+
+def test_configurable_size(temp_persistence_dir):
+    """Test pool size and port ranges from arguments and environment."""
+    with patch.object(PortPool, 'PERSISTENCE_FILE', temp_persistence_dir / "port_allocations.json"), \
+         patch.dict(os.environ, {"ADW_PORT_POOL_SIZE": "150", "ADW_BACKEND_PORT_START": "10000"}):
+        pool = PortPool()
+
+    assert (pool.size, pool.backend_start, pool.frontend_start) == (150, 10000, 10150)
+    for i in range(150):
+        pool.reserve(f"adw-test{i}")
+    assert pool.get_allocation("adw-test149") == (10149, 10299)
+
+    with pytest.raises(RuntimeError, match="Port pool exhausted"):
+        pool.reserve("adw-overflow")
+
+
+def test_overlapping_ranges_rejected(temp_persistence_dir):
+    """Test that backend and frontend ranges may not overlap."""
+    with patch.object(PortPool, 'PERSISTENCE_FILE', temp_persistence_dir / "port_allocations.json"):
+        with pytest.raises(ValueError, match="overlap"):
+            PortPool(size=150, backend_start=9100, frontend_start=9200)
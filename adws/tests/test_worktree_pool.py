@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm worktree pool.
+
+Run with:
+    cd adws
+    pytest tests/test_worktree_pool.py -v
+"""
+
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adw_modules import worktree_pool
+
+
+logger = logging.getLogger("test_worktree_pool")
+
+
+def _git(*args, cwd):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+def _fake_install(worktree_path, _logger, parent_repo=None):
+    """Stands in for install_dependencies: leaves an ignored node_modules behind."""
+    modules = Path(worktree_path) / "app" / "client" / "node_modules"
+    modules.mkdir(parents=True)
+    (modules / "installed").write_text("yes")
+    return True, None
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A clone of a local origin with a main branch, used as PROJECT_ROOT."""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git("init", "-q", "-b", "main", cwd=origin)
+    _git("config", "user.email", "test@example.com", cwd=origin)
+    _git("config", "user.name", "Test", cwd=origin)
+    (origin / "app" / "client").mkdir(parents=True)
+    (origin / "app" / "client" / ".gitignore").write_text("node_modules\n")
+    (origin / "README.md").write_text("v1\n")
+    _git("add", ".", cwd=origin)
+    _git("commit", "-q", "-m", "initial", cwd=origin)
+
+    root = tmp_path / "project"
+    _git("clone", "-q", str(origin), str(root), cwd=tmp_path)
+
+    trees = root / "trees"
+    with patch.object(worktree_pool, "PROJECT_ROOT", str(root)), \
+         patch.object(worktree_pool, "TREES_DIR", str(trees)), \
+         patch.object(worktree_pool, "WARM_DIR", str(trees / ".warm")), \
+         patch.object(worktree_pool, "install_dependencies", _fake_install), \
+         patch.object(worktree_pool, "request_refill"), \
+         patch.dict(os.environ, {"ADW_WARM_POOL_SIZE": "2"}):
+        yield root, origin
+
+
+def test_fill_pool(project):
+    """Test that fill creates ready worktrees up to the pool size."""
+    root, _ = project
+
+    assert worktree_pool.fill_pool(logger) == 2
+    assert worktree_pool.fill_pool(logger) == 0
+
+    ready = worktree_pool._ready_names()
+    assert len(ready) == 2
+    for name in ready:
+        assert (root / "trees" / ".warm" / name / "app" / "client" / "node_modules" / "installed").exists()
+
+
+def test_lease_checks_out_fresh_branch(project):
+    """Test that a leased worktree moves to trees/<adw_id> on the latest origin/main."""
+    root, origin = project
+    worktree_pool.fill_pool(logger, size=1)
+
+    # origin moves on after the warm worktree was created
+    (origin / "README.md").write_text("v2\n")
+    _git("commit", "-q", "-am", "update", cwd=origin)
+
+    path, error = worktree_pool.lease_worktree("adw-abc123", "feat-issue-1-adw-abc123", logger)
+
+    assert error is None
+    assert path == str(root / "trees" / "adw-abc123")
+    assert (Path(path) / "README.md").read_text() == "v2\n"
+    assert (Path(path) / "app" / "client" / "node_modules" / "installed").exists()
+    head = subprocess.run(["git", "branch", "--show-current"], cwd=path, capture_output=True, text=True)
+    assert head.stdout.strip() == "feat-issue-1-adw-abc123"
+    assert worktree_pool._ready_names() == []
+    worktree_pool.request_refill.assert_called_once()
+
+
+def test_lease_from_empty_or_disabled_pool(project):
+    """Test that leasing falls back (None, None) when nothing is ready."""
+    assert worktree_pool.lease_worktree("adw-abc123", "branch", logger) == (None, None)
+
+    with patch.dict(os.environ, {"ADW_WARM_POOL_SIZE": "0"}):
+        worktree_pool.fill_pool(logger)
+        assert worktree_pool._ready_names() == []
+        assert worktree_pool.lease_worktree("adw-abc123", "branch", logger) == (None, None)
+
+
+def test_abandoned_fill_is_replaced(project):
+    """Test that worktrees left by a crashed filler are removed on the next fill."""
+    root, _ = project
+    warm_dir = root / "trees" / ".warm"
+    warm_dir.mkdir(parents=True)
+    (warm_dir / "warm-dead").mkdir()
+    (warm_dir / "warm-dead.filling").write_text("999999999")
+
+    assert worktree_pool.fill_pool(logger, size=1) == 1
+
+    assert not (warm_dir / "warm-dead").exists()
+    assert not (warm_dir / "warm-dead.filling").exists()
+
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Tests for the worktree setup task graph and the dependency cache.
+
+Run with:
+    cd adws
+    pytest tests/test_worktree_setup.py -v
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adw_modules import dependency_cache, worktree_setup
+from adw_modules.plan_executor import ExecutionResult, execute_worktree_setup
+from adw_modules.task_graph import SetupTask, run_task_graph
+
+
+logger = logging.getLogger("test_worktree_setup")
+_real_run = subprocess.run
+
+
+class TestTaskGraph:
+    """Concurrent setup steps with dependencies."""
+
+    def test_independent_tasks_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other():
+            barrier.wait()  # deadlocks (BrokenBarrierError) if run one after another
+            return True, None
+
+        assert run_task_graph([SetupTask("a", wait_for_other), SetupTask("b", wait_for_other)], logger) is None
+
+    def test_dependencies_run_first(self):
+        order = []
+
+        def record(name):
+            def run():
+                order.append(name)
+                return True, None
+            return run
+
+        run_task_graph([
+            SetupTask("db", record("db"), depends_on=("backend",)),
+            SetupTask("backend", record("backend")),
+        ], logger)
+
+        assert order == ["backend", "db"]
+
+    def test_failure_skips_dependants_only(self):
+        ran = []
+
+        def ok(name):
+            def run():
+                ran.append(name)
+                return True, None
+            return run
+
+        failure = run_task_graph([
+            SetupTask("backend", lambda: (False, "uv exploded")),
+            SetupTask("db", ok("db"), depends_on=("backend",)),
+            SetupTask("frontend", ok("frontend")),
+        ], logger)
+
+        assert (failure[0].name, failure[1]) == ("backend", "uv exploded")
+        assert ran == ["frontend"]
+
+    def test_exceptions_become_failures(self):
+        def boom():
+            raise RuntimeError("disk full")
+
+        failure = run_task_graph([SetupTask("copy", boom)], logger)
+
+        assert failure[1] == "disk full"
+
+    def test_invalid_graphs(self):
+        with pytest.raises(ValueError, match="unknown"):
+            run_task_graph([SetupTask("a", lambda: (True, None), depends_on=("missing",))], logger)
+        with pytest.raises(ValueError, match="cycle"):
+            run_task_graph([
+                SetupTask("a", lambda: (True, None), depends_on=("b",)),
+                SetupTask("b", lambda: (True, None), depends_on=("a",)),
+            ], logger)
+
+    def test_plan_executor_orders_database_after_backend(self, tmp_path):
+        order = []
+        result = ExecutionResult()
+        setup = {"backend_port": 9100, "frontend_port": 9200, "steps": [
+            {"action": "setup_database"},
+            {"action": "install_backend"},
+            {"action": "create_ports_env"},
+            {"action": "bogus"},
+        ]}
+
+        with patch("adw_modules.plan_executor._install_backend", side_effect=lambda *a: order.append("backend")), \
+             patch("adw_modules.plan_executor._setup_database", side_effect=lambda *a: order.append("db")):
+            assert execute_worktree_setup(str(tmp_path), setup, logger, result)
+
+        assert order == ["backend", "db"]
+        assert (tmp_path / ".ports.env").exists()
+        assert result.warnings == ["Unknown action: bogus"]
+
+
+def _fake_installer(install_dir, files):
+    """subprocess.run stand-in: uv/bun create install_dir with files, anything else runs for real."""
+    calls = []
+
+    def run(cmd, *args, **kwargs):
+        if cmd[0] not in ("uv", "bun"):
+            return _real_run(cmd, *args, **kwargs)
+        calls.append(cmd)
+        target = Path(kwargs["cwd"]) / install_dir
+        for relative, content in files(Path(kwargs["cwd"])).items():
+            (target / relative).parent.mkdir(parents=True, exist_ok=True)
+            (target / relative).write_text(content)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    return run, calls
+
+
+class TestDependencyCache:
+    """Lockfile-keyed restores of node_modules and .venv."""
+
+    @pytest.fixture
+    def make_worktree(self, tmp_path):
+        def make(name, lock="{}"):
+            root = tmp_path / name
+            (root / "app" / "client").mkdir(parents=True)
+            (root / "app" / "client" / "package.json").write_text('{"name": "client"}')
+            (root / "app" / "client" / "package-lock.json").write_text(lock)
+            (root / "app" / "server").mkdir(parents=True)
+            (root / "app" / "server" / "uv.lock").write_text(lock)
+            return root
+
+        with patch.object(dependency_cache, "DEPS_CACHE_DIR", tmp_path / "cache"):
+            yield make
+
+    def test_frontend_restored_from_cache(self, make_worktree):
+        first, second = make_worktree("first"), make_worktree("second")
+        run, calls = _fake_installer("node_modules", lambda cwd: {"react/index.js": "module.exports = {};"})
+
+        with patch.object(subprocess, "run", side_effect=run):
+            assert worktree_setup._install_frontend(str(first), logger) == (True, None)
+            assert worktree_setup._install_frontend(str(second), logger) == (True, None)
+
+        assert len(calls) == 1
+        assert (second / "app/client/node_modules/react/index.js").read_text() == "module.exports = {};"
+
+    def test_unchanged_lockfiles_skip_install(self, make_worktree):
+        worktree = make_worktree("first")
+        run, calls = _fake_installer("node_modules", lambda cwd: {"react/index.js": "x"})
+
+        with patch.object(subprocess, "run", side_effect=run):
+            worktree_setup._install_frontend(str(worktree), logger)
+            worktree_setup._install_frontend(str(worktree), logger)
+
+            (worktree / "app/client/package-lock.json").write_text('{"changed": true}')
+            worktree_setup._install_frontend(str(worktree), logger)
+
+        assert len(calls) == 2
+
+    def test_venv_is_relocated(self, make_worktree):
+        first, second = make_worktree("first"), make_worktree("second")
+        run, calls = _fake_installer(".venv", lambda cwd: {
+            "bin/pytest": f"#!{cwd}/.venv/bin/python\nimport pytest\n",
+            "lib/python3.12/site-packages/_server.pth": f"{cwd}\n",
+            "lib/python3.12/site-packages/fastapi/__init__.py": "",
+        })
+
+        with patch.object(subprocess, "run", side_effect=run):
+            worktree_setup._install_backend(str(first), logger)
+            worktree_setup._install_backend(str(second), logger)
+
+        assert len(calls) == 1
+        venv = second / "app/server/.venv"
+        assert (venv / "bin/pytest").read_text().startswith(f"#!{second}/app/server/.venv/bin/python")
+        assert (venv / "lib/python3.12/site-packages/_server.pth").read_text() == f"{second}/app/server\n"
+        # The source install is untouched
+        assert (first / "app/server/.venv/bin/pytest").read_text().startswith(f"#!{first}/app/server")
+
+    def test_moved_venv_is_relocated_in_place(self, make_worktree, tmp_path):
+        warm = make_worktree("warm")
+        run, calls = _fake_installer(".venv", lambda cwd: {
+            "bin/pytest": f"#!{cwd}/.venv/bin/python\nimport pytest\n",
+            "lib/python3.12/site-packages/_server.pth": f"{cwd}\n",
+        })
+
+        with patch.object(subprocess, "run", side_effect=run):
+            worktree_setup._install_backend(str(warm), logger)
+            # Leasing a warm worktree moves it, .venv included
+            leased = tmp_path / "adw-1234"
+            warm.rename(leased)
+            assert worktree_setup._install_backend(str(leased), logger) == (True, None)
+
+        assert len(calls) == 1
+        venv = leased / "app/server/.venv"
+        assert (venv / "bin/pytest").read_text().startswith(f"#!{leased}/app/server/.venv/bin/python")
+        assert (venv / "lib/python3.12/site-packages/_server.pth").read_text() == f"{leased}/app/server\n"
+        assert (venv / dependency_cache.ORIGIN_FILE).read_text().strip() == f"{leased}/app/server"
+
+    def test_parent_repo_with_identical_lockfiles(self, make_worktree):
+        parent, worktree = make_worktree("parent"), make_worktree("worktree")
+        (parent / "app/client/node_modules/vite").mkdir(parents=True)
+        (parent / "app/client/node_modules/vite/index.js").write_text("vite")
+        run, calls = _fake_installer("node_modules", lambda cwd: {})
+
+        with patch.object(subprocess, "run", side_effect=run):
+            assert worktree_setup._install_frontend(str(worktree), logger, str(parent)) == (True, None)
+
+        assert calls == []
+        assert (worktree / "app/client/node_modules/vite/index.js").read_text() == "vite"
+
+    def test_parent_repo_with_different_lockfiles(self, make_worktree):
+        parent, worktree = make_worktree("parent", lock="{}"), make_worktree("worktree", lock='{"v": 2}')
+        (parent / "app/client/node_modules").mkdir(parents=True)
+        run, calls = _fake_installer("node_modules", lambda cwd: {"react/index.js": "x"})
+
+        with patch.object(subprocess, "run", side_effect=run):
+            worktree_setup._install_frontend(str(worktree), logger, str(parent))
+
+        assert len(calls) == 1
+
+    def test_backend_install_uses_hardlink_mode(self, make_worktree):
+        worktree = make_worktree("first")
+        envs = []
+
+        def fake_uv(cmd, *args, **kwargs):
+            if cmd[0] != "uv":
+                return _real_run(cmd, *args, **kwargs)
+            envs.append(kwargs["env"].get("UV_LINK_MODE"))
+            (Path(kwargs["cwd"]) / ".venv").mkdir(exist_ok=True)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch.dict(os.environ), patch.object(subprocess, "run", side_effect=fake_uv):
+            os.environ.pop("UV_LINK_MODE", None)
+            worktree_setup._install_backend(str(worktree), logger)
+
+        assert envs == ["hardlink"]
@@ -6,6 +6,7 @@ import { type PlannedFeature, plannedFeaturesClient, type PlannedFeaturesStats }
 import type { HistoryAnalytics, Route, WorkflowExecution, WorkflowHistoryItem } from '../types';
 import { apiConfig } from '../config/api';
 import { intervals } from '../config/intervals';
+import { ChannelDeltaTracker, CLIENT_READY_MESSAGE } from '../utils/channelDeltas';
 
 // Debug flag - only show errors, not connection status
 const DEBUG_WS = false;
@@ -472,8 +473,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] Queue connected`);
         reconnectAttemptsRefs.current.queue = 0;
         setQueueConnectionState({
@@ -486,7 +489,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'queue_update') {
             setQueueData(message.data);
             setQueueConnectionState(prev => ({
@@ -536,8 +540,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] ADW Monitor connected`);
         reconnectAttemptsRefs.current.adw = 0;
         setAdwConnectionState({
@@ -550,7 +556,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'adw_monitor_update') {
             setAdwMonitorData(message.data);
             setAdwConnectionState(prev => ({
@@ -600,8 +607,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] System Status connected`);
         reconnectAttemptsRefs.current.system = 0;
         setSystemConnectionState({
@@ -614,7 +623,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'system_status_update') {
             setSystemStatusData(message.data);
             setSystemConnectionState(prev => ({
@@ -664,8 +674,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] Workflows connected`);
         reconnectAttemptsRefs.current.workflows = 0;
         setWorkflowsConnectionState({
@@ -678,7 +690,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'workflows_update') {
             setWorkflows(message.data);
             setWorkflowsConnectionState(prev => ({
@@ -728,8 +741,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] Routes connected`);
         reconnectAttemptsRefs.current.routes = 0;
         setRoutesConnectionState({
@@ -742,7 +757,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'routes_update') {
             setRoutes(message.data);
             setRoutesConnectionState(prev => ({
@@ -792,8 +808,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] History connected`);
         reconnectAttemptsRefs.current.history = 0;
         setHistoryConnectionState({
@@ -806,7 +824,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'workflow_history_update') {
             setHistoryWorkflows(message.data.workflows);
             setHistoryTotalCount(message.data.total_count);
@@ -858,8 +877,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] Planned Features connected`);
         reconnectAttemptsRefs.current.plannedFeatures = 0;
         setPlannedFeaturesConnectionState({
@@ -872,7 +893,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'planned_features_update') {
             if (Array.isArray(message.data)) {
               setPlannedFeatures(message.data);
@@ -929,8 +951,10 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
     try {
       const ws = new WebSocket(url);
+      const deltas = new ChannelDeltaTracker();
 
       ws.onopen = () => {
+        ws.send(CLIENT_READY_MESSAGE);
         if (DEBUG_WS) console.log(`[WS] Webhook Status connected`);
         reconnectAttemptsRefs.current.webhookStatus = 0;
         setWebhookStatusConnectionState({
@@ -943,7 +967,8 @@ export function GlobalWebSocketProvider({ children }: GlobalWebSocketProviderPro
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltas.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           if (message.type === 'webhook_status_update') {
             setWebhookStatusData(message.data);
             setWebhookStatusConnectionState(prev => ({
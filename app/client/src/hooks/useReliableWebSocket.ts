@@ -1,6 +1,7 @@
 import { useCallback, useEffect, useRef, useState } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import { intervals } from '../config/intervals';
+import { ChannelDeltaTracker, CLIENT_READY_MESSAGE } from '../utils/channelDeltas';
 
 // Debug flag - disabled to reduce console noise
 const DEBUG_WS = false;
@@ -30,6 +31,7 @@ interface ConnectionState {
  * - Visibility API integration (pause when hidden)
  * - Connection quality monitoring
  * - Maximum retry limits
+ * - Versioned channel deltas (see utils/channelDeltas)
  */
 export function useReliableWebSocket<T, M = any>({
   url,
@@ -56,6 +58,7 @@ export function useReliableWebSocket<T, M = any>({
   const isPageVisibleRef = useRef(true);
   const lastMessageTimeRef = useRef<number>(Date.now());
   const messageCountRef = useRef(0);
+  const deltasRef = useRef(new ChannelDeltaTracker());
 
   // Use refs for callbacks to avoid recreating connect on every render
   const onMessageRef = useRef(onMessage);
@@ -152,6 +155,8 @@ export function useReliableWebSocket<T, M = any>({
 
       ws.onopen = () => {
         if (DEBUG_WS) console.log(`[WS] Connected to ${url}`);
+        deltasRef.current.reset();
+        ws.send(CLIENT_READY_MESSAGE);
         reconnectAttemptsRef.current = 0;
         lastMessageTimeRef.current = Date.now();
         messageCountRef.current = 0;
@@ -166,7 +171,8 @@ export function useReliableWebSocket<T, M = any>({
 
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
+          const message = deltasRef.current.receive(JSON.parse(event.data), (payload) => ws.send(payload));
+          if (!message) return;
           onMessageRef.current(message);
 
           lastMessageTimeRef.current = Date.now();
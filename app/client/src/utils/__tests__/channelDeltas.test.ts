@@ -0,0 +1,73 @@
+/**
+ * Unit tests for channel delta utilities
+ * Tests JSON Patch application and versioned channel tracking
+ */
+
+import { describe, expect, it, vi } from 'vitest';
+import { applyPatch, ChannelDeltaTracker } from '../channelDeltas';
+
+describe('applyPatch', () => {
+  it('should apply add, remove and replace operations without mutating input', () => {
+    const original = { items: [{ id: 1 }, { id: 2 }], status: 'idle', stale: true };
+
+    const result = applyPatch(original, [
+      { op: 'remove', path: '/stale' },
+      { op: 'replace', path: '/status', value: 'running' },
+      { op: 'add', path: '/items/0', value: { id: 0 } },
+      { op: 'remove', path: '/items/2' },
+    ]);
+
+    expect(result).toEqual({ items: [{ id: 0 }, { id: 1 }], status: 'running' });
+    expect(original.items).toHaveLength(2);
+  });
+
+  it('should unescape JSON Pointer tokens and replace the root', () => {
+    expect(applyPatch({ 'a/b': 1 }, [{ op: 'replace', path: '/a~1b', value: 2 }])).toEqual({ 'a/b': 2 });
+    expect(applyPatch({ a: 1 }, [{ op: 'replace', path: '', value: [1] }])).toEqual([1]);
+  });
+});
+
+describe('ChannelDeltaTracker', () => {
+  const snapshot = { type: 'queue_update', data: { phases: [1, 2] }, version: 3 };
+
+  it('should rebuild full messages from deltas', () => {
+    const tracker = new ChannelDeltaTracker();
+    const resync = vi.fn();
+
+    expect(tracker.receive(snapshot, resync)).toBe(snapshot);
+    const message = tracker.receive(
+      {
+        type: 'delta',
+        channel: 'queue_update',
+        version: 4,
+        base_version: 3,
+        ops: [{ op: 'add', path: '/phases/2', value: 3 }],
+      },
+      resync
+    );
+
+    expect(message).toEqual({ type: 'queue_update', data: { phases: [1, 2, 3] }, version: 4 });
+    expect(resync).not.toHaveBeenCalled();
+  });
+
+  it('should request a resync when a version was missed', () => {
+    const tracker = new ChannelDeltaTracker();
+    const resync = vi.fn();
+    tracker.receive(snapshot, resync);
+
+    const message = tracker.receive(
+      { type: 'delta', channel: 'queue_update', version: 6, base_version: 5, ops: [] },
+      resync
+    );
+
+    expect(message).toBeNull();
+    expect(JSON.parse(resync.mock.calls[0][0])).toEqual({ type: 'resync', channel: 'queue_update' });
+  });
+
+  it('should pass unversioned messages through unchanged', () => {
+    const tracker = new ChannelDeltaTracker();
+    const legacy = { type: 'queue_update', event: 'phase_completed' };
+
+    expect(tracker.receive(legacy, vi.fn())).toBe(legacy);
+  });
+});
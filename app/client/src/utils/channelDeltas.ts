@@ -0,0 +1,107 @@
+/**
+ * Channel Delta Utilities
+ *
+ * The server publishes versioned channel state. Full snapshots look like
+ * `{ type, data, version }`; clients that opt in with `CLIENT_READY_MESSAGE`
+ * also receive `{ type: 'delta', channel, version, base_version, ops }`
+ * messages carrying JSON Patch operations against the previous version.
+ *
+ * ChannelDeltaTracker rebuilds full `{ type, data, version }` messages from
+ * deltas so existing `message.type === ...` handlers keep working unchanged.
+ */
+
+export interface PatchOperation {
+  op: 'add' | 'remove' | 'replace';
+  path: string;
+  value?: unknown;
+}
+
+export interface DeltaMessage {
+  type: 'delta';
+  channel: string;
+  version: number;
+  base_version: number;
+  ops: PatchOperation[];
+}
+
+/** Sent on open to opt in to delta updates */
+export const CLIENT_READY_MESSAGE = JSON.stringify({ type: 'client_ready', deltas: true });
+
+const unescapeToken = (token: string): string => token.replace(/~1/g, '/').replace(/~0/g, '~');
+
+/**
+ * Apply JSON Patch operations to a deep copy of a value
+ */
+export function applyPatch<T>(value: T, ops: PatchOperation[]): T {
+  let doc: any = JSON.parse(JSON.stringify(value));
+
+  for (const op of ops) {
+    const tokens = op.path.split('/').slice(1).map(unescapeToken);
+    if (tokens.length === 0) {
+      doc = op.value;
+      continue;
+    }
+
+    let parent = doc;
+    for (const token of tokens.slice(0, -1)) {
+      parent = Array.isArray(parent) ? parent[Number(token)] : parent[token];
+    }
+
+    const last = tokens[tokens.length - 1];
+    if (Array.isArray(parent)) {
+      const index = last === '-' ? parent.length : Number(last);
+      if (op.op === 'add') {
+        parent.splice(index, 0, op.value);
+      } else if (op.op === 'remove') {
+        parent.splice(index, 1);
+      } else {
+        parent[index] = op.value;
+      }
+    } else if (op.op === 'remove') {
+      delete parent[last];
+    } else {
+      parent[last] = op.value;
+    }
+  }
+
+  return doc as T;
+}
+
+/**
+ * Tracks the last known version of each channel on one connection
+ */
+export class ChannelDeltaTracker {
+  private channels = new Map<string, { version: number; data: unknown }>();
+
+  /** Forget all channel state (call when the connection is re-opened) */
+  reset(): void {
+    this.channels.clear();
+  }
+
+  /**
+   * Turn an incoming message into the full message handlers expect.
+   *
+   * Returns null when a delta cannot be applied; `requestResync` is then
+   * called with a resync message the caller should send to the server.
+   */
+  receive(message: any, requestResync: (payload: string) => void): any | null {
+    if (message?.type === 'delta') {
+      const delta = message as DeltaMessage;
+      const current = this.channels.get(delta.channel);
+      if (!current || current.version !== delta.base_version) {
+        this.channels.delete(delta.channel);
+        requestResync(JSON.stringify({ type: 'resync', channel: delta.channel }));
+        return null;
+      }
+
+      const data = applyPatch(current.data, delta.ops);
+      this.channels.set(delta.channel, { version: delta.version, data });
+      return { type: delta.channel, data, version: delta.version };
+    }
+
+    if (typeof message?.version === 'number' && typeof message?.type === 'string') {
+      this.channels.set(message.type, { version: message.version, data: message.data });
+    }
+    return message;
+  }
+}
@@ -0,0 +1,124 @@
+"""Benchmark cost history parsing: readlines() vs cached tail reader
+
+Generates synthetic raw_output.jsonl transcripts and compares bytes read and
+wall time for:
+    - legacy:  readlines() of every file, then a reverse search in memory
+    - cold:    reverse-seeking tail reader, empty cache
+    - warm:    second pass with nothing changed (cache hits only)
+    - append:  running transcripts grew by a few messages since the last pass
+
+Usage:
+    python benchmark_cost_history.py                        # 30 files x 8 MB
+    python benchmark_cost_history.py --files 10 --size-mb 20
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from core.cost_tracker import clear_transcript_cache, get_transcript_cache_stats, parse_jsonl_file
+
+_FILLER_LINE = json.dumps({
+    "type": "assistant",
+    "message": {"role": "assistant", "content": [{"type": "text", "text": "x" * 900}]},
+}) + "\n"
+
+
+def _result_line(i: int) -> str:
+    return json.dumps({
+        "type": "result",
+        "model": "claude-sonnet-4-5",
+        "usage": {
+            "input_tokens": 1000 + i,
+            "cache_creation_input_tokens": 500,
+            "cache_read_input_tokens": 20000,
+            "output_tokens": 800,
+        },
+    }) + "\n"
+
+
+def _write_transcripts(root: Path, files: int, size_mb: int) -> list[Path]:
+    """Write transcripts; every third one is still running (no result yet)."""
+    filler = _FILLER_LINE * max(1, (size_mb * 1024 * 1024) // len(_FILLER_LINE))
+    paths = []
+    for i in range(files):
+        path = root / f"adw{i:03d}" / "sdlc_planner" / "raw_output.jsonl"
+        path.parent.mkdir(parents=True)
+        with open(path, "w") as f:
+            f.write(filler)
+            if i % 3:
+                f.write(_result_line(i))
+        paths.append(path)
+    return paths
+
+
+def _legacy_parse(path: Path) -> tuple[dict | None, int]:
+    """Previous parser: read the whole file, search lines in reverse."""
+    with open(path) as f:
+        lines = f.readlines()
+    bytes_read = os.path.getsize(path)
+    for line in reversed(lines):
+        try:
+            data = json.loads(line.strip())
+        except json.JSONDecodeError:
+            continue
+        if data.get("type") == "result":
+            return data, bytes_read
+    return None, bytes_read
+
+
+def _append_to_running(paths: list[Path]) -> None:
+    for i, path in enumerate(paths):
+        if i % 3 == 0:
+            with open(path, "a") as f:
+                f.write(_FILLER_LINE * 5)
+
+
+def _measure(fn) -> tuple[float, int]:
+    before = get_transcript_cache_stats()["bytes_read"]
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start, get_transcript_cache_stats()["bytes_read"] - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=30, help="Number of transcripts")
+    parser.add_argument("--size-mb", type=int, default=8, help="Approximate size of each transcript")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = _write_transcripts(Path(tmp_dir), args.files, args.size_mb)
+        clear_transcript_cache()
+
+        start = time.perf_counter()
+        legacy_bytes = sum(_legacy_parse(p)[1] for p in paths)
+        results = {"legacy": (time.perf_counter() - start, legacy_bytes)}
+
+        def parse_all():
+            for p in paths:
+                parse_jsonl_file(p)
+
+        results["cold"] = _measure(parse_all)
+        results["warm"] = _measure(parse_all)
+        _append_to_running(paths)
+        results["append"] = _measure(parse_all)
+
+    print(f"\n{'='*70}")
+    print(f"COST HISTORY PARSING ({args.files} transcripts x ~{args.size_mb} MB)")
+    print(f"{'='*70}")
+    print(f"{'Pass':<10} {'Time':>10} {'Bytes read':>16} {'vs legacy':>12}")
+    print("-" * 70)
+    for name, (seconds, bytes_read) in results.items():
+        ratio = f"{legacy_bytes / bytes_read:.0f}x less" if bytes_read else "no reads"
+        if name == "legacy":
+            ratio = "-"
+        print(f"{name.upper():<10} {seconds:>9.3f}s {bytes_read:>16,} {ratio:>12}")
+    print(f"\nCache: {get_transcript_cache_stats()}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
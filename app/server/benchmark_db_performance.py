@@ -1,9 +1,44 @@
-"""Benchmark database performance: SQLite vs PostgreSQL"""
+"""Benchmark database performance: SQLite vs PostgreSQL
+
+Usage:
+    python benchmark_db_performance.py                 # SQLite vs PostgreSQL
+    python benchmark_db_performance.py --sqlite-modes  # SQLite per-call vs per-thread connections
+    python benchmark_db_performance.py --dependency-graph  # Ready-phase lookup: per-dependency queries vs graph
+"""
+import json
 import os
 import sys
+import tempfile
 import time
 from datetime import datetime
 
+# Minimal phase_queue schema for the SQLite connection-mode benchmark
+_SQLITE_PHASE_QUEUE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS phase_queue (
+        queue_id TEXT PRIMARY KEY,
+        feature_id INTEGER,
+        phase_number INTEGER NOT NULL,
+        issue_number INTEGER,
+        status TEXT DEFAULT 'queued',
+        current_phase TEXT DEFAULT 'init',
+        depends_on_phases TEXT DEFAULT '[]',
+        phase_data TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        error_message TEXT,
+        adw_id TEXT,
+        pr_number INTEGER,
+        priority INTEGER DEFAULT 50,
+        queue_position INTEGER,
+        ready_timestamp TIMESTAMP,
+        started_timestamp TIMESTAMP,
+        claimed_by TEXT,
+        claimed_at TIMESTAMP,
+        heartbeat_at TIMESTAMP,
+        lease_expires_at TIMESTAMP
+    )
+"""
+
 
 def benchmark_operations(db_type, iterations=100):
     """Benchmark basic operations"""
@@ -85,6 +120,185 @@ def benchmark_operations(db_type, iterations=100):
         "total": total_time
     }
 
+def benchmark_sqlite_connection_modes(iterations=500):
+    """
+    Compare SQLiteAdapter pool modes on the INSERT/SELECT/UPDATE/DELETE workload.
+
+    "none" opens a new connection per repository call (previous behaviour);
+    "thread" reuses a persistent WAL-mode connection per thread.
+    """
+    from database.sqlite_adapter import SQLiteAdapter
+    from models.phase_queue_item import PhaseQueueItem
+    from repositories.phase_queue_repository import PhaseQueueRepository
+
+    results = {}
+    for mode in ("none", "thread"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "bench.db")
+            adapter = SQLiteAdapter(db_path=db_path, pool_mode=mode)
+            with adapter.get_connection() as conn:
+                conn.execute(_SQLITE_PHASE_QUEUE_SCHEMA)
+
+            repo = PhaseQueueRepository(db_path=db_path)
+            repo.adapter = adapter
+
+            timings = {}
+            start = time.perf_counter()
+            for i in range(iterations):
+                repo.create(PhaseQueueItem(
+                    queue_id=f"bench-{mode}-{i}",
+                    feature_id=1000 + i,
+                    phase_number=1,
+                    status="ready",
+                    phase_data={"title": f"Benchmark {i}", "content": "Performance test"},
+                ))
+            timings["insert"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(iterations):
+                # Raw select: PhaseQueueItem.from_db_row expects dict rows (PostgreSQL)
+                adapter.execute_query(
+                    "SELECT * FROM phase_queue WHERE queue_id = ?", (f"bench-{mode}-{i}",)
+                )
+            timings["select"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(iterations):
+                repo.update_status(f"bench-{mode}-{i}", "completed")
+            timings["update"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(iterations):
+                repo.delete(f"bench-{mode}-{i}")
+            timings["delete"] = time.perf_counter() - start
+
+            timings["total"] = sum(timings.values())
+            adapter.close()
+            results[mode] = timings
+
+    print(f"\n{'='*70}")
+    print(f"SQLITE CONNECTION MODES ({iterations} ops each)")
+    print(f"{'='*70}")
+    print(f"{'Operation':<15} {'per-call':<15} {'per-thread':<15} {'Speedup'}")
+    print("-" * 70)
+    for op in ["insert", "select", "update", "delete", "total"]:
+        legacy, pooled = results["none"][op], results["thread"][op]
+        print(f"{op.upper():<15} {legacy:>6.3f}s      {pooled:>6.3f}s      {legacy / pooled:.1f}x")
+
+    return results
+
+
+def _legacy_find_ready_phases(conn, feature_id):
+    """Ready-phase lookup as PhaseCoordinator did it: one query per dependency."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT queue_id, phase_number, depends_on_phases, phase_data FROM phase_queue "
+        "WHERE feature_id = ? AND status = 'queued'",
+        (feature_id,),
+    )
+    ready = []
+    for phase in cursor.fetchall():
+        for dep_phase_num in json.loads(phase["depends_on_phases"] or "[]"):
+            cursor.execute(
+                "SELECT status FROM phase_queue WHERE feature_id = ? AND phase_number = ?",
+                (feature_id, dep_phase_num),
+            )
+            dep_row = cursor.fetchone()
+            if not dep_row or dep_row["status"] != "completed":
+                break
+        else:
+            ready.append(phase["queue_id"])
+    return ready
+
+
+def benchmark_dependency_graph(features=5, phases_per_feature=60):
+    """
+    Compare ready-phase resolution after each phase completion.
+
+    Every phase depends on the previous one and every tenth phase also fans
+    in on the five before it, so each lookup sees a long queued tail.
+    """
+    from database.sqlite_adapter import SQLiteAdapter
+    from models.phase_queue_item import PhaseQueueItem
+    from repositories.phase_queue_repository import PhaseQueueRepository
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        adapter = SQLiteAdapter(db_path=db_path, pool_mode="thread")
+        with adapter.get_connection() as conn:
+            conn.execute(_SQLITE_PHASE_QUEUE_SCHEMA)
+
+        repo = PhaseQueueRepository(db_path=db_path)
+        repo.adapter = adapter
+
+        for feature_id in range(1, features + 1):
+            for n in range(1, phases_per_feature + 1):
+                depends_on = [n - 1] if n > 1 else []
+                if n % 10 == 0:
+                    depends_on = list(range(max(1, n - 5), n))
+                repo.create(PhaseQueueItem(
+                    queue_id=f"dep-{feature_id}-{n}",
+                    feature_id=feature_id,
+                    phase_number=n,
+                    status="queued",
+                    depends_on_phases=depends_on,
+                    phase_data={"title": f"Phase {n}"},
+                ))
+
+        start = time.perf_counter()
+        repo.dependency_graph.ensure_loaded()
+        load_time = time.perf_counter() - start
+
+        timings = {"legacy": 0.0, "graph": 0.0}
+        lookups = 0
+        for feature_id in range(1, features + 1):
+            for n in range(1, phases_per_feature + 1):
+                repo.update_status(f"dep-{feature_id}-{n}", "completed")
+                lookups += 1
+
+                start = time.perf_counter()
+                with adapter.get_connection() as conn:
+                    legacy = _legacy_find_ready_phases(conn, feature_id)
+                timings["legacy"] += time.perf_counter() - start
+
+                start = time.perf_counter()
+                candidates = repo.dependency_graph.ready_phases(feature_id)
+                graph = []
+                if candidates:
+                    with adapter.get_connection() as conn:
+                        rows = conn.execute(
+                            f"SELECT * FROM phase_queue WHERE queue_id IN ({', '.join('?' for _ in candidates)})",
+                            candidates,
+                        ).fetchall()
+                    graph = [row["queue_id"] for row in rows if row["status"] == "queued"]
+                timings["graph"] += time.perf_counter() - start
+
+                assert sorted(legacy) == sorted(graph), (legacy, graph)
+
+        problems = repo.dependency_graph.check_consistency(rebuild=False)
+        adapter.close()
+
+    print(f"\n{'='*70}")
+    print(f"READY-PHASE LOOKUP ({features} features x {phases_per_feature} phases, {lookups} lookups)")
+    print(f"{'='*70}")
+    print(f"Graph load (1 query): {load_time * 1000:.1f}ms, consistency problems: {len(problems)}")
+    print(f"{'Method':<25} {'Total':<12} {'Per lookup'}")
+    print("-" * 70)
+    for method, label in (("legacy", "per-dependency queries"), ("graph", "dependency graph")):
+        print(f"{label:<25} {timings[method]:>6.3f}s     {timings[method] / lookups * 1000:.3f}ms")
+    print(f"Speedup: {timings['legacy'] / timings['graph']:.1f}x")
+
+    return timings
+
+
+if "--dependency-graph" in sys.argv:
+    benchmark_dependency_graph()
+    sys.exit(0)
+
+if "--sqlite-modes" in sys.argv:
+    benchmark_sqlite_connection_modes()
+    sys.exit(0)
+
 print("=" * 70)
 print("DATABASE PERFORMANCE BENCHMARK")
 print("=" * 70)
@@ -0,0 +1,248 @@
+"""Benchmark history analytics: per-metric queries vs single pass vs daily rollup
+
+Seeds a synthetic workflow_history table (100,000 rows over 120 days by
+default) and compares three ways of computing get_history_analytics():
+    - legacy:  the previous 12 separate aggregate queries
+    - single:  one conditional-aggregation query plus one GROUP BY
+    - rollup:  the same two queries over workflow_history_daily_rollup
+
+For each approach it reports wall time per call and a summary of the query
+plans (SQLite: full table scans from EXPLAIN QUERY PLAN; PostgreSQL: buffers
+and execution time from EXPLAIN ANALYZE).
+
+PostgreSQL runs use the POSTGRES_* settings and work in a scratch schema
+cloned from the existing workflow_history table, which is dropped afterwards.
+
+Usage:
+    python benchmark_history_analytics.py                  # SQLite, 100,000 rows
+    python benchmark_history_analytics.py --rows 10000
+    python benchmark_history_analytics.py --postgres       # SQLite and PostgreSQL
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import core.workflow_history_utils.database.schema as schema_module
+from core.workflow_history_utils.database.analytics import _query_history, _query_rollup
+from core.workflow_history_utils.database.rollup import create_rollup_table, refresh_rollup_days
+from database.sqlite_adapter import SQLiteAdapter
+
+_SEED_COLUMNS = (
+    "adw_id", "status", "model_used", "workflow_template", "duration_seconds",
+    "actual_cost_total", "total_tokens", "cache_efficiency_percent", "created_at",
+)
+
+
+class _RecordingCursor:
+    """Cursor proxy that records every statement executed through it."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.statements: list[tuple[str, list]] = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, list(params or [])))
+        return self._cursor.execute(sql, params or [])
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+
+def legacy_history_analytics(cursor, db_type: str) -> None:
+    """Previous implementation: one aggregate query per metric."""
+    if db_type == "postgresql":
+        since = {d: f"NOW() - INTERVAL '{d} days'" for d in (7, 14, 30, 60)}
+    else:
+        since = {d: f"datetime('now', '-{d} days')" for d in (7, 14, 30, 60)}
+    costed = (
+        "(status = 'completed' OR status = 'failed') "
+        "AND actual_cost_total IS NOT NULL AND actual_cost_total > 0"
+    )
+    queries = [
+        "SELECT COUNT(*) as total FROM workflow_history",
+        "SELECT status, COUNT(*) as count FROM workflow_history GROUP BY status",
+        "SELECT AVG(duration_seconds) FROM workflow_history "
+        "WHERE status = 'completed' AND duration_seconds IS NOT NULL",
+        "SELECT model_used, COUNT(*) FROM workflow_history "
+        "WHERE model_used IS NOT NULL GROUP BY model_used",
+        "SELECT workflow_template, COUNT(*) FROM workflow_history "
+        "WHERE workflow_template IS NOT NULL GROUP BY workflow_template",
+        "SELECT AVG(actual_cost_total), SUM(actual_cost_total) FROM workflow_history "
+        "WHERE actual_cost_total IS NOT NULL AND actual_cost_total > 0",
+        f"SELECT AVG(actual_cost_total) FROM workflow_history WHERE {costed}",
+        f"SELECT AVG(actual_cost_total) FROM workflow_history WHERE {costed} "
+        f"AND created_at >= {since[7]}",
+        f"SELECT AVG(actual_cost_total) FROM workflow_history WHERE {costed} "
+        f"AND created_at >= {since[14]} AND created_at < {since[7]}",
+        f"SELECT AVG(actual_cost_total) FROM workflow_history WHERE {costed} "
+        f"AND created_at >= {since[30]}",
+        f"SELECT AVG(actual_cost_total) FROM workflow_history WHERE {costed} "
+        f"AND created_at >= {since[60]} AND created_at < {since[30]}",
+        "SELECT AVG(total_tokens), AVG(cache_efficiency_percent) FROM workflow_history "
+        "WHERE total_tokens IS NOT NULL AND total_tokens > 0",
+    ]
+    for sql in queries:
+        cursor.execute(sql)
+        cursor.fetchall()
+
+
+def _seed_rows(count: int) -> list[tuple]:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        status = rng.choices(["completed", "failed", "running", "pending"], [70, 20, 8, 2])[0]
+        tokens = rng.randint(0, 80_000)
+        rows.append((
+            f"bench{i:06d}",
+            status,
+            rng.choice(["claude-sonnet-4-5", "claude-opus-4", "claude-haiku-4-5", None]),
+            rng.choice(["adw_sdlc_iso", "adw_plan_build", "adw_patch", None]),
+            rng.randint(60, 7200) if status == "completed" else None,
+            round(rng.uniform(0, 5), 4) if status in ("completed", "failed") else 0.0,
+            tokens,
+            rng.uniform(0, 100) if tokens else 0.0,
+            (now - timedelta(minutes=rng.randint(0, 120 * 24 * 60))).strftime("%Y-%m-%d %H:%M:%S"),
+        ))
+    return rows
+
+
+def _plan_summary(cursor, db_type: str, statements: list[tuple[str, list]]) -> str:
+    """Summarize the plans of the recorded statements."""
+    if db_type == "postgresql":
+        blocks = 0
+        exec_ms = 0.0
+        for sql, params in statements:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", params)
+            row = cursor.fetchone()
+            plan = row["QUERY PLAN"] if isinstance(row, dict) else row[0]
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            blocks += plan[0]["Plan"].get("Shared Hit Blocks", 0) + plan[0]["Plan"].get("Shared Read Blocks", 0)
+            exec_ms += plan[0]["Execution Time"]
+        return f"{len(statements)} queries, {blocks:,} buffers, {exec_ms:.1f} ms exec"
+
+    scans = []
+    for sql, params in statements:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        scans += [row["detail"] for row in cursor.fetchall() if row["detail"].startswith("SCAN")]
+    tables = {detail.split()[1] for detail in scans}
+    return f"{len(statements)} queries, {len(scans)} full scans of {', '.join(sorted(tables)) or '-'}"
+
+
+def _compare(conn, db_type: str, placeholder: str, repeat: int) -> dict:
+    cursor = conn.cursor()
+    create_rollup_table(cursor)
+    start = time.perf_counter()
+    refresh_rollup_days(cursor, placeholder, db_type)
+    conn.commit()
+    rebuild_seconds = time.perf_counter() - start
+
+    approaches = {
+        "legacy": lambda c: legacy_history_analytics(c, db_type),
+        "single": lambda c: _query_history(c, db_type),
+        "rollup": _query_rollup,
+    }
+    results = {}
+    for name, run in approaches.items():
+        recorder = _RecordingCursor(conn.cursor())
+        run(recorder)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run(conn.cursor())
+        results[name] = {
+            "ms": (time.perf_counter() - start) / repeat * 1000,
+            "plan": _plan_summary(conn.cursor(), db_type, recorder.statements),
+        }
+    results["rebuild_seconds"] = rebuild_seconds
+    return results
+
+
+def run_sqlite(rows: list[tuple], repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter(db_path=os.path.join(tmp_dir, "history.db"))
+        with patch.object(schema_module, "_get_adapter", lambda: adapter):
+            schema_module.init_db()
+        with adapter.get_connection() as conn:
+            conn.executemany(
+                f"INSERT INTO workflow_history ({', '.join(_SEED_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _SEED_COLUMNS)})",
+                rows,
+            )
+            conn.execute("ANALYZE")
+            results = _compare(conn, "sqlite", "?", repeat)
+        adapter.close()
+        return results
+
+
+def run_postgres(rows: list[tuple], repeat: int) -> dict:
+    import psycopg2
+    from psycopg2.extras import RealDictCursor, execute_values
+
+    conn = psycopg2.connect(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        dbname=os.getenv("POSTGRES_DB", "tac_webbuilder"),
+        user=os.getenv("POSTGRES_USER", "tac_user"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+        cursor_factory=RealDictCursor,
+    )
+    try:
+        cursor = conn.cursor()
+        cursor.execute("DROP SCHEMA IF EXISTS bench_analytics CASCADE")
+        cursor.execute("CREATE SCHEMA bench_analytics")
+        cursor.execute(
+            "CREATE TABLE bench_analytics.workflow_history "
+            "(LIKE public.workflow_history INCLUDING ALL)"
+        )
+        cursor.execute("SET search_path TO bench_analytics")
+        execute_values(
+            cursor,
+            f"INSERT INTO workflow_history ({', '.join(_SEED_COLUMNS)}) VALUES %s",
+            rows,
+        )
+        cursor.execute("ANALYZE workflow_history")
+        conn.commit()
+        return _compare(conn, "postgresql", "%s", repeat)
+    finally:
+        conn.rollback()
+        conn.cursor().execute("DROP SCHEMA IF EXISTS bench_analytics CASCADE")
+        conn.commit()
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic workflow_history rows")
+    parser.add_argument("--repeat", type=int, default=20, help="Analytics calls timed per approach")
+    parser.add_argument("--postgres", action="store_true", help="Also benchmark PostgreSQL")
+    args = parser.parse_args()
+
+    rows = _seed_rows(args.rows)
+    backends = {"sqlite": run_sqlite(rows, args.repeat)}
+    if args.postgres:
+        backends["postgresql"] = run_postgres(rows, args.repeat)
+
+    for backend, results in backends.items():
+        print(f"\n{'='*90}")
+        print(f"HISTORY ANALYTICS - {backend.upper()} ({args.rows:,} rows, rollup rebuilt in "
+              f"{results['rebuild_seconds']:.2f}s)")
+        print(f"{'='*90}")
+        print(f"{'Approach':<10} {'Per call':>10} {'vs legacy':>10}   Plan")
+        print("-" * 90)
+        legacy_ms = results["legacy"]["ms"]
+        for name in ("legacy", "single", "rollup"):
+            ms = results[name]["ms"]
+            print(f"{name.upper():<10} {ms:>8.2f}ms {legacy_ms / ms:>9.1f}x   {results[name]['plan']}")
+    return backends
+
+
+if __name__ == "__main__":
+    main()
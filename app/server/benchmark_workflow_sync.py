@@ -0,0 +1,182 @@
+"""Benchmark workflow history sync: per-row lookups vs batched pipeline
+
+Builds a synthetic agents directory (5,000 ADWs by default) and a temporary
+SQLite database, then times a backfill (empty database) and a steady-state
+sync (1% of workflows changed) for both implementations.
+
+Enrichment and pattern detection are stubbed out in both runs; they do the
+same work either way, so the numbers isolate database round trips.
+
+Usage:
+    python benchmark_workflow_sync.py            # 5,000 ADWs
+    python benchmark_workflow_sync.py --adws 500
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import core.workflow_history_utils.database.mutations as mutations_module
+import core.workflow_history_utils.database.queries as queries_module
+import core.workflow_history_utils.database.schema as schema_module
+import core.workflow_history_utils.sync_manager as sync_manager_module
+from core.workflow_history_utils.database import (
+    get_workflow_by_adw_id,
+    get_workflow_history,
+    init_db,
+    insert_workflow_history,
+    update_workflow_history,
+)
+from core.workflow_history_utils.filesystem import scan_agents_directory
+from database.sqlite_adapter import SQLiteAdapter
+
+
+def _write_agents_dir(agents_dir: Path, count: int) -> None:
+    """Create count ADW directories; 70% completed, the rest running."""
+    for i in range(count):
+        adw_id = f"bench{i:05d}"
+        adw_dir = agents_dir / adw_id
+        adw_dir.mkdir(parents=True)
+        (adw_dir / "adw_state.json").write_text(json.dumps({
+            "adw_id": adw_id,
+            "nl_input": f"Synthetic workflow {i}",
+            "status": "completed" if i % 10 < 7 else "running",
+            "start_time": "2025-01-01T00:00:00",
+            "end_time": "2025-01-01T01:00:00" if i % 10 < 7 else None,
+            "current_phase": "ship" if i % 10 < 7 else "build",
+        }))
+
+
+def _touch_state_files(agents_dir: Path, count: int, fraction: float) -> None:
+    """Move a fraction of running workflows to a new phase."""
+    step = max(1, int(1 / fraction))
+    for i in range(0, count, step):
+        state_file = agents_dir / f"bench{i:05d}" / "adw_state.json"
+        state = json.loads(state_file.read_text())
+        state["current_phase"] = "test"
+        state_file.write_text(json.dumps(state))
+        st = state_file.stat()
+        os.utime(state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def legacy_sync_workflow_history(adapter) -> int:
+    """Previous implementation: one lookup, write and COUNT(*) per workflow."""
+    workflows = scan_agents_directory()
+    synced_count = 0
+
+    for workflow_data in workflows:
+        adw_id = workflow_data["adw_id"]
+        existing = get_workflow_by_adw_id(adw_id)
+
+        if not existing:
+            get_workflow_history()
+
+        if existing:
+            updates = sync_manager_module._build_update_dict(existing, workflow_data, None, adw_id)
+            if updates:
+                update_workflow_history(adw_id, **updates)
+                synced_count += 1
+        else:
+            insert_workflow_history(**{
+                **workflow_data,
+                "created_at": workflow_data.get("start_time") or datetime.now().isoformat(),
+            })
+            synced_count += 1
+
+    with adapter.get_connection() as conn:
+        cursor = conn.cursor()
+        for workflow in workflows:
+            if workflow.get("status") in ("completed", "failed"):
+                cursor.execute(
+                    "SELECT COUNT(*) as count FROM pattern_occurrences WHERE workflow_id = ?",
+                    (workflow["adw_id"],),
+                )
+                cursor.fetchone()
+
+    return synced_count
+
+
+def _run(implementation: str, adws: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir, ExitStack() as stack:
+        agents_dir = Path(tmp_dir) / "agents"
+        _write_agents_dir(agents_dir, adws)
+
+        adapter = SQLiteAdapter(db_path=os.path.join(tmp_dir, "history.db"))
+        for module in (schema_module, mutations_module, queries_module, sync_manager_module):
+            stack.enter_context(patch.object(module, "_get_adapter", lambda: adapter))
+        stack.enter_context(patch(
+            "core.workflow_history_utils.filesystem.get_agents_dir", return_value=agents_dir
+        ))
+        stack.enter_context(patch.object(sync_manager_module, "enrich_workflow", return_value=None))
+        stack.enter_context(patch(
+            "core.pattern_persistence.process_and_persist_workflow",
+            return_value={"patterns_detected": 0},
+        ))
+        # Bulk inserts log one phantom warning per batch; the legacy path one per row
+        stack.enter_context(patch.object(mutations_module.logger, "error"))
+        stack.enter_context(patch.object(mutations_module.logger, "info"))
+
+        init_db()
+        with adapter.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE pattern_occurrences (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    pattern_id INTEGER NOT NULL,
+                    workflow_id TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX idx_po_workflow ON pattern_occurrences(workflow_id)")
+
+        def sync():
+            if implementation == "legacy":
+                return legacy_sync_workflow_history(adapter)
+            return sync_manager_module.sync_workflow_history()
+
+        timings = {}
+        for phase in ("backfill", "steady"):
+            if phase == "steady":
+                _touch_state_files(agents_dir, adws, fraction=0.01)
+            checkouts = adapter.get_pool_stats()["checkouts"]
+            start = time.perf_counter()
+            synced = sync()
+            timings[phase] = {
+                "seconds": time.perf_counter() - start,
+                "synced": synced,
+                "connections": adapter.get_pool_stats()["checkouts"] - checkouts,
+            }
+
+        adapter.close()
+        return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adws", type=int, default=5000, help="Number of synthetic ADW directories")
+    args = parser.parse_args()
+
+    # Fresh agents index per run (the index is shared per directory path)
+    results = {name: _run(name, args.adws) for name in ("legacy", "batched")}
+
+    print(f"\n{'='*78}")
+    print(f"WORKFLOW HISTORY SYNC ({args.adws} ADWs)")
+    print(f"{'='*78}")
+    print(f"{'Phase':<10} {'Per-row':<24} {'Batched':<24} {'Speedup'}")
+    print("-" * 78)
+    for phase in ("backfill", "steady"):
+        legacy, batched = results["legacy"][phase], results["batched"][phase]
+        print(
+            f"{phase.upper():<10} "
+            f"{legacy['seconds']:>7.3f}s ({legacy['connections']:>5} conn)  "
+            f"{batched['seconds']:>7.3f}s ({batched['connections']:>5} conn)  "
+            f"{legacy['seconds'] / batched['seconds']:.1f}x"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,13 @@ import logging
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from core.agents_index import get_agents_index
+from core.process_table import get_process_table
+
+if TYPE_CHECKING:
+    from core.models.observability import AdwPhaseSummary
 
 logger = logging.getLogger(__name__)
 
@@ -86,37 +92,33 @@ def scan_adw_states(use_cache: bool = True) -> list[dict[str, Any]]:
         logger.warning(f"Agents directory not found: {agents_dir}")
         return []
 
-    states = []
+    # Shared incremental index: only changed state files are re-read
+    index = get_agents_index(agents_dir)
+    index.refresh()
 
-    for adw_dir in agents_dir.iterdir():
-        if not adw_dir.is_dir():
-            continue
+    states = []
 
-        adw_id = adw_dir.name
-        state_file = adw_dir / "adw_state.json"
+    for entry in index.entries():
+        adw_id = entry.adw_id
 
-        if not state_file.exists():
-            logger.debug(f"No adw_state.json found for {adw_id}")
+        if isinstance(entry.error, json.JSONDecodeError):
+            logger.warning(f"Failed to parse state file for {adw_id}: {entry.error}")
             continue
-
-        try:
-            with open(state_file, encoding='utf-8') as f:
-                state_data = json.load(f)
-
-            # Add adw_id to state data
-            state_data["adw_id"] = adw_id
-            state_data["state_file_path"] = str(state_file)
-            state_data["agent_dir_path"] = str(adw_dir)
-
-            states.append(state_data)
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse state file for {adw_id}: {e}")
+        if entry.error is not None:
+            logger.error(f"Error reading state file for {adw_id}: {entry.error}")
             continue
-        except Exception as e:
-            logger.error(f"Error reading state file for {adw_id}: {e}")
+        if not isinstance(entry.state, dict):
+            logger.error(f"Error reading state file for {adw_id}: state is not a JSON object")
             continue
 
+        # Copy so callers can annotate without mutating the shared cache
+        state_data = dict(entry.state)
+        state_data["adw_id"] = adw_id
+        state_data["state_file_path"] = str(entry.state_file)
+        state_data["agent_dir_path"] = str(entry.adw_dir)
+
+        states.append(state_data)
+
     # Update cache
     _state_scan_cache["states"] = states
     _state_scan_cache["timestamp"] = datetime.now()
@@ -128,6 +130,9 @@ def is_process_running(adw_id: str) -> bool:
     """
     Check if a workflow process is currently running.
 
+    Uses the shared process table snapshot (see core.process_table), so
+    repeated checks within its TTL cost a dict lookup, not a ps call.
+
     Args:
         adw_id: The ADW workflow identifier
 
@@ -135,31 +140,7 @@ def is_process_running(adw_id: str) -> bool:
         bool: True if process is running, False otherwise
     """
     try:
-        # Use ps to check for running processes containing the adw_id
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        # Look for the adw_id in process list
-        # Common patterns: adw_sdlc_complete_iso.py, adw_plan_iso.py, adw_build_iso.py, etc.
-        # Also check for legacy "aider" pattern for backward compatibility
-        for line in result.stdout.splitlines():
-            if adw_id in line:
-                # Check for ADW workflow scripts (isolated workflows)
-                if any(pattern in line.lower() for pattern in ["adw_", "uv run"]):
-                    return True
-                # Check for legacy aider pattern
-                if "aider" in line.lower():
-                    return True
-
-        return False
-
-    except subprocess.TimeoutExpired:
-        logger.warning(f"Process check timed out for {adw_id}")
-        return False
+        return get_process_table().is_adw_running(adw_id)
     except Exception as e:
         logger.error(f"Error checking process for {adw_id}: {e}")
         return False
@@ -167,9 +148,10 @@ def is_process_running(adw_id: str) -> bool:
 
 def batch_check_running_processes(adw_ids: list[str]) -> dict[str, bool]:
     """
-    Check which workflows have running processes in a single ps call.
+    Check which workflows have running processes.
 
-    More efficient than calling is_process_running() for each workflow individually.
+    All lookups share one process table snapshot, and each uses the same
+    rules as is_process_running().
 
     Args:
         adw_ids: List of ADW workflow identifiers
@@ -177,33 +159,7 @@ def batch_check_running_processes(adw_ids: list[str]) -> dict[str, bool]:
     Returns:
         dict: Mapping of adw_id to boolean (True if running)
     """
-    result_map = dict.fromkeys(adw_ids, False)
-
-    try:
-        # Run ps aux once for all workflows
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        # Check each line once for all adw_ids
-        for line in result.stdout.splitlines():
-            line_lower = line.lower()
-            if "aider" in line_lower:
-                for adw_id in adw_ids:
-                    if adw_id in line:
-                        result_map[adw_id] = True
-
-        return result_map
-
-    except subprocess.TimeoutExpired:
-        logger.warning("Process check timed out for batch operation")
-        return result_map
-    except Exception as e:
-        logger.error(f"Error in batch process check: {e}")
-        return result_map
+    return {adw_id: is_process_running(adw_id) for adw_id in adw_ids}
 
 
 def worktree_exists(adw_id: str) -> bool:
@@ -253,7 +209,9 @@ def get_last_activity_timestamp(adw_id: str) -> datetime | None:
         return None
 
 
-def determine_status(adw_id: str, state: dict[str, Any]) -> str:
+def determine_status(
+    adw_id: str, state: dict[str, Any], running_processes: dict[str, bool] | None = None
+) -> str:
     """
     Determine the current status of a workflow.
 
@@ -271,6 +229,7 @@ def determine_status(adw_id: str, state: dict[str, Any]) -> str:
     Args:
         adw_id: The ADW workflow identifier
         state: The workflow state dictionary
+        running_processes: Optional pre-computed map of adw_id -> is_running
 
     Returns:
         str: One of: running, completed, failed, paused, queued
@@ -284,8 +243,11 @@ def determine_status(adw_id: str, state: dict[str, Any]) -> str:
     if state_status == "failed":
         return "failed"
 
-    # Check if process is running
-    if is_process_running(adw_id):
+    # Check if process is running (use pre-computed value if available)
+    if running_processes is not None:
+        if running_processes.get(adw_id, False):
+            return "running"
+    elif is_process_running(adw_id):
         return "running"
 
     # Check if worktree exists but no process
@@ -311,6 +273,70 @@ def determine_status(adw_id: str, state: dict[str, Any]) -> str:
     return "queued"
 
 
+# Standard SDLC phases (9 total)
+SDLC_PHASES = ["plan", "validate", "build", "lint", "test", "review", "doc", "ship", "cleanup"]
+
+
+def load_phase_summaries(adw_ids: list[str]) -> dict[str, "AdwPhaseSummary"]:
+    """
+    Load task_logs phase progress and cost for many workflows in one query.
+
+    Args:
+        adw_ids: ADW workflow identifiers
+
+    Returns:
+        dict: Mapping of adw_id -> AdwPhaseSummary (workflows without task logs are omitted)
+    """
+    from repositories.task_log_repository import TaskLogRepository
+
+    return TaskLogRepository().get_phase_summaries(adw_ids)
+
+
+def phase_progress_from_summary(
+    summary: "AdwPhaseSummary | None", state: dict[str, Any]
+) -> tuple[str | None, float, list[str], int]:
+    """
+    Calculate the current phase and overall progress from a task_logs summary.
+
+    Args:
+        summary: Phase summary for the workflow (None if it has no task logs)
+        state: The workflow state dictionary
+
+    Returns:
+        tuple: (current_phase, progress_percentage, completed_phases_list, total_phases)
+    """
+    total_phases = len(SDLC_PHASES)
+    completed_phases = list(summary.completed_phases) if summary else []
+    current_phase = summary.current_phase if summary else None
+
+    # Calculate base progress
+    base_progress = (len(completed_phases) / total_phases) * 100
+
+    # If no current phase from database, check state (fallback)
+    if not current_phase:
+        current_phase = state.get("current_phase")
+        if current_phase:
+            current_phase = current_phase.lower()
+
+    # If still no current phase but workflow is running/paused, infer next phase
+    if not current_phase and (state.get("status") or "").lower() in ["running", "paused"]:
+        # Next incomplete phase is current
+        for phase in SDLC_PHASES:
+            if phase not in completed_phases:
+                current_phase = phase
+                break
+
+    # If we have a current phase that's not in completed phases,
+    # add partial progress (50% of one phase)
+    if current_phase and current_phase not in completed_phases:
+        base_progress += (100 / total_phases) * 0.5
+
+    # Cap at 100%
+    progress = min(base_progress, 100.0)
+
+    return current_phase, round(progress, 1), completed_phases, total_phases
+
+
 def calculate_phase_progress(adw_id: str, state: dict[str, Any]) -> tuple[str | None, float, list[str], int]:
     """
     Calculate the current phase and overall progress percentage.
@@ -318,6 +344,9 @@ def calculate_phase_progress(adw_id: str, state: dict[str, Any]) -> tuple[str |
     Progress is based on task_logs database records (single source of truth).
     Standard SDLC phases: plan, validate, build, lint, test, review, doc, ship, cleanup
 
+    For many workflows at once, use load_phase_summaries() with
+    phase_progress_from_summary() instead of calling this per workflow.
+
     Args:
         adw_id: The ADW workflow identifier
         state: The workflow state dictionary
@@ -325,59 +354,41 @@ def calculate_phase_progress(adw_id: str, state: dict[str, Any]) -> tuple[str |
     Returns:
         tuple: (current_phase, progress_percentage, completed_phases_list, total_phases)
     """
-    from repositories.task_log_repository import TaskLogRepository
-
-    # Standard SDLC phases (9 total)
-    phases = ["plan", "validate", "build", "lint", "test", "review", "doc", "ship", "cleanup"]
-    total_phases = len(phases)
-
-    # Query task_logs table for authoritative phase completion data
     try:
-        task_log_repo = TaskLogRepository()
-        task_logs = task_log_repo.get_by_adw_id(adw_id)
-
-        # Extract completed phases from database
-        completed_phases = []
-        current_phase = None
-
-        for log in task_logs:
-            if log.phase_status == "completed" and log.phase_name.lower() not in completed_phases:
-                completed_phases.append(log.phase_name.lower())
-            elif log.phase_status == "started" and not current_phase:
-                # Most recent "started" phase is the current one
-                current_phase = log.phase_name.lower()
-
-        # Calculate base progress
-        base_progress = (len(completed_phases) / total_phases) * 100
-
-        # If no current phase from database, check state (fallback)
-        if not current_phase:
-            current_phase = state.get("current_phase")
-            if current_phase:
-                current_phase = current_phase.lower()
-
-        # If still no current phase but workflow is running/paused, infer next phase
-        if not current_phase and state.get("status", "").lower() in ["running", "paused"]:
-            # Next incomplete phase is current
-            for phase in phases:
-                if phase not in completed_phases:
-                    current_phase = phase
-                    break
-
-        # If we have a current phase that's not in completed phases,
-        # add partial progress (50% of one phase)
-        if current_phase and current_phase not in completed_phases:
-            base_progress += (100 / total_phases) * 0.5
-
-        # Cap at 100%
-        progress = min(base_progress, 100.0)
-
-        return current_phase, round(progress, 1), completed_phases, total_phases
-
+        summary = load_phase_summaries([adw_id]).get(adw_id)
     except Exception as e:
         logger.error(f"Error querying task_logs for {adw_id}: {e}")
         # Fallback: return minimal progress if database query fails
-        return None, 0.0, [], total_phases
+        return None, 0.0, [], len(SDLC_PHASES)
+
+    return phase_progress_from_summary(summary, state)
+
+
+def _to_float(value: Any) -> float | None:
+    """Convert a cost value (possibly a string) to float, None if not convertible."""
+    try:
+        return float(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def cost_data_from_summary(
+    summary: "AdwPhaseSummary | None", state: dict[str, Any]
+) -> tuple[float | None, float | None]:
+    """
+    Extract current and estimated total cost from a task_logs summary.
+
+    Args:
+        summary: Phase summary for the workflow (None if it has no task logs)
+        state: The workflow state dictionary
+
+    Returns:
+        tuple: (current_cost, estimated_total_cost)
+    """
+    # Sum of completed/failed phase costs; None when nothing was spent yet
+    current_cost = summary.total_cost if summary and summary.total_cost > 0 else None
+    estimated_cost = state.get("estimated_cost_total") or state.get("estimated_cost")
+    return current_cost, _to_float(estimated_cost)
 
 
 def extract_cost_data(state: dict[str, Any], adw_id: str | None = None) -> tuple[float | None, float | None]:
@@ -394,48 +405,15 @@ def extract_cost_data(state: dict[str, Any], adw_id: str | None = None) -> tuple
     Returns:
         tuple: (current_cost, estimated_total_cost)
     """
-    from repositories.task_log_repository import TaskLogRepository
-
-    current_cost = None
-    estimated_cost = state.get("estimated_cost_total") or state.get("estimated_cost")
-
-    # Query database for actual accumulated costs
     if adw_id:
         try:
-            task_log_repo = TaskLogRepository()
-            task_logs = task_log_repo.get_by_adw_id(adw_id)
-
-            # Sum all costs from completed phases
-            total_cost = 0.0
-            for log in task_logs:
-                if log.cost_usd and log.phase_status in ["completed", "failed"]:
-                    total_cost += log.cost_usd
-
-            current_cost = total_cost if total_cost > 0 else None
-
+            return cost_data_from_summary(load_phase_summaries([adw_id]).get(adw_id), state)
         except Exception as e:
             logger.error(f"Error querying task_logs for cost data (adw_id={adw_id}): {e}")
-            # Fallback to state file
-            current_cost = state.get("current_cost")
-
-    else:
-        # No adw_id provided, fallback to state file
-        current_cost = state.get("current_cost")
 
-    # Convert to float if string
-    try:
-        if current_cost is not None:
-            current_cost = float(current_cost)
-    except (ValueError, TypeError):
-        current_cost = None
-
-    try:
-        if estimated_cost is not None:
-            estimated_cost = float(estimated_cost)
-    except (ValueError, TypeError):
-        estimated_cost = None
-
-    return current_cost, estimated_cost
+    # No adw_id provided or query failed, fallback to state file
+    estimated_cost = state.get("estimated_cost_total") or state.get("estimated_cost")
+    return _to_float(state.get("current_cost")), _to_float(estimated_cost)
 
 
 def extract_error_info(adw_id: str, state: dict[str, Any]) -> tuple[int, str | None]:
@@ -535,13 +513,21 @@ def detect_pr_for_issue(issue_number: int | None) -> int | None:
     return None
 
 
-def build_workflow_status(state: dict[str, Any], running_processes: dict[str, bool] | None = None) -> dict[str, Any]:
+def build_workflow_status(
+    state: dict[str, Any],
+    running_processes: dict[str, bool] | None = None,
+    phase_summaries: dict[str, "AdwPhaseSummary"] | None = None,
+    status: str | None = None,
+) -> dict[str, Any]:
     """
     Build a complete workflow status object from state data.
 
     Args:
         state: The workflow state dictionary
         running_processes: Optional pre-computed map of adw_id -> is_running
+        phase_summaries: Optional pre-loaded task_logs summaries (see load_phase_summaries);
+            queried for this workflow alone if not provided
+        status: Optional pre-computed status (see determine_status)
 
     Returns:
         dict: Complete workflow status with all fields
@@ -550,13 +536,19 @@ def build_workflow_status(state: dict[str, Any], running_processes: dict[str, bo
 
     try:
         # Determine status
-        status = determine_status(adw_id, state)
+        if status is None:
+            status = determine_status(adw_id, state, running_processes)
 
-        # Calculate phase progress (now returns total_phases dynamically)
-        current_phase, progress, completed_phases, total_phases = calculate_phase_progress(adw_id, state)
+        if phase_summaries is not None:
+            summary = phase_summaries.get(adw_id)
+            current_phase, progress, completed_phases, total_phases = phase_progress_from_summary(summary, state)
+            current_cost, estimated_cost = cost_data_from_summary(summary, state)
+        else:
+            # Calculate phase progress (now returns total_phases dynamically)
+            current_phase, progress, completed_phases, total_phases = calculate_phase_progress(adw_id, state)
 
-        # Extract costs (queries database for actual accumulated costs)
-        current_cost, estimated_cost = extract_cost_data(state, adw_id=adw_id)
+            # Extract costs (queries database for actual accumulated costs)
+            current_cost, estimated_cost = extract_cost_data(state, adw_id=adw_id)
 
         # Extract error info
         error_count, last_error = extract_error_info(adw_id, state)
@@ -631,35 +623,88 @@ def build_workflow_status(state: dict[str, Any], running_processes: dict[str, bo
         }
 
 
-def aggregate_adw_monitor_data() -> dict[str, Any]:
+def aggregate_adw_monitor_data(
+    status: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    use_cache: bool = True,
+) -> dict[str, Any]:
     """
     Aggregate all ADW workflow status data.
 
     This is the main entry point for the ADW monitor functionality.
-    Returns comprehensive status for all workflows.
+    Returns comprehensive status for all workflows, or one page of them.
+
+    Statuses come from state files and a single ps call; phase progress and
+    costs for the matching workflows come from one grouped task_logs query,
+    so the cost does not grow with a query per workflow.
+
+    Args:
+        status: Only return workflows with this status (summary still counts all)
+        limit: Maximum number of workflows to return (None = all)
+        offset: Number of workflows to skip, after sorting
+        use_cache: Whether to use cached results (default: True); only the
+            unfiltered, unpaginated result is cached
 
     Returns:
         dict: Complete monitor response with summary and workflow list
     """
+    cacheable = status is None and limit is None and offset == 0
+
     # Check cache
-    if _monitor_cache["data"] and _monitor_cache["timestamp"]:
+    if use_cache and cacheable and _monitor_cache["data"] and _monitor_cache["timestamp"]:
         elapsed = (datetime.now() - _monitor_cache["timestamp"]).total_seconds()
         if elapsed < _monitor_cache["ttl_seconds"]:
             logger.debug("Returning cached ADW monitor data")
             return _monitor_cache["data"]
 
     # Scan for ADW states
-    states = scan_adw_states()
+    states = scan_adw_states(use_cache=use_cache)
 
     # Batch check for running processes (more efficient than individual checks)
     adw_ids = [state.get("adw_id") for state in states if state.get("adw_id")]
     running_processes = batch_check_running_processes(adw_ids)
 
+    # Determine every status up front: the summary counts all workflows
+    statuses = {}
+    for state in states:
+        adw_id = state.get("adw_id", "unknown")
+        try:
+            statuses[adw_id] = determine_status(adw_id, state, running_processes)
+        except Exception as e:
+            logger.error(f"Error determining status for {adw_id}: {e}")
+            statuses[adw_id] = "unknown"
+
+    summary = {
+        "total": len(statuses),
+        "running": sum(1 for s in statuses.values() if s == "running"),
+        "completed": sum(1 for s in statuses.values() if s == "completed"),
+        "failed": sum(1 for s in statuses.values() if s == "failed"),
+        "paused": sum(1 for s in statuses.values() if s == "paused"),
+    }
+
+    if status is not None:
+        states = [state for state in states if statuses[state.get("adw_id", "unknown")] == status]
+
+    # One grouped task_logs query for progress and cost of all matching workflows
+    try:
+        phase_summaries = load_phase_summaries(
+            [state["adw_id"] for state in states if state.get("adw_id")]
+        )
+    except Exception as e:
+        logger.error(f"Error querying task_logs for ADW monitor: {e}")
+        phase_summaries = {}
+
     # Build workflow status for each state
     workflows = []
     for state in states:
         try:
-            workflow_status = build_workflow_status(state, running_processes)
+            workflow_status = build_workflow_status(
+                state,
+                running_processes,
+                phase_summaries=phase_summaries,
+                status=statuses[state.get("adw_id", "unknown")],
+            )
             workflows.append(workflow_status)
         except Exception as e:
             logger.error(f"Error building status for {state.get('adw_id')}: {e}")
@@ -701,14 +746,11 @@ def aggregate_adw_monitor_data() -> dict[str, Any]:
 
     workflows.sort(key=sort_key)
 
-    # Calculate summary statistics
-    summary = {
-        "total": len(workflows),
-        "running": sum(1 for w in workflows if w["status"] == "running"),
-        "completed": sum(1 for w in workflows if w["status"] == "completed"),
-        "failed": sum(1 for w in workflows if w["status"] == "failed"),
-        "paused": sum(1 for w in workflows if w["status"] == "paused"),
-    }
+    # Paginate after sorting so pages are stable
+    if limit is not None:
+        workflows = workflows[offset:offset + limit]
+    elif offset:
+        workflows = workflows[offset:]
 
     # Build response
     response = {
@@ -718,7 +760,8 @@ def aggregate_adw_monitor_data() -> dict[str, Any]:
     }
 
     # Update cache
-    _monitor_cache["data"] = response
-    _monitor_cache["timestamp"] = datetime.now()
+    if cacheable:
+        _monitor_cache["data"] = response
+        _monitor_cache["timestamp"] = datetime.now()
 
     return response
@@ -0,0 +1,270 @@
+"""
+Incremental index of ADW state files in the agents directory.
+
+Replaces the independent full scans of ``agents/*/adw_state.json`` done by
+workflow history sync, the ADW monitor and WorkflowService. The index keeps
+parsed state keyed by (mtime_ns, size) and only re-reads files that changed.
+It also caches each ADW directory's layout (phase subdirectories, error.log),
+so callers never need to list directories that have not changed.
+
+Every refresh that finds a difference bumps the index version. Consumers can
+ask for the added/modified/removed ADW ids since a version they have already
+processed, so several consumers can share one index without stealing each
+other's change notifications.
+
+Example:
+    index = get_agents_index(agents_dir)
+    index.refresh()
+    changes = index.changes_since(last_version)
+    for entry in index.entries():
+        ...
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE_NAME = "adw_state.json"
+ERROR_LOG_NAME = "error.log"
+
+
+@dataclass
+class AgentStateEntry:
+    """Cached state for one ADW directory."""
+
+    adw_id: str
+    adw_dir: Path
+    state_file: Path
+    state: Any = None
+    error: Exception | None = None
+    state_mtime: float = 0.0
+    state_key: tuple[int, int] = (0, 0)
+    dir_mtime_ns: int | None = None
+    phase_dirs: tuple[str, ...] = ()
+    error_log_mtime: float | None = None
+    created_version: int = 0
+    version: int = 0
+
+    @property
+    def has_error_log(self) -> bool:
+        """True if the ADW directory contains error.log."""
+        return self.error_log_mtime is not None
+
+
+@dataclass
+class AgentsChangeSet:
+    """ADW ids that changed between two index versions."""
+
+    version: int
+    added: set[str] = field(default_factory=set)
+    modified: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    @property
+    def changed(self) -> set[str]:
+        """ADW ids that were added or modified."""
+        return self.added | self.modified
+
+
+class AgentsDirectoryIndex:
+    """Thread-safe, incrementally refreshed index of ADW state files."""
+
+    def __init__(self, agents_dir: Path):
+        """
+        Args:
+            agents_dir: Path to the agents directory
+        """
+        self.agents_dir = agents_dir
+        self._lock = threading.Lock()
+        self._entries: dict[str, AgentStateEntry] = {}
+        self._removed_at: dict[str, int] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic version, bumped whenever a refresh finds changes."""
+        return self._version
+
+    def refresh(self) -> AgentsChangeSet:
+        """
+        Re-stat the agents directory and re-read only changed state files.
+
+        Returns:
+            Changes found by this refresh
+        """
+        with self._lock:
+            version = self._version + 1
+            changes = AgentsChangeSet(version=version)
+            seen: set[str] = set()
+
+            children = list(self.agents_dir.iterdir()) if self.agents_dir.exists() else []
+
+            for adw_dir in children:
+                adw_id = adw_dir.name
+                state_file = adw_dir / STATE_FILE_NAME
+                try:
+                    st = state_file.stat()
+                except NotADirectoryError:
+                    continue
+                except FileNotFoundError:
+                    logger.debug(f"[AGENTS_INDEX] No adw_state.json found for {adw_id}")
+                    continue
+                except OSError as e:
+                    logger.debug(f"[AGENTS_INDEX] Cannot stat {state_file}: {e}")
+                    continue
+
+                seen.add(adw_id)
+                entry = self._entries.get(adw_id)
+                state_key = (st.st_mtime_ns, st.st_size)
+
+                if entry is None:
+                    entry = AgentStateEntry(adw_id=adw_id, adw_dir=adw_dir, state_file=state_file)
+                    entry.created_version = version
+                    self._load_state(entry, state_key, st.st_mtime)
+                    self._entries[adw_id] = entry
+                    self._removed_at.pop(adw_id, None)
+                    changes.added.add(adw_id)
+                elif entry.state_key != state_key or _is_transient(entry.error):
+                    self._load_state(entry, state_key, st.st_mtime)
+                    changes.modified.add(adw_id)
+
+                if self._refresh_layout(entry) and adw_id not in changes.added:
+                    changes.modified.add(adw_id)
+
+                if adw_id in changes.added or adw_id in changes.modified:
+                    entry.version = version
+
+            for adw_id in set(self._entries) - seen:
+                del self._entries[adw_id]
+                self._removed_at[adw_id] = version
+                changes.removed.add(adw_id)
+
+            if changes.has_changes:
+                self._version = version
+                logger.debug(
+                    f"[AGENTS_INDEX] v{version}: +{len(changes.added)} "
+                    f"~{len(changes.modified)} -{len(changes.removed)}"
+                )
+            else:
+                changes.version = self._version
+            return changes
+
+    def entries(self) -> list[AgentStateEntry]:
+        """Return all indexed entries, including ones whose state failed to parse."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def get(self, adw_id: str) -> AgentStateEntry | None:
+        """Return the entry for one ADW, or None if it is not indexed."""
+        with self._lock:
+            return self._entries.get(adw_id)
+
+    def changes_since(self, version: int) -> AgentsChangeSet:
+        """
+        Return ADW ids added, modified or removed after ``version``.
+
+        Args:
+            version: Index version the caller last processed (0 for everything)
+
+        Returns:
+            Change set whose ``version`` the caller should store for next time
+        """
+        with self._lock:
+            changes = AgentsChangeSet(version=self._version)
+            for adw_id, entry in self._entries.items():
+                if entry.created_version > version:
+                    changes.added.add(adw_id)
+                elif entry.version > version:
+                    changes.modified.add(adw_id)
+            changes.removed = {
+                adw_id for adw_id, removed_at in self._removed_at.items() if removed_at > version
+            }
+            return changes
+
+    def _load_state(self, entry: AgentStateEntry, state_key: tuple[int, int], mtime: float) -> None:
+        """Parse the state file, recording the error instead of raising."""
+        entry.state_key = state_key
+        entry.state_mtime = mtime
+        try:
+            with open(entry.state_file, encoding="utf-8") as f:
+                entry.state = json.load(f)
+            entry.error = None
+        except Exception as e:
+            entry.state = None
+            entry.error = e
+
+    def _refresh_layout(self, entry: AgentStateEntry) -> bool:
+        """
+        Update cached phase directories and error.log info.
+
+        The directory is only listed when its mtime changes (entries added,
+        removed or renamed). error.log is re-stat'ed every time because
+        appending to it does not touch the directory mtime.
+
+        Returns:
+            True if the layout changed
+        """
+        changed = False
+        try:
+            dir_mtime_ns = entry.adw_dir.stat().st_mtime_ns
+        except OSError:
+            return False
+
+        if dir_mtime_ns != entry.dir_mtime_ns:
+            entry.dir_mtime_ns = dir_mtime_ns
+            phase_dirs = tuple(sorted(
+                child.name for child in entry.adw_dir.iterdir()
+                if child.name.startswith("adw_") and child.is_dir()
+            ))
+            if phase_dirs != entry.phase_dirs:
+                entry.phase_dirs = phase_dirs
+                changed = True
+
+        try:
+            error_log_mtime = (entry.adw_dir / ERROR_LOG_NAME).stat().st_mtime
+        except OSError:
+            error_log_mtime = None
+        if error_log_mtime != entry.error_log_mtime:
+            entry.error_log_mtime = error_log_mtime
+            changed = True
+
+        return changed
+
+
+def _is_transient(error: Exception | None) -> bool:
+    """I/O errors are retried every refresh; malformed JSON waits for the file to change."""
+    return error is not None and not isinstance(error, ValueError)
+
+
+# Shared indexes, one per agents directory
+_indexes: dict[str, AgentsDirectoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_agents_index(agents_dir: Path) -> AgentsDirectoryIndex:
+    """
+    Get the shared index for an agents directory.
+
+    Args:
+        agents_dir: Path to the agents directory
+
+    Returns:
+        AgentsDirectoryIndex shared by all callers using the same path
+    """
+    key = os.path.abspath(str(agents_dir))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = AgentsDirectoryIndex(agents_dir)
+            _indexes[key] = index
+        return index
@@ -15,9 +15,15 @@ from pathlib import Path
 from anthropic import Anthropic
 from models.context_review import ContextReviewResult
 from repositories.context_review_repository import ContextReviewRepository
+from utils.codebase_analyzer.content_index import get_codebase_index
 
 logger = logging.getLogger(__name__)
 
+# Reuse an index refreshed this recently instead of re-stat'ing the tree
+INDEX_MAX_AGE_SECONDS = 5.0
+# Path matches dominate; content matches break ties and surface files whose names miss
+CONTENT_MATCH_WEIGHT = 0.25
+
 
 class ContextReviewAgent:
     """External AI agent for codebase context analysis"""
@@ -94,8 +100,8 @@ class ContextReviewAgent:
 
         Steps:
         1. Extract keywords from description
-        2. Walk project directory
-        3. Match file names and paths against keywords
+        2. Refresh the shared content index of the project
+        3. Match file paths and indexed contents against keywords
         4. Score by relevance
         5. Return sorted list
 
@@ -114,14 +120,16 @@ class ContextReviewAgent:
             logger.warning(f"[AGENT] Project path does not exist: {project_path}")
             return []
 
-        scored_files = []
+        # Shared content index: only files changed since the last request are re-read
+        index = get_codebase_index(project_root)
+        index.refresh(max_age=INDEX_MAX_AGE_SECONDS)
+        keyword_counts = index.keyword_counts(keywords)
 
-        # Walk directory and score files
-        for file_path in project_root.rglob("*"):
-            if file_path.is_file() and not self._should_skip_file(file_path):
-                score = self._score_file(file_path, keywords, project_root)
-                if score > 0:
-                    scored_files.append((score, str(file_path.relative_to(project_root))))
+        scored_files = []
+        for file_path in index.paths():
+            score = self._score_file(file_path, keywords, keyword_counts.get(file_path, {}))
+            if score > 0:
+                scored_files.append((score, file_path))
 
         # Sort by score and return top matches
         scored_files.sort(reverse=True, key=lambda x: x[0])
@@ -237,29 +245,22 @@ Return ONLY the JSON object, no additional text.
         words = description.lower().replace(",", " ").replace(".", " ").split()
         # Filter out common words
         stopwords = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "with"}
-        return [w for w in words if w not in stopwords and len(w) > 2]
+        # Two-character words are kept when one is a digit ("s3", "v2")
+        return [w for w in words if w not in stopwords and (len(w) > 2 or (len(w) == 2 and not w.isalpha()))]
 
-    def _score_file(self, file_path: Path, keywords: list[str], project_root: Path) -> float:
-        """Score a file's relevance based on keywords."""
+    def _score_file(self, file_path: str, keywords: list[str], keyword_counts: dict[str, int]) -> float:
+        """Score a file's relevance: path matches, plus a smaller boost per keyword in its content."""
         score = 0.0
-        file_str = str(file_path.relative_to(project_root)).lower()
+        file_str = file_path.lower()
 
         for keyword in keywords:
             if keyword in file_str:
                 score += 1.0
+            if keyword_counts.get(keyword):
+                score += CONTENT_MATCH_WEIGHT
 
         return score
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """Check if file should be skipped during analysis."""
-        skip_patterns = [
-            ".git", "__pycache__", "node_modules", ".venv", "venv",
-            ".pytest_cache", "dist", "build", ".next", ".DS_Store"
-        ]
-
-        path_str = str(file_path)
-        return any(pattern in path_str for pattern in skip_patterns)
-
     def _read_file_samples(self, file_paths: list[str], project_root: str) -> dict[str, str]:
         """Read sample content from files."""
         samples = {}
@@ -3,11 +3,19 @@ Cost tracking utility for ADW workflows.
 
 This module reads cost data from raw_output.jsonl files in the agents directory
 and calculates cost metrics including total cost, cache efficiency, and per-phase breakdowns.
+
+Transcripts can be tens of MB, so the result message is found by reading the
+file backwards in blocks, and parsed usage is cached per file keyed by
+(path, mtime, size). Unchanged transcripts are never re-read; transcripts that
+grew (running phases) are only scanned from where the previous scan stopped.
 """
 
 import json
 import logging
+import os
+import threading
 from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 
 from core.data_models import (
@@ -47,49 +55,159 @@ def calculate_api_call_cost(
     return input_cost + cache_write_cost + cache_read_cost + output_cost
 
 
+# Bytes read per backwards seek when looking for the result message
+TAIL_BLOCK_SIZE = 64 * 1024
+
+# Upper bound on cached transcripts (oldest entries are evicted first)
+TRANSCRIPT_CACHE_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class _TranscriptCacheEntry:
+    """Parsed usage for one transcript at a given (mtime, size)."""
+
+    mtime_ns: int
+    size: int
+    stats: dict | None
+    # Offset just past the last complete line that was scanned
+    scanned_to: int
+
+
+_transcript_cache: dict[str, _TranscriptCacheEntry] = {}
+_transcript_cache_lock = threading.Lock()
+_transcript_cache_stats = {"hits": 0, "full_scans": 0, "incremental_scans": 0, "bytes_read": 0}
+
+
+def _find_last_result(f, start: int, end: int) -> tuple[dict | None, int, int]:
+    """
+    Find the last type="result" line in f[start:end] by reading backwards.
+
+    ``start`` must be at a line boundary.
+
+    Returns:
+        Tuple of (result message or None, offset past the last newline in the
+        range, bytes read)
+    """
+    bytes_read = 0
+    last_newline = None
+    pos = end
+    carry = b""
+
+    while pos > start:
+        size = min(TAIL_BLOCK_SIZE, pos - start)
+        pos -= size
+        f.seek(pos)
+        chunk = f.read(size)
+        bytes_read += len(chunk)
+
+        if last_newline is None:
+            idx = chunk.rfind(b"\n")
+            if idx != -1:
+                last_newline = pos + idx + 1
+
+        lines = (chunk + carry).split(b"\n")
+        # The first piece may be the tail of a line that starts in an earlier block
+        carry = lines[0] if pos > start else b""
+        complete = lines[1:] if pos > start else lines
+
+        for line in reversed(complete):
+            # Cheap filter before decoding; result lines always contain this token
+            if b'"result"' not in line:
+                continue
+            try:
+                data = json.loads(line.strip())
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(data, dict) and data.get("type") == "result":
+                return data, last_newline if last_newline is not None else start, bytes_read
+
+    return None, last_newline if last_newline is not None else start, bytes_read
+
+
+def _extract_usage(result_msg: dict) -> dict:
+    """Extract API call statistics from a result message."""
+    usage = result_msg.get("usage", {})
+    model = result_msg.get("model", "unknown")
+
+    return {
+        "model": model,
+        "input_tokens": usage.get("input_tokens", 0),
+        "cache_creation_tokens": usage.get("cache_creation_input_tokens", 0),
+        "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+    }
+
+
 def parse_jsonl_file(file_path: Path) -> dict | None:
     """
     Parse a raw_output.jsonl file and extract API call statistics.
 
     Returns a dict with model, input_tokens, cache_creation_tokens,
     cache_read_tokens, output_tokens, or None if parsing fails.
+
+    Results are cached per file. A transcript whose mtime and size are
+    unchanged is not read at all; one that only grew is scanned from the
+    end of the previous scan, keeping the cached result if no newer result
+    message was appended.
     """
     try:
-        with open(file_path) as f:
-            lines = f.readlines()
-
-        # Find the result message (last message with type="result")
-        result_msg = None
-        for line in reversed(lines):
-            try:
-                data = json.loads(line.strip())
-                if data.get("type") == "result":
-                    result_msg = data
-                    break
-            except json.JSONDecodeError:
-                continue
+        key = str(file_path)
+        st = os.stat(file_path)
+
+        with _transcript_cache_lock:
+            entry = _transcript_cache.get(key)
+            if entry and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                _transcript_cache_stats["hits"] += 1
+                return dict(entry.stats) if entry.stats else None
+
+        # Appended since the last scan: only the new tail can hold a newer result
+        incremental = entry is not None and st.st_size > entry.size
+        start = entry.scanned_to if incremental else 0
+
+        with open(file_path, "rb") as f:
+            result_msg, scanned_to, bytes_read = _find_last_result(f, start, st.st_size)
+
+        if result_msg:
+            stats = _extract_usage(result_msg)
+        elif incremental:
+            stats = entry.stats
+        else:
+            stats = None
+
+        with _transcript_cache_lock:
+            _transcript_cache_stats["bytes_read"] += bytes_read
+            _transcript_cache_stats["incremental_scans" if incremental else "full_scans"] += 1
+            _transcript_cache.pop(key, None)
+            _transcript_cache[key] = _TranscriptCacheEntry(
+                mtime_ns=st.st_mtime_ns, size=st.st_size, stats=stats, scanned_to=scanned_to
+            )
+            while len(_transcript_cache) > TRANSCRIPT_CACHE_MAX_ENTRIES:
+                del _transcript_cache[next(iter(_transcript_cache))]
 
-        if not result_msg:
+        if not stats:
             logger.debug(f"No result message found in {file_path}")
             return None
-
-        # Extract usage statistics
-        usage = result_msg.get("usage", {})
-        model = result_msg.get("model", "unknown")
-
-        return {
-            "model": model,
-            "input_tokens": usage.get("input_tokens", 0),
-            "cache_creation_tokens": usage.get("cache_creation_input_tokens", 0),
-            "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
-            "output_tokens": usage.get("output_tokens", 0),
-        }
+        return dict(stats)
 
     except Exception as e:
         logger.error(f"Error parsing {file_path}: {e}")
         return None
 
 
+def get_transcript_cache_stats() -> dict:
+    """Return transcript cache counters (hits, scans, bytes read, entries)."""
+    with _transcript_cache_lock:
+        return {**_transcript_cache_stats, "entries": len(_transcript_cache)}
+
+
+def clear_transcript_cache() -> None:
+    """Drop all cached transcript results and reset counters."""
+    with _transcript_cache_lock:
+        _transcript_cache.clear()
+        for counter in _transcript_cache_stats:
+            _transcript_cache_stats[counter] = 0
+
+
 def infer_phase_from_path(file_path: Path) -> str:
     """
     Infer the workflow phase from the agent directory name.
@@ -16,6 +16,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from core.process_table import get_process_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -283,27 +285,18 @@ def check_process_health(adw_id: str) -> dict[str, Any]:
 
     # Find processes related to this ADW
     try:
-        # Use ps to find processes with adw_id in command
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        # Shared /proc snapshot instead of a ps subprocess per check
+        table = get_process_table()
 
         processes = []
-        for line in result.stdout.split("\n"):
-            if adw_id in line and "ps aux" not in line:
-                # Extract basic info from ps output
-                # Format: USER PID %CPU %MEM ... COMMAND
-                parts = line.split(None, 10)
-                if len(parts) >= 11:
-                    processes.append({
-                        "pid": parts[1],
-                        "cpu_percent": parts[2],
-                        "memory_percent": parts[3],
-                        "command": parts[10][:100]  # Truncate long commands
-                    })
+        for info in table.find(adw_id):
+            usage = table.resource_usage(info.pid)
+            processes.append({
+                "pid": str(info.pid),
+                "cpu_percent": f"{usage[0]:.1f}" if usage else "",
+                "memory_percent": f"{usage[1]:.1f}" if usage else "",
+                "command": info.command[:100]  # Truncate long commands
+            })
 
         checks["processes"] = processes
         checks["active"] = len(processes) > 0
@@ -314,9 +307,6 @@ def check_process_health(adw_id: str) -> dict[str, Any]:
             checks["status"] = STATUS_WARNING
             checks["warnings"].append(f"High process count ({len(processes)}) - possible leaks")
 
-    except subprocess.TimeoutExpired:
-        checks["status"] = STATUS_WARNING
-        checks["warnings"].append("Process check timed out")
     except Exception as e:
         checks["status"] = STATUS_WARNING
         checks["warnings"].append(f"Failed to check processes: {str(e)}")
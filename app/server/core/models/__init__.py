@@ -20,6 +20,7 @@ from .domain import (
     TableSchema,
 )
 from .observability import (
+    AdwPhaseSummary,
     IssueProgress,
     TaskLog,
     TaskLogCreate,
@@ -154,6 +155,7 @@ __all__ = [
     "WorkflowTrends",
     "WorktreeHealthCheck",
     # Observability models
+    "AdwPhaseSummary",
     "IssueProgress",
     "TaskLog",
     "TaskLogCreate",
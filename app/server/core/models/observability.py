@@ -162,6 +162,14 @@ class IssueProgress(BaseModel):
     last_activity: datetime | None = None
 
 
+class AdwPhaseSummary(BaseModel):
+    """Per-ADW phase and cost rollup of task logs (see TaskLogRepository.get_phase_summaries)."""
+    adw_id: str
+    completed_phases: list[str] = Field(default_factory=list)  # lowercased, in phase order
+    current_phase: str | None = None  # first "started" phase in phase order
+    total_cost: float = 0.0  # cost of completed and failed phases
+
+
 # =====================================================================
 # Query/Filter Models
 # =====================================================================
@@ -61,6 +61,7 @@ class HealthCheckResponse(BaseModel):
     tables_count: int
     version: str = "1.0.0"
     uptime_seconds: float
+    database_pool: dict[str, Any] | None = None
 
 
 # System Status Models
@@ -619,9 +619,13 @@ def check_worktree_availability() -> dict[str, Any]:
             }
 
         # Count worktrees (exclude main worktree)
-        worktree_lines = result.stdout.strip().split('\n')
-        # First line is always the main worktree, rest are ADW worktrees
-        active_count = len(worktree_lines) - 1 if len(worktree_lines) > 0 else 0
+        worktree_lines = [line for line in result.stdout.strip().split('\n') if line]
+        # First line is always the main worktree, rest are ADW worktrees.
+        # Warm-pool worktrees (trees/.warm/*) are idle spares, not active ADWs.
+        active_count = sum(
+            1 for line in worktree_lines[1:]
+            if "/trees/.warm/" not in line.split()[0]
+        )
         max_worktrees = 15
         available = max_worktrees - active_count
 
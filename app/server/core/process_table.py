@@ -0,0 +1,204 @@
+"""
+Shared snapshot of the system process table.
+
+Replaces the ``ps aux`` subprocess calls made by the ADW monitor, the ADW
+health checks and the webhook trigger. The snapshot is read directly from
+``/proc/<pid>/cmdline`` (no fork+exec) and kept for a short TTL, so many
+lookups in one request or broadcast share a single scan.
+
+Each command line is split into word tokens and indexed token -> pids, so
+looking up an ADW id is a dict lookup and only matches whole tokens
+("abc1" does not match a process running "abc12345").
+
+Platforms without /proc (macOS development machines) fall back to one
+``ps`` call per snapshot.
+
+Example:
+    table = get_process_table()
+    if table.is_adw_running(adw_id):
+        ...
+    running = table.running_adws(adw_ids)
+"""
+
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Command line fragments that identify ADW workflow processes
+ADW_PROCESS_PATTERNS = ("adw_", "uv run", "aider")
+
+_TOKEN_RE = re.compile(r"[\w-]+")
+
+
+@dataclass(frozen=True)
+class ProcessInfo:
+    """One process from the snapshot."""
+
+    pid: int
+    command: str
+
+    @property
+    def is_adw_process(self) -> bool:
+        """True if the command line looks like an ADW workflow script."""
+        command = self.command.lower()
+        return any(pattern in command for pattern in ADW_PROCESS_PATTERNS)
+
+
+class ProcessTable:
+    """
+    Process table snapshot with a token -> pids index, refreshed after a TTL.
+
+    Thread-safe: the snapshot is replaced atomically, readers never see a
+    partially built index.
+    """
+
+    def __init__(self, ttl_seconds: float = 2.0, proc_root: str | Path = "/proc"):
+        """
+        Args:
+            ttl_seconds: How long a snapshot is reused before rescanning
+            proc_root: procfs mount point (overridable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.proc_root = Path(proc_root)
+        self._lock = threading.Lock()
+        self._processes: dict[int, ProcessInfo] = {}
+        self._index: dict[str, tuple[int, ...]] = {}
+        self._taken_at: float | None = None
+
+    def refresh(self, force: bool = False) -> None:
+        """Rescan the process table if the snapshot is older than the TTL."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._taken_at is not None and now - self._taken_at < self.ttl_seconds:
+                return
+
+            processes = self._scan()
+            index: dict[str, list[int]] = {}
+            for info in processes.values():
+                for token in set(_TOKEN_RE.findall(info.command)):
+                    index.setdefault(token, []).append(info.pid)
+
+            self._processes = processes
+            self._index = {token: tuple(pids) for token, pids in index.items()}
+            self._taken_at = now
+
+    def _scan(self) -> dict[int, ProcessInfo]:
+        if not self.proc_root.is_dir():
+            return self._scan_ps()
+
+        processes = {}
+        for entry in os.scandir(self.proc_root):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "cmdline"), "rb") as f:
+                    raw = f.read()
+            except OSError:
+                # Process exited during the scan or is not readable
+                continue
+            if not raw:
+                # Kernel threads and zombies have no command line
+                continue
+            command = raw.rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", "replace")
+            pid = int(entry.name)
+            processes[pid] = ProcessInfo(pid=pid, command=command)
+        return processes
+
+    def _scan_ps(self) -> dict[int, ProcessInfo]:
+        try:
+            result = subprocess.run(
+                ["ps", "-axo", "pid=,args="],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning(f"[PROCESS_TABLE] ps fallback failed: {e}")
+            return {}
+
+        processes = {}
+        for line in result.stdout.splitlines():
+            pid, _, command = line.strip().partition(" ")
+            if pid.isdigit() and command:
+                processes[int(pid)] = ProcessInfo(pid=int(pid), command=command.strip())
+        return processes
+
+    def find(self, token: str) -> list[ProcessInfo]:
+        """
+        Get processes whose command line contains the token as a whole word.
+
+        Args:
+            token: Word to look up, e.g. an ADW id
+
+        Returns:
+            Matching processes ordered by pid
+        """
+        self.refresh()
+        processes = self._processes
+        return [processes[pid] for pid in sorted(self._index.get(token, ())) if pid in processes]
+
+    def adw_pids(self, adw_id: str) -> list[int]:
+        """Get pids of ADW workflow processes running for an ADW id."""
+        return [info.pid for info in self.find(adw_id) if info.is_adw_process]
+
+    def is_adw_running(self, adw_id: str) -> bool:
+        """True if an ADW workflow process is running for the ADW id."""
+        return bool(self.adw_pids(adw_id))
+
+    def running_adws(self, adw_ids: list[str]) -> dict[str, bool]:
+        """Map each ADW id to whether a workflow process is running for it."""
+        return {adw_id: self.is_adw_running(adw_id) for adw_id in adw_ids}
+
+    def resource_usage(self, pid: int) -> tuple[float, float] | None:
+        """
+        Get lifetime-average CPU % and resident memory % of a process (like ps).
+
+        Returns:
+            (cpu_percent, memory_percent), or None if unavailable
+        """
+        try:
+            stat = (self.proc_root / str(pid) / "stat").read_text()
+            uptime = float((self.proc_root / "uptime").read_text().split()[0])
+            mem_total_kb = _read_mem_total_kb(self.proc_root / "meminfo")
+        except (OSError, ValueError, IndexError):
+            return None
+
+        # Fields after the parenthesised command name, starting at field 3 (state)
+        fields = stat[stat.rfind(")") + 2:].split()
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / clock_ticks
+        elapsed = uptime - int(fields[19]) / clock_ticks
+        rss_kb = int(fields[21]) * os.sysconf("SC_PAGE_SIZE") / 1024
+
+        cpu_percent = cpu_seconds / elapsed * 100 if elapsed > 0 else 0.0
+        memory_percent = rss_kb / mem_total_kb * 100 if mem_total_kb else 0.0
+        return cpu_percent, memory_percent
+
+
+def _read_mem_total_kb(meminfo: Path) -> int:
+    for line in meminfo.read_text().splitlines():
+        if line.startswith("MemTotal:"):
+            return int(line.split()[1])
+    return 0
+
+
+# Global singleton instance
+_process_table: ProcessTable | None = None
+_process_table_lock = threading.Lock()
+
+
+def get_process_table() -> ProcessTable:
+    """Get or create the shared ProcessTable."""
+    global _process_table
+    if _process_table is None:
+        with _process_table_lock:
+            if _process_table is None:
+                _process_table = ProcessTable()
+    return _process_table
@@ -0,0 +1,330 @@
+"""
+Streaming n-gram mining over hook-event tool sequences.
+
+Shared by scripts/analyze_hook_sequences.py and
+scripts/analyze_daily_patterns.py. Memory stays bounded no matter how many
+events are read:
+
+- hook_events are streamed with a server-side cursor (PostgreSQL) or plain
+  cursor iteration (SQLite), never fetched all at once.
+- Tool names are interned to small ints (starting at 1).
+- The n-grams ending at each event are encoded incrementally: extending a
+  suffix by one older tool is one shift-and-or, so an n-gram key costs O(1)
+  instead of building a tuple. Because ids are never 0 the packed int is an
+  exact encoding, so keys cannot collide.
+- Counts live in a Space-Saving heavy-hitters sketch with a fixed number of
+  counters. Every n-gram that occurs more than events/capacity times is
+  guaranteed to be kept, and each count is off by at most its ``error``.
+- Example sessions are recorded on the counter as events arrive.
+
+Example:
+    miner = SequenceMiner(min_length=3, max_length=9)
+    with adapter.get_connection() as conn:
+        miner.feed(stream_tool_events(conn, adapter.get_db_type()))
+    for seq in miner.top(min_count=5):
+        print(" → ".join(seq.tools), seq.count, seq.examples)
+"""
+
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+# Bits per interned tool id in a packed n-gram key
+TOOL_ID_BITS = 16
+OTHER_TOOL = "<other>"
+
+
+class ToolInterner:
+    """Maps tool names to small ints (1-based) and back."""
+
+    def __init__(self, max_tools: int = (1 << TOOL_ID_BITS) - 1):
+        self.max_tools = max_tools
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = [""]  # index 0 unused
+
+    def intern(self, name: str) -> int:
+        """Get the id for a tool name; names past max_tools share one id."""
+        tool_id = self._ids.get(name)
+        if tool_id is None:
+            # The last free id is kept for OTHER_TOOL
+            if name != OTHER_TOOL and len(self) >= self.max_tools - 1:
+                return self.intern(OTHER_TOOL)
+            tool_id = len(self._names)
+            self._ids[name] = tool_id
+            self._names.append(name)
+        return tool_id
+
+    def name(self, tool_id: int) -> str:
+        return self._names[tool_id]
+
+    def __len__(self) -> int:
+        return len(self._names) - 1
+
+
+@dataclass
+class _Counter:
+    count: int
+    error: int
+    examples: list[str] = field(default_factory=list)
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters sketch (Metwally et al.) with example sessions.
+
+    Keeps at most ``capacity`` counters. When a new key arrives and the sketch
+    is full, the smallest counter is reassigned to it and its count becomes an
+    overestimate by ``error``.
+
+    The minimum comes from a heap with one entry per counter that is only
+    refreshed on eviction: counts never decrease, so a popped entry whose
+    count is stale is pushed back with its current count, and the first entry
+    that is up to date is the true minimum.
+    """
+
+    def __init__(self, capacity: int = 100_000, max_examples: int = 3):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.max_examples = max_examples
+        self._counters: dict[int, _Counter] = {}
+        self._heap: list[tuple[int, int]] = []  # (count when pushed, key)
+
+    def offer(self, key: int, example: str | None = None) -> None:
+        """Count one occurrence of key, remembering example if there is room."""
+        counter = self._counters.get(key)
+        if counter is None:
+            if len(self._counters) < self.capacity:
+                counter = _Counter(count=0, error=0)
+            else:
+                counter = self._evict_min()
+            self._counters[key] = counter
+            heapq.heappush(self._heap, (counter.count + 1, key))
+
+        counter.count += 1
+        if example is not None and len(counter.examples) < self.max_examples and example not in counter.examples:
+            counter.examples.append(example)
+
+    def _evict_min(self) -> _Counter:
+        """Remove the smallest counter and return it reset for a new key."""
+        heap, counters = self._heap, self._counters
+        while True:
+            count, key = heap[0]
+            counter = counters[key]
+            if counter.count == count:
+                heapq.heappop(heap)
+                del counters[key]
+                counter.error = count
+                counter.examples = []
+                return counter
+            heapq.heapreplace(heap, (counter.count, key))
+
+    def items(self) -> Iterator[tuple[int, int, int, list[str]]]:
+        """Yield (key, count, error, examples) for every tracked key."""
+        for key, counter in self._counters.items():
+            yield key, counter.count, counter.error, counter.examples
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+@dataclass
+class MinedSequence:
+    """A frequent tool sequence."""
+
+    tools: tuple[str, ...]
+    # Upper bound on occurrences; count - error is a guaranteed lower bound
+    count: int
+    error: int
+    examples: list[str]
+
+
+class SequenceMiner:
+    """
+    Counts tool n-grams (min_length..max_length) within each session.
+
+    Events must arrive grouped by session and in time order within a session,
+    which is what stream_tool_events() yields. Every occurrence is counted,
+    including overlapping ones.
+    """
+
+    def __init__(
+        self,
+        min_length: int = 3,
+        max_length: int = 9,
+        capacity: int = 100_000,
+        max_examples: int = 3,
+    ):
+        if not 1 <= min_length <= max_length:
+            raise ValueError("need 1 <= min_length <= max_length")
+        self.min_length = min_length
+        self.max_length = max_length
+        self.interner = ToolInterner()
+        self.sketch = SpaceSaving(capacity=capacity, max_examples=max_examples)
+        self.events = 0
+        self.sessions = 0
+        self._session: str | None = None
+        self._window: list[int] = []  # last max_length tool ids, newest last
+
+    def add(self, session_id: str, tool_name: str) -> None:
+        """Process one tool event."""
+        if session_id != self._session:
+            self._session = session_id
+            self._window = []
+            self.sessions += 1
+        self.events += 1
+
+        window = self._window
+        window.append(self.interner.intern(tool_name))
+        if len(window) > self.max_length:
+            del window[0]
+
+        # Extend the n-gram ending at this event one older tool at a time
+        key = 0
+        for length, tool_id in enumerate(reversed(window), start=1):
+            key = (tool_id << (TOOL_ID_BITS * (length - 1))) | key
+            if length >= self.min_length:
+                self.sketch.offer(key, session_id)
+
+    def feed(self, events: Iterable[tuple[str, str]]) -> "SequenceMiner":
+        """Process a stream of (session_id, tool_name) events."""
+        for session_id, tool_name in events:
+            self.add(session_id, tool_name)
+        return self
+
+    def decode(self, key: int) -> tuple[str, ...]:
+        """Turn a packed n-gram key back into tool names (oldest first)."""
+        mask = (1 << TOOL_ID_BITS) - 1
+        tools = []
+        while key:
+            tools.append(self.interner.name(key & mask))
+            key >>= TOOL_ID_BITS
+        return tuple(reversed(tools))
+
+    def top(self, min_count: int = 1, limit: int | None = None) -> list[MinedSequence]:
+        """
+        Get the most frequent sequences.
+
+        Args:
+            min_count: Minimum (estimated) occurrences
+            limit: Maximum number of sequences to return
+
+        Returns:
+            Sequences by descending count, longer sequences first on ties
+        """
+        hits = (item for item in self.sketch.items() if item[1] >= min_count)
+        ranked = sorted(hits, key=lambda item: (-item[1], -item[0].bit_length(), item[0]))
+        return [
+            MinedSequence(tools=self.decode(key), count=count, error=error, examples=list(examples))
+            for key, count, error, examples in itertools.islice(ranked, limit)
+        ]
+
+
+def stream_tool_events(
+    conn,
+    db_type: str,
+    event_types: tuple[str, ...] = ("PreToolUse",),
+    since_hours: float | None = None,
+    batch_size: int = 10_000,
+) -> Iterator[tuple[str, str]]:
+    """Stream (session_id, tool_name) pairs; see iter_tool_event_rows()."""
+    for row in iter_tool_event_rows(conn, db_type, event_types, since_hours, batch_size):
+        yield row["session_key"], row["tool_name"]
+
+
+def iter_tool_event_rows(
+    conn,
+    db_type: str,
+    event_types: tuple[str, ...] = ("PreToolUse",),
+    since_hours: float | None = None,
+    batch_size: int = 10_000,
+) -> Iterator[Any]:
+    """
+    Stream tool events from hook_events, grouped by session.
+
+    Rows have session_key, tool_name and timestamp, ordered by session_key
+    and then timestamp.
+
+    On PostgreSQL a named (server-side) cursor fetches ``batch_size`` rows at
+    a time; SQLite cursors already step through results lazily. Events
+    without a session use their workflow_id, as the analysis scripts did.
+
+    Args:
+        conn: Open DB-API connection (keep it open while iterating)
+        db_type: "postgresql" or "sqlite"
+        event_types: hook event types to include
+        since_hours: Only events from the last N hours (None = all)
+        batch_size: Rows per round trip for the server-side cursor
+    """
+    postgres = db_type == "postgresql"
+    ph = "%s" if postgres else "?"
+    conditions = [
+        f"event_type IN ({', '.join(ph for _ in event_types)})",
+        "tool_name IS NOT NULL",
+        "COALESCE(session_id, workflow_id) IS NOT NULL",
+    ]
+    params: list = list(event_types)
+    if since_hours is not None:
+        if postgres:
+            conditions.append(f"timestamp >= NOW() - {ph} * INTERVAL '1 hour'")
+            params.append(since_hours)
+        else:
+            conditions.append(f"timestamp >= datetime('now', {ph})")
+            params.append(f"-{since_hours} hours")
+
+    query = f"""
+        SELECT COALESCE(session_id, workflow_id) AS session_key, tool_name, timestamp
+        FROM hook_events
+        WHERE {' AND '.join(conditions)}
+        ORDER BY session_key, timestamp
+    """
+    yield from _stream(conn, postgres, query, params, batch_size)
+
+
+def iter_hook_events_after(
+    conn,
+    db_type: str,
+    after_id: int = 0,
+    event_types: tuple[str, ...] = ("PreToolUse",),
+    batch_size: int = 10_000,
+) -> Iterator[Any]:
+    """
+    Stream hook events with an id above a high-water mark, in id order.
+
+    Used for incremental analysis: rows have id, event_type, session_key,
+    tool_name and timestamp. tool_name may be NULL for non-tool events such
+    as SessionEnd.
+
+    Args:
+        conn: Open DB-API connection (keep it open while iterating)
+        db_type: "postgresql" or "sqlite"
+        after_id: Last hook_events.id already processed
+        event_types: hook event types to include
+        batch_size: Rows per round trip for the server-side cursor
+    """
+    postgres = db_type == "postgresql"
+    ph = "%s" if postgres else "?"
+    query = f"""
+        SELECT id, event_type, COALESCE(session_id, workflow_id) AS session_key, tool_name, timestamp
+        FROM hook_events
+        WHERE id > {ph}
+          AND event_type IN ({', '.join(ph for _ in event_types)})
+          AND COALESCE(session_id, workflow_id) IS NOT NULL
+        ORDER BY id
+    """
+    yield from _stream(conn, postgres, query, [after_id, *event_types], batch_size)
+
+
+def _stream(conn, postgres: bool, query: str, params: list, batch_size: int) -> Iterator[Any]:
+    if postgres:
+        cursor = conn.cursor(name="hook_events_stream")
+        cursor.itersize = batch_size
+    else:
+        cursor = conn.cursor()
+    try:
+        cursor.execute(query, tuple(params))
+        yield from cursor
+    finally:
+        cursor.close()
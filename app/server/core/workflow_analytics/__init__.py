@@ -43,6 +43,7 @@ from .similarity import (
     calculate_text_similarity,
     find_similar_workflows,
 )
+from .similarity_index import WorkflowSimilarityIndex
 
 # Export all functions for backward compatibility
 __all__ = [
@@ -58,6 +59,7 @@ __all__ = [
     # Similarity
     'calculate_text_similarity',
     'find_similar_workflows',
+    'WorkflowSimilarityIndex',
     # Anomaly detection
     'detect_anomalies',
     # Recommendations
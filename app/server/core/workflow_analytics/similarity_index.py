@@ -0,0 +1,288 @@
+"""
+Workflow Similarity Index.
+
+Incremental index for finding similar workflows without scoring every
+historical workflow. It uses the same multi-factor score as
+find_similar_workflows (classification 30, template 30, complexity 20,
+text 0-20, threshold 70); only the text factor differs, using TF-IDF cosine
+over stemmed tokens instead of raw word-set Jaccard.
+
+Two structures keep queries cheap:
+- Bucket prefilter: a workflow can only reach 70 points if at least two of
+  classification, template and complexity match, so candidates come from
+  three pair-keyed sets instead of the whole history.
+- Inverted index: term -> {adw_id: tf weight}, a sparse TF-IDF matrix kept
+  as postings so insertions are O(tokens) and a query only touches the
+  documents it shares terms with (or the candidates, whichever is smaller).
+"""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from .helpers import detect_complexity
+
+# Scoring weights, shared with find_similar_workflows
+CLASSIFICATION_POINTS = 30.0
+TEMPLATE_POINTS = 30.0
+COMPLEXITY_POINTS = 20.0
+TEXT_POINTS = 20.0
+MIN_SIMILARITY_SCORE = 70.0
+
+# Recompute document norms once the corpus has grown by this fraction,
+# since IDF (and so every norm) drifts as documents are added
+NORM_REFRESH_GROWTH = 0.25
+
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into',
+    'is', 'it', 'of', 'on', 'or', 'so', 'that', 'the', 'this', 'to', 'was', 'we',
+    'with', 'will', 'should', 'can', 'i', 'our', 'all', 'new', 'when', 'please',
+})
+
+# Longest suffixes first; (suffix, replacement)
+_SUFFIXES = (
+    ('ational', 'ate'), ('ization', 'ize'), ('ations', 'ate'), ('ation', 'ate'),
+    ('ments', ''), ('ment', ''), ('ness', ''), ('ings', ''), ('ing', ''),
+    ('ies', 'y'), ('ied', 'y'), ('ers', ''), ('er', ''), ('ed', ''), ('es', ''),
+    ('ly', ''), ('s', ''),
+)
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def stem(word: str) -> str:
+    """
+    Strip common English suffixes (a light Porter-style stemmer).
+
+    Examples:
+        >>> stem('authentication'), stem('authenticate'), stem('tests')
+        ('authenticate', 'authenticate', 'test')
+    """
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:len(word) - len(suffix)] + replacement
+    return word
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercase, split on non-alphanumerics, drop stop words and stem."""
+    if not text:
+        return []
+    return [stem(word) for word in _TOKEN_RE.findall(text.lower()) if len(word) > 1 and word not in STOP_WORDS]
+
+
+@dataclass(frozen=True)
+class SimilarWorkflow:
+    """A query result."""
+
+    adw_id: str
+    score: float
+    text_similarity: float
+
+
+@dataclass
+class _Document:
+    classification: str | None
+    template: str | None
+    complexity: str
+    weights: dict[str, float] = field(default_factory=dict)  # term -> tf weight
+    norm: float = 0.0
+
+
+class WorkflowSimilarityIndex:
+    """
+    In-memory similarity index over workflows.
+
+    Thread-safe. Workflows are dicts with adw_id, classification_type,
+    workflow_template, nl_input and the fields detect_complexity() reads.
+
+    Example:
+        index = WorkflowSimilarityIndex()
+        index.add_many(history)
+        index.add(just_completed)
+        index.similar_ids(just_completed)  # -> ['adw-1', 'adw-7', ...]
+    """
+
+    def __init__(self, min_score: float = MIN_SIMILARITY_SCORE):
+        self.min_score = min_score
+        self._lock = threading.RLock()
+        self._docs: dict[str, _Document] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        # (kind, value, value) -> adw_ids; a match needs two of three attributes
+        self._pairs: dict[tuple, set[str]] = {}
+        self._norm_size = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, adw_id: str) -> bool:
+        return adw_id in self._docs
+
+    # ------------------------------------------------------------------
+    # Insertion
+    # ------------------------------------------------------------------
+
+    def add(self, workflow: dict) -> None:
+        """Add or replace a workflow."""
+        adw_id = workflow.get('adw_id')
+        if not adw_id:
+            return
+
+        with self._lock:
+            self.remove(adw_id)
+            doc = _Document(
+                classification=workflow.get('classification_type'),
+                template=workflow.get('workflow_template'),
+                complexity=detect_complexity(workflow),
+                weights=_tf_weights(tokenize(workflow.get('nl_input'))),
+            )
+            self._docs[adw_id] = doc
+            for term, weight in doc.weights.items():
+                self._postings.setdefault(term, {})[adw_id] = weight
+            for key in _pair_keys(doc):
+                self._pairs.setdefault(key, set()).add(adw_id)
+
+            if len(self._docs) > self._norm_size * (1 + NORM_REFRESH_GROWTH):
+                self._refresh_norms()
+            else:
+                doc.norm = self._norm(doc.weights)
+
+    def add_many(self, workflows: Iterable[dict]) -> None:
+        """Add workflows in bulk (norms are computed once at the end)."""
+        with self._lock:
+            size = self._norm_size
+            self._norm_size = math.inf  # defer refreshes
+            try:
+                for workflow in workflows:
+                    self.add(workflow)
+            finally:
+                self._norm_size = size
+            self._refresh_norms()
+
+    def remove(self, adw_id: str) -> None:
+        """Remove a workflow if present."""
+        with self._lock:
+            doc = self._docs.pop(adw_id, None)
+            if doc is None:
+                return
+            for term in doc.weights:
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(adw_id, None)
+                    if not postings:
+                        del self._postings[term]
+            for key in _pair_keys(doc):
+                members = self._pairs.get(key)
+                if members is not None:
+                    members.discard(adw_id)
+                    if not members:
+                        del self._pairs[key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(self, workflow: dict, k: int = 10) -> list[SimilarWorkflow]:
+        """
+        Find the k most similar indexed workflows scoring >= min_score.
+
+        The workflow itself (same adw_id) is never returned.
+        """
+        target = _Document(
+            classification=workflow.get('classification_type'),
+            template=workflow.get('workflow_template'),
+            complexity=detect_complexity(workflow),
+            weights=_tf_weights(tokenize(workflow.get('nl_input'))),
+        )
+        own_id = workflow.get('adw_id')
+
+        with self._lock:
+            candidates = set()
+            for key in _pair_keys(target):
+                candidates |= self._pairs.get(key, set())
+            candidates.discard(own_id)
+            if not candidates:
+                return []
+
+            text_scores = self._text_scores(target.weights, candidates)
+            results = []
+            for adw_id in candidates:
+                doc = self._docs[adw_id]
+                text = text_scores.get(adw_id, 0.0)
+                score = (
+                    CLASSIFICATION_POINTS * (doc.classification == target.classification)
+                    + TEMPLATE_POINTS * (doc.template == target.template)
+                    + COMPLEXITY_POINTS * (doc.complexity == target.complexity)
+                    + TEXT_POINTS * text
+                )
+                if score >= self.min_score:
+                    results.append(SimilarWorkflow(adw_id, round(score, 4), round(text, 4)))
+
+        return heapq.nlargest(k, results, key=lambda r: (r.score, r.adw_id))
+
+    def similar_ids(self, workflow: dict, k: int = 10) -> list[str]:
+        """ADW IDs of the k most similar workflows, best first."""
+        return [result.adw_id for result in self.query(workflow, k)]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        return math.log((1 + len(self._docs)) / (1 + df)) + 1.0
+
+    def _norm(self, weights: dict[str, float]) -> float:
+        return math.sqrt(sum((weight * self._idf(term)) ** 2 for term, weight in weights.items()))
+
+    def _refresh_norms(self) -> None:
+        idf = {term: self._idf(term) for term in self._postings}
+        for doc in self._docs.values():
+            doc.norm = math.sqrt(sum((weight * idf[term]) ** 2 for term, weight in doc.weights.items()))
+        self._norm_size = len(self._docs)
+
+    def _text_scores(self, query: dict[str, float], candidates: set[str]) -> dict[str, float]:
+        """Cosine similarity between the query and each candidate sharing a term."""
+        if not query:
+            return {}
+        idf_sq = {term: self._idf(term) ** 2 for term in query}
+        query_norm = math.sqrt(sum(weight * weight * idf_sq[term] for term, weight in query.items()))
+
+        dots: dict[str, float] = {}
+        posting_size = sum(len(self._postings.get(term, ())) for term in query)
+        if posting_size <= len(candidates):
+            # Walk the postings of the query terms
+            for term, weight in query.items():
+                for adw_id, doc_weight in self._postings.get(term, {}).items():
+                    if adw_id in candidates:
+                        dots[adw_id] = dots.get(adw_id, 0.0) + weight * doc_weight * idf_sq[term]
+        else:
+            # Fewer candidates than postings: look the terms up per candidate
+            for adw_id in candidates:
+                doc_weights = self._docs[adw_id].weights
+                dot = sum(weight * doc_weights[term] * idf_sq[term] for term, weight in query.items() if term in doc_weights)
+                if dot:
+                    dots[adw_id] = dot
+
+        return {
+            adw_id: min(1.0, dot / (query_norm * self._docs[adw_id].norm))
+            for adw_id, dot in dots.items()
+            if self._docs[adw_id].norm
+        }
+
+
+def _tf_weights(tokens: list[str]) -> dict[str, float]:
+    """Sublinear term frequency: 1 + log(count)."""
+    return {term: 1.0 + math.log(count) for term, count in Counter(tokens).items()}
+
+
+def _pair_keys(doc: _Document) -> tuple[tuple, tuple, tuple]:
+    return (
+        ('ct', doc.classification, doc.template),
+        ('cx', doc.classification, doc.complexity),
+        ('tx', doc.template, doc.complexity),
+    )
@@ -9,16 +9,18 @@ Refactored from monolithic database.py into focused modules:
 - mutations.py: Insert and update operations
 - queries.py: Read operations and filtering
 - analytics.py: Analytics and aggregate queries
+- rollup.py: Optional daily analytics rollup maintenance
 
 All original functions remain accessible via this package for backward compatibility.
 """
 
 # Schema operations
 # Analytics operations
-from .analytics import get_history_analytics
+from .analytics import get_history_analytics, rebuild_analytics_rollup
 
 # Mutation operations (INSERT, UPDATE)
 from .mutations import (
+    bulk_upsert_workflow_history,
     insert_workflow_history,
     update_workflow_history,
     update_workflow_history_by_issue,
@@ -28,6 +30,7 @@ from .mutations import (
 from .queries import (
     get_workflow_by_adw_id,
     get_workflow_history,
+    get_workflows_by_adw_ids,
 )
 from .schema import DB_PATH, _db_adapter, init_db
 
@@ -40,9 +43,12 @@ __all__ = [
     'insert_workflow_history',
     'update_workflow_history_by_issue',
     'update_workflow_history',
+    'bulk_upsert_workflow_history',
     # Queries
     'get_workflow_by_adw_id',
+    'get_workflows_by_adw_ids',
     'get_workflow_history',
     # Analytics
     'get_history_analytics',
+    'rebuild_analytics_rollup',
 ]
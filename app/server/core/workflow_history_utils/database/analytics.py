@@ -2,14 +2,172 @@
 Database analytics operations.
 
 This module provides analytics and aggregate queries for the workflow history system.
+
+Analytics are computed with two statements: one conditional-aggregation
+query for every scalar metric and one UNION ALL of per-column GROUP BYs for
+the status/model/template breakdowns.
+
+With WORKFLOW_ANALYTICS_ROLLUP=true the same figures are read from
+workflow_history_daily_rollup instead, a per-day table of counts and sums
+that the mutation functions refresh for the days they touch. Its size grows
+with days x (status, model, template) combinations rather than with
+workflows, so the dashboard query stays flat as history grows. Cost trend
+windows are then aligned to whole days.
 """
 
 import logging
+from datetime import UTC, datetime, timedelta
 
+from .rollup import ROLLUP_TABLE, create_rollup_table, refresh_rollup_days, rollup_enabled
 from .schema import _get_adapter
 
 logger = logging.getLogger(__name__)
 
+# Cost metrics only count completed and failed workflows with a positive cost
+_COSTED_RUN = "status IN ('completed', 'failed') AND actual_cost_total > 0"
+
+
+def _trend(current: float | None, previous: float | None) -> float:
+    """Percentage change from previous to current (0.0 without a baseline)."""
+    if not previous:
+        return 0.0
+    return ((current or 0.0) - previous) / previous * 100
+
+
+def _ratio(total, count) -> float:
+    return float(total) / count if count else 0.0
+
+
+def _breakdown_query(table: str, count: str) -> str:
+    """
+    Counts by status, model and template as one statement.
+
+    Each branch groups a single indexed column, which is cheaper than one
+    GROUP BY over all three (that needs a temporary sort of every row).
+    """
+    return f"""
+        SELECT 'status' AS dimension, status AS value, {count} AS count
+        FROM {table} GROUP BY status
+        UNION ALL
+        SELECT 'model', model_used, {count}
+        FROM {table} WHERE model_used IS NOT NULL GROUP BY model_used
+        UNION ALL
+        SELECT 'template', workflow_template, {count}
+        FROM {table} WHERE workflow_template IS NOT NULL GROUP BY workflow_template
+    """
+
+
+def _fold_breakdown(rows) -> dict[str, dict]:
+    """Split (dimension, value, count) rows into one dict per dimension."""
+    breakdown: dict[str, dict] = {"status": {}, "model": {}, "template": {}}
+    for row in rows:
+        breakdown[row["dimension"]][row["value"]] = int(row["count"])
+    return breakdown
+
+
+def _query_history(cursor, db_type: str) -> tuple[dict, list]:
+    """Compute scalar metrics and breakdowns directly from workflow_history."""
+    if db_type == "postgresql":
+        # PostgreSQL uses NOW() and INTERVAL
+        date_7days_ago = "NOW() - INTERVAL '7 days'"
+        date_14days_ago = "NOW() - INTERVAL '14 days'"
+        date_30days_ago = "NOW() - INTERVAL '30 days'"
+        date_60days_ago = "NOW() - INTERVAL '60 days'"
+    else:
+        # SQLite uses datetime() function
+        date_7days_ago = "datetime('now', '-7 days')"
+        date_14days_ago = "datetime('now', '-14 days')"
+        date_30days_ago = "datetime('now', '-30 days')"
+        date_60days_ago = "datetime('now', '-60 days')"
+
+    cursor.execute(f"""
+        SELECT
+            COUNT(*) AS total,
+            AVG(CASE WHEN status = 'completed' AND duration_seconds IS NOT NULL
+                     THEN duration_seconds END) AS avg_duration,
+            AVG(CASE WHEN actual_cost_total IS NOT NULL AND actual_cost_total > 0
+                     THEN actual_cost_total END) AS avg_cost,
+            SUM(CASE WHEN actual_cost_total IS NOT NULL AND actual_cost_total > 0
+                     THEN actual_cost_total END) AS total_cost,
+            AVG(CASE WHEN {_COSTED_RUN}
+                     THEN actual_cost_total END) AS avg_cost_per_completion,
+            AVG(CASE WHEN {_COSTED_RUN} AND created_at >= {date_7days_ago}
+                     THEN actual_cost_total END) AS avg_cost_7day_current,
+            AVG(CASE WHEN {_COSTED_RUN} AND created_at >= {date_14days_ago}
+                          AND created_at < {date_7days_ago}
+                     THEN actual_cost_total END) AS avg_cost_7day_previous,
+            AVG(CASE WHEN {_COSTED_RUN} AND created_at >= {date_30days_ago}
+                     THEN actual_cost_total END) AS avg_cost_30day_current,
+            AVG(CASE WHEN {_COSTED_RUN} AND created_at >= {date_60days_ago}
+                          AND created_at < {date_30days_ago}
+                     THEN actual_cost_total END) AS avg_cost_30day_previous,
+            AVG(CASE WHEN total_tokens IS NOT NULL AND total_tokens > 0
+                     THEN total_tokens END) AS avg_tokens,
+            AVG(CASE WHEN total_tokens IS NOT NULL AND total_tokens > 0
+                     THEN cache_efficiency_percent END) AS avg_cache_efficiency
+        FROM workflow_history
+    """)
+    summary = dict(cursor.fetchone())
+
+    cursor.execute(_breakdown_query("workflow_history", "COUNT(*)"))
+    return summary, cursor.fetchall()
+
+
+def _query_rollup(cursor) -> tuple[dict, list]:
+    """Compute scalar metrics and breakdowns from the daily rollup table."""
+    # created_at defaults to CURRENT_TIMESTAMP, which is UTC
+    today = datetime.now(UTC).date()
+    since = {days: (today - timedelta(days=days - 1)).isoformat() for days in (7, 14, 30, 60)}
+    costed = "status IN ('completed', 'failed')"
+
+    def window(name: str, start: str, end: str | None = None) -> str:
+        bounds = f"day >= '{start}'" + (f" AND day < '{end}'" if end else "")
+        return (
+            f"SUM(CASE WHEN {costed} AND {bounds} THEN cost_sum END) AS {name}_sum, "
+            f"SUM(CASE WHEN {costed} AND {bounds} THEN cost_count END) AS {name}_count"
+        )
+
+    cursor.execute(f"""
+        SELECT
+            SUM(workflow_count) AS total,
+            SUM(CASE WHEN status = 'completed' THEN duration_sum END) AS duration_sum,
+            SUM(CASE WHEN status = 'completed' THEN duration_count END) AS duration_count,
+            SUM(cost_sum) AS cost_sum,
+            SUM(cost_count) AS cost_count,
+            SUM(CASE WHEN {costed} THEN cost_sum END) AS completion_sum,
+            SUM(CASE WHEN {costed} THEN cost_count END) AS completion_count,
+            {window("cur7", since[7])},
+            {window("prev7", since[14], since[7])},
+            {window("cur30", since[30])},
+            {window("prev30", since[60], since[30])},
+            SUM(tokens_sum) AS tokens_sum,
+            SUM(tokens_count) AS tokens_count,
+            SUM(cache_efficiency_sum) AS cache_efficiency_sum,
+            SUM(cache_efficiency_count) AS cache_efficiency_count
+        FROM {ROLLUP_TABLE}
+    """)
+    row = cursor.fetchone()
+
+    def avg(name: str) -> float:
+        return _ratio(row[f"{name}_sum"], row[f"{name}_count"])
+
+    summary = {
+        "total": int(row["total"] or 0),
+        "avg_duration": avg("duration"),
+        "avg_cost": avg("cost"),
+        "total_cost": float(row["cost_sum"] or 0.0),
+        "avg_cost_per_completion": avg("completion"),
+        "avg_cost_7day_current": avg("cur7"),
+        "avg_cost_7day_previous": avg("prev7"),
+        "avg_cost_30day_current": avg("cur30"),
+        "avg_cost_30day_previous": avg("prev30"),
+        "avg_tokens": avg("tokens"),
+        "avg_cache_efficiency": avg("cache_efficiency"),
+    }
+
+    cursor.execute(_breakdown_query(ROLLUP_TABLE, "SUM(workflow_count)"))
+    return summary, cursor.fetchall()
+
 
 def get_history_analytics() -> dict:
     """
@@ -37,199 +195,56 @@ def get_history_analytics() -> dict:
     with adapter.get_connection() as conn:
         cursor = conn.cursor()
 
-        # Total workflows
-        cursor.execute("SELECT COUNT(*) as total FROM workflow_history")
-        total_workflows = cursor.fetchone()["total"]
-
-        # Count by status
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM workflow_history
-            GROUP BY status
-        """)
-        status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
-
-        completed_workflows = status_counts.get("completed", 0)
-        failed_workflows = status_counts.get("failed", 0)
-
-        # Calculate success rate
-        success_rate = (
-            (completed_workflows / total_workflows * 100)
-            if total_workflows > 0
-            else 0.0
-        )
-
-        # Average duration (only for completed workflows)
-        cursor.execute("""
-            SELECT AVG(duration_seconds) as avg_duration
-            FROM workflow_history
-            WHERE status = 'completed' AND duration_seconds IS NOT NULL
-        """)
-        avg_duration_row = cursor.fetchone()
-        avg_duration = avg_duration_row["avg_duration"] if avg_duration_row["avg_duration"] else 0.0
-
-        # Count by model
-        cursor.execute("""
-            SELECT model_used, COUNT(*) as count
-            FROM workflow_history
-            WHERE model_used IS NOT NULL
-            GROUP BY model_used
-        """)
-        workflows_by_model = {row["model_used"]: row["count"] for row in cursor.fetchall()}
-
-        # Count by template
-        cursor.execute("""
-            SELECT workflow_template, COUNT(*) as count
-            FROM workflow_history
-            WHERE workflow_template IS NOT NULL
-            GROUP BY workflow_template
-        """)
-        workflows_by_template = {
-            row["workflow_template"]: row["count"] for row in cursor.fetchall()
-        }
-
-        # Cost analytics
-        cursor.execute("""
-            SELECT
-                AVG(actual_cost_total) as avg_cost,
-                SUM(actual_cost_total) as total_cost
-            FROM workflow_history
-            WHERE actual_cost_total IS NOT NULL AND actual_cost_total > 0
-        """)
-        cost_row = cursor.fetchone()
-        avg_cost = cost_row["avg_cost"] if cost_row["avg_cost"] else 0.0
-        total_cost = cost_row["total_cost"] if cost_row["total_cost"] else 0.0
-
-        # Average cost per workflow execution (includes both completed and failed)
-        # This metric reflects true system efficiency by accounting for failed attempts
-        cursor.execute("""
-            SELECT AVG(actual_cost_total) as avg_cost_per_completion
-            FROM workflow_history
-            WHERE (status = 'completed' OR status = 'failed')
-              AND actual_cost_total IS NOT NULL
-              AND actual_cost_total > 0
-        """)
-        completion_cost_row = cursor.fetchone()
-        avg_cost_per_completion = (
-            completion_cost_row["avg_cost_per_completion"]
-            if completion_cost_row["avg_cost_per_completion"]
-            else 0.0
-        )
-
-        # Database-specific date functions
-        db_type = adapter.get_db_type()
-        if db_type == "postgresql":
-            # PostgreSQL uses NOW() and INTERVAL
-            date_7days_ago = "NOW() - INTERVAL '7 days'"
-            date_14days_ago = "NOW() - INTERVAL '14 days'"
-            date_30days_ago = "NOW() - INTERVAL '30 days'"
-            date_60days_ago = "NOW() - INTERVAL '60 days'"
+        if rollup_enabled():
+            summary, breakdown = _query_rollup(cursor)
         else:
-            # SQLite uses datetime() function
-            date_7days_ago = "datetime('now', '-7 days')"
-            date_14days_ago = "datetime('now', '-14 days')"
-            date_30days_ago = "datetime('now', '-30 days')"
-            date_60days_ago = "datetime('now', '-60 days')"
-
-        # 7-day trend: Compare last 7 days vs previous 7 days (includes completed and failed)
-        cursor.execute(f"""
-            SELECT AVG(actual_cost_total) as avg_cost
-            FROM workflow_history
-            WHERE (status = 'completed' OR status = 'failed')
-              AND actual_cost_total IS NOT NULL
-              AND actual_cost_total > 0
-              AND created_at >= {date_7days_ago}
-        """)
-        cost_7day_current = cursor.fetchone()
-        avg_cost_7day_current = (
-            cost_7day_current["avg_cost"] if cost_7day_current["avg_cost"] else 0.0
-        )
-
-        cursor.execute(f"""
-            SELECT AVG(actual_cost_total) as avg_cost
-            FROM workflow_history
-            WHERE (status = 'completed' OR status = 'failed')
-              AND actual_cost_total IS NOT NULL
-              AND actual_cost_total > 0
-              AND created_at >= {date_14days_ago}
-              AND created_at < {date_7days_ago}
-        """)
-        cost_7day_previous = cursor.fetchone()
-        avg_cost_7day_previous = (
-            cost_7day_previous["avg_cost"] if cost_7day_previous["avg_cost"] else 0.0
-        )
-
-        # Calculate 7-day trend percentage
-        cost_trend_7day = 0.0
-        if avg_cost_7day_previous > 0:
-            cost_trend_7day = (
-                (avg_cost_7day_current - avg_cost_7day_previous) / avg_cost_7day_previous * 100
-            )
-
-        # 30-day trend: Compare last 30 days vs previous 30 days (includes completed and failed)
-        cursor.execute(f"""
-            SELECT AVG(actual_cost_total) as avg_cost
-            FROM workflow_history
-            WHERE (status = 'completed' OR status = 'failed')
-              AND actual_cost_total IS NOT NULL
-              AND actual_cost_total > 0
-              AND created_at >= {date_30days_ago}
-        """)
-        cost_30day_current = cursor.fetchone()
-        avg_cost_30day_current = (
-            cost_30day_current["avg_cost"] if cost_30day_current["avg_cost"] else 0.0
-        )
-
-        cursor.execute(f"""
-            SELECT AVG(actual_cost_total) as avg_cost
-            FROM workflow_history
-            WHERE (status = 'completed' OR status = 'failed')
-              AND actual_cost_total IS NOT NULL
-              AND actual_cost_total > 0
-              AND created_at >= {date_60days_ago}
-              AND created_at < {date_30days_ago}
-        """)
-        cost_30day_previous = cursor.fetchone()
-        avg_cost_30day_previous = (
-            cost_30day_previous["avg_cost"] if cost_30day_previous["avg_cost"] else 0.0
-        )
-
-        # Calculate 30-day trend percentage
-        cost_trend_30day = 0.0
-        if avg_cost_30day_previous > 0:
-            cost_trend_30day = (
-                (avg_cost_30day_current - avg_cost_30day_previous) / avg_cost_30day_previous * 100
-            )
-
-        # Token analytics
-        cursor.execute("""
-            SELECT
-                AVG(total_tokens) as avg_tokens,
-                AVG(cache_efficiency_percent) as avg_cache_efficiency
-            FROM workflow_history
-            WHERE total_tokens IS NOT NULL AND total_tokens > 0
-        """)
-        token_row = cursor.fetchone()
-        avg_tokens = token_row["avg_tokens"] if token_row["avg_tokens"] else 0.0
-        avg_cache_efficiency = token_row["avg_cache_efficiency"] if token_row["avg_cache_efficiency"] else 0.0
-
-        analytics = {
-            "total_workflows": total_workflows,
-            "completed_workflows": completed_workflows,
-            "failed_workflows": failed_workflows,
-            "avg_duration_seconds": avg_duration,
-            "success_rate_percent": success_rate,
-            "workflows_by_model": workflows_by_model,
-            "workflows_by_template": workflows_by_template,
-            "workflows_by_status": status_counts,
-            "avg_cost": avg_cost,
-            "total_cost": total_cost,
-            "avg_cost_per_completion": avg_cost_per_completion,
-            "cost_trend_7day": cost_trend_7day,
-            "cost_trend_30day": cost_trend_30day,
-            "avg_tokens": avg_tokens,
-            "avg_cache_efficiency": avg_cache_efficiency,
-        }
-
-        logger.debug(f"[DB] Generated analytics: {analytics}")
-        return analytics
+            summary, breakdown = _query_history(cursor, adapter.get_db_type())
+
+    breakdown = _fold_breakdown(breakdown)
+    status_counts = breakdown["status"]
+
+    total_workflows = summary["total"] or 0
+    completed_workflows = status_counts.get("completed", 0)
+    failed_workflows = status_counts.get("failed", 0)
+
+    # Calculate success rate
+    success_rate = (
+        (completed_workflows / total_workflows * 100)
+        if total_workflows > 0
+        else 0.0
+    )
+
+    analytics = {
+        "total_workflows": total_workflows,
+        "completed_workflows": completed_workflows,
+        "failed_workflows": failed_workflows,
+        "avg_duration_seconds": summary["avg_duration"] or 0.0,
+        "success_rate_percent": success_rate,
+        "workflows_by_model": breakdown["model"],
+        "workflows_by_template": breakdown["template"],
+        "workflows_by_status": status_counts,
+        "avg_cost": summary["avg_cost"] or 0.0,
+        "total_cost": summary["total_cost"] or 0.0,
+        "avg_cost_per_completion": summary["avg_cost_per_completion"] or 0.0,
+        "cost_trend_7day": _trend(
+            summary["avg_cost_7day_current"], summary["avg_cost_7day_previous"]
+        ),
+        "cost_trend_30day": _trend(
+            summary["avg_cost_30day_current"], summary["avg_cost_30day_previous"]
+        ),
+        "avg_tokens": summary["avg_tokens"] or 0.0,
+        "avg_cache_efficiency": summary["avg_cache_efficiency"] or 0.0,
+    }
+
+    logger.debug(f"[DB] Generated analytics: {analytics}")
+    return analytics
+
+
+def rebuild_analytics_rollup() -> None:
+    """Create the rollup table if needed and rebuild it from all history."""
+    adapter = _get_adapter()
+    with adapter.get_connection() as conn:
+        cursor = conn.cursor()
+        create_rollup_table(cursor)
+        refresh_rollup_days(cursor, adapter.placeholder(), adapter.get_db_type())
+    logger.info("[DB] Rebuilt workflow analytics rollup")
@@ -8,10 +8,114 @@ import json
 import logging
 import traceback
 
+from .rollup import refresh_rollup_days, rollup_days_for, rollup_enabled
 from .schema import _get_adapter
 
 logger = logging.getLogger(__name__)
 
+VALID_STATUSES = ("pending", "running", "completed", "failed")
+
+# Columns always written on insert (NULL if not provided)
+_INSERT_BASE_FIELDS = (
+    "adw_id", "issue_number", "nl_input", "github_url", "gh_issue_state",
+    "workflow_template", "model_used", "status"
+)
+
+# Columns written on insert only when provided and present in the database
+_INSERT_OPTIONAL_FIELDS = (
+    "start_time", "end_time", "duration_seconds", "error_message",
+    "phase_count", "current_phase", "success_rate", "retry_count",
+    "worktree_path", "backend_port", "frontend_port", "concurrent_workflows",
+    "input_tokens", "output_tokens", "cached_tokens", "cache_hit_tokens",
+    "cache_miss_tokens", "total_tokens", "cache_efficiency_percent",
+    "estimated_cost_total", "actual_cost_total", "estimated_cost_per_step",
+    "actual_cost_per_step", "cost_per_token", "structured_input",
+    "cost_breakdown", "token_breakdown", "worktree_reused",
+    "steps_completed", "steps_total",
+    "phase_durations", "idle_time_seconds", "bottleneck_phase",
+    "error_category", "retry_reasons", "error_phase_distribution",
+    "recovery_time_seconds", "complexity_estimated", "complexity_actual",
+    # Phase 3A/3B: Analytics scoring fields
+    "hour_of_day", "day_of_week", "scoring_version",
+    "nl_input_clarity_score", "cost_efficiency_score",
+    "performance_score", "quality_score",
+    # Phase 3D: Insights & recommendations
+    "anomaly_flags", "optimization_recommendations",
+    # Timestamp override (normally auto-set by DB)
+    "created_at"
+)
+
+# Dicts and lists in these columns are stored as JSON strings
+_JSON_FIELDS = (
+    "structured_input", "cost_breakdown", "token_breakdown",
+    "phase_durations", "retry_reasons", "error_phase_distribution",
+    "anomaly_flags", "optimization_recommendations", "similar_workflow_ids"
+)
+
+
+def _normalize_status(status: str | None, adw_id: str) -> str:
+    """Default missing or unknown statuses to 'pending' to satisfy NOT NULL constraints."""
+    if status is None or status == "" or status not in VALID_STATUSES:
+        logger.warning(f"[DB] Invalid status '{status}' for {adw_id}, defaulting to 'pending'")
+        return "pending"
+    return status
+
+
+def _get_existing_columns(cursor, db_type: str) -> set[str]:
+    """Return the column names of the workflow_history table."""
+    if db_type == "postgresql":
+        cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = 'workflow_history'
+        """)
+        return {row["column_name"] for row in cursor.fetchall()}
+
+    # SQLite
+    cursor.execute("PRAGMA table_info(workflow_history)")
+    return {row["name"] for row in cursor.fetchall()}
+
+
+def _serialize_json(field: str, value):
+    """Convert dicts and lists to JSON strings for JSON columns."""
+    if field in _JSON_FIELDS and isinstance(value, dict | list):
+        return json.dumps(value)
+    return value
+
+
+def _refresh_rollup(cursor, adapter, adw_ids, days_before: set[str] | None = None) -> None:
+    """Refresh the analytics rollup for the days of the given workflows, if enabled."""
+    ph = adapter.placeholder()
+    db_type = adapter.get_db_type()
+    days = rollup_days_for(cursor, ph, db_type, adw_ids) | (days_before or set())
+    refresh_rollup_days(cursor, ph, db_type, days)
+
+
+def _build_insert_columns(data: dict, existing_columns: set[str]) -> tuple[list[str], list]:
+    """
+    Build the column list and values for inserting one workflow.
+
+    Args:
+        data: Workflow fields, including adw_id and status
+        existing_columns: Columns present in the workflow_history table
+
+    Returns:
+        Tuple of (column names, values)
+    """
+    fields = list(_INSERT_BASE_FIELDS)
+    values = [data.get(field) for field in fields]
+
+    for field in _INSERT_OPTIONAL_FIELDS:
+        if field in data:
+            # Only add field if column exists in database
+            if field in existing_columns:
+                fields.append(field)
+                values.append(_serialize_json(field, data[field]))
+            else:
+                logger.debug(f"[DB] Skipping field '{field}' (maps to '{field}') - column doesn't exist in database")
+
+    return fields, values
+
 
 def insert_workflow_history(
     adw_id: str,
@@ -43,96 +147,28 @@ def insert_workflow_history(
         sqlite3.IntegrityError: If a workflow with this adw_id already exists
         ValueError: If status is None or invalid
     """
-    # Validate status field to prevent NOT NULL constraint violations
-    if status is None or status == "":
-        logger.warning(f"[DB] Invalid status '{status}' for {adw_id}, defaulting to 'pending'")
-        status = "pending"
-
-    # Ensure status is one of the valid values
-    valid_statuses = ["pending", "running", "completed", "failed"]
-    if status not in valid_statuses:
-        logger.warning(f"[DB] Invalid status '{status}' for {adw_id}, defaulting to 'pending'")
-        status = "pending"
+    status = _normalize_status(status, adw_id)
 
     adapter = _get_adapter()
     with adapter.get_connection() as conn:
         cursor = conn.cursor()
 
-        # Build dynamic query based on provided kwargs
-        fields = [
-            "adw_id", "issue_number", "nl_input", "github_url", "gh_issue_state",
-            "workflow_template", "model_used", "status"
-        ]
-        values = [
-            adw_id, issue_number, nl_input, github_url, kwargs.get("gh_issue_state"),
-            workflow_template, model_used, status
-        ]
-
-        # Add optional fields from kwargs
-        optional_fields = [
-            "start_time", "end_time", "duration_seconds", "error_message",
-            "phase_count", "current_phase", "success_rate", "retry_count",
-            "worktree_path", "backend_port", "frontend_port", "concurrent_workflows",
-            "input_tokens", "output_tokens", "cached_tokens", "cache_hit_tokens",
-            "cache_miss_tokens", "total_tokens", "cache_efficiency_percent",
-            "estimated_cost_total", "actual_cost_total", "estimated_cost_per_step",
-            "actual_cost_per_step", "cost_per_token", "structured_input",
-            "cost_breakdown", "token_breakdown", "worktree_reused",
-            "steps_completed", "steps_total",
-            "phase_durations", "idle_time_seconds", "bottleneck_phase",
-            "error_category", "retry_reasons", "error_phase_distribution",
-            "recovery_time_seconds", "complexity_estimated", "complexity_actual",
-            # Phase 3A/3B: Analytics scoring fields
-            "hour_of_day", "day_of_week", "scoring_version",
-            "nl_input_clarity_score", "cost_efficiency_score",
-            "performance_score", "quality_score",
-            # Phase 3D: Insights & recommendations
-            "anomaly_flags", "optimization_recommendations",
-            # Timestamp override (normally auto-set by DB)
-            "created_at"
-        ]
-
         # Get existing columns from database to validate fields before inserting
-        db_type = adapter.get_db_type()
-        if db_type == "postgresql":
-            cursor.execute("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = 'workflow_history'
-            """)
-            existing_columns = {row["column_name"] for row in cursor.fetchall()}
-        else:
-            # SQLite
-            cursor.execute("PRAGMA table_info(workflow_history)")
-            existing_columns = {row["name"] for row in cursor.fetchall()}
-
-        # Map field names from code schema to database schema
-        # Note: Currently no mapping needed - code and DB use same names
-        field_name_mapping = {}
-
-        for field in optional_fields:
-            if field in kwargs:
-                # Map field name if needed
-                db_field = field_name_mapping.get(field, field)
-
-                # Only add field if column exists in database
-                if db_field in existing_columns:
-                    fields.append(db_field)
-                    # Convert dicts and lists to JSON strings
-                    json_fields = [
-                        "structured_input", "cost_breakdown", "token_breakdown",
-                        "phase_durations", "retry_reasons", "error_phase_distribution",
-                        "anomaly_flags", "optimization_recommendations"
-                    ]
-                    if field in json_fields:
-                        if isinstance(kwargs[field], dict | list):
-                            values.append(json.dumps(kwargs[field]))
-                        else:
-                            values.append(kwargs[field])
-                    else:
-                        values.append(kwargs[field])
-                else:
-                    logger.debug(f"[DB] Skipping field '{field}' (maps to '{db_field}') - column doesn't exist in database")
+        existing_columns = _get_existing_columns(cursor, adapter.get_db_type())
+
+        fields, values = _build_insert_columns(
+            {
+                "adw_id": adw_id,
+                "issue_number": issue_number,
+                "nl_input": nl_input,
+                "github_url": github_url,
+                "workflow_template": workflow_template,
+                "model_used": model_used,
+                "status": status,
+                **kwargs,
+            },
+            existing_columns,
+        )
 
         ph = adapter.placeholder()
         placeholders = ", ".join([ph for _ in values])
@@ -153,6 +189,9 @@ def insert_workflow_history(
         cursor.execute(query, values)
         row_id = cursor.lastrowid
 
+        if rollup_enabled():
+            _refresh_rollup(cursor, adapter, [adw_id])
+
         logger.info(f"[DB] Inserted workflow history for ADW {adw_id} (ID: {row_id})")
         return row_id
 
@@ -230,28 +269,10 @@ def update_workflow_history(
         cursor = conn.cursor()
 
         # Get existing columns from database to validate fields before updating
-        db_type = adapter.get_db_type()
-        if db_type == "postgresql":
-            cursor.execute("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = 'workflow_history'
-            """)
-            existing_columns = {row["column_name"] for row in cursor.fetchall()}
-        else:
-            # SQLite
-            cursor.execute("PRAGMA table_info(workflow_history)")
-            existing_columns = {row["name"] for row in cursor.fetchall()}
+        existing_columns = _get_existing_columns(cursor, adapter.get_db_type())
 
         # Convert dicts and lists to JSON strings
-        json_fields = [
-            "structured_input", "cost_breakdown", "token_breakdown",
-            "phase_durations", "retry_reasons", "error_phase_distribution",
-            "anomaly_flags", "optimization_recommendations"
-        ]
-        for field in json_fields:
-            if field in kwargs and isinstance(kwargs[field], dict | list):
-                kwargs[field] = json.dumps(kwargs[field])
+        kwargs = {field: _serialize_json(field, value) for field, value in kwargs.items()}
 
         # Map field names from code schema to database schema
         # Note: Currently no mapping needed - code and DB use same names
@@ -291,12 +312,120 @@ def update_workflow_history(
                 f"Stack trace:\n{stack_trace}"
             )
 
+        # An update can move a workflow to another day, so refresh both
+        days_before = None
+        if rollup_enabled():
+            days_before = rollup_days_for(cursor, ph, adapter.get_db_type(), [adw_id])
+
         values = list(mapped_kwargs.values()) + [adw_id]
         cursor.execute(query, values)
+        updated = cursor.rowcount > 0
+
+        if days_before is not None:
+            _refresh_rollup(cursor, adapter, [adw_id], days_before)
 
-        if cursor.rowcount > 0:
+        if updated:
             logger.debug(f"[DB] Updated workflow history for ADW {adw_id}")
             return True
         else:
             logger.warning(f"[DB] No workflow found with ADW ID {adw_id}")
             return False
+
+
+def bulk_upsert_workflow_history(
+    inserts: list[dict] | None = None,
+    updates: dict[str, dict] | None = None,
+) -> tuple[int, int]:
+    """
+    Insert and update many workflow history records in a single transaction.
+
+    Used by the history sync so a pass over thousands of workflows costs one
+    connection, one column lookup and a handful of executemany() calls instead
+    of several round trips per workflow. Inserts are upserts on adw_id, so a
+    row created concurrently by another writer is updated rather than failing
+    the whole batch.
+
+    Args:
+        inserts: New workflows, each a dict of fields including adw_id
+        updates: Fields to update, keyed by adw_id
+
+    Returns:
+        Tuple of (rows inserted or upserted, rows updated)
+    """
+    inserts = inserts or []
+    updates = updates or {}
+    if not inserts and not updates:
+        return 0, 0
+
+    adapter = _get_adapter()
+    ph = adapter.placeholder()
+
+    with adapter.get_connection() as conn:
+        cursor = conn.cursor()
+        existing_columns = _get_existing_columns(cursor, adapter.get_db_type())
+
+        touched = [data["adw_id"] for data in inserts] + list(updates)
+        days_before = None
+        if rollup_enabled():
+            days_before = rollup_days_for(cursor, ph, adapter.get_db_type(), touched)
+
+        # Group rows by column set so each group is a single executemany()
+        insert_groups: dict[tuple[str, ...], list[list]] = {}
+        phantoms = []
+        for data in inserts:
+            data = {**data, "status": _normalize_status(data.get("status"), data["adw_id"])}
+            if data["status"] in ("completed", "failed") and data.get("end_time") is None:
+                phantoms.append(data["adw_id"])
+            fields, values = _build_insert_columns(data, existing_columns)
+            insert_groups.setdefault(tuple(fields), []).append(values)
+
+        if phantoms:
+            stack_trace = "".join(traceback.format_stack())
+            logger.error(
+                f"[PHANTOM CREATION] Bulk insert of {len(phantoms)} completed/failed workflow(s) "
+                f"without end_time: {', '.join(phantoms[:20])}\n"
+                f"Stack trace:\n{stack_trace}"
+            )
+
+        for fields, rows in insert_groups.items():
+            set_clause = ", ".join(
+                f"{field} = excluded.{field}" for field in fields
+                if field not in ("adw_id", "created_at")
+            )
+            query = f"""
+                INSERT INTO workflow_history ({", ".join(fields)})
+                VALUES ({", ".join(ph for _ in fields)})
+                ON CONFLICT (adw_id) DO UPDATE SET {set_clause}, updated_at = CURRENT_TIMESTAMP
+            """
+            cursor.executemany(query, rows)
+
+        update_groups: dict[tuple[str, ...], list[list]] = {}
+        for adw_id, fields_to_update in updates.items():
+            columns = {
+                field: _serialize_json(field, value)
+                for field, value in fields_to_update.items()
+                if field in existing_columns
+            }
+            if not columns:
+                logger.warning(f"[DB] No valid fields to update for ADW {adw_id}")
+                continue
+            update_groups.setdefault(tuple(columns), []).append([*columns.values(), adw_id])
+
+        updated = 0
+        for fields, rows in update_groups.items():
+            set_clauses = [f"{field} = {ph}" for field in fields]
+            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+            query = f"""
+                UPDATE workflow_history
+                SET {", ".join(set_clauses)}
+                WHERE adw_id = {ph}
+            """
+            cursor.executemany(query, rows)
+            updated += len(rows)
+
+        if days_before is not None:
+            _refresh_rollup(cursor, adapter, touched, days_before)
+
+    inserted = sum(len(rows) for rows in insert_groups.values())
+    logger.debug(f"[DB] Bulk upserted {inserted} and updated {updated} workflow history rows")
+    return inserted, updated
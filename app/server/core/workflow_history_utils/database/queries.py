@@ -6,12 +6,42 @@ This module provides all read operations for the workflow history system.
 
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 
 from .schema import _get_adapter
 
 logger = logging.getLogger(__name__)
 
+# JSON columns parsed on read
+_JSON_FIELDS = (
+    "structured_input", "cost_breakdown", "token_breakdown",
+    "phase_durations", "retry_reasons", "error_phase_distribution",
+    "anomaly_flags", "optimization_recommendations", "similar_workflow_ids"
+)
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+IN_CLAUSE_BATCH_SIZE = 500
+
+
+def _parse_json_fields(result: dict, adw_id: str) -> dict:
+    """Parse JSON columns of a workflow row in place and return it."""
+    # PostgreSQL may return pre-parsed dicts/lists or strings
+    for field in _JSON_FIELDS:
+        if result.get(field):
+            # PostgreSQL can return already-parsed objects, only parse if string
+            if isinstance(result[field], str):
+                try:
+                    result[field] = json.loads(result[field])
+                except json.JSONDecodeError:
+                    logger.warning(f"[DB] Failed to parse JSON for {field} in ADW {adw_id}")
+                    result[field] = None
+            # else: already parsed dict/list, keep as-is
+        elif field in ["anomaly_flags", "optimization_recommendations"]:
+            # Default to empty arrays for certain fields
+            result[field] = []
+    return result
+
 
 def get_workflow_by_adw_id(adw_id: str) -> dict | None:
     """
@@ -31,34 +61,44 @@ def get_workflow_by_adw_id(adw_id: str) -> dict | None:
         row = cursor.fetchone()
 
         if row:
-            result = dict(row)
-
-            # No field name mapping needed - database and code use same names
-
-            # Parse JSON fields (PostgreSQL may return pre-parsed dicts/lists or strings)
-            json_fields = [
-                "structured_input", "cost_breakdown", "token_breakdown",
-                "phase_durations", "retry_reasons", "error_phase_distribution",
-                "anomaly_flags", "optimization_recommendations"
-            ]
-            for field in json_fields:
-                if result.get(field):
-                    # PostgreSQL can return already-parsed objects, only parse if string
-                    if isinstance(result[field], str):
-                        try:
-                            result[field] = json.loads(result[field])
-                        except json.JSONDecodeError:
-                            logger.warning(f"[DB] Failed to parse JSON for {field} in ADW {adw_id}")
-                            result[field] = None
-                    # else: already parsed dict/list, keep as-is
-                else:
-                    # Default to empty arrays for certain fields
-                    if field in ["anomaly_flags", "optimization_recommendations"]:
-                        result[field] = []
-            return result
+            return _parse_json_fields(dict(row), adw_id)
         return None
 
 
+def get_workflows_by_adw_ids(adw_ids: Iterable[str]) -> dict[str, dict]:
+    """
+    Get workflow history records for many ADW IDs with one connection.
+
+    Rows are returned in the same shape as get_workflow_by_adw_id(). IDs are
+    queried in batches of IN_CLAUSE_BATCH_SIZE.
+
+    Args:
+        adw_ids: ADW workflow identifiers
+
+    Returns:
+        Dict mapping adw_id to its record; IDs not in the database are omitted
+    """
+    ids = list(dict.fromkeys(adw_ids))
+    if not ids:
+        return {}
+
+    adapter = _get_adapter()
+    ph = adapter.placeholder()
+    results = {}
+    with adapter.get_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(ids), IN_CLAUSE_BATCH_SIZE):
+            batch = ids[start:start + IN_CLAUSE_BATCH_SIZE]
+            cursor.execute(
+                f"SELECT * FROM workflow_history WHERE adw_id IN ({', '.join(ph for _ in batch)})",
+                tuple(batch),
+            )
+            for row in cursor.fetchall():
+                result = dict(row)
+                results[result["adw_id"]] = _parse_json_fields(result, result["adw_id"])
+    return results
+
+
 def _build_where_clauses(
     ph: str,
     status: str | None,
@@ -105,26 +145,7 @@ def _build_where_clauses(
 def _process_workflow_row(row: dict) -> dict:
     """Process a single workflow row from PostgreSQL database."""
     result = dict(row)
-
-    # Parse JSON fields (PostgreSQL may return pre-parsed dicts/lists or strings)
-    json_fields = [
-        "structured_input", "cost_breakdown", "token_breakdown",
-        "phase_durations", "retry_reasons", "error_phase_distribution",
-        "anomaly_flags", "optimization_recommendations"
-    ]
-    for field in json_fields:
-        if result.get(field):
-            # PostgreSQL can return already-parsed objects, only parse if string
-            if isinstance(result[field], str):
-                try:
-                    result[field] = json.loads(result[field])
-                except json.JSONDecodeError:
-                    logger.warning(f"[DB] Failed to parse JSON for {field}")
-                    result[field] = None
-            # else: already parsed dict/list, keep as-is
-        elif field in ["anomaly_flags", "optimization_recommendations"]:
-            # Default to empty arrays for certain fields
-            result[field] = []
+    _parse_json_fields(result, result.get("adw_id"))
 
     # Convert datetime objects to ISO format strings (PostgreSQL returns datetime objects)
     datetime_fields = [
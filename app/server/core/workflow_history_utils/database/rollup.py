@@ -0,0 +1,113 @@
+"""
+Daily analytics rollup maintenance.
+
+workflow_history_daily_rollup holds one row of counts and sums per
+(day, status, model_used, workflow_template). Writers refresh the days they
+touch in the same transaction; get_history_analytics() reads it when
+WORKFLOW_ANALYTICS_ROLLUP is enabled.
+"""
+
+import os
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+ROLLUP_TABLE = "workflow_history_daily_rollup"
+
+# Aggregates kept per (day, status, model_used, workflow_template)
+_ROLLUP_AGGREGATES = {
+    "workflow_count": "COUNT(*)",
+    "duration_sum": "SUM(duration_seconds)",
+    "duration_count": "COUNT(duration_seconds)",
+    "cost_sum": "SUM(CASE WHEN actual_cost_total > 0 THEN actual_cost_total END)",
+    "cost_count": "COUNT(CASE WHEN actual_cost_total > 0 THEN 1 END)",
+    "tokens_sum": "SUM(CASE WHEN total_tokens > 0 THEN total_tokens END)",
+    "tokens_count": "COUNT(CASE WHEN total_tokens > 0 THEN 1 END)",
+    "cache_efficiency_sum": "SUM(CASE WHEN total_tokens > 0 THEN cache_efficiency_percent END)",
+    "cache_efficiency_count": "COUNT(CASE WHEN total_tokens > 0 THEN cache_efficiency_percent END)",
+}
+
+
+def rollup_enabled() -> bool:
+    """Return True if analytics should be served from the daily rollup table."""
+    return os.getenv("WORKFLOW_ANALYTICS_ROLLUP", "false").lower() in ("1", "true", "yes")
+
+
+def _day_expr(db_type: str) -> str:
+    """SQL expression for the YYYY-MM-DD day of a workflow's created_at."""
+    if db_type == "postgresql":
+        return "TO_CHAR(created_at, 'YYYY-MM-DD')"
+    return "date(created_at)"
+
+
+def create_rollup_table(cursor) -> None:
+    """Create the daily analytics rollup table if it does not exist."""
+    columns = ", ".join(f"{name} DOUBLE PRECISION DEFAULT 0" for name in _ROLLUP_AGGREGATES)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+            day TEXT NOT NULL,
+            status TEXT NOT NULL,
+            model_used TEXT,
+            workflow_template TEXT,
+            {columns}
+        )
+    """)
+    cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{ROLLUP_TABLE}_day ON {ROLLUP_TABLE}(day)
+    """)
+
+
+def rollup_days_for(cursor, placeholder: str, db_type: str, adw_ids: Iterable[str]) -> set[str]:
+    """Return the created_at days of the given workflows."""
+    adw_ids = list(adw_ids)
+    days: set[str] = set()
+    # Keep IN lists well under SQLite's bound-variable limit
+    for i in range(0, len(adw_ids), 500):
+        chunk = adw_ids[i:i + 500]
+        cursor.execute(
+            f"SELECT DISTINCT {_day_expr(db_type)} AS day FROM workflow_history "
+            f"WHERE adw_id IN ({', '.join(placeholder for _ in chunk)})",
+            chunk,
+        )
+        days.update(row["day"] for row in cursor.fetchall() if row["day"])
+    return days
+
+
+def refresh_rollup_days(cursor, placeholder: str, db_type: str, days: Iterable[str] | None = None) -> None:
+    """
+    Recompute rollup rows for the given days from workflow_history.
+
+    Each day is rebuilt from the rows created on it, so inserts, updates and
+    status changes are all reflected without tracking per-row deltas. Pass
+    ``days=None`` to rebuild the whole table.
+    """
+    names = ", ".join(_ROLLUP_AGGREGATES)
+    aggregates = ", ".join(_ROLLUP_AGGREGATES.values())
+    day = _day_expr(db_type)
+
+    if days is None:
+        cursor.execute(f"DELETE FROM {ROLLUP_TABLE}")
+        where, params = "", []
+    else:
+        days = sorted(days)
+        if not days:
+            return
+        day_list = ", ".join(placeholder for _ in days)
+        cursor.execute(f"DELETE FROM {ROLLUP_TABLE} WHERE day IN ({day_list})", days)
+        # Range predicates on created_at can use idx_created_at
+        where = "WHERE " + " OR ".join(
+            f"(created_at >= {placeholder} AND created_at < {placeholder})" for _ in days
+        )
+        params = []
+        for d in days:
+            params += [d, (date.fromisoformat(d) + timedelta(days=1)).isoformat()]
+
+    cursor.execute(
+        f"""
+        INSERT INTO {ROLLUP_TABLE} (day, status, model_used, workflow_template, {names})
+        SELECT {day}, status, model_used, workflow_template, {aggregates}
+        FROM workflow_history
+        {where}
+        GROUP BY {day}, status, model_used, workflow_template
+        """,
+        params,
+    )
@@ -10,6 +10,8 @@ from pathlib import Path
 
 from database import get_database_adapter
 
+from .rollup import create_rollup_table, refresh_rollup_days, rollup_enabled
+
 logger = logging.getLogger(__name__)
 
 # Database path - relative to package: core/workflow_history_utils/database/
@@ -173,5 +175,12 @@ def init_db():
                     f"status={record['status']}, end_time={record['end_time']}"
                 )
 
+        # Optional daily analytics rollup. Rebuilt on startup because writes made
+        # while it was disabled are not reflected; writers keep it current after.
+        if rollup_enabled():
+            create_rollup_table(cursor)
+            refresh_rollup_days(cursor, adapter.placeholder(), db_type)
+            logger.info("[DB] Rebuilt workflow analytics rollup")
+
         db_type = adapter.get_db_type()
         logger.info(f"[DB] Workflow history database initialized (type: {db_type})")
@@ -5,11 +5,12 @@ This module handles scanning and parsing of ADW workflow state files
 from the agents directory.
 """
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
+from core.agents_index import AgentStateEntry, get_agents_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,26 +66,23 @@ def _extract_workflow_metadata(adw_id: str, adw_dir: Path, state_data: dict) ->
     }
 
 
-def _infer_status_from_filesystem(workflow: dict, adw_dir: Path, state_data: dict, state_file: Path) -> None:
-    """Infer workflow status from filesystem state (modifies workflow dict in place)."""
+def _infer_status_from_filesystem(workflow: dict, entry: AgentStateEntry) -> None:
+    """Infer workflow status from cached directory layout (modifies workflow dict in place)."""
     if workflow["status"] in ("completed", "failed"):
         return
 
+    state_data = entry.state
+
     # Check for error file first
-    error_file = adw_dir / "error.log"
-    if error_file.exists():
+    if entry.has_error_log:
         workflow["status"] = "failed"
         if not workflow.get("end_time"):
-            error_mtime = error_file.stat().st_mtime
-            workflow["end_time"] = datetime.fromtimestamp(error_mtime).isoformat()
+            workflow["end_time"] = datetime.fromtimestamp(entry.error_log_mtime).isoformat()
         logger.debug(f"[SCAN] Workflow {workflow['adw_id']} failed (error.log exists)")
         return
 
     # Check completion based on phases
-    completed_phases = [
-        d for d in adw_dir.iterdir()
-        if d.is_dir() and d.name.startswith("adw_")
-    ]
+    completed_phases = entry.phase_dirs
 
     if len(completed_phases) >= 3:
         # Check for completion indicators
@@ -93,8 +91,7 @@ def _infer_status_from_filesystem(workflow: dict, adw_dir: Path, state_data: dic
         if plan_file and branch_name:
             workflow["status"] = "completed"
             if not workflow.get("end_time"):
-                state_mtime = state_file.stat().st_mtime
-                workflow["end_time"] = datetime.fromtimestamp(state_mtime).isoformat()
+                workflow["end_time"] = datetime.fromtimestamp(entry.state_mtime).isoformat()
             logger.debug(f"[SCAN] Workflow {workflow['adw_id']} completed (3+ phases, has plan & branch)")
         else:
             workflow["status"] = "running"
@@ -103,8 +100,7 @@ def _infer_status_from_filesystem(workflow: dict, adw_dir: Path, state_data: dic
         # Only planning phase, no plan file - likely failed early
         workflow["status"] = "failed"
         if not workflow.get("end_time"):
-            state_mtime = state_file.stat().st_mtime
-            workflow["end_time"] = datetime.fromtimestamp(state_mtime).isoformat()
+            workflow["end_time"] = datetime.fromtimestamp(entry.state_mtime).isoformat()
         logger.debug(f"[SCAN] Workflow {workflow['adw_id']} failed (only 1 phase, no plan file)")
     else:
         # In progress
@@ -112,57 +108,75 @@ def _infer_status_from_filesystem(workflow: dict, adw_dir: Path, state_data: dic
         logger.debug(f"[SCAN] Workflow {workflow['adw_id']} running ({len(completed_phases)} phases)")
 
 
+def get_agents_dir() -> Path:
+    """Return the project's agents directory."""
+    project_root = Path(__file__).parent.parent.parent.parent.parent
+    return project_root / "agents"
+
+
+def build_workflow_from_entry(entry: AgentStateEntry) -> dict | None:
+    """
+    Build workflow metadata from an indexed state file.
+
+    Args:
+        entry: Agents index entry (must have parsed without error)
+
+    Returns:
+        Workflow metadata dict, or None if the issue number is invalid
+    """
+    state_data = entry.state
+
+    # Validate issue number
+    issue_number = _validate_issue_number(entry.adw_id, state_data.get("issue_number"))
+    if state_data.get("issue_number") is not None and issue_number is None:
+        # Validation failed, skip this workflow
+        return None
+
+    # Extract metadata
+    workflow = _extract_workflow_metadata(entry.adw_id, entry.adw_dir, state_data)
+    workflow["issue_number"] = issue_number
+
+    # Infer status from filesystem
+    _infer_status_from_filesystem(workflow, entry)
+    return workflow
+
+
 def scan_agents_directory() -> list[dict]:
     """
     Scan the agents directory for workflow state files and extract metadata.
 
+    Uses the shared agents index, so only state files that changed since the
+    previous scan are re-read.
+
     Returns:
         List[Dict]: List of workflow metadata dictionaries
     """
     # Locate agents directory
-    project_root = Path(__file__).parent.parent.parent.parent.parent
-    agents_dir = project_root / "agents"
+    agents_dir = get_agents_dir()
 
     if not agents_dir.exists():
         logger.warning(f"[SCAN] Agents directory not found: {agents_dir}")
         return []
 
-    workflows = []
+    index = get_agents_index(agents_dir)
+    index.refresh()
 
-    # Iterate through subdirectories in agents/
-    for adw_dir in agents_dir.iterdir():
-        if not adw_dir.is_dir():
-            continue
-
-        adw_id = adw_dir.name
-        state_file = adw_dir / "adw_state.json"
-
-        if not state_file.exists():
-            logger.debug(f"[SCAN] No adw_state.json found for {adw_id}")
-            continue
+    workflows = []
 
+    for entry in index.entries():
         try:
-            with open(state_file) as f:
-                state_data = json.load(f)
+            if entry.error is not None:
+                raise entry.error
 
-            # Validate issue number
-            issue_number = _validate_issue_number(adw_id, state_data.get("issue_number"))
-            if state_data.get("issue_number") is not None and issue_number is None:
-                # Validation failed, skip this workflow
+            workflow = build_workflow_from_entry(entry)
+            if workflow is None:
                 continue
 
-            # Extract metadata
-            workflow = _extract_workflow_metadata(adw_id, adw_dir, state_data)
-            workflow["issue_number"] = issue_number
-
-            # Infer status from filesystem
-            _infer_status_from_filesystem(workflow, adw_dir, state_data, state_file)
-
             workflows.append(workflow)
-            logger.debug(f"[SCAN] Found workflow {adw_id}: {workflow['status']}")
+            logger.debug(f"[SCAN] Found workflow {entry.adw_id}: {workflow['status']}")
 
         except Exception as e:
-            logger.error(f"[SCAN] Error parsing {state_file}: {e}")
+            logger.error(f"[SCAN] Error parsing {entry.state_file}: {e}")
             continue
 
     logger.debug(f"[SCAN] Scanned agents directory, found {len(workflows)} workflows")
@@ -10,20 +10,36 @@ This module handles the orchestration of workflow history synchronization:
 
 import json
 import logging
+import weakref
 from datetime import datetime
+from typing import Any
 
+from core.workflow_analytics.similarity_index import WorkflowSimilarityIndex
 from core.workflow_history_utils.database import (
+    bulk_upsert_workflow_history,
     get_workflow_by_adw_id,
     get_workflow_history,
-    insert_workflow_history,
+    get_workflows_by_adw_ids,
     update_workflow_history,
 )
+from core.workflow_history_utils.database.mutations import _get_existing_columns
+from core.workflow_history_utils.database.queries import IN_CLAUSE_BATCH_SIZE
 from core.workflow_history_utils.database.schema import _get_adapter
 from core.workflow_history_utils.enrichment import enrich_cost_data_for_resync, enrich_workflow
 from core.workflow_history_utils.filesystem import scan_agents_directory
 
 logger = logging.getLogger(__name__)
 
+# Completed workflows already run through pattern learning by this process.
+# Workflows that yield no patterns have no occurrences to find in the
+# database, so without this they would be re-analyzed on every sync.
+_pattern_processed_adw_ids: set[str] = set()
+
+# Similarity index per database adapter, loaded from workflow_history on first use
+_similarity_indexes: "weakref.WeakKeyDictionary[Any, WorkflowSimilarityIndex]" = weakref.WeakKeyDictionary()
+
+FINISHED_STATUSES = ("completed", "failed")
+
 
 def _should_update_cost(existing: dict, workflow_data: dict) -> tuple[bool, str, dict]:
     """
@@ -141,6 +157,77 @@ def _build_update_dict(existing: dict, workflow_data: dict, duration_seconds: fl
     return updates
 
 
+def _get_analyzed_adw_ids(conn, adapter, adw_ids: list[str]) -> set[str]:
+    """
+    Return the subset of adw_ids that already have pattern occurrences.
+
+    pattern_occurrences.workflow_id stores workflow_history.id (as text),
+    so occurrences are matched back to adw_id through workflow_history.
+    """
+    ph = adapter.placeholder()
+    analyzed = set()
+    cursor = conn.cursor()
+    for start in range(0, len(adw_ids), IN_CLAUSE_BATCH_SIZE):
+        batch = adw_ids[start:start + IN_CLAUSE_BATCH_SIZE]
+        cursor.execute(
+            f"""
+            SELECT DISTINCT wh.adw_id
+            FROM workflow_history wh
+            JOIN pattern_occurrences po ON po.workflow_id = CAST(wh.id AS TEXT)
+            WHERE wh.adw_id IN ({', '.join(ph for _ in batch)})
+            """,
+            tuple(batch),
+        )
+        analyzed.update(row["adw_id"] for row in cursor.fetchall())
+    return analyzed
+
+
+def _get_similarity_index(adapter) -> WorkflowSimilarityIndex:
+    """Get the similarity index for an adapter, indexing finished workflows on first use."""
+    index = _similarity_indexes.get(adapter)
+    if index is None:
+        index = WorkflowSimilarityIndex()
+        with adapter.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM workflow_history WHERE status IN ('completed', 'failed')")
+            index.add_many(dict(row) for row in cursor.fetchall())
+        _similarity_indexes[adapter] = index
+        logger.info(f"[SIMILARITY] Indexed {len(index)} finished workflows")
+    return index
+
+
+def _update_similar_workflows(workflows: list[dict], existing_by_id: dict[str, dict]) -> int:
+    """
+    Index finished workflows and store their similar_workflow_ids.
+
+    Only workflows without stored similar_workflow_ids are processed, so each
+    workflow is scored once, when it first shows up as finished (older rows
+    without the field are backfilled on the first sync that sees them).
+
+    Returns:
+        Number of workflows whose similar_workflow_ids were written
+    """
+    pending = [
+        w for w in workflows
+        if w.get("status") in FINISHED_STATUSES
+        and (existing_by_id.get(w["adw_id"]) or {}).get("similar_workflow_ids") is None
+    ]
+    if not pending:
+        return 0
+
+    adapter = _get_adapter()
+    with adapter.get_connection() as conn:
+        if "similar_workflow_ids" not in _get_existing_columns(conn.cursor(), adapter.get_db_type()):
+            return 0
+
+    index = _get_similarity_index(adapter)
+    for workflow in pending:
+        index.add(workflow)
+    updates = {w["adw_id"]: {"similar_workflow_ids": index.similar_ids(w)} for w in pending}
+    bulk_upsert_workflow_history([], updates)
+    return len(updates)
+
+
 def sync_workflow_history() -> int:
     """
     Synchronize workflow history database with agents directory.
@@ -150,38 +237,42 @@ def sync_workflow_history() -> int:
     - Updates existing workflows if status changed
     - Enriches with cost data from cost_tracker
 
+    Existing rows are loaded with one bulk read and diffed in memory; all
+    inserts and updates are then written in a single transaction, so the
+    number of queries no longer grows with the number of workflows.
+
     Returns:
         int: Number of workflows synchronized
     """
     workflows = scan_agents_directory()
-    synced_count = 0
+    existing_by_id = get_workflows_by_adw_ids(w["adw_id"] for w in workflows)
+
+    inserts: list[dict] = []
+    updates: dict[str, dict] = {}
+    # Recent workflows for insight generation, loaded once and only if needed
+    all_workflows = None
 
     for workflow_data in workflows:
         adw_id = workflow_data["adw_id"]
-
-        # Check if workflow already exists in database
-        existing = get_workflow_by_adw_id(adw_id)
+        existing = existing_by_id.get(adw_id)
 
         # Enrich workflow data with cost, GitHub state, scores, insights, etc.
         # Pass all_workflows only for new workflows (to generate insights)
-        all_workflows = None
-        if not existing:
+        if not existing and all_workflows is None:
             all_workflows, _ = get_workflow_history()
 
         duration_seconds = enrich_workflow(
             workflow_data=workflow_data,
             adw_id=adw_id,
             is_new=not existing,
-            all_workflows=all_workflows
+            all_workflows=None if existing else all_workflows
         )
 
         if existing:
             # Update existing record if status or other fields changed
-            updates = _build_update_dict(existing, workflow_data, duration_seconds, adw_id)
-
-            if updates:
-                update_workflow_history(adw_id, **updates)
-                synced_count += 1
+            workflow_updates = _build_update_dict(existing, workflow_data, duration_seconds, adw_id)
+            if workflow_updates:
+                updates[adw_id] = workflow_updates
         else:
             # Insert new workflow
             insert_data = {
@@ -192,16 +283,20 @@ def sync_workflow_history() -> int:
             if duration_seconds:
                 insert_data["duration_seconds"] = duration_seconds
 
-            insert_workflow_history(**insert_data)
-            synced_count += 1
+            inserts.append(insert_data)
 
-    # Workflow Similarity Analysis - Skip to avoid redundant processing on every sync
-    # Similarity detection is expensive and should only run:
-    # 1. During initial backfill (one-time)
-    # 2. When explicitly requested via API
-    # 3. NOT on every routine sync
-    # This phase is intentionally disabled for performance - re-enable only if needed
-    logger.debug("[SYNC] Skipping similarity analysis (performance optimization)")
+    inserted, updated = bulk_upsert_workflow_history(inserts, updates)
+    synced_count = inserted + updated
+
+    # Workflow Similarity - newly finished workflows are added to the in-memory
+    # index and queried against it (bucket prefilter + TF-IDF postings), so this
+    # costs milliseconds per workflow instead of a scan of the whole history
+    try:
+        similar_count = _update_similar_workflows(workflows, existing_by_id)
+        if similar_count:
+            logger.debug(f"[SIMILARITY] Stored similar workflows for {similar_count} workflows")
+    except Exception as e:
+        logger.error(f"[SIMILARITY] Similarity analysis failed: {e}")
 
     # Pattern Learning - Process completed workflows for pattern detection
     # Only processes workflows that haven't been analyzed yet
@@ -210,37 +305,38 @@ def sync_workflow_history() -> int:
         from core.pattern_persistence import process_and_persist_workflow
 
         # Get newly completed workflows
-        completed_workflows = [w for w in workflows if w.get('status') in ('completed', 'failed')]
+        completed_ids = [
+            w["adw_id"] for w in workflows
+            if w.get('status') in ('completed', 'failed') and w["adw_id"] not in _pattern_processed_adw_ids
+        ]
 
         # Process each completed workflow for patterns
         patterns_detected_total = 0
 
-        # Get database connection for pattern operations
+        # One set-based lookup instead of a COUNT(*) per workflow
         adapter = _get_adapter()
         with adapter.get_connection() as conn:
-            for workflow in completed_workflows:
-                try:
-                    # Check if this workflow has already been analyzed
-                    cursor = conn.cursor()
-                    ph = adapter.placeholder()
-                    cursor.execute(
-                        f"SELECT COUNT(*) as count FROM pattern_occurrences WHERE adw_id = {ph}",
-                        (workflow.get('adw_id'),)
-                    )
-                    already_analyzed = cursor.fetchone()['count'] > 0
-
-                    if not already_analyzed:
+            analyzed = _get_analyzed_adw_ids(conn, adapter, completed_ids)
+        _pattern_processed_adw_ids.update(analyzed)
+
+        # Pattern detection works on stored rows (it links occurrences by row id)
+        pending = get_workflows_by_adw_ids(a for a in completed_ids if a not in analyzed)
+
+        if pending:
+            with adapter.get_connection() as conn:
+                for adw_id, workflow in pending.items():
+                    try:
                         result = process_and_persist_workflow(workflow, conn)
+                        _pattern_processed_adw_ids.add(adw_id)
                         patterns_detected = result.get('patterns_detected', 0)
                         patterns_detected_total += patterns_detected
 
                         if patterns_detected > 0:
                             logger.info(
-                                f"[PATTERN] Detected {patterns_detected} patterns "
-                                f"in {workflow.get('adw_id')}"
+                                f"[PATTERN] Detected {patterns_detected} patterns in {adw_id}"
                             )
-                except Exception as e:
-                    logger.warning(f"[PATTERN] Learning failed for {workflow.get('adw_id')}: {e}")
+                    except Exception as e:
+                        logger.warning(f"[PATTERN] Learning failed for {adw_id}: {e}")
 
         if patterns_detected_total > 0:
             logger.info(f"[PATTERN] Total patterns detected: {patterns_detected_total}")
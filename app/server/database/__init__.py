@@ -7,8 +7,9 @@ Provides unified interface for both SQLite and PostgreSQL.
 import os
 from typing import TYPE_CHECKING
 
+from .async_adapter import AsyncDatabaseAdapter, AsyncRepository
 from .connection import DatabaseAdapter
-from .factory import close_database_adapter, get_database_adapter
+from .factory import close_database_adapter, get_async_database_adapter, get_database_adapter
 
 # Lazy import adapters to avoid importing psycopg2 when using SQLite
 if TYPE_CHECKING:
@@ -16,10 +17,13 @@ if TYPE_CHECKING:
     from .sqlite_adapter import SQLiteAdapter
 
 __all__ = [
+    "AsyncDatabaseAdapter",
+    "AsyncRepository",
     "DatabaseAdapter",
     "SQLiteAdapter",
     "PostgreSQLAdapter",
     "get_database_adapter",
+    "get_async_database_adapter",
     "close_database_adapter",
 ]
 
@@ -0,0 +1,176 @@
+"""
+Async Database Adapter
+
+Async facade over any DatabaseAdapter so FastAPI routes and background
+watchers can query the database without blocking the event loop.
+
+Blocking driver calls run on a dedicated thread pool sized to the underlying
+connection pool (the same approach aiosqlite uses internally), so the
+existing psycopg2/sqlite3 adapters, SQL dialect handling and repositories are
+reused unchanged. Database work is kept off asyncio's default executor so it
+cannot starve other ``to_thread`` users, and concurrent queries never exceed
+the number of pooled connections.
+
+Example:
+    db = get_async_database_adapter()
+    rows = await db.execute_query("SELECT * FROM phase_queue")
+
+    repo = AsyncRepository(TaskLogRepository())
+    logs = await repo.get_by_adw_id(adw_id)
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .connection import DatabaseAdapter
+
+T = TypeVar("T")
+
+
+class AsyncDatabaseAdapter:
+    """Async wrapper running DatabaseAdapter calls on a bounded executor"""
+
+    def __init__(self, adapter: DatabaseAdapter, max_workers: int | None = None):
+        """
+        Initialize async adapter.
+
+        Args:
+            adapter: Synchronous adapter to delegate to
+            max_workers: Executor size (default: ASYNC_DB_MAX_WORKERS, else the
+                PostgreSQL pool size, else 8 for SQLite)
+        """
+        self.adapter = adapter
+        self.max_workers = max_workers or _default_max_workers(adapter)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazy-initialize the database executor"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="db-async"
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking database callable on the database executor.
+
+        Args:
+            func: Synchronous callable (e.g. a repository method)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._queued += 1
+        try:
+            return await loop.run_in_executor(
+                self.executor, functools.partial(self._tracked, func, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+    def _tracked(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def execute_query(self, query: str, params: tuple | None = None) -> Any:
+        """Execute a query and return results without blocking the event loop"""
+        return await self.run(self.adapter.execute_query, query, params)
+
+    async def health_check(self) -> bool:
+        """Check database health without blocking the event loop"""
+        return await self.run(self.adapter.health_check)
+
+    def placeholder(self) -> str:
+        """Return the placeholder character of the underlying adapter"""
+        return self.adapter.placeholder()
+
+    def now_function(self) -> str:
+        """Return the timestamp function of the underlying adapter"""
+        return self.adapter.now_function()
+
+    def get_db_type(self) -> str:
+        """Return the database type of the underlying adapter"""
+        return self.adapter.get_db_type()
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Return underlying pool counters plus executor occupancy"""
+        with self._lock:
+            executor_stats = {
+                "max_workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "waiting": self._queued - self._in_flight,
+            }
+        return {**self.adapter.get_pool_stats(), "async_executor": executor_stats}
+
+    def close(self) -> None:
+        """Shut down the executor (the underlying adapter is closed separately)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class AsyncRepository:
+    """
+    Async proxy for a synchronous repository or service.
+
+    Every public method of the wrapped object becomes awaitable and runs on
+    the database executor; attributes that are not callables pass through.
+    """
+
+    def __init__(self, repository: Any, db: AsyncDatabaseAdapter | None = None):
+        """
+        Args:
+            repository: Synchronous repository/service instance
+            db: Async adapter whose executor should run the calls
+                (default: get_async_database_adapter())
+        """
+        self._repository = repository
+        self._db = db
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repository, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            db = self._db
+            if db is None:
+                from .factory import get_async_database_adapter
+                db = get_async_database_adapter()
+            return await db.run(attr, *args, **kwargs)
+
+        return call
+
+
+def _default_max_workers(adapter: DatabaseAdapter) -> int:
+    """Size the executor so concurrent queries never exceed pooled connections"""
+    configured = os.getenv("ASYNC_DB_MAX_WORKERS")
+    if configured:
+        return int(configured)
+    if adapter.get_db_type() == "postgresql":
+        return int(os.getenv("POSTGRES_POOL_MAX", "10"))
+    return 8
@@ -0,0 +1,247 @@
+"""
+Table Change Notifications
+
+Lets background watchers sleep until phase_queue, queue_config or
+planned_features actually change instead of re-reading them on a timer.
+
+Two sources feed the bus:
+- In-process: PhaseQueueRepository and PlannedFeaturesService call
+  notify_change() after each committed mutation, with the primary keys of
+  the rows they touched.
+- PostgreSQL: PostgresChangeListener LISTENs on the "table_changes" channel
+  fed by the triggers in db/migrations/022_add_change_notify_triggers_postgres.sql,
+  so writes from ADW processes and other server instances are seen too.
+
+SQLite has no cross-process notifications, so watchers keep a slow safety
+refresh to pick up writes made outside this process.
+
+Usage:
+    from database.change_bus import get_change_bus, notify_change
+
+    notify_change("phase_queue", queue_id)            # after commit
+    changes = await get_change_bus().wait(("phase_queue",), timeout=60)
+    # {"phase_queue": {"abc"}}  - keys of changed rows
+    # {"phase_queue": None}     - unknown rows changed, reload the table
+    # {}                        - timed out without notifications
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "table_changes"
+
+
+class ChangeBus:
+    """
+    Collects row-level change notifications and wakes waiting watchers.
+
+    notify() is thread-safe: repositories usually run on the database
+    executor, so wakeups are handed to the event loop the bus is attached to.
+    Notifications for the same table accumulate until a watcher takes them,
+    so a burst of writes produces a single wakeup.
+    """
+
+    def __init__(self, settle_seconds: float = 0.05):
+        """
+        Args:
+            settle_seconds: Delay after the first notification before changes
+                are handed out, so bursts of writes are batched together
+        """
+        self.settle_seconds = settle_seconds
+        self._lock = threading.Lock()
+        self._pending: dict[str, set[str] | None] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._wakeup = asyncio.Event()
+
+    def attach(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Bind the bus to the running event loop (called by BackgroundTaskManager)."""
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+
+    def notify(self, table: str, keys: Iterable[Any] | None = None) -> None:
+        """
+        Record that rows of a table changed.
+
+        Args:
+            table: Table name, e.g. "phase_queue"
+            keys: Primary keys of the changed rows, or None if unknown
+        """
+        with self._lock:
+            if keys is None:
+                self._pending[table] = None
+            elif table not in self._pending:
+                self._pending[table] = {str(key) for key in keys}
+            elif self._pending[table] is not None:
+                self._pending[table].update(str(key) for key in keys)
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._wakeup.set()
+        else:
+            loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _take(self, tables: tuple[str, ...]) -> dict[str, set[str] | None]:
+        with self._lock:
+            return {table: self._pending.pop(table) for table in tables if table in self._pending}
+
+    async def wait(self, tables: tuple[str, ...], timeout: float) -> dict[str, set[str] | None]:
+        """
+        Wait until any of the tables changes or the timeout expires.
+
+        Returns:
+            Dict of table -> changed keys (None = reload the whole table);
+            empty if the timeout expired without notifications
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            with self._lock:
+                ready = any(table in self._pending for table in tables)
+            if ready:
+                await asyncio.sleep(self.settle_seconds)
+                return self._take(tables)
+
+            self._wakeup.clear()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return {}
+            try:
+                async with asyncio.timeout(remaining):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                return {}
+
+
+class PostgresChangeListener:
+    """
+    Forwards PostgreSQL NOTIFY events on NOTIFY_CHANNEL to a ChangeBus.
+
+    Uses a dedicated autocommit connection registered with the event loop's
+    reader callbacks, so listening costs no thread and no polling. The notify
+    triggers come from migration 022; if they are missing (database not
+    migrated yet) the migration is applied on start. Reconnects on failure,
+    telling watchers to reload everything since notifications may have been
+    missed while disconnected.
+    """
+
+    TABLES = ("phase_queue", "queue_config", "planned_features")
+    TRIGGERS_FILE = "022_add_change_notify_triggers_postgres.sql"
+    TRIGGER_NAMES = tuple(f"{table}_change_notify" for table in TABLES)
+
+    def __init__(self, bus: ChangeBus, adapter, reconnect_delay: float = 5.0):
+        self.bus = bus
+        self.adapter = adapter
+        self.reconnect_delay = reconnect_delay
+        self._conn = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reconnect_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Open the listening connection and register it with the event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._conn = await asyncio.to_thread(self._open)
+        self._loop.add_reader(self._conn.fileno(), self._on_readable)
+        logger.info(f"[CHANGE_BUS] Listening for PostgreSQL notifications on '{NOTIFY_CHANNEL}'")
+
+    def _open(self):
+        conn = self.adapter.connect_listener()
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_trigger WHERE NOT tgisinternal AND tgname = ANY(%s)",
+                (list(self.TRIGGER_NAMES),),
+            )
+            if cursor.fetchone()[0] < len(self.TRIGGER_NAMES):
+                logger.info(f"[CHANGE_BUS] Notify triggers missing, applying {self.TRIGGERS_FILE}")
+                schema_path = os.path.join(
+                    os.path.dirname(__file__), "..", "db", "migrations", self.TRIGGERS_FILE
+                )
+                with open(schema_path) as f:
+                    cursor.execute(f.read())
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        return conn
+
+    def _on_readable(self) -> None:
+        try:
+            self._conn.poll()
+        except Exception as e:
+            logger.error(f"[CHANGE_BUS] Notification connection lost: {e}")
+            self._drop_connection()
+            self._reconnect_task = self._loop.create_task(self._reconnect())
+            return
+
+        while self._conn.notifies:
+            notification = self._conn.notifies.pop(0)
+            try:
+                payload = json.loads(notification.payload)
+            except ValueError:
+                logger.warning(f"[CHANGE_BUS] Ignoring malformed notification: {notification.payload!r}")
+                continue
+            table = payload.get("table") if isinstance(payload, dict) else None
+            if not table:
+                logger.warning(f"[CHANGE_BUS] Ignoring notification without a table: {notification.payload!r}")
+                continue
+            key = payload.get("key")
+            self.bus.notify(table, None if key is None else [key])
+
+    async def _reconnect(self) -> None:
+        while True:
+            await asyncio.sleep(self.reconnect_delay)
+            try:
+                await self.start()
+            except Exception as e:
+                logger.error(f"[CHANGE_BUS] Reconnect failed: {e}")
+                continue
+            for table in self.TABLES:
+                self.bus.notify(table)
+            return
+
+    def _drop_connection(self) -> None:
+        if self._conn is None:
+            return
+        with contextlib.suppress(Exception):
+            self._loop.remove_reader(self._conn.fileno())
+        with contextlib.suppress(Exception):
+            self._conn.close()
+        self._conn = None
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._drop_connection()
+
+
+# Global singleton instance
+_global_bus: ChangeBus | None = None
+
+
+def get_change_bus() -> ChangeBus:
+    """Get or create the global ChangeBus singleton."""
+    global _global_bus
+    if _global_bus is None:
+        _global_bus = ChangeBus()
+    return _global_bus
+
+
+def notify_change(table: str, *keys: Any) -> None:
+    """
+    Notify watchers that rows of a table changed (call after commit).
+
+    Args:
+        table: Table name
+        *keys: Primary keys of the changed rows; none means "unknown rows"
+    """
+    get_change_bus().notify(table, keys or None)
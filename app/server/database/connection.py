@@ -92,3 +92,14 @@ class DatabaseAdapter(ABC):
             'sqlite' or 'postgresql'
         """
         pass
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool usage counters.
+
+        Adapters without a pool return an empty dict.
+
+        Returns:
+            Dictionary of pool metrics (checkouts, wait time, in-use, overflow, ...)
+        """
+        return {}
@@ -11,10 +11,11 @@ from typing import TYPE_CHECKING, Union
 from .connection import DatabaseAdapter
 
 if TYPE_CHECKING:
-    pass
+    from .async_adapter import AsyncDatabaseAdapter
 
 # Global adapter instance (singleton pattern)
 _adapter: Union[DatabaseAdapter, None] = None
+_async_adapter: Union["AsyncDatabaseAdapter", None] = None
 
 
 def get_database_adapter() -> DatabaseAdapter:
@@ -70,9 +71,32 @@ def get_database_adapter() -> DatabaseAdapter:
     return _adapter
 
 
+def get_async_database_adapter() -> "AsyncDatabaseAdapter":
+    """
+    Get the async facade over the configured database adapter.
+
+    Use from async routes and background watchers so database calls run on a
+    dedicated executor instead of blocking the event loop.
+
+    Returns:
+        AsyncDatabaseAdapter wrapping get_database_adapter()
+    """
+    global _async_adapter
+
+    adapter = get_database_adapter()
+    if _async_adapter is None or _async_adapter.adapter is not adapter:
+        from .async_adapter import AsyncDatabaseAdapter
+        _async_adapter = AsyncDatabaseAdapter(adapter)
+
+    return _async_adapter
+
+
 def close_database_adapter() -> None:
     """Close the database adapter (cleanup pools, etc.)"""
-    global _adapter
+    global _adapter, _async_adapter
+    if _async_adapter is not None:
+        _async_adapter.close()
+        _async_adapter = None
     if _adapter is not None:
         _adapter.close()
         _adapter = None
@@ -0,0 +1,335 @@
+"""
+Bounded Connection Pool
+
+Thread-safe connection pool used by the PostgreSQL adapter.
+
+Unlike psycopg2's SimpleConnectionPool, this pool:
+- Holds its lock only while touching pool bookkeeping (never while connecting
+  or validating), so checkouts from different threads do not serialize on I/O
+- Waits up to ``timeout`` seconds for a free connection instead of failing
+  immediately with "connection pool exhausted"
+- Allows a bounded number of temporary overflow connections under bursts
+- Validates connections that have been idle for a while before handing them out
+- Recycles connections older than ``max_lifetime``
+- Exposes usage counters via ``stats()``
+
+The pool is driver-agnostic: callers supply ``connect``/``validate``/``close``
+callables so it can be unit-tested without a database server.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when a connection is requested from a closed pool."""
+
+
+@dataclass
+class _PooledConnection:
+    """Bookkeeping wrapper for a pooled connection."""
+
+    conn: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    overflow: bool = False
+
+
+class BoundedConnectionPool:
+    """Thread-safe connection pool with bounded wait, validation and metrics."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        minconn: int = 1,
+        maxconn: int = 10,
+        max_overflow: int = 0,
+        timeout: float = 30.0,
+        max_lifetime: float = 1800.0,
+        validate_after_idle: float = 30.0,
+        validate: Callable[[Any], None] | None = None,
+        close: Callable[[Any], None] | None = None,
+    ):
+        """
+        Initialize the pool and open ``minconn`` connections.
+
+        Args:
+            connect: Factory returning a new driver connection
+            minconn: Connections opened up front and kept idle
+            maxconn: Maximum number of persistent connections
+            max_overflow: Extra temporary connections allowed under load
+                (closed when returned instead of being kept idle)
+            timeout: Seconds to wait for a free connection before raising
+                PoolTimeoutError
+            max_lifetime: Seconds after which a connection is recycled
+                (0 disables recycling)
+            validate_after_idle: Validate connections idle for at least this many
+                seconds on checkout (0 validates on every checkout)
+            validate: Callable raising an exception if a connection is unusable
+            close: Callable closing a driver connection (default: ``conn.close()``)
+        """
+        if maxconn < 1:
+            raise ValueError("maxconn must be at least 1")
+        if minconn < 0 or minconn > maxconn:
+            raise ValueError("minconn must be between 0 and maxconn")
+        if max_overflow < 0:
+            raise ValueError("max_overflow must not be negative")
+
+        self._connect = connect
+        self._validate = validate
+        self._close = close or (lambda conn: conn.close())
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.validate_after_idle = validate_after_idle
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: list[_PooledConnection] = []
+        self._checked_out: dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._closed = False
+
+        # Metrics
+        self._checkouts = 0
+        self._timeouts = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._created = 0
+        self._recycled = 0
+        self._invalidated = 0
+        self._discarded = 0
+        self._overflow_total = 0
+
+        for _ in range(minconn):
+            self._idle.append(self._open())
+            self._size += 1
+
+    # ------------------------------------------------------------------
+    # Checkout / return
+    # ------------------------------------------------------------------
+
+    def getconn(self) -> Any:
+        """
+        Check a connection out of the pool.
+
+        Returns:
+            Driver connection
+
+        Raises:
+            PoolTimeoutError: If no connection is available within ``timeout``
+            PoolClosedError: If the pool has been closed
+        """
+        start = time.monotonic()
+        entry, overflow, waited = self._reserve(start)
+
+        try:
+            entry = self._open(overflow=overflow) if entry is None else self._ensure_usable(entry)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        wait_time = time.monotonic() - start
+        entry.last_used_at = time.monotonic()
+        with self._cond:
+            self._checked_out[id(entry.conn)] = entry
+            self._checkouts += 1
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+            if waited:
+                self._waits += 1
+        return entry.conn
+
+    def putconn(self, conn: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection previously obtained from getconn()
+            discard: Close the connection instead of keeping it idle
+                (use after driver-level errors)
+        """
+        now = time.monotonic()
+        with self._cond:
+            entry = self._checked_out.pop(id(conn), None)
+            if entry is None:
+                raise ValueError("Connection was not checked out from this pool")
+
+            expired = self._is_expired(entry, now)
+            keep = (
+                not discard
+                and not self._closed
+                and not entry.overflow
+                and not expired
+                and not _is_closed(conn)
+            )
+            if keep:
+                entry.last_used_at = now
+                self._idle.append(entry)
+            else:
+                self._size -= 1
+                if discard:
+                    self._discarded += 1
+                elif expired:
+                    self._recycled += 1
+            self._cond.notify()
+
+        if not keep:
+            self._safe_close(conn)
+
+    def closeall(self) -> None:
+        """Close all idle connections and reject further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        for entry in idle:
+            self._safe_close(entry.conn)
+
+    @property
+    def closed(self) -> bool:
+        """True once closeall() has been called."""
+        return self._closed
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return a snapshot of pool usage counters.
+
+        Returns:
+            Dictionary with configuration, current occupancy and cumulative counters
+        """
+        with self._cond:
+            in_use = len(self._checked_out)
+            overflow = sum(1 for entry in self._checked_out.values() if entry.overflow)
+            checkouts = self._checkouts
+            return {
+                "minconn": self.minconn,
+                "maxconn": self.maxconn,
+                "max_overflow": self.max_overflow,
+                "timeout_seconds": self.timeout,
+                "size": self._size,
+                "in_use": in_use,
+                "idle": len(self._idle),
+                "overflow": overflow,
+                "checkouts": checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "wait_time_total_ms": round(self._wait_time_total * 1000, 3),
+                "wait_time_avg_ms": round(self._wait_time_total * 1000 / checkouts, 3) if checkouts else 0.0,
+                "wait_time_max_ms": round(self._wait_time_max * 1000, 3),
+                "connections_created": self._created,
+                "connections_recycled": self._recycled,
+                "connections_invalidated": self._invalidated,
+                "connections_discarded": self._discarded,
+                "overflow_total": self._overflow_total,
+                "closed": self._closed,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reserve(self, start: float) -> tuple[_PooledConnection | None, bool, bool]:
+        """
+        Reserve an idle connection or a slot for a new one, waiting if needed.
+
+        Returns:
+            (idle entry or None, whether a new connection is overflow, whether we waited)
+        """
+        deadline = start + self.timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolClosedError("Connection pool is closed")
+                if self._idle:
+                    return self._idle.pop(), False, waited
+                if self._size < self.maxconn + self.max_overflow:
+                    self._size += 1
+                    overflow = self._size > self.maxconn
+                    return None, overflow, waited
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Timed out after {self.timeout:.1f}s waiting for a database "
+                        f"connection ({self._size} open, {len(self._checked_out)} in use)"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+    def _open(self, overflow: bool = False) -> _PooledConnection:
+        """Open a new driver connection (called without the lock held)."""
+        conn = self._connect()
+        with self._cond:
+            self._created += 1
+            if overflow:
+                self._overflow_total += 1
+        return _PooledConnection(conn=conn, overflow=overflow)
+
+    def _ensure_usable(self, entry: _PooledConnection) -> _PooledConnection:
+        """Replace an idle connection that is expired, closed or fails validation."""
+        now = time.monotonic()
+
+        if self._is_expired(entry, now):
+            self._safe_close(entry.conn)
+            with self._cond:
+                self._recycled += 1
+            return self._open()
+
+        stale = self._needs_validation(entry, now) and not self._is_valid(entry.conn)
+        if _is_closed(entry.conn) or stale:
+            self._safe_close(entry.conn)
+            with self._cond:
+                self._invalidated += 1
+            return self._open()
+
+        return entry
+
+    def _is_expired(self, entry: _PooledConnection, now: float) -> bool:
+        return self.max_lifetime > 0 and now - entry.created_at >= self.max_lifetime
+
+    def _needs_validation(self, entry: _PooledConnection, now: float) -> bool:
+        return self._validate is not None and now - entry.last_used_at >= self.validate_after_idle
+
+    def _is_valid(self, conn: Any) -> bool:
+        try:
+            self._validate(conn)
+            return True
+        except Exception as e:
+            logger.warning(f"[POOL] Discarding stale connection: {e}")
+            return False
+
+    def _safe_close(self, conn: Any) -> None:
+        try:
+            self._close(conn)
+        except Exception as e:
+            logger.debug(f"[POOL] Error closing connection: {e}")
+
+
+def _is_closed(conn: Any) -> bool:
+    """Best-effort check whether a driver connection is already closed."""
+    return bool(getattr(conn, "closed", False))
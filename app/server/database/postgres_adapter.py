@@ -2,6 +2,13 @@
 PostgreSQL Database Adapter
 
 Implements DatabaseAdapter interface using psycopg2 with connection pooling.
+
+Pool tuning (environment variables):
+- POSTGRES_POOL_MIN / POSTGRES_POOL_MAX: persistent connections kept by the pool
+- POSTGRES_POOL_MAX_OVERFLOW: extra temporary connections allowed under bursts
+- POSTGRES_POOL_TIMEOUT: seconds to wait for a free connection
+- POSTGRES_POOL_MAX_LIFETIME: seconds before a connection is recycled
+- POSTGRES_POOL_VALIDATE_IDLE: validate connections idle at least this many seconds
 """
 
 import os
@@ -11,10 +18,10 @@ from contextlib import contextmanager
 from typing import Any
 
 import psycopg2
-import psycopg2.pool
 from psycopg2.extras import RealDictCursor
 
 from .connection import DatabaseAdapter
+from .pool import BoundedConnectionPool
 
 
 class PostgreSQLAdapter(DatabaseAdapter):
@@ -22,11 +29,17 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
     def __init__(self):
         """Initialize PostgreSQL adapter (lazy connection pool)"""
-        self._pool = None
-        self._lock = threading.Lock()  # Protect SimpleConnectionPool from concurrent access
+        self._pool: BoundedConnectionPool | None = None
+        self._lock = threading.Lock()  # Guards lazy pool creation only
         self._pool_config = {
             "minconn": int(os.getenv("POSTGRES_POOL_MIN", "1")),
             "maxconn": int(os.getenv("POSTGRES_POOL_MAX", "10")),
+            "max_overflow": int(os.getenv("POSTGRES_POOL_MAX_OVERFLOW", "5")),
+            "timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+            "max_lifetime": float(os.getenv("POSTGRES_POOL_MAX_LIFETIME", "1800")),
+            "validate_after_idle": float(os.getenv("POSTGRES_POOL_VALIDATE_IDLE", "30")),
+        }
+        self._connect_config = {
             "host": os.getenv("POSTGRES_HOST", "localhost"),
             "port": int(os.getenv("POSTGRES_PORT", "5432")),
             "database": os.getenv("POSTGRES_DB", "tac_webbuilder"),
@@ -36,28 +49,51 @@ class PostgreSQLAdapter(DatabaseAdapter):
         }
 
     @property
-    def pool(self):
-        """Lazy-initialize connection pool on first access"""
+    def pool(self) -> BoundedConnectionPool:
+        """Lazy-initialize connection pool on first access (thread-safe)"""
         if self._pool is None:
-            # Use SimpleConnectionPool instead of ThreadedConnectionPool to avoid
-            # threading issues with uvicorn's recursive lifespan contexts
-            self._pool = psycopg2.pool.SimpleConnectionPool(**self._pool_config)
+            with self._lock:
+                if self._pool is None:
+                    self._pool = BoundedConnectionPool(
+                        self._connect,
+                        validate=_validate_connection,
+                        **self._pool_config,
+                    )
         return self._pool
 
+    def _connect(self):
+        """Open a new psycopg2 connection"""
+        return psycopg2.connect(**self._connect_config)
+
+    def connect_listener(self):
+        """Open a dedicated autocommit connection outside the pool (for LISTEN)"""
+        conn = self._connect()
+        conn.autocommit = True
+        return conn
+
     @contextmanager
     def get_connection(self) -> Generator[Any, None, None]:
-        """Get PostgreSQL connection from pool (thread-safe)"""
-        with self._lock:
-            conn = self.pool.getconn()
+        """
+        Get PostgreSQL connection from pool (thread-safe).
+
+        Waits up to POSTGRES_POOL_TIMEOUT seconds for a free connection and
+        raises PoolTimeoutError if none becomes available. Connections that
+        fail to roll back are discarded rather than returned to the pool.
+        """
+        pool = self.pool
+        conn = pool.getconn()
+        discard = False
         try:
             yield conn
             conn.commit()
         except Exception:
-            conn.rollback()
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                discard = True
             raise
         finally:
-            with self._lock:
-                self.pool.putconn(conn)
+            pool.putconn(conn, discard=discard or bool(conn.closed))
 
     def execute_query(self, query: str, params: tuple | None = None) -> Any:
         """Execute query and return results"""
@@ -79,9 +115,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
     def close(self) -> None:
         """Close connection pool"""
-        if self._pool:
-            self._pool.closeall()
-            self._pool = None  # Reset to allow lazy re-initialization
+        with self._lock:
+            if self._pool:
+                self._pool.closeall()
+                self._pool = None  # Reset to allow lazy re-initialization
 
     def health_check(self) -> bool:
         """Check PostgreSQL health"""
@@ -96,3 +133,16 @@ class PostgreSQLAdapter(DatabaseAdapter):
     def get_db_type(self) -> str:
         """Get database type"""
         return "postgresql"
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Get connection pool usage counters (empty until the pool is created)"""
+        if self._pool is None:
+            return {}
+        return self._pool.stats()
+
+
+def _validate_connection(conn) -> None:
+    """Raise if a pooled connection can no longer execute queries"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    conn.rollback()
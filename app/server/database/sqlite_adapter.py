@@ -3,16 +3,50 @@ SQLite Database Adapter
 
 Wraps existing SQLite connection logic from utils/db_connection.py
 into the DatabaseAdapter interface for backward compatibility.
+
+Connection modes (SQLITE_POOL_MODE env var or ``pool_mode`` argument):
+- "thread" (default): each thread keeps one persistent connection tuned with
+  WAL journaling, synchronous=NORMAL, mmap/cache sizing and a busy timeout.
+  The connection's prepared-statement cache survives across calls.
+- "none": legacy behaviour - open and close a connection per call.
 """
 
+import logging
+import os
 import sqlite3
+import threading
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any
 
 from .connection import DatabaseAdapter
 
+logger = logging.getLogger(__name__)
+
+POOL_MODES = ("thread", "none")
+
+# Applied to every new connection. journal_mode=WAL is persistent in the
+# database file; the rest are per-connection settings.
+DEFAULT_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -20000,  # Negative = KiB (~20MB page cache)
+    "mmap_size": 268435456,  # 256MB memory-mapped I/O
+    "temp_store": "MEMORY",
+}
+
+
+@dataclass
+class _ThreadConnection:
+    """Persistent connection owned by a single thread."""
+
+    conn: sqlite3.Connection
+    thread: threading.Thread
+    file_id: tuple[int, int] | None
+    in_use: bool = False
+
 
 class SQLiteAdapter(DatabaseAdapter):
     """SQLite database adapter (backward compatible with existing code)"""
@@ -22,6 +56,10 @@ class SQLiteAdapter(DatabaseAdapter):
         db_path: str = "db/database.db",
         max_retries: int = 3,
         retry_delay: float = 0.1,
+        pool_mode: str | None = None,
+        busy_timeout: float = 5.0,
+        pragmas: dict[str, str | int] | None = None,
+        cached_statements: int = 256,
     ):
         """
         Initialize SQLite adapter.
@@ -30,10 +68,33 @@ class SQLiteAdapter(DatabaseAdapter):
             db_path: Path to SQLite database file
             max_retries: Maximum connection retry attempts
             retry_delay: Delay between retries in seconds
+            pool_mode: "thread" for persistent per-thread connections, "none" to
+                open a connection per call (default: SQLITE_POOL_MODE or "thread")
+            busy_timeout: Seconds to wait on a locked database before failing
+            pragmas: PRAGMA overrides merged over DEFAULT_PRAGMAS
+            cached_statements: Size of each connection's prepared-statement cache
         """
+        pool_mode = (pool_mode or os.getenv("SQLITE_POOL_MODE", "thread")).lower()
+        if pool_mode not in POOL_MODES:
+            raise ValueError(f"pool_mode must be one of {POOL_MODES}, got {pool_mode!r}")
+
         self.db_path = db_path
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.pool_mode = pool_mode
+        self.busy_timeout = busy_timeout
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.cached_statements = cached_statements
+
+        self._local = threading.local()
+        self._registry_lock = threading.Lock()
+        self._connections: dict[int, _ThreadConnection] = {}
+        self._stats = {
+            "checkouts": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "connections_reopened": 0,
+        }
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
@@ -45,17 +106,127 @@ class SQLiteAdapter(DatabaseAdapter):
         - Automatic rollback on errors
         - Retry logic for SQLITE_BUSY
         - Dict-like row access via sqlite3.Row
+        - Persistent per-thread connection reuse (pool_mode="thread")
+
+        Nested calls on the same thread get a separate short-lived connection
+        so an inner commit/rollback never affects the outer transaction.
 
         Yields:
             sqlite3.Connection: Database connection
         """
+        entry = self._checkout_thread_connection()
+        conn = entry.conn if entry else self._open_connection()
+
+        # Transaction management
+        try:
+            yield conn
+        except Exception as e:
+            # Rollback on any exception
+            conn.rollback()
+            raise e
+        else:
+            # Commit on successful completion
+            conn.commit()
+        finally:
+            if entry:
+                entry.in_use = False
+            else:
+                conn.close()
+
+    def _checkout_thread_connection(self) -> _ThreadConnection | None:
+        """
+        Get this thread's persistent connection, (re)opening it if needed.
+
+        Returns:
+            The thread's connection entry, or None if a one-off connection
+            should be used (pool_mode="none" or a nested call)
+        """
+        with self._registry_lock:
+            self._stats["checkouts"] += 1
+
+        if self.pool_mode != "thread":
+            return None
+
+        entry: _ThreadConnection | None = getattr(self._local, "entry", None)
+        if entry is not None and entry.in_use:
+            return None
+
+        if entry is not None and self._is_reusable(entry):
+            with self._registry_lock:
+                self._stats["connections_reused"] += 1
+        else:
+            if entry is not None:
+                self._discard(entry)
+                with self._registry_lock:
+                    self._stats["connections_reopened"] += 1
+            entry = self._register_thread_connection()
+
+        entry.in_use = True
+        return entry
+
+    def _register_thread_connection(self) -> _ThreadConnection:
+        """Open a persistent connection for the current thread."""
+        conn = self._open_connection()
+        entry = _ThreadConnection(
+            conn=conn,
+            thread=threading.current_thread(),
+            file_id=self._file_id(),
+        )
+        self._local.entry = entry
+
+        with self._registry_lock:
+            # Close connections whose owning threads have exited
+            dead = [key for key, e in self._connections.items() if not e.thread.is_alive()]
+            stale = [self._connections.pop(key) for key in dead]
+            self._connections[id(entry)] = entry
+
+        for old in stale:
+            _safe_close(old.conn)
+        return entry
+
+    def _is_reusable(self, entry: _ThreadConnection) -> bool:
+        """
+        Check a cached connection is still open and points at the current file.
+
+        The file identity check catches databases that were deleted or replaced
+        on disk (e.g. by reset scripts or test fixtures) while a connection was
+        still cached.
+        """
+        try:
+            entry.conn.total_changes  # noqa: B018 - raises if connection was closed
+        except sqlite3.ProgrammingError:
+            return False
+        return entry.file_id is None or entry.file_id == self._file_id()
+
+    def _file_id(self) -> tuple[int, int] | None:
+        """Return (device, inode) of the database file, or None for in-memory databases."""
+        if self.db_path == ":memory:" or str(self.db_path).startswith("file:"):
+            return None
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return (-1, -1)
+        return (st.st_dev, st.st_ino)
+
+    def _discard(self, entry: _ThreadConnection) -> None:
+        with self._registry_lock:
+            self._connections.pop(id(entry), None)
+        _safe_close(entry.conn)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new connection, retrying on SQLITE_BUSY."""
         conn = None
         last_error = None
 
         # Retry loop for SQLITE_BUSY errors
         for attempt in range(self.max_retries):
             try:
-                conn = sqlite3.connect(str(self.db_path))
+                conn = sqlite3.connect(
+                    str(self.db_path),
+                    timeout=self.busy_timeout,
+                    cached_statements=self.cached_statements,
+                    check_same_thread=False,  # Allows close() from the shutdown thread
+                )
                 conn.row_factory = sqlite3.Row  # Enable dict-like row access
                 break  # Connection successful
             except sqlite3.OperationalError as e:
@@ -74,19 +245,19 @@ class SQLiteAdapter(DatabaseAdapter):
                 "Failed to connect to database"
             )
 
-        # Transaction management
-        try:
-            yield conn
-        except Exception as e:
-            # Rollback on any exception
-            conn.rollback()
-            raise e
-        else:
-            # Commit on successful completion
-            conn.commit()
-        finally:
-            # Always close the connection
-            conn.close()
+        self._apply_pragmas(conn)
+        with self._registry_lock:
+            self._stats["connections_opened"] += 1
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Apply performance PRAGMAs; failures are logged, not fatal."""
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        for name, value in self.pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.DatabaseError as e:
+                logger.warning(f"[SQLITE] Could not apply PRAGMA {name}={value}: {e}")
 
     def execute_query(self, query: str, params: tuple | None = None) -> Any:
         """
@@ -129,9 +300,15 @@ class SQLiteAdapter(DatabaseAdapter):
         """
         Clean up resources.
 
-        SQLite doesn't have connection pools, so nothing to clean up.
+        Closes every persistent per-thread connection. Threads that use the
+        adapter afterwards transparently reopen their connection.
         """
-        pass
+        with self._registry_lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+
+        for entry in entries:
+            _safe_close(entry.conn)
 
     def health_check(self) -> bool:
         """
@@ -156,3 +333,24 @@ class SQLiteAdapter(DatabaseAdapter):
             'sqlite'
         """
         return "sqlite"
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """
+        Get connection reuse counters.
+
+        Returns:
+            Dictionary with pool mode, open connections and checkout/reuse counts
+        """
+        with self._registry_lock:
+            return {
+                "mode": self.pool_mode,
+                "open_connections": len(self._connections),
+                **self._stats,
+            }
+
+
+def _safe_close(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"[SQLITE] Error closing connection: {e}")
@@ -0,0 +1,41 @@
+-- Migration 022: Change notification triggers (PostgreSQL)
+-- Purpose: Publish row changes of phase_queue, queue_config and planned_features
+-- on the 'table_changes' channel so background watchers wake on real changes
+-- instead of polling. Payload: {"table": "<table name>", "key": "<primary key>"}
+-- PostgresChangeListener applies it on server startup if the triggers are missing (idempotent).
+
+CREATE OR REPLACE FUNCTION notify_table_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := to_jsonb(OLD);
+    ELSE
+        changed := to_jsonb(NEW);
+    END IF;
+    PERFORM pg_notify(
+        'table_changes',
+        json_build_object('table', TG_TABLE_NAME, 'key', changed ->> TG_ARGV[0])::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS phase_queue_change_notify ON phase_queue;
+CREATE TRIGGER phase_queue_change_notify
+AFTER INSERT OR UPDATE OR DELETE ON phase_queue
+FOR EACH ROW
+EXECUTE FUNCTION notify_table_change('queue_id');
+
+DROP TRIGGER IF EXISTS queue_config_change_notify ON queue_config;
+CREATE TRIGGER queue_config_change_notify
+AFTER INSERT OR UPDATE OR DELETE ON queue_config
+FOR EACH ROW
+EXECUTE FUNCTION notify_table_change('config_key');
+
+DROP TRIGGER IF EXISTS planned_features_change_notify ON planned_features;
+CREATE TRIGGER planned_features_change_notify
+AFTER INSERT OR UPDATE OR DELETE ON planned_features
+FOR EACH ROW
+EXECUTE FUNCTION notify_table_change('id');
@@ -0,0 +1,12 @@
+-- Migration 023: Add dispatcher claim/lease columns to phase_queue
+-- Purpose: Let several dispatchers claim ready phases atomically without duplicate launches.
+-- A claim is held by claimed_by until lease_expires_at; heartbeat_at records the last renewal.
+
+ALTER TABLE phase_queue ADD COLUMN claimed_by TEXT;
+ALTER TABLE phase_queue ADD COLUMN claimed_at TIMESTAMP;
+ALTER TABLE phase_queue ADD COLUMN heartbeat_at TIMESTAMP;
+ALTER TABLE phase_queue ADD COLUMN lease_expires_at TIMESTAMP;
+
+-- Claim queries filter by status and order by priority, queue_position
+CREATE INDEX IF NOT EXISTS idx_phase_queue_claim
+  ON phase_queue(status, priority, queue_position);
@@ -0,0 +1,15 @@
+-- Migration 023: Add dispatcher claim/lease columns to phase_queue (PostgreSQL)
+-- Purpose: Let several dispatchers claim ready phases atomically without duplicate launches.
+-- A claim is held by claimed_by until lease_expires_at; heartbeat_at records the last renewal.
+
+ALTER TABLE phase_queue ADD COLUMN IF NOT EXISTS claimed_by TEXT;
+ALTER TABLE phase_queue ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP;
+ALTER TABLE phase_queue ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP;
+ALTER TABLE phase_queue ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP;
+
+-- Claim queries filter by status and order by priority, queue_position
+CREATE INDEX IF NOT EXISTS idx_phase_queue_claim
+  ON phase_queue(status, priority, queue_position);
+
+COMMENT ON COLUMN phase_queue.claimed_by IS 'Dispatcher (host:pid) that claimed the phase for launching';
+COMMENT ON COLUMN phase_queue.lease_expires_at IS 'Claim expiry; another dispatcher may reclaim the phase after this time';
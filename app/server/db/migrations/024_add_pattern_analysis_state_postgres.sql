@@ -0,0 +1,18 @@
+-- Migration 024: Add incremental pattern analysis state (PostgreSQL)
+-- Purpose: Let scripts/analyze_daily_patterns.py --incremental resume from the last
+-- processed hook_events.id instead of re-reading the whole --hours window.
+-- open_sessions holds partial tool sequences of sessions that have not ended yet;
+-- pending_patterns holds counts of patterns still below min_occurrences, and
+-- recent_event_ids the ids already processed just below last_event_id, which are
+-- re-read to catch rows committed out of id order (all JSON).
+
+CREATE TABLE IF NOT EXISTS pattern_analysis_state (
+    name TEXT PRIMARY KEY,
+    last_event_id BIGINT NOT NULL DEFAULT 0,
+    last_event_timestamp TEXT,
+    recent_event_ids TEXT,
+    total_sessions INTEGER NOT NULL DEFAULT 0,
+    open_sessions TEXT,
+    pending_patterns TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
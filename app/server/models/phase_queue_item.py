@@ -31,6 +31,10 @@ class PhaseQueueItem:
         queue_position: int | None = None,
         ready_timestamp: str | None = None,
         started_timestamp: str | None = None,
+        claimed_by: str | None = None,
+        claimed_at: str | None = None,
+        heartbeat_at: str | None = None,
+        lease_expires_at: str | None = None,
     ):
         self.queue_id = queue_id
         self.feature_id = feature_id
@@ -49,6 +53,11 @@ class PhaseQueueItem:
         self.queue_position = queue_position
         self.ready_timestamp = ready_timestamp
         self.started_timestamp = started_timestamp
+        # Dispatcher claim (see PhaseQueueRepository.claim_ready_phases)
+        self.claimed_by = claimed_by
+        self.claimed_at = claimed_at
+        self.heartbeat_at = heartbeat_at
+        self.lease_expires_at = lease_expires_at
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -76,6 +85,10 @@ class PhaseQueueItem:
             "queue_position": self.queue_position,
             "ready_timestamp": to_iso(self.ready_timestamp),
             "started_timestamp": to_iso(self.started_timestamp),
+            "claimed_by": self.claimed_by,
+            "claimed_at": to_iso(self.claimed_at),
+            "heartbeat_at": to_iso(self.heartbeat_at),
+            "lease_expires_at": to_iso(self.lease_expires_at),
         }
 
     @classmethod
@@ -88,7 +101,12 @@ class PhaseQueueItem:
             phase_data = {}
 
         # Handle depends_on_phases (JSONB in PostgreSQL, TEXT in SQLite)
-        depends_on_phases_raw = row.get("depends_on_phases")
+        # Older rows may lack the column: dicts raise KeyError, sqlite3.Row IndexError
+        # (and `in` on a sqlite3.Row tests values, not column names)
+        try:
+            depends_on_phases_raw = row["depends_on_phases"]
+        except (KeyError, IndexError):
+            depends_on_phases_raw = None
         if depends_on_phases_raw:
             if isinstance(depends_on_phases_raw, str):
                 depends_on_phases = json.loads(depends_on_phases_raw)
@@ -124,4 +142,8 @@ class PhaseQueueItem:
             queue_position=safe_get("queue_position"),
             ready_timestamp=safe_get("ready_timestamp"),
             started_timestamp=safe_get("started_timestamp"),
+            claimed_by=safe_get("claimed_by"),
+            claimed_at=safe_get("claimed_at"),
+            heartbeat_at=safe_get("heartbeat_at"),
+            lease_expires_at=safe_get("lease_expires_at"),
         )
@@ -0,0 +1,381 @@
+"""
+Phase Dependency Graph
+
+In-memory DAG of phase_queue dependencies, used by PhaseCoordinator to find
+ready phases without querying every dependency of every queued phase.
+
+Each phase tracks how many of its dependencies are not completed yet
+(``unmet``). Completing a phase decrements its dependents, so the newly ready
+phases fall out in O(out-degree); a per-feature ready set (queued phases with
+no unmet dependencies) is kept alongside.
+
+The graph is built lazily from a single query and then maintained by
+PhaseQueueRepository mutations (create, status changes, delete). Writes made
+outside the repository are not seen: resync_feature() reloads one feature and
+check_consistency() compares the whole graph with the database, rebuilding it
+if they disagree. PhaseCoordinator uses both (see _find_newly_ready_phases).
+
+Example:
+    graph = get_dependency_graph(adapter)
+    graph.ready_phases(feature_id)          # queue_ids ready to launch
+    graph.set_status(queue_id, "completed") # -> queue_ids that became ready
+"""
+
+import json
+import logging
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = "completed"
+QUEUED = "queued"
+
+
+@dataclass
+class PhaseNode:
+    """One phase_queue row as seen by the graph."""
+
+    queue_id: str
+    feature_id: int | None
+    phase_number: int
+    status: str
+    depends_on: tuple[int, ...]
+    unmet: int = 0
+
+
+def parse_depends_on(raw: Any) -> tuple[int, ...]:
+    """Parse depends_on_phases (JSONB list in PostgreSQL, JSON text in SQLite)."""
+    if not raw:
+        return ()
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning(f"[DEP_GRAPH] Failed to parse depends_on_phases: {raw!r}")
+            return ()
+    if not isinstance(raw, list):
+        return ()
+    # Deduplicated so each dependency counts once
+    return tuple(dict.fromkeys(raw))
+
+
+class PhaseDependencyGraph:
+    """
+    Dependency DAG with per-phase unmet-dependency counts.
+
+    Thread-safe; all methods take the graph lock. Mutation hooks are no-ops
+    until the graph has been loaded, since the first read loads the current
+    state from the database anyway.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[Any]],
+        feature_loader: Callable[[int | None], Iterable[Any]] | None = None,
+    ):
+        """
+        Args:
+            loader: Returns all phase_queue rows with queue_id, feature_id,
+                phase_number, status and depends_on_phases
+            feature_loader: Returns the same columns for one feature
+                (default: filter the full load)
+        """
+        self._loader = loader
+        self._feature_loader = feature_loader or (
+            lambda feature_id: [row for row in loader() if row["feature_id"] == feature_id]
+        )
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._nodes: dict[str, PhaseNode] = {}
+        # (feature_id, phase_number) -> queue_id of that phase
+        self._by_number: dict[tuple[int | None, int], str] = {}
+        # (feature_id, phase_number) -> queue_ids of phases depending on it
+        self._dependents: dict[tuple[int | None, int], set[str]] = {}
+        # feature_id -> queue_ids of queued phases with no unmet dependencies
+        self._ready: dict[int | None, set[str]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the graph holds a loaded snapshot."""
+        return self._loaded
+
+    def ensure_loaded(self) -> None:
+        """Build the graph from the database if it has not been loaded yet."""
+        with self._lock:
+            if not self._loaded:
+                self._rebuild(self._loader())
+
+    def invalidate(self) -> None:
+        """Drop the graph; the next read rebuilds it with a single query."""
+        with self._lock:
+            self._loaded = False
+            self._nodes.clear()
+            self._by_number.clear()
+            self._dependents.clear()
+            self._ready.clear()
+
+    def _rebuild(self, rows: Iterable[Any]) -> None:
+        self.invalidate()
+        self._loaded = True
+        for row in rows:
+            self._add(
+                row["queue_id"],
+                row["feature_id"],
+                row["phase_number"],
+                row["status"],
+                parse_depends_on(row["depends_on_phases"]),
+            )
+        logger.info(f"[DEP_GRAPH] Loaded {len(self._nodes)} phases")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def ready_phases(self, feature_id: int | None) -> list[str]:
+        """
+        Get queued phases of a feature whose dependencies are all completed.
+
+        Returns:
+            queue_ids ordered by phase number
+        """
+        with self._lock:
+            self.ensure_loaded()
+            ready = self._ready.get(feature_id, ())
+            return sorted(ready, key=lambda queue_id: self._nodes[queue_id].phase_number)
+
+    def get(self, queue_id: str) -> PhaseNode | None:
+        """Get the graph node for a phase (None if unknown)."""
+        with self._lock:
+            self.ensure_loaded()
+            return self._nodes.get(queue_id)
+
+    # ------------------------------------------------------------------
+    # Mutation hooks (called by PhaseQueueRepository after commit)
+    # ------------------------------------------------------------------
+
+    def add_phase(
+        self,
+        queue_id: str,
+        feature_id: int | None,
+        phase_number: int,
+        status: str,
+        depends_on: Iterable[int],
+    ) -> None:
+        """Record a newly created phase."""
+        with self._lock:
+            if self._loaded:
+                self._add(queue_id, feature_id, phase_number, status, parse_depends_on(list(depends_on)))
+
+    def set_status(self, queue_id: str, status: str) -> list[str]:
+        """
+        Record a status change.
+
+        Returns:
+            queue_ids of phases that became ready because of this change
+        """
+        with self._lock:
+            node = self._nodes.get(queue_id) if self._loaded else None
+            if node is None or node.status == status:
+                return []
+
+            old_status, node.status = node.status, status
+            newly_ready = []
+            if status == COMPLETED:
+                newly_ready = self._adjust_dependents(node, -1)
+            elif old_status == COMPLETED:
+                self._adjust_dependents(node, +1)
+
+            self._update_ready(node)
+            if status == QUEUED and node.unmet == 0:
+                newly_ready.append(queue_id)
+            return newly_ready
+
+    def remove_phase(self, queue_id: str) -> None:
+        """Record a deleted phase."""
+        with self._lock:
+            node = self._nodes.pop(queue_id, None) if self._loaded else None
+            if node is None:
+                return
+
+            key = (node.feature_id, node.phase_number)
+            if self._by_number.get(key) == queue_id:
+                del self._by_number[key]
+                # A missing dependency blocks its dependents, like an incomplete one
+                if node.status == COMPLETED:
+                    self._adjust_dependents(node, +1)
+            for dependency in node.depends_on:
+                dependents = self._dependents.get((node.feature_id, dependency))
+                if dependents:
+                    dependents.discard(queue_id)
+            self._ready.get(node.feature_id, set()).discard(queue_id)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _add(
+        self,
+        queue_id: str,
+        feature_id: int | None,
+        phase_number: int,
+        status: str,
+        depends_on: tuple[int, ...],
+    ) -> None:
+        if queue_id in self._nodes:
+            self.remove_phase(queue_id)
+
+        node = PhaseNode(queue_id, feature_id, phase_number, status, depends_on)
+        node.unmet = sum(1 for dependency in depends_on if not self._is_completed(feature_id, dependency))
+        self._nodes[queue_id] = node
+
+        key = (feature_id, phase_number)
+        previous = self._by_number.get(key)
+        if previous is not None and self._nodes[previous].status == COMPLETED:
+            self._adjust_dependents(self._nodes[previous], +1)
+        self._by_number[key] = queue_id
+        if status == COMPLETED:
+            self._adjust_dependents(node, -1)
+
+        for dependency in depends_on:
+            self._dependents.setdefault((feature_id, dependency), set()).add(queue_id)
+        self._update_ready(node)
+
+    def _is_completed(self, feature_id: int | None, phase_number: int) -> bool:
+        queue_id = self._by_number.get((feature_id, phase_number))
+        return queue_id is not None and self._nodes[queue_id].status == COMPLETED
+
+    def _adjust_dependents(self, node: PhaseNode, delta: int) -> list[str]:
+        """Add delta to the unmet count of the node's dependents; return those now ready."""
+        newly_ready = []
+        for queue_id in self._dependents.get((node.feature_id, node.phase_number), ()):
+            dependent = self._nodes[queue_id]
+            dependent.unmet += delta
+            self._update_ready(dependent)
+            if delta < 0 and dependent.unmet == 0 and dependent.status == QUEUED:
+                newly_ready.append(queue_id)
+        return newly_ready
+
+    def _update_ready(self, node: PhaseNode) -> None:
+        ready = self._ready.setdefault(node.feature_id, set())
+        if node.status == QUEUED and node.unmet == 0:
+            ready.add(node.queue_id)
+        else:
+            ready.discard(node.queue_id)
+
+    # ------------------------------------------------------------------
+    # Consistency
+    # ------------------------------------------------------------------
+
+    def resync_feature(self, feature_id: int | None) -> bool:
+        """
+        Reload one feature's phases from the database.
+
+        Dependencies never cross features, so this makes the feature's
+        readiness exact again after writes the graph did not see (ADW
+        scripts, another server process).
+
+        Returns:
+            True if the graph differed from the database
+        """
+        rows = list(self._feature_loader(feature_id))
+        with self._lock:
+            if not self._loaded:
+                self._rebuild(self._loader())
+                return True
+
+            fresh = {
+                row["queue_id"]: (row["phase_number"], row["status"], parse_depends_on(row["depends_on_phases"]))
+                for row in rows
+            }
+            current = {
+                queue_id: (node.phase_number, node.status, node.depends_on)
+                for queue_id, node in self._nodes.items()
+                if node.feature_id == feature_id
+            }
+            if fresh == current:
+                return False
+
+            for queue_id in current:
+                self.remove_phase(queue_id)
+            for queue_id, (phase_number, status, depends_on) in fresh.items():
+                self._add(queue_id, feature_id, phase_number, status, depends_on)
+            logger.info(f"[DEP_GRAPH] Resynced feature {feature_id} from database")
+            return True
+
+    def check_consistency(self, rebuild: bool = True) -> list[str]:
+        """
+        Compare the graph with a fresh load from the database.
+
+        Args:
+            rebuild: Replace the graph with the fresh load if they differ
+
+        Returns:
+            Descriptions of the differences found (empty if consistent)
+        """
+        fresh = PhaseDependencyGraph(self._loader)
+        fresh.ensure_loaded()
+
+        with self._lock:
+            self.ensure_loaded()
+            problems = []
+            for queue_id in sorted(self._nodes.keys() | fresh._nodes.keys()):
+                ours, theirs = self._nodes.get(queue_id), fresh._nodes.get(queue_id)
+                if ours is None:
+                    problems.append(f"{queue_id}: missing from graph")
+                elif theirs is None:
+                    problems.append(f"{queue_id}: no longer in database")
+                elif (ours.status, ours.unmet, ours.depends_on) != (theirs.status, theirs.unmet, theirs.depends_on):
+                    problems.append(
+                        f"{queue_id}: graph has status={ours.status} unmet={ours.unmet}, "
+                        f"database has status={theirs.status} unmet={theirs.unmet}"
+                    )
+            for feature_id in self._ready.keys() | fresh._ready.keys():
+                if self._ready.get(feature_id, set()) != fresh._ready.get(feature_id, set()):
+                    problems.append(f"feature {feature_id}: ready set differs")
+
+            if problems:
+                logger.warning(f"[DEP_GRAPH] {len(problems)} inconsistencies found: {problems[:5]}")
+                if rebuild:
+                    self._loaded = True
+                    self._nodes = fresh._nodes
+                    self._by_number = fresh._by_number
+                    self._dependents = fresh._dependents
+                    self._ready = fresh._ready
+            return problems
+
+
+# One graph per database adapter, shared by all repositories using it
+_graphs: "weakref.WeakKeyDictionary[Any, PhaseDependencyGraph]" = weakref.WeakKeyDictionary()
+_graphs_lock = threading.Lock()
+
+
+def get_dependency_graph(adapter) -> PhaseDependencyGraph:
+    """Get or create the dependency graph for a database adapter."""
+    with _graphs_lock:
+        graph = _graphs.get(adapter)
+        if graph is None:
+            # Weak reference so the graph does not keep a discarded adapter alive
+            adapter_ref = weakref.ref(adapter)
+            graph = PhaseDependencyGraph(
+                lambda: _load_rows(adapter_ref()),
+                lambda feature_id: _load_rows(adapter_ref(), feature_id, one_feature=True),
+            )
+            _graphs[adapter] = graph
+        return graph
+
+
+def _load_rows(adapter, feature_id: int | None = None, one_feature: bool = False) -> list[Any]:
+    query = "SELECT queue_id, feature_id, phase_number, status, depends_on_phases FROM phase_queue"
+    with adapter.get_connection() as conn:
+        cursor = conn.cursor()
+        if not one_feature:
+            cursor.execute(query)
+        elif feature_id is None:
+            cursor.execute(f"{query} WHERE feature_id IS NULL")
+        else:
+            cursor.execute(f"{query} WHERE feature_id = {adapter.placeholder()}", (feature_id,))
+        return cursor.fetchall()
@@ -7,15 +7,27 @@ Separates database access from business logic (Repository Pattern).
 
 import json
 import logging
+import os
+import socket
 import traceback
 from datetime import datetime
 
 from database import get_database_adapter
+from database.change_bus import notify_change
 from database.sqlite_adapter import SQLiteAdapter
 from models.phase_queue_item import PhaseQueueItem
+from repositories.phase_dependency_graph import PhaseDependencyGraph, get_dependency_graph
 
 logger = logging.getLogger(__name__)
 
+# How long a dispatcher owns a claimed phase without sending a heartbeat
+DEFAULT_CLAIM_LEASE_SECONDS = 300
+
+
+def default_worker_id() -> str:
+    """Identify this dispatcher process in phase claims (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
 
 class PhaseQueueRepository:
     """Repository for phase queue database operations"""
@@ -33,6 +45,11 @@ class PhaseQueueRepository:
         else:
             self.adapter = get_database_adapter()
 
+    @property
+    def dependency_graph(self) -> PhaseDependencyGraph:
+        """In-memory dependency graph shared by repositories on the same adapter."""
+        return get_dependency_graph(self.adapter)
+
     def create(self, item: PhaseQueueItem) -> PhaseQueueItem:
         """
         Create a new phase queue item.
@@ -91,7 +108,11 @@ class PhaseQueueRepository:
                         item.adw_id,
                     ),
                 )
-                return item
+            notify_change("phase_queue", item.queue_id)
+            self.dependency_graph.add_phase(
+                item.queue_id, item.feature_id, item.phase_number, item.status, item.depends_on_phases
+            )
+            return item
         except Exception as e:
             logger.error(f"[ERROR] Failed to create phase: {str(e)}")
             logger.error(f"[ERROR] Exception type: {type(e).__name__}")
@@ -125,6 +146,34 @@ class PhaseQueueRepository:
             logger.error(f"[ERROR] Failed to get phase by ID: {str(e)}")
             raise
 
+    def get_by_ids(self, queue_ids: list[str]) -> list[PhaseQueueItem]:
+        """
+        Get several phase queue items in one query.
+
+        Args:
+            queue_ids: Primary keys to fetch
+
+        Returns:
+            PhaseQueueItems that exist (missing IDs are omitted)
+        """
+        if not queue_ids:
+            return []
+        try:
+            with self.adapter.get_connection() as conn:
+                ph = self.adapter.placeholder()
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT * FROM phase_queue WHERE queue_id IN ({', '.join(ph for _ in queue_ids)})",
+                    tuple(queue_ids)
+                )
+                rows = cursor.fetchall()
+
+            return [PhaseQueueItem.from_db_row(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to get phases by ID: {str(e)}")
+            raise
+
     def find_by_adw_id(self, adw_id: str) -> PhaseQueueItem | None:
         """
         Find phase queue item by ADW ID.
@@ -231,7 +280,7 @@ class PhaseQueueRepository:
                     rows = cursor.fetchall()
                     filtered_rows = []
                     for row in rows:
-                        depends_on_phases_raw = row.get("depends_on_phases", "[]")
+                        depends_on_phases_raw = row["depends_on_phases"] or "[]"
                         depends_on_phases = json.loads(depends_on_phases_raw) if isinstance(depends_on_phases_raw, str) else depends_on_phases_raw
                         if phase_number in depends_on_phases:
                             filtered_rows.append(row)
@@ -345,7 +394,11 @@ class PhaseQueueRepository:
                     """,
                     tuple(params),
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+            if updated:
+                notify_change("phase_queue", queue_id)
+                self.dependency_graph.set_status(queue_id, status)
+            return updated
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to update status: {str(e)}")
@@ -379,7 +432,11 @@ class PhaseQueueRepository:
                     """,
                     (current_phase, status, datetime.now().isoformat(), queue_id),
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+            if updated:
+                notify_change("phase_queue", queue_id)
+                self.dependency_graph.set_status(queue_id, status)
+            return updated
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to update phase: {str(e)}")
@@ -408,7 +465,10 @@ class PhaseQueueRepository:
                     """,
                     (issue_number, datetime.now().isoformat(), queue_id),
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+            if updated:
+                notify_change("phase_queue", queue_id)
+            return updated
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to update issue number: {str(e)}")
@@ -437,7 +497,10 @@ class PhaseQueueRepository:
                     """,
                     (error_message, datetime.now().isoformat(), queue_id),
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+            if updated:
+                notify_change("phase_queue", queue_id)
+            return updated
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to update error message: {str(e)}")
@@ -461,7 +524,11 @@ class PhaseQueueRepository:
                     f"DELETE FROM phase_queue WHERE queue_id = {ph}",
                     (queue_id,)
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+            if updated:
+                notify_change("phase_queue", queue_id)
+                self.dependency_graph.remove_phase(queue_id)
+            return updated
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to delete phase: {str(e)}")
@@ -520,11 +587,224 @@ class PhaseQueueRepository:
                     """,
                     (config_key, config_value, datetime.now().isoformat()),
                 )
+            notify_change("queue_config", config_key)
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to set config value: {str(e)}")
             raise
 
+    def claim_ready_phases(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = DEFAULT_CLAIM_LEASE_SECONDS,
+        statuses: tuple[str, ...] = ("ready",),
+        phase_number: int | None = None,
+        queue_ids: list[str] | None = None,
+        without_issue: bool = False,
+    ) -> list[PhaseQueueItem]:
+        """
+        Atomically select and claim phases for launching.
+
+        A phase is claimable when its status is in ``statuses`` and it has no
+        claim or its lease has expired. Selection and claim happen in one
+        UPDATE statement, so concurrent dispatchers never get the same phase:
+        PostgreSQL skips rows another transaction is claiming (FOR UPDATE
+        SKIP LOCKED); SQLite takes the write lock up front (BEGIN IMMEDIATE).
+
+        Args:
+            worker_id: Dispatcher claiming the phases (see default_worker_id)
+            limit: Maximum number of phases to claim
+            lease_seconds: Claim lifetime unless renewed by heartbeat_claim()
+            statuses: Statuses that may be claimed
+            phase_number: Only claim phases with this phase number
+            queue_ids: Only claim these phases
+            without_issue: Only claim phases that have no GitHub issue yet
+
+        Returns:
+            Claimed PhaseQueueItems in priority order (empty if none available)
+        """
+        if limit <= 0 or queue_ids == []:
+            return []
+        try:
+            with self.adapter.get_connection() as conn:
+                ph = self.adapter.placeholder()
+                now_fn = self.adapter.now_function()
+                lease_expr, lease_param = self._lease_expression(lease_seconds)
+
+                if self.adapter.get_db_type() == "postgresql":
+                    lock_clause = "FOR UPDATE SKIP LOCKED"
+                else:
+                    lock_clause = ""
+                    if not conn.in_transaction:
+                        conn.execute("BEGIN IMMEDIATE")
+
+                conditions, params = self._claimable_conditions(
+                    statuses, phase_number, queue_ids, without_issue
+                )
+
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    UPDATE phase_queue
+                    SET claimed_by = {ph},
+                        claimed_at = {now_fn},
+                        heartbeat_at = {now_fn},
+                        lease_expires_at = {lease_expr},
+                        updated_at = {ph}
+                    WHERE queue_id IN (
+                        SELECT queue_id FROM phase_queue
+                        WHERE {' AND '.join(conditions)}
+                        ORDER BY priority ASC, queue_position ASC, queue_id ASC
+                        LIMIT {ph}
+                        {lock_clause}
+                    )
+                    RETURNING *
+                    """,
+                    (worker_id, lease_param, datetime.now().isoformat(), *params, limit),
+                )
+                claimed = [PhaseQueueItem.from_db_row(row) for row in cursor.fetchall()]
+
+            # RETURNING order is unspecified
+            claimed.sort(key=lambda item: (item.priority, item.queue_position or 0, item.queue_id))
+            if claimed:
+                notify_change("phase_queue", *(item.queue_id for item in claimed))
+                logger.info(
+                    f"[CLAIM] {worker_id} claimed {len(claimed)} phase(s): "
+                    f"{', '.join(item.queue_id for item in claimed)}"
+                )
+            return claimed
+
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to claim phases: {str(e)}")
+            raise
+
+    def find_claimable_phases(
+        self,
+        statuses: tuple[str, ...] = ("ready",),
+        phase_number: int | None = None,
+        queue_ids: list[str] | None = None,
+        without_issue: bool = False,
+    ) -> list[PhaseQueueItem]:
+        """
+        Read (without claiming) the phases claim_ready_phases() could claim now.
+
+        For schedulers that pick phases themselves and then claim their picks
+        by queue_id.
+        """
+        if queue_ids == []:
+            return []
+        try:
+            with self.adapter.get_connection() as conn:
+                conditions, params = self._claimable_conditions(statuses, phase_number, queue_ids, without_issue)
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT * FROM phase_queue
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY priority ASC, queue_position ASC, queue_id ASC
+                    """,
+                    tuple(params),
+                )
+                rows = cursor.fetchall()
+
+            return [PhaseQueueItem.from_db_row(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to find claimable phases: {str(e)}")
+            raise
+
+    def _claimable_conditions(
+        self,
+        statuses: tuple[str, ...],
+        phase_number: int | None,
+        queue_ids: list[str] | None,
+        without_issue: bool = False,
+    ) -> tuple[list[str], list]:
+        """WHERE conditions (and parameters) matching unclaimed or lease-expired phases."""
+        ph = self.adapter.placeholder()
+        conditions = [
+            f"status IN ({', '.join(ph for _ in statuses)})",
+            f"(claimed_by IS NULL OR lease_expires_at IS NULL OR lease_expires_at < {self.adapter.now_function()})",
+        ]
+        params: list = list(statuses)
+        if phase_number is not None:
+            conditions.append(f"phase_number = {ph}")
+            params.append(phase_number)
+        if queue_ids is not None:
+            conditions.append(f"queue_id IN ({', '.join(ph for _ in queue_ids)})")
+            params.extend(queue_ids)
+        if without_issue:
+            conditions.append("issue_number IS NULL")
+        return conditions, params
+
+    def _lease_expression(self, lease_seconds: float) -> tuple[str, float | str]:
+        """SQL expression (and its parameter) for "now + lease_seconds" in the database clock."""
+        ph = self.adapter.placeholder()
+        if self.adapter.get_db_type() == "postgresql":
+            return f"NOW() + {ph} * INTERVAL '1 second'", lease_seconds
+        # SQLite date modifier, e.g. '+300 seconds'
+        return f"datetime('now', {ph})", f"{lease_seconds:+} seconds"
+
+    def heartbeat_claim(
+        self, queue_id: str, worker_id: str, lease_seconds: float = DEFAULT_CLAIM_LEASE_SECONDS
+    ) -> bool:
+        """
+        Renew the lease on a phase claimed by this worker.
+
+        Returns:
+            True if renewed, False if the worker no longer holds the claim
+        """
+        try:
+            with self.adapter.get_connection() as conn:
+                ph = self.adapter.placeholder()
+                now_fn = self.adapter.now_function()
+                lease_expr, lease_param = self._lease_expression(lease_seconds)
+
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    UPDATE phase_queue
+                    SET heartbeat_at = {now_fn}, lease_expires_at = {lease_expr}
+                    WHERE queue_id = {ph} AND claimed_by = {ph}
+                    """,
+                    (lease_param, queue_id, worker_id),
+                )
+                return cursor.rowcount > 0
+
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to renew phase claim: {str(e)}")
+            raise
+
+    def release_claim(self, queue_id: str, worker_id: str) -> bool:
+        """
+        Give up a claim so another dispatcher can pick the phase up at once.
+
+        Returns:
+            True if released, False if the worker did not hold the claim
+        """
+        try:
+            with self.adapter.get_connection() as conn:
+                ph = self.adapter.placeholder()
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    UPDATE phase_queue
+                    SET claimed_by = NULL, claimed_at = NULL,
+                        heartbeat_at = NULL, lease_expires_at = NULL
+                    WHERE queue_id = {ph} AND claimed_by = {ph}
+                    """,
+                    (queue_id, worker_id),
+                )
+                released = cursor.rowcount > 0
+            if released:
+                notify_change("phase_queue", queue_id)
+            return released
+
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to release phase claim: {str(e)}")
+            raise
+
     def try_acquire_workflow_lock(self, feature_id: int, adw_id: str) -> bool:
         """
         Try to acquire exclusive workflow lock for a feature.
@@ -8,6 +8,7 @@ import json
 import logging
 
 from core.models.observability import (
+    AdwPhaseSummary,
     IssueProgress,
     TaskLog,
     TaskLogCreate,
@@ -322,6 +323,55 @@ class TaskLogRepository:
             logger.error(f"Failed to get task logs for ADW {adw_id}: {e}")
             raise
 
+    def get_phase_summaries(self, adw_ids: list[str]) -> dict[str, AdwPhaseSummary]:
+        """
+        Get phase progress and cost for many ADW workflows in one grouped query.
+
+        Args:
+            adw_ids: ADW workflow IDs
+
+        Returns:
+            Dict of adw_id -> AdwPhaseSummary (ADWs without task logs are omitted)
+        """
+        if not adw_ids:
+            return {}
+
+        query = """
+            SELECT adw_id,
+                   ARRAY_AGG(LOWER(phase_name) ORDER BY phase_number, created_at)
+                       FILTER (WHERE phase_status = 'completed') AS completed_phases,
+                   (ARRAY_AGG(LOWER(phase_name) ORDER BY phase_number, created_at)
+                       FILTER (WHERE phase_status = 'started'))[1] AS current_phase,
+                   COALESCE(SUM(cost_usd) FILTER (WHERE phase_status IN ('completed', 'failed')), 0)
+                       AS total_cost
+            FROM task_logs
+            WHERE adw_id = ANY(%s)
+            GROUP BY adw_id
+        """
+
+        try:
+            with self.adapter.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (list(adw_ids),))
+                rows = cursor.fetchall()
+
+                summaries = {
+                    row['adw_id']: AdwPhaseSummary(
+                        adw_id=row['adw_id'],
+                        # Keep first occurrence of phases completed more than once
+                        completed_phases=list(dict.fromkeys(row['completed_phases'] or [])),
+                        current_phase=row['current_phase'],
+                        total_cost=float(row['total_cost'] or 0),
+                    )
+                    for row in rows
+                }
+
+                logger.debug(f"Retrieved phase summaries for {len(summaries)}/{len(adw_ids)} ADWs")
+                return summaries
+        except Exception as e:
+            logger.error(f"Failed to get phase summaries for {len(adw_ids)} ADWs: {e}")
+            raise
+
     def get_issue_progress(self, issue_number: int) -> IssueProgress | None:
         """
         Get progress summary for an issue.
@@ -16,6 +16,7 @@ from core.models.observability import (
     UserPromptFilters,
     UserPromptWithProgress,
 )
+from database import AsyncRepository
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 from repositories.task_log_repository import TaskLogRepository
@@ -54,8 +55,9 @@ def init_observability_routes(
         task_log_repository: TaskLogRepository instance (creates new if None)
         user_prompt_repository: UserPromptRepository instance (creates new if None)
     """
-    task_repo = task_log_repository or TaskLogRepository()
-    prompt_repo = user_prompt_repository or UserPromptRepository()
+    # Repository calls run on the database executor, off the event loop
+    task_repo = AsyncRepository(task_log_repository or TaskLogRepository())
+    prompt_repo = AsyncRepository(user_prompt_repository or UserPromptRepository())
 
     # =========================================================================
     # User Prompt Routes
@@ -69,7 +71,7 @@ def init_observability_routes(
         This endpoint is called automatically when a user submits a request.
         """
         try:
-            return prompt_repo.create(prompt)
+            return await prompt_repo.create(prompt)
         except Exception as e:
             logger.error(f"Error creating user prompt log: {e}")
             raise HTTPException(status_code=500, detail="Failed to create user prompt log")
@@ -106,7 +108,7 @@ def init_observability_routes(
                 limit=limit,
                 offset=offset,
             )
-            return prompt_repo.get_all(filters)
+            return await prompt_repo.get_all(filters)
         except Exception as e:
             logger.error(f"Error retrieving user prompts: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve user prompts")
@@ -137,7 +139,7 @@ def init_observability_routes(
                 limit=limit,
                 offset=offset,
             )
-            return prompt_repo.get_with_progress(filters)
+            return await prompt_repo.get_with_progress(filters)
         except Exception as e:
             logger.error(f"Error retrieving user prompts with progress: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve user prompts with progress")
@@ -157,7 +159,7 @@ def init_observability_routes(
             404: If request not found
         """
         try:
-            prompt = prompt_repo.get_by_request_id(request_id)
+            prompt = await prompt_repo.get_by_request_id(request_id)
             if not prompt:
                 raise HTTPException(status_code=404, detail=f"User prompt {request_id} not found")
             return prompt
@@ -222,7 +224,7 @@ def init_observability_routes(
                     log_message=request.message,
                     duration_seconds=request.duration_seconds,
                 )
-                task_repo.create(task_log_entry)
+                await task_repo.create(task_log_entry)
 
             return {
                 "status": "logged",
@@ -249,7 +251,7 @@ def init_observability_routes(
         This endpoint is called automatically by ADW workflows when phases complete.
         """
         try:
-            return task_repo.create(task_log)
+            return await task_repo.create(task_log)
         except Exception as e:
             logger.error(f"Error creating task log: {e}")
             raise HTTPException(status_code=500, detail="Failed to create task log")
@@ -286,7 +288,7 @@ def init_observability_routes(
                 limit=limit,
                 offset=offset,
             )
-            return task_repo.get_all(filters)
+            return await task_repo.get_all(filters)
         except Exception as e:
             logger.error(f"Error retrieving task logs: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve task logs")
@@ -303,7 +305,7 @@ def init_observability_routes(
             List of task logs ordered by phase_number
         """
         try:
-            return task_repo.get_by_issue(issue_number)
+            return await task_repo.get_by_issue(issue_number)
         except Exception as e:
             logger.error(f"Error retrieving task logs for issue #{issue_number}: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve task logs for issue")
@@ -320,7 +322,7 @@ def init_observability_routes(
             List of task logs ordered by phase_number
         """
         try:
-            return task_repo.get_by_adw_id(adw_id)
+            return await task_repo.get_by_adw_id(adw_id)
         except Exception as e:
             logger.error(f"Error retrieving task logs for ADW {adw_id}: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve task logs for ADW")
@@ -340,7 +342,7 @@ def init_observability_routes(
             404: If no logs found for issue
         """
         try:
-            log = task_repo.get_latest_by_issue(issue_number)
+            log = await task_repo.get_latest_by_issue(issue_number)
             if not log:
                 raise HTTPException(status_code=404, detail=f"No task logs found for issue #{issue_number}")
             return log
@@ -369,7 +371,7 @@ def init_observability_routes(
             404: If no progress data found for issue
         """
         try:
-            progress = task_repo.get_issue_progress(issue_number)
+            progress = await task_repo.get_issue_progress(issue_number)
             if not progress:
                 raise HTTPException(status_code=404, detail=f"No progress data found for issue #{issue_number}")
             return progress
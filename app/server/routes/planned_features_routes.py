@@ -26,7 +26,6 @@ from fastapi import APIRouter, HTTPException, Query
 from models.phase_queue_item import PhaseQueueItem
 from repositories.phase_queue_repository import PhaseQueueRepository
 from services.planned_features_service import PlannedFeaturesService
-from services.websocket_manager import get_connection_manager
 
 # Add scripts directory to path for PhaseAnalyzer
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "scripts"))
@@ -119,29 +118,6 @@ def _create_github_issue_from_feature(feature: PlannedFeature) -> int:
     return issue_number
 
 
-async def _broadcast_planned_features_update():
-    """Broadcast planned features update to all WebSocket clients"""
-    try:
-        manager = get_connection_manager()
-        service = PlannedFeaturesService()
-
-        # Get all features and stats
-        features = service.get_all(limit=200)
-        stats = service.get_statistics()
-
-        # Broadcast update
-        await manager.broadcast({
-            "type": "planned_features_update",
-            "data": {
-                "features": [f.model_dump() for f in features],
-                "stats": stats
-            }
-        })
-        logger.debug("[WS] Broadcast planned features update")
-    except Exception as e:
-        logger.error(f"[WS] Error broadcasting planned features update: {e}")
-
-
 @router.get("/", response_model=list[PlannedFeature])
 async def get_planned_features(
     status: str | None = Query(
@@ -304,9 +280,6 @@ async def create_planned_feature(feature_data: PlannedFeatureCreate):
             f"[POST /api/planned-features] Created feature {feature.id}: {feature.title}"
         )
 
-        # Broadcast update to WebSocket clients
-        await _broadcast_planned_features_update()
-
         return feature
     except ValueError as e:
         logger.error(f"[POST /api/planned-features] Validation error: {e}")
@@ -362,9 +335,6 @@ async def update_planned_feature(feature_id: int, update_data: PlannedFeatureUpd
             f"[PATCH /api/planned-features/{feature_id}] Updated feature"
         )
 
-        # Broadcast update to WebSocket clients
-        await _broadcast_planned_features_update()
-
         return feature
     except HTTPException:
         raise
@@ -408,9 +378,6 @@ async def delete_planned_feature(feature_id: int):
             f"[DELETE /api/planned-features/{feature_id}] Soft deleted feature"
         )
 
-        # Broadcast update to WebSocket clients
-        await _broadcast_planned_features_update()
-
         return None
     except HTTPException:
         raise
@@ -564,9 +531,6 @@ async def start_automation(feature_id: int):
         # Update feature status to 'in_progress'
         service.update(feature_id, PlannedFeatureUpdate(status='in_progress'))
 
-        # Broadcast update to WebSocket clients
-        await _broadcast_planned_features_update()
-
         # Return summary
         summary = {
             "feature_id": feature_id,
@@ -10,8 +10,10 @@ import time
 from core.models import PlannedFeatureUpdate
 from core.models.observability import TaskLogCreate
 from core.nl_processor import suggest_adw_workflow
+from database import AsyncRepository
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field, field_validator
+from repositories.phase_queue_repository import default_worker_id
 from repositories.task_log_repository import TaskLogRepository
 from repositories.webhook_event_repository import WebhookEventRepository
 from services.planned_features_service import PlannedFeaturesService
@@ -229,20 +231,20 @@ class SetQueuePausedRequest(BaseModel):
 
 async def _get_queue_config_handler(phase_queue_service) -> QueueConfigResponse:
     """Handler for getting queue configuration."""
-    paused = phase_queue_service.is_paused()
+    paused = await AsyncRepository(phase_queue_service).is_paused()
     return QueueConfigResponse(paused=paused)
 
 
 async def _set_queue_paused_handler(request: SetQueuePausedRequest, phase_queue_service) -> QueueConfigResponse:
     """Handler for setting queue pause state."""
-    phase_queue_service.set_paused(request.paused)
+    await AsyncRepository(phase_queue_service).set_paused(request.paused)
     logger.info(f"[CONFIG] Queue {'paused' if request.paused else 'resumed'}")
     return QueueConfigResponse(paused=request.paused)
 
 
 async def _get_all_queued_handler(phase_queue_service) -> QueueListResponse:
     """Handler for getting all queued phases."""
-    items = phase_queue_service.get_all_queued()
+    items = await AsyncRepository(phase_queue_service).get_all_queued()
     phases = [
         PhaseQueueItemResponse(**item.to_dict())
         for item in items
@@ -252,7 +254,7 @@ async def _get_all_queued_handler(phase_queue_service) -> QueueListResponse:
 
 async def _get_queue_by_parent_handler(parent_issue: int, phase_queue_service) -> QueueListResponse:
     """Handler for getting phases by parent issue."""
-    items = phase_queue_service.get_queue_by_parent(parent_issue)
+    items = await AsyncRepository(phase_queue_service).get_queue_by_parent(parent_issue)
     phases = [
         PhaseQueueItemResponse(**item.to_dict())
         for item in items
@@ -262,7 +264,7 @@ async def _get_queue_by_parent_handler(parent_issue: int, phase_queue_service) -
 
 async def _enqueue_phase_handler(request: EnqueueRequest, phase_queue_service) -> EnqueueResponse:
     """Handler for enqueueing a new phase."""
-    queue_id = phase_queue_service.enqueue(
+    queue_id = await AsyncRepository(phase_queue_service).enqueue(
         parent_issue=request.parent_issue,
         phase_number=request.phase_number,
         phase_data=request.phase_data,
@@ -276,7 +278,7 @@ async def _enqueue_phase_handler(request: EnqueueRequest, phase_queue_service) -
 
 async def _dequeue_phase_handler(queue_id: str, phase_queue_service) -> DequeueResponse:
     """Handler for dequeueing a phase."""
-    success = phase_queue_service.dequeue(queue_id)
+    success = await AsyncRepository(phase_queue_service).dequeue(queue_id)
     if success:
         return DequeueResponse(
             success=True,
@@ -577,11 +579,30 @@ def _update_phase_status(
         response.phase_updated = True
         response.message = f"Phase marked as {new_status}"
         logger.info(f"[WEBHOOK] Updated phase {request.queue_id} to {new_status}")
+        if new_status == "completed":
+            _record_phase_completion(phase_queue_service, request)
     else:
         logger.warning(f"[WEBHOOK] Queue ID {request.queue_id} not found")
         response.message = "Queue ID not found, but notification received"
 
 
+def _record_phase_completion(phase_queue_service, request: WorkflowCompleteRequest) -> None:
+    """Feed the completed phase's run time and cost into the hopper scheduler's estimates."""
+    from services.hopper_sorter import record_phase_completion
+
+    try:
+        phase = phase_queue_service.repository.get_by_id(request.queue_id)
+        if phase:
+            record_phase_completion(
+                phase,
+                duration_seconds=request.metadata.get("duration_seconds"),
+                cost_usd=request.metadata.get("cost"),
+            )
+    except Exception as e:
+        # Estimates are best effort; never fail the webhook over them
+        logger.warning(f"[WEBHOOK] Could not record phase completion for scheduling: {e}")
+
+
 def _sync_planned_feature_status(request: WorkflowCompleteRequest) -> None:
     """
     Auto-sync planned_features table based on workflow completion.
@@ -651,32 +672,58 @@ def _sync_planned_feature_status(request: WorkflowCompleteRequest) -> None:
         )
 
 
-def _find_next_phase(phase_queue_service, request: WorkflowCompleteRequest):
-    """Find the next phase to execute."""
-    # Find next phase directly (optimized - no N+1 query)
-    next_phase = phase_queue_service.repository.find_by_depends_on_phase(
+def _find_next_phase(phase_queue_service, request: WorkflowCompleteRequest, worker_id: str):
+    """
+    Find and claim the next phase to execute.
+
+    The phase is claimed atomically through the hopper scheduler (same as
+    PhaseCoordinator._launch_phases), so the coordinator cannot launch it as
+    well. The caller must release the claim once the launch attempt is over.
+    """
+    from services.hopper_sorter import HopperSorter, claim_phases, get_phase_scheduler
+
+    repository = phase_queue_service.repository
+
+    # Find next phases directly (optimized - no N+1 query)
+    dependents = repository.find_phases_depending_on(
         request.parent_issue,
         request.phase_number
     )
 
-    # If no next phase in current parent, check hopper
-    if not next_phase:
-        logger.info(
-            f"[WEBHOOK] No next phase in parent #{request.parent_issue}. "
-            "Checking hopper for other ready Phase 1s..."
+    if dependents:
+        claimed = claim_phases(
+            repository,
+            worker_id,
+            scheduler=get_phase_scheduler(),
+            queue_ids=[phase.queue_id for phase in dependents],
+            statuses=("queued", "ready"),
         )
-
-        from services.hopper_sorter import HopperSorter
-        sorter = HopperSorter()
-        next_phase = sorter.get_next_phase_1()
-
-        if next_phase:
+        if not claimed:
             logger.info(
-                f"[WEBHOOK] Hopper selected next parent: #{next_phase.parent_issue} "
-                f"(priority={next_phase.priority}, position={next_phase.queue_position})"
+                f"[WEBHOOK] Next phase in parent #{request.parent_issue} already claimed, "
+                "held by the scheduler or no longer launchable, skipping"
             )
-        else:
-            logger.info("[WEBHOOK] Hopper empty - no more Phase 1s to start")
+            return None
+        return claimed[0]
+
+    # No next phase in current parent, check hopper
+    logger.info(
+        f"[WEBHOOK] No next phase in parent #{request.parent_issue}. "
+        "Checking hopper for other ready Phase 1s..."
+    )
+
+    sorter = HopperSorter(scheduler=get_phase_scheduler())
+    # Claimed atomically so the coordinator cannot launch it as well
+    claimed = sorter.claim_next_phases(max_parallel=1, worker_id=worker_id)
+    next_phase = claimed[0] if claimed else None
+
+    if next_phase:
+        logger.info(
+            f"[WEBHOOK] Hopper claimed next feature: #{next_phase.feature_id} "
+            f"(priority={next_phase.priority}, position={next_phase.queue_position})"
+        )
+    else:
+        logger.info("[WEBHOOK] Hopper empty - no more Phase 1s to start")
 
     return next_phase
 
@@ -737,6 +784,36 @@ def _create_phase_issue(github_poster, next_phase, phase_queue_service) -> int:
     return issue_number
 
 
+def _start_claimed_phase(
+    phase_queue_service, github_poster, next_phase, response: WorkflowCompleteResponse
+) -> tuple[str, bool]:
+    """Create the issue if needed and launch a claimed phase. Returns (adw_id, success)."""
+    logger.info(
+        f"[WEBHOOK] Found next phase: {next_phase.phase_number} "
+        f"(queue_id: {next_phase.queue_id})"
+    )
+
+    # Create GitHub issue if needed
+    if not next_phase.issue_number:
+        issue_number = _create_phase_issue(github_poster, next_phase, phase_queue_service)
+        phase_queue_service.update_issue_number(next_phase.queue_id, issue_number)
+        next_phase.issue_number = issue_number
+        response.next_issue_created = issue_number
+
+    # Mark next phase as ready
+    phase_queue_service.update_status(next_phase.queue_id, "ready")
+    logger.info(f"[WEBHOOK] Marked phase {next_phase.phase_number} as ready")
+
+    # Launch workflow
+    adw_id, success = _launch_workflow(next_phase)
+
+    if success:
+        # Mark phase as running
+        phase_queue_service.update_status(next_phase.queue_id, "running", adw_id=adw_id)
+
+    return adw_id, success
+
+
 def _launch_workflow(next_phase) -> tuple[str, bool]:
     """Launch workflow for next phase. Returns (adw_id, success)."""
     import uuid
@@ -934,41 +1011,29 @@ def init_webhook_routes(phase_queue_service, github_poster, websocket_manager=No
                 await _broadcast_workflow_completed(request)
                 return response
 
-            # Find next phase
-            next_phase = _find_next_phase(phase_queue_service, request)
+            # Find and claim next phase
+            worker_id = default_worker_id()
+            next_phase = _find_next_phase(phase_queue_service, request, worker_id)
 
             if not next_phase:
                 response.message += ". No more phases in queue"
                 await _broadcast_workflow_completed(request)
                 return response
 
-            logger.info(
-                f"[WEBHOOK] Found next phase: {next_phase.phase_number} "
-                f"(queue_id: {next_phase.queue_id})"
-            )
-
-            # Create GitHub issue if needed
-            if not next_phase.issue_number:
-                issue_number = _create_phase_issue(github_poster, next_phase, phase_queue_service)
-                phase_queue_service.update_issue_number(next_phase.queue_id, issue_number)
-                next_phase.issue_number = issue_number
-                response.next_issue_created = issue_number
-
-            # Mark next phase as ready
-            phase_queue_service.update_status(next_phase.queue_id, "ready")
-            logger.info(f"[WEBHOOK] Marked phase {next_phase.phase_number} as ready")
-
-            # Launch workflow
-            adw_id, success = _launch_workflow(next_phase)
+            try:
+                adw_id, success = _start_claimed_phase(
+                    phase_queue_service, github_poster, next_phase, response
+                )
+            finally:
+                # The claim only covers the launch: a started phase is 'running'
+                # and a failed launch should be retryable straight away
+                phase_queue_service.repository.release_claim(next_phase.queue_id, worker_id)
 
             if not success:
                 response.message += ". Next phase ready but workflow script not found"
                 await _broadcast_workflow_completed(request)
                 return response
 
-            # Mark phase as running
-            phase_queue_service.update_status(next_phase.queue_id, "running", adw_id=adw_id)
-
             response.next_phase_triggered = True
             response.next_phase_number = next_phase.phase_number
             response.message = (
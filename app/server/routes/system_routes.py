@@ -56,14 +56,18 @@ async def _get_system_status_handler(health_service) -> SystemStatusResponse:
     return response
 
 
-async def _get_adw_monitor_handler() -> AdwMonitorResponse:
-    """ADW monitor endpoint handler with caching."""
+async def _get_adw_monitor_handler(
+    status: str | None = None, limit: int | None = None, offset: int = 0
+) -> AdwMonitorResponse:
+    """ADW monitor endpoint handler with caching (unfiltered requests only)."""
     global _adw_monitor_cache, _adw_monitor_cache_time
     from core.adw_monitor import aggregate_adw_monitor_data
 
+    cacheable = status is None and limit is None and offset == 0
+
     # Check if cache is valid
     now = datetime.now()
-    if _adw_monitor_cache and _adw_monitor_cache_time:
+    if cacheable and _adw_monitor_cache and _adw_monitor_cache_time:
         cache_age = (now - _adw_monitor_cache_time).total_seconds()
         if cache_age < ADW_MONITOR_CACHE_TTL:
             logger.debug(f"Returning cached ADW monitor data (age: {cache_age:.1f}s)")
@@ -72,12 +76,13 @@ async def _get_adw_monitor_handler() -> AdwMonitorResponse:
     # Cache miss or expired - fetch fresh data
     logger.debug("Cache miss - fetching fresh ADW monitor data")
     try:
-        monitor_data = aggregate_adw_monitor_data()
+        monitor_data = aggregate_adw_monitor_data(status=status, limit=limit, offset=offset)
         response = AdwMonitorResponse(**monitor_data)
 
         # Update cache
-        _adw_monitor_cache = response
-        _adw_monitor_cache_time = now
+        if cacheable:
+            _adw_monitor_cache = response
+            _adw_monitor_cache_time = now
 
         return response
     except Exception as e:
@@ -163,7 +168,8 @@ async def _health_check_handler(app_start_time: datetime) -> HealthCheckResponse
             status="ok",
             database_connected=True,
             tables_count=len(tables),
-            uptime_seconds=uptime
+            uptime_seconds=uptime,
+            database_pool=adapter.get_pool_stats() or None
         )
         logger.info(f"[SUCCESS] Health check: OK, {len(tables)} tables ({db_type}), uptime: {uptime}s")
         return response
@@ -195,9 +201,15 @@ def init_system_routes(health_service, service_controller, app_start_time):
         return await _get_system_status_handler(health_service)
 
     @router.get("/adw-monitor", response_model=AdwMonitorResponse)
-    async def get_adw_monitor_status() -> AdwMonitorResponse:
-        """Get real-time status of all ADW workflows with caching."""
-        return await _get_adw_monitor_handler()
+    async def get_adw_monitor_status(
+        status: str | None = Query(
+            None, description="Filter by status: running, paused, failed, completed, queued"
+        ),
+        limit: int | None = Query(None, ge=1, le=1000, description="Maximum workflows to return"),
+        offset: int = Query(0, ge=0, description="Number of workflows to skip"),
+    ) -> AdwMonitorResponse:
+        """Get real-time status of ADW workflows with caching, optionally filtered and paginated."""
+        return await _get_adw_monitor_handler(status, limit, offset)
 
     @router.get("/adw-monitor/{adw_id}/health", response_model=AdwHealthCheckResponse)
     async def get_adw_health(adw_id: str) -> AdwHealthCheckResponse:
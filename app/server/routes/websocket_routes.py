@@ -15,10 +15,61 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="", tags=["WebSockets"])
 
 
-async def _handle_websocket_connection(websocket: WebSocket, manager, initial_data: dict, error_context: str):
+async def _await_client_ready(websocket: WebSocket, manager, error_context: str) -> None:
+    """Wait up to 2s for the optional client_ready message and apply its delta opt-in."""
+    try:
+        ready_msg = await asyncio.wait_for(websocket.receive_text(), timeout=2.0)
+        client_msg = json.loads(ready_msg)
+
+        if client_msg.get('type') != 'client_ready':
+            logger.debug(f"[WS] {error_context}: Received {client_msg.get('type')} instead of client_ready, continuing anyway")
+        elif client_msg.get('deltas'):
+            manager.enable_deltas(websocket)
+    except TimeoutError:
+        # Client didn't send ready signal - that's OK, proceed anyway for backwards compatibility
+        logger.debug(f"[WS] {error_context}: No client_ready signal within 2s, proceeding with initial data send")
+    except json.JSONDecodeError:
+        logger.debug(f"[WS] {error_context}: Invalid JSON in client message, proceeding anyway")
+
+
+async def _handle_client_message(websocket: WebSocket, manager, msg: dict, error_context: str) -> None:
+    """Handle a message received after the initial data: ping, client_ready or resync."""
+    msg_type = msg.get('type')
+
+    if msg_type == 'ping':
+        # Respond to ping with pong
+        manager.send(websocket, {
+            'type': 'pong',
+            'timestamp': msg.get('timestamp')
+        })
+        logger.debug(f"[WS] {error_context}: Responded to ping with pong")
+    elif msg_type == 'client_ready':
+        # Client ready signal (can be sent multiple times)
+        logger.debug(f"[WS] {error_context}: Received client_ready signal")
+        if msg.get('deltas'):
+            manager.enable_deltas(websocket)
+    elif msg_type == 'resync' and msg.get('channel'):
+        # Client missed a delta version, send a full snapshot
+        await manager.send_snapshot(websocket, msg['channel'])
+        logger.debug(f"[WS] {error_context}: Resynced channel {msg['channel']}")
+    else:
+        # Unknown message type, log but don't crash
+        logger.debug(f"[WS] {error_context}: Received unknown message type: {msg_type}")
+
+
+async def _handle_websocket_connection(
+    websocket: WebSocket, manager, initial_data: dict, error_context: str, versioned: bool = False
+):
     """
     Handle common websocket connection pattern: connect, send initial data, keep alive, disconnect.
 
+    Versioned channels (state published by background watchers via
+    manager.publish()) send the initial data as a versioned snapshot. Clients
+    may opt in to delta updates with {"type": "client_ready", "deltas": true}
+    and request a fresh snapshot with {"type": "resync", "channel": ...}.
+    All outbound messages go through the manager's per-client queue so they
+    are never sent concurrently with background broadcasts.
+
     CRITICAL FIX: This implementation uses non-blocking asyncio.sleep() instead of blocking
     on receive_text(). The client is a passive listener that never sends messages (except
     for optional ping/pong), so blocking on receive_text() causes connections to timeout.
@@ -28,26 +79,20 @@ async def _handle_websocket_connection(websocket: WebSocket, manager, initial_da
         manager: WebSocket connection manager
         initial_data: Initial data to send to client
         error_context: Context string for error logging
+        versioned: Send initial data through the manager's versioned channel
     """
     await manager.connect(websocket)
 
     try:
         # OPTIONAL: Wait for client_ready signal with timeout
         # This prevents race condition where client isn't ready to receive data
-        try:
-            ready_msg = await asyncio.wait_for(websocket.receive_text(), timeout=2.0)
-            client_msg = json.loads(ready_msg)
-
-            if client_msg.get('type') != 'client_ready':
-                logger.debug(f"[WS] {error_context}: Received {client_msg.get('type')} instead of client_ready, continuing anyway")
-        except TimeoutError:
-            # Client didn't send ready signal - that's OK, proceed anyway for backwards compatibility
-            logger.debug(f"[WS] {error_context}: No client_ready signal within 2s, proceeding with initial data send")
-        except json.JSONDecodeError:
-            logger.debug(f"[WS] {error_context}: Invalid JSON in client message, proceeding anyway")
+        await _await_client_ready(websocket, manager, error_context)
 
         # Send initial data
-        await websocket.send_json(initial_data)
+        if versioned:
+            await manager.send_snapshot(websocket, initial_data["type"], initial_data["data"])
+        else:
+            manager.send(websocket, initial_data)
         logger.debug(f"[WS] {error_context}: Sent initial data to client")
 
         # CRITICAL FIX: Non-blocking keep-alive loop
@@ -69,23 +114,7 @@ async def _handle_websocket_connection(websocket: WebSocket, manager, initial_da
 
                 # Parse and handle the message
                 try:
-                    msg = json.loads(msg_text)
-                    msg_type = msg.get('type')
-
-                    if msg_type == 'ping':
-                        # Respond to ping with pong
-                        await websocket.send_json({
-                            'type': 'pong',
-                            'timestamp': msg.get('timestamp', None)
-                        })
-                        logger.debug(f"[WS] {error_context}: Responded to ping with pong")
-                    elif msg_type == 'client_ready':
-                        # Client ready signal (can be sent multiple times, ignore)
-                        logger.debug(f"[WS] {error_context}: Received client_ready signal")
-                    else:
-                        # Unknown message type, log but don't crash
-                        logger.debug(f"[WS] {error_context}: Received unknown message type: {msg_type}")
-
+                    await _handle_client_message(websocket, manager, json.loads(msg_text), error_context)
                 except json.JSONDecodeError as e:
                     logger.warning(f"[WS] {error_context}: Failed to parse JSON message: {e}")
 
@@ -115,6 +144,14 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
     This function is called from server.py to inject service dependencies.
     """
 
+    @router.get("/ws/stats")
+    async def websocket_stats() -> dict:
+        """Per-client outbound queue depth and delivery counters"""
+        return {
+            "connections": len(manager.active_connections),
+            "clients": manager.queue_stats(),
+        }
+
     @router.websocket("/ws/workflows")
     async def websocket_workflows(websocket: WebSocket) -> None:
         """WebSocket endpoint for real-time workflow updates"""
@@ -123,7 +160,7 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
             "type": "workflows_update",
             "data": [w.model_dump() for w in workflows]
         }
-        await _handle_websocket_connection(websocket, manager, initial_data, "workflows")
+        await _handle_websocket_connection(websocket, manager, initial_data, "workflows", versioned=True)
 
     @router.websocket("/ws/routes")
     async def websocket_routes(websocket: WebSocket) -> None:
@@ -133,7 +170,7 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
             "type": "routes_update",
             "data": [r.model_dump() for r in routes]
         }
-        await _handle_websocket_connection(websocket, manager, initial_data, "routes")
+        await _handle_websocket_connection(websocket, manager, initial_data, "routes", versioned=True)
 
     @router.websocket("/ws/workflow-history")
     async def websocket_workflow_history(websocket: WebSocket) -> None:
@@ -148,7 +185,7 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
                 "analytics": history_data.analytics.model_dump()
             }
         }
-        await _handle_websocket_connection(websocket, manager, initial_data, "workflow history")
+        await _handle_websocket_connection(websocket, manager, initial_data, "workflow history", versioned=True)
 
     @router.websocket("/ws/adw-state/{adw_id}")
     async def websocket_adw_state(websocket: WebSocket, adw_id: str) -> None:
@@ -169,7 +206,7 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
             "type": "adw_monitor_update",
             "data": monitor_data
         }
-        await _handle_websocket_connection(websocket, manager, initial_data, "ADW monitor")
+        await _handle_websocket_connection(websocket, manager, initial_data, "ADW monitor", versioned=True)
 
     @router.websocket("/ws/queue")
     async def websocket_queue(websocket: WebSocket) -> None:
@@ -179,7 +216,7 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
             "type": "queue_update",
             "data": queue_data
         }
-        await _handle_websocket_connection(websocket, manager, initial_data, "queue")
+        await _handle_websocket_connection(websocket, manager, initial_data, "queue", versioned=True)
 
     @router.websocket("/ws/system-status")
     async def websocket_system_status(websocket: WebSocket) -> None:
@@ -209,7 +246,7 @@ def init_websocket_routes(manager, get_workflows_data_func, get_routes_data_func
             "type": "planned_features_update",
             "data": planned_features_data
         }
-        await _handle_websocket_connection(websocket, manager, initial_data, "planned features")
+        await _handle_websocket_connection(websocket, manager, initial_data, "planned features", versioned=True)
 
     @router.websocket("/ws/qc-metrics")
     async def websocket_qc_metrics(websocket: WebSocket) -> None:
@@ -11,6 +11,7 @@ from core.models.work_log import (
     WorkLogEntryCreate,
     WorkLogListResponse,
 )
+from database import AsyncRepository
 from fastapi import APIRouter, HTTPException
 from repositories.work_log_repository import WorkLogRepository
 
@@ -26,7 +27,8 @@ def init_work_log_routes(repository: WorkLogRepository | None = None):
     Args:
         repository: WorkLogRepository instance (creates new if None)
     """
-    repo = repository or WorkLogRepository()
+    # Repository calls run on the database executor, off the event loop
+    repo = AsyncRepository(repository or WorkLogRepository())
 
     @router.post("", response_model=WorkLogEntry, status_code=201)
     async def create_work_log_entry(entry: WorkLogEntryCreate) -> WorkLogEntry:
@@ -36,7 +38,7 @@ def init_work_log_routes(repository: WorkLogRepository | None = None):
         Validates that summary is at most 280 characters.
         """
         try:
-            return repo.create(entry)
+            return await repo.create(entry)
         except ValueError as e:
             logger.warning(f"Validation error creating work log: {e}")
             raise HTTPException(status_code=400, detail=str(e))
@@ -60,8 +62,8 @@ def init_work_log_routes(repository: WorkLogRepository | None = None):
             List of work log entries with pagination info
         """
         try:
-            entries = repo.get_all(limit=limit, offset=offset)
-            total = repo.get_count()
+            entries = await repo.get_all(limit=limit, offset=offset)
+            total = await repo.get_count()
 
             return WorkLogListResponse(
                 entries=entries,
@@ -87,7 +89,7 @@ def init_work_log_routes(repository: WorkLogRepository | None = None):
             List of work log entries for the session
         """
         try:
-            return repo.get_by_session(session_id)
+            return await repo.get_by_session(session_id)
         except Exception as e:
             logger.error(f"Error retrieving work logs for session {session_id}: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve session work logs")
@@ -108,7 +110,7 @@ def init_work_log_routes(repository: WorkLogRepository | None = None):
             500: If database operation fails
         """
         try:
-            deleted = repo.delete(entry_id)
+            deleted = await repo.delete(entry_id)
             if not deleted:
                 raise HTTPException(status_code=404, detail=f"Work log entry {entry_id} not found")
         except HTTPException:
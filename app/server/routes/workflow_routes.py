@@ -303,12 +303,10 @@ async def _update_phase_handler(request: PhaseUpdateRequest, websocket_manager)
             try:
                 # Broadcast to ADW monitor listeners
                 from core.adw_monitor import aggregate_adw_monitor_data
-                monitor_data = aggregate_adw_monitor_data()
+                # Bypass the 5s cache so the broadcast reflects this update
+                monitor_data = aggregate_adw_monitor_data(use_cache=False)
 
-                await websocket_manager.broadcast({
-                    "type": "adw_monitor_update",
-                    "data": monitor_data,
-                })
+                await websocket_manager.publish("adw_monitor_update", monitor_data)
                 broadcasted = True
                 logger.info(f"[PHASE_UPDATE] Broadcasted update to {len(websocket_manager.active_connections)} WebSocket clients")
             except Exception as e:
@@ -186,7 +186,7 @@ background_task_manager = BackgroundTaskManager(
     routes_watch_interval=10.0,
     history_watch_interval=10.0,
     adw_monitor_watch_interval=0.5,  # 500ms for near-instant workflow updates in Panel 1
-    queue_watch_interval=2.0,  # Keep queue at 2s (less critical)
+    queue_watch_interval=2.0,  # Polling fallback; on PostgreSQL changes are pushed via database.change_bus
     qc_metrics_watcher=qc_watcher,  # Add QC metrics watcher
 )
 # Set app reference for routes introspection (done after app is created above)
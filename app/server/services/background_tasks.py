@@ -5,15 +5,18 @@ This service is responsible for:
 - Watching workflows directory for changes
 - Watching routes for changes
 - Watching workflow history for changes
-- Broadcasting updates via WebSocket
+- Watching the phase queue and planned features through change notifications
+  (see database.change_bus) instead of polling
+- Publishing updates to versioned WebSocket channels (see ConnectionManager.publish)
 """
 
 import asyncio
-import json
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from core.data_models import WorkflowHistoryFilters
+from database import AsyncRepository, get_async_database_adapter, get_database_adapter
+from database.change_bus import PostgresChangeListener, get_change_bus
 
 if TYPE_CHECKING:
     from services.websocket_manager import ConnectionManager
@@ -21,6 +24,140 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How often idle watchers check for newly connected clients
+IDLE_CHECK_INTERVAL = 1.0
+
+
+class QueueSnapshot:
+    """
+    In-memory copy of the queue_update payload (see server.get_queue_data).
+
+    Refreshed from change notifications: only the phase_queue rows whose keys
+    were notified are re-read, and queue_config changes re-read the paused
+    flag. Falls back to a full reload when the changed rows are unknown or
+    the display window is full, since rows outside it may then move in.
+    """
+
+    def __init__(self, repository, limit: int = 100):
+        """
+        Args:
+            repository: PhaseQueueRepository to read from
+            limit: Number of rows shown (matches PhaseQueueRepository.get_all)
+        """
+        self.repository = repository
+        self.limit = limit
+        self._items: dict[str, Any] | None = None
+        self._paused = False
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the cache holds a full load to apply changes to."""
+        return self._items is not None
+
+    def invalidate(self) -> None:
+        """Drop the cached rows; the next refresh reloads everything."""
+        self._items = None
+
+    def refresh(self, changes: dict[str, set[str] | None]) -> dict:
+        """
+        Apply change notifications and return the current payload.
+
+        Args:
+            changes: Result of ChangeBus.wait(); empty means reload everything
+
+        Returns:
+            dict: Queue data with phases list, total count, and paused state
+        """
+        full = not changes or self._items is None
+        keys = changes.get("phase_queue", set())
+        if full or keys is None or (keys and len(self._items) >= self.limit):
+            self._items = {item.queue_id: item for item in self.repository.get_all(limit=self.limit)}
+        elif keys:
+            fetched = {item.queue_id: item for item in self.repository.get_by_ids(sorted(keys))}
+            for key in keys:
+                if key in fetched:
+                    self._items[key] = fetched[key]
+                else:
+                    self._items.pop(key, None)
+            if len(self._items) > self.limit:
+                self._items = {item.queue_id: item for item in self.repository.get_all(limit=self.limit)}
+
+        if full or "queue_config" in changes:
+            self._paused = self.repository.get_config_value("queue_paused") == "true"
+
+        # Same order as get_all (ORDER BY feature_id, phase_number; NULLs first)
+        items = sorted(
+            self._items.values(),
+            key=lambda item: (item.feature_id is not None, item.feature_id or 0, item.phase_number),
+        )
+        phases = [item.to_dict() for item in items]
+        return {"phases": phases, "total": len(phases), "paused": self._paused}
+
+
+class PlannedFeaturesSnapshot:
+    """
+    In-memory copy of the planned_features_update payload.
+
+    Re-reads only the notified features and re-sorts the cached window in
+    Python (PlannedFeaturesService.sort_features); statistics are recomputed
+    only when something changed.
+    """
+
+    def __init__(self, service, limit: int = 200):
+        """
+        Args:
+            service: PlannedFeaturesService to read from
+            limit: Number of features shown
+        """
+        self.service = service
+        self.limit = limit
+        self._features: dict[int, Any] | None = None
+        self._stats: dict[str, Any] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the cache holds a full load to apply changes to."""
+        return self._features is not None
+
+    def invalidate(self) -> None:
+        """Drop the cached features; the next refresh reloads everything."""
+        self._features = None
+
+    def _reload(self) -> None:
+        self._features = {f.id: f for f in self.service.get_all(limit=self.limit)}
+
+    def refresh(self, changes: dict[str, set[str] | None]) -> dict:
+        """
+        Apply change notifications and return the current payload.
+
+        Args:
+            changes: Result of ChangeBus.wait(); empty means reload everything
+
+        Returns:
+            dict: {"features": [...], "stats": {...}}
+        """
+        keys = changes.get("planned_features", set())
+        if not changes or self._features is None or keys is None or (
+            keys and len(self._features) >= self.limit
+        ):
+            self._reload()
+        elif keys:
+            fetched = {f.id: f for f in self.service.get_by_ids(sorted(int(key) for key in keys))}
+            for key in keys:
+                feature_id = int(key)
+                if feature_id in fetched:
+                    self._features[feature_id] = fetched[feature_id]
+                else:
+                    self._features.pop(feature_id, None)
+            if len(self._features) > self.limit:
+                self._reload()
+
+        if not changes or "planned_features" in changes:
+            self._stats = self.service.get_statistics()
+
+        features = self.service.sort_features(list(self._features.values()))
+        return {"features": [f.model_dump() for f in features], "stats": self._stats}
+
 
 class BackgroundTaskManager:
     """Manages background tasks for watching and broadcasting changes"""
@@ -35,6 +172,7 @@ class BackgroundTaskManager:
         adw_monitor_watch_interval: float = 2.0,
         queue_watch_interval: float = 2.0,
         planned_features_watch_interval: float = 30.0,
+        notified_refresh_interval: float = 60.0,
         pattern_sync_interval: float = 3600.0,  # 1 hour default
         qc_metrics_watcher = None,  # QC metrics watcher instance
     ):
@@ -48,8 +186,13 @@ class BackgroundTaskManager:
             routes_watch_interval: Seconds between routes checks (default: 10)
             history_watch_interval: Seconds between history checks (default: 10)
             adw_monitor_watch_interval: Seconds between ADW monitor checks (default: 2)
-            queue_watch_interval: Seconds between queue checks (default: 2)
-            planned_features_watch_interval: Seconds between planned features checks (default: 30)
+            queue_watch_interval: Seconds between full queue refreshes when no
+                change notifications arrive (default: 2)
+            planned_features_watch_interval: Seconds between full planned features
+                refreshes when no change notifications arrive (default: 30)
+            notified_refresh_interval: Safety refresh used instead of the two
+                intervals above while the PostgreSQL change listener is running,
+                since writes from other processes are then notified too (default: 60)
             qc_metrics_watcher: QC metrics watcher instance
         """
         self.websocket_manager = websocket_manager
@@ -60,12 +203,16 @@ class BackgroundTaskManager:
         self.adw_monitor_watch_interval = adw_monitor_watch_interval
         self.queue_watch_interval = queue_watch_interval
         self.planned_features_watch_interval = planned_features_watch_interval
+        self.notified_refresh_interval = notified_refresh_interval
         self.pattern_sync_interval = pattern_sync_interval
         self.qc_metrics_watcher = qc_metrics_watcher
 
         # Task references for cleanup
         self._tasks: list[asyncio.Task] = []
 
+        # PostgreSQL LISTEN connection feeding the change bus (None on SQLite)
+        self._change_listener: PostgresChangeListener | None = None
+
         # App reference (will be set when starting routes watcher)
         self._app = None
 
@@ -87,6 +234,21 @@ class BackgroundTaskManager:
         """
         logger.info("[BACKGROUND_TASKS] Starting all background watchers...")
 
+        # Route table change notifications to this loop; on PostgreSQL also
+        # listen for changes made by other processes
+        bus = get_change_bus()
+        bus.attach()
+        adapter = get_database_adapter()
+        if adapter.get_db_type() == "postgresql":
+            self._change_listener = PostgresChangeListener(bus, adapter)
+            try:
+                await self._change_listener.start()
+            except Exception as e:
+                logger.error(
+                    f"[BACKGROUND_TASKS] Change listener unavailable, relying on safety refresh: {e}"
+                )
+                self._change_listener = None
+
         # Create tasks
         # NOTE: ADW monitor watcher REMOVED - now using event-driven HTTP POST updates
         # Orchestrator broadcasts phase changes via /api/v1/adw-phase-update (0ms latency)
@@ -120,6 +282,10 @@ class BackgroundTaskManager:
             await self.qc_metrics_watcher.stop()
             logger.info("[BACKGROUND_TASKS] QC metrics watcher stopped")
 
+        if self._change_listener:
+            await self._change_listener.stop()
+            self._change_listener = None
+
         for task in self._tasks:
             task.cancel()
 
@@ -145,22 +311,13 @@ class BackgroundTaskManager:
                     # Only do work if there are active connections (snapshot to avoid race conditions)
                     active_count = len(list(self.websocket_manager.active_connections))
                     if active_count > 0:
-                        workflows = self.workflow_service.get_workflows()
-
-                        # Convert to JSON for comparison
-                        current_state = json.dumps(
-                            [w.model_dump() for w in workflows], sort_keys=True
-                        )
+                        # Filesystem scan runs in a worker thread, off the event loop
+                        workflows = await asyncio.to_thread(self.workflow_service.get_workflows)
 
-                        # Only broadcast if state changed
-                        if current_state != self.websocket_manager.last_workflow_state:
-                            self.websocket_manager.last_workflow_state = current_state
-                            await self.websocket_manager.broadcast(
-                                {
-                                    "type": "workflows_update",
-                                    "data": [w.model_dump() for w in workflows],
-                                }
-                            )
+                        # Only broadcasts if the content hash changed
+                        if await self.websocket_manager.publish(
+                            "workflows_update", [w.model_dump() for w in workflows]
+                        ):
                             logger.info(
                                 f"[BACKGROUND_TASKS] Broadcasted workflow update to "
                                 f"{active_count} clients"
@@ -201,20 +358,10 @@ class BackgroundTaskManager:
 
                         routes = self.workflow_service.get_routes(self._app)
 
-                        # Convert to JSON for comparison
-                        current_state = json.dumps(
-                            [r.model_dump() for r in routes], sort_keys=True
-                        )
-
-                        # Only broadcast if state changed
-                        if current_state != self.websocket_manager.last_routes_state:
-                            self.websocket_manager.last_routes_state = current_state
-                            await self.websocket_manager.broadcast(
-                                {
-                                    "type": "routes_update",
-                                    "data": [r.model_dump() for r in routes],
-                                }
-                            )
+                        # Only broadcasts if the content hash changed
+                        if await self.websocket_manager.publish(
+                            "routes_update", [r.model_dump() for r in routes]
+                        ):
                             logger.info(
                                 f"[BACKGROUND_TASKS] Broadcasted routes update to "
                                 f"{active_count} clients"
@@ -247,20 +394,15 @@ class BackgroundTaskManager:
                     active_count = len(list(self.websocket_manager.active_connections))
                     if active_count > 0:
                         # Get latest workflow history - did_sync tells us if anything changed
-                        history_data, did_sync = (
-                            self.workflow_service.get_workflow_history_with_cache(
-                                WorkflowHistoryFilters(limit=50, offset=0)
-                            )
+                        history_data, did_sync = await get_async_database_adapter().run(
+                            self.workflow_service.get_workflow_history_with_cache,
+                            WorkflowHistoryFilters(limit=50, offset=0),
                         )
 
                         # Only broadcast if sync found actual changes
-                        if did_sync:
-                            await self.websocket_manager.broadcast(
-                                {
-                                    "type": "workflow_history_update",
-                                    "data": history_data.model_dump(),
-                                }
-                            )
+                        if did_sync and await self.websocket_manager.publish(
+                            "workflow_history_update", history_data.model_dump()
+                        ):
                             logger.info(
                                 f"[BACKGROUND_TASKS] Broadcasted workflow history update to "
                                 f"{active_count} clients"
@@ -297,20 +439,12 @@ class BackgroundTaskManager:
                         from core.adw_monitor import aggregate_adw_monitor_data
 
                         # Get latest ADW monitor data
-                        monitor_data = aggregate_adw_monitor_data()
-
-                        # Convert to JSON for comparison
-                        current_state = json.dumps(monitor_data, sort_keys=True)
-
-                        # Only broadcast if state changed
-                        if current_state != getattr(self.websocket_manager, 'last_adw_monitor_state', None):
-                            self.websocket_manager.last_adw_monitor_state = current_state
-                            await self.websocket_manager.broadcast(
-                                {
-                                    "type": "adw_monitor_update",
-                                    "data": monitor_data,
-                                }
-                            )
+                        monitor_data = await get_async_database_adapter().run(
+                            aggregate_adw_monitor_data
+                        )
+
+                        # Only broadcasts if the content hash changed
+                        if await self.websocket_manager.publish("adw_monitor_update", monitor_data):
                             logger.debug(
                                 f"[BACKGROUND_TASKS] Broadcasted ADW monitor update to "
                                 f"{active_count} clients"
@@ -333,114 +467,98 @@ class BackgroundTaskManager:
         Background task to watch for queue changes and broadcast updates
 
         This watcher:
-        - Checks every queue_watch_interval seconds (default: 2s for real-time feel)
+        - Wakes on phase_queue / queue_config change notifications and re-reads
+          only the affected rows (QueueSnapshot)
+        - Falls back to a full refresh every queue_watch_interval seconds
+          without notifications (notified_refresh_interval on PostgreSQL)
         - Only broadcasts if there are active WebSocket connections
         - Only broadcasts if queue state has changed
-        - Tracks state changes to prevent redundant broadcasts
         """
-        try:
-            while True:
-                try:
-                    # Only do work if there are active connections (snapshot to avoid race conditions)
-                    active_count = len(list(self.websocket_manager.active_connections))
-                    if active_count > 0:
-                        # Import here to avoid circular dependencies
-                        from server import get_queue_data
-
-                        # Get latest queue data
-                        queue_data = get_queue_data()
-
-                        # Convert to JSON for comparison
-                        current_state = json.dumps(queue_data, sort_keys=True)
-
-                        # Only broadcast if state changed
-                        if current_state != getattr(self.websocket_manager, 'last_queue_state', None):
-                            self.websocket_manager.last_queue_state = current_state
-                            await self.websocket_manager.broadcast(
-                                {
-                                    "type": "queue_update",
-                                    "data": queue_data,
-                                }
-                            )
-                            logger.debug(
-                                f"[BACKGROUND_TASKS] Broadcasted queue update to "
-                                f"{active_count} clients"
-                            )
-
-                    await asyncio.sleep(self.queue_watch_interval)
-
-                except Exception as e:
-                    logger.error(
-                        f"[BACKGROUND_TASKS] Error in queue watcher: {e}"
-                    )
-                    await asyncio.sleep(5)  # Back off on error
-
-        except asyncio.CancelledError:
-            logger.info("[BACKGROUND_TASKS] Queue watcher cancelled")
-            raise  # Re-raise to properly handle cancellation
+        from repositories.phase_queue_repository import PhaseQueueRepository
+
+        await self._watch_snapshot(
+            "queue",
+            "queue_update",
+            QueueSnapshot(PhaseQueueRepository()),
+            ("phase_queue", "queue_config"),
+            self.queue_watch_interval,
+        )
 
     async def watch_planned_features(self) -> None:
         """
         Background task to watch for planned features changes and broadcast updates
 
         This watcher:
-        - Checks every planned_features_watch_interval seconds (default: 30s)
+        - Wakes on planned_features change notifications and re-reads only the
+          affected features (PlannedFeaturesSnapshot)
+        - Falls back to a full refresh every planned_features_watch_interval
+          seconds without notifications (notified_refresh_interval on PostgreSQL)
         - Only broadcasts if there are active WebSocket connections
         - Only broadcasts if planned features state has changed
-        - Tracks state changes to prevent redundant broadcasts
 
         This ensures Plans Panel shows real-time updates when:
         - Workflows complete and update feature status
         - GitHub issues are synced to planned_features
         - Features are marked as completed/cancelled
         """
+        from services.planned_features_service import PlannedFeaturesService
+
+        await self._watch_snapshot(
+            "planned features",
+            "planned_features_update",
+            PlannedFeaturesSnapshot(PlannedFeaturesService()),
+            ("planned_features",),
+            self.planned_features_watch_interval,
+        )
+
+    async def _watch_snapshot(
+        self,
+        name: str,
+        channel: str,
+        snapshot: "QueueSnapshot | PlannedFeaturesSnapshot",
+        tables: tuple[str, ...],
+        interval: float,
+    ) -> None:
+        """
+        Keep a snapshot published while clients are connected.
+
+        Waits on the change bus for the given tables and refreshes only what
+        changed; a timeout without notifications triggers a full refresh to
+        catch writes the bus cannot see (other processes on SQLite). The
+        polling interval applies unless the PostgreSQL listener is running.
+        """
+        bus = get_change_bus()
         try:
             while True:
                 try:
                     # Only do work if there are active connections (snapshot to avoid race conditions)
                     active_count = len(list(self.websocket_manager.active_connections))
-                    if active_count > 0:
-                        from services.planned_features_service import PlannedFeaturesService
-
-                        service = PlannedFeaturesService()
-
-                        # Get all features and stats
-                        features = service.get_all(limit=200)
-                        stats = service.get_statistics()
-
-                        # Convert to JSON for comparison
-                        current_state = json.dumps({
-                            "features": [f.model_dump() for f in features],
-                            "stats": stats
-                        }, sort_keys=True)
-
-                        # Only broadcast if state changed
-                        if current_state != getattr(self.websocket_manager, 'last_planned_features_state', None):
-                            self.websocket_manager.last_planned_features_state = current_state
-                            await self.websocket_manager.broadcast(
-                                {
-                                    "type": "planned_features_update",
-                                    "data": {
-                                        "features": [f.model_dump() for f in features],
-                                        "stats": stats
-                                    }
-                                }
-                            )
-                            logger.debug(
-                                f"[BACKGROUND_TASKS] Broadcasted planned features update to "
-                                f"{active_count} clients"
-                            )
-
-                    await asyncio.sleep(self.planned_features_watch_interval)
+                    if active_count == 0:
+                        # Changes are not tracked while idle; start over on the next client
+                        snapshot.invalidate()
+                        await asyncio.sleep(IDLE_CHECK_INTERVAL)
+                        continue
+
+                    timeout = self.notified_refresh_interval if self._change_listener else interval
+                    changes = await bus.wait(tables, timeout=timeout) if snapshot.loaded else {}
+                    data = await get_async_database_adapter().run(snapshot.refresh, changes)
+
+                    # Only broadcasts if the content hash changed
+                    if await self.websocket_manager.publish(channel, data):
+                        logger.debug(
+                            f"[BACKGROUND_TASKS] Broadcasted {name} update to "
+                            f"{active_count} clients"
+                        )
 
                 except Exception as e:
                     logger.error(
-                        f"[BACKGROUND_TASKS] Error in planned features watcher: {e}"
+                        f"[BACKGROUND_TASKS] Error in {name} watcher: {e}"
                     )
+                    snapshot.invalidate()
                     await asyncio.sleep(5)  # Back off on error
 
         except asyncio.CancelledError:
-            logger.info("[BACKGROUND_TASKS] Planned features watcher cancelled")
+            logger.info(f"[BACKGROUND_TASKS] {name.capitalize()} watcher cancelled")
             raise  # Re-raise to properly handle cancellation
 
     async def watch_pattern_sync(self) -> None:
@@ -463,7 +581,7 @@ class BackgroundTaskManager:
             # Import here to avoid circular dependencies
             from services.pattern_sync_service import PatternSyncService
 
-            pattern_sync_service = PatternSyncService()
+            pattern_sync_service = AsyncRepository(PatternSyncService())
 
             logger.info(
                 f"[BACKGROUND_TASKS] Pattern sync watcher started "
@@ -473,7 +591,7 @@ class BackgroundTaskManager:
             while True:
                 try:
                     # Run high-priority pattern sync
-                    result = pattern_sync_service.sync_high_priority_patterns()
+                    result = await pattern_sync_service.sync_high_priority_patterns()
 
                     logger.info(
                         f"[BACKGROUND_TASKS] Pattern sync completed: "
@@ -287,11 +287,16 @@ class HealthService:
 
                 tables = cursor.fetchall()
 
+            details = {"tables_count": len(tables), "database_type": db_type, "path": self.db_path}
+            pool_stats = adapter.get_pool_stats()
+            if pool_stats:
+                details["pool"] = pool_stats
+
             return ServiceHealth(
                 name="Database",
                 status="healthy",
                 message=f"{len(tables)} tables available ({db_type})",
-                details={"tables_count": len(tables), "database_type": db_type, "path": self.db_path}
+                details=details
             )
         except Exception as e:
             return ServiceHealth(
@@ -0,0 +1,277 @@
+"""
+Discrete-event simulator for hopper scheduling policies.
+
+Replays a queue of jobs (by default: completed workflows from
+workflow_history) through a PhaseScheduler with a fixed number of execution
+slots, and reports throughput, makespan and waiting times so policies can be
+compared on the same workload.
+
+The scheduler only sees estimates (PhaseEstimator); jobs run for their actual
+historical duration, and the estimator learns from each completion as it
+would in production.
+
+Usage:
+    python -m services.hopper_simulator --days 30 --max-parallel 3 --budget-usd 25
+"""
+
+import argparse
+import heapq
+import logging
+import statistics
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from database import get_database_adapter
+from services.hopper_sorter import (
+    POLICIES,
+    CostBudget,
+    PhaseEstimator,
+    PhaseScheduler,
+    SchedulableJob,
+    SchedulingPolicy,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SimulatedJob(SchedulableJob):
+    """A job with its arrival time and actual (not estimated) behaviour."""
+
+    arrival: float = 0.0
+    duration: float = 0.0
+    cost_usd: float = 0.0
+    tokens: int = 0
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of replaying a workload under one policy."""
+
+    policy: str
+    completed: int
+    makespan: float
+    throughput_per_hour: float
+    mean_wait: float
+    p95_wait: float
+    max_wait: float
+    total_cost_usd: float
+    # feature_id -> time its last job finished
+    feature_completion: dict[int | None, float] = field(default_factory=dict)
+
+
+def simulate(
+    jobs: list[SimulatedJob],
+    policy: SchedulingPolicy,
+    max_parallel: int = 3,
+    estimator: PhaseEstimator | None = None,
+    budget: CostBudget | None = None,
+    learn: bool = True,
+) -> SimulationResult:
+    """
+    Replay jobs through a scheduler and measure the outcome.
+
+    Args:
+        jobs: Workload; arrival times are seconds from the start of the replay
+        policy: Fresh policy instance (policies keep dispatch state)
+        max_parallel: Execution slots
+        estimator: Estimates seen by the scheduler (default: PhaseEstimator())
+        budget: Optional spend window (times are simulation seconds)
+        learn: Feed each completion back into the estimator
+
+    Returns:
+        SimulationResult for the policy
+    """
+    scheduler = PhaseScheduler(policy, estimator or PhaseEstimator(), budget)
+    arrivals = sorted(jobs, key=lambda j: (j.arrival, j.queue_id))
+    pending: dict[str, SimulatedJob] = {}
+    running: list[tuple[float, str, SimulatedJob]] = []  # heap of (end, queue_id, job)
+    waits: list[float] = []
+    feature_completion: dict[int | None, float] = {}
+    now = arrivals[0].arrival if arrivals else 0.0
+    start = now
+    next_arrival = 0
+    completed = 0
+    total_cost = 0.0
+
+    while next_arrival < len(arrivals) or pending or running:
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival <= now:
+            job = arrivals[next_arrival]
+            pending[job.queue_id] = job
+            next_arrival += 1
+
+        for job in scheduler.select(list(pending.values()), slots=max_parallel - len(running), now=now):
+            del pending[job.queue_id]
+            waits.append(now - job.arrival)
+            total_cost += job.cost_usd
+            heapq.heappush(running, (now + job.duration, job.queue_id, job))
+
+        candidates = []
+        if running:
+            candidates.append(running[0][0])
+        if next_arrival < len(arrivals):
+            candidates.append(arrivals[next_arrival].arrival)
+        if pending and budget and len(running) < max_parallel:
+            release = budget.next_release(now)
+            if release is not None:
+                candidates.append(release)
+        if not candidates:
+            # Only reachable if the policy refuses to dispatch with free slots
+            logger.warning(f"[SIMULATOR] {len(pending)} job(s) could not be scheduled")
+            break
+        now = max(now, min(candidates))
+
+        while running and running[0][0] <= now:
+            end, _, job = heapq.heappop(running)
+            completed += 1
+            feature_completion[job.feature_id] = max(feature_completion.get(job.feature_id, 0.0), end - start)
+            if learn:
+                scheduler.estimator.observe(job.template, job.duration, job.cost_usd, job.tokens)
+
+    makespan = now - start
+    return SimulationResult(
+        policy=policy.name,
+        completed=completed,
+        makespan=makespan,
+        throughput_per_hour=completed / makespan * 3600 if makespan > 0 else 0.0,
+        mean_wait=statistics.mean(waits) if waits else 0.0,
+        p95_wait=_percentile(waits, 95),
+        max_wait=max(waits, default=0.0),
+        total_cost_usd=total_cost,
+        feature_completion=feature_completion,
+    )
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def compare_policies(
+    jobs: list[SimulatedJob],
+    policies: dict[str, type[SchedulingPolicy]] | None = None,
+    max_parallel: int = 3,
+    estimator_factory: Callable[[], PhaseEstimator] = PhaseEstimator,
+    budget_factory: Callable[[], CostBudget | None] = lambda: None,
+) -> list[SimulationResult]:
+    """
+    Run the same workload under each policy, each with fresh state.
+
+    Args:
+        jobs: Workload to replay
+        policies: Policies to compare (default: all registered in POLICIES)
+        max_parallel: Execution slots
+        estimator_factory: Creates the starting estimator for each run
+        budget_factory: Creates the budget for each run (None = unlimited)
+    """
+    return [
+        simulate(
+            jobs,
+            policy_cls(),
+            max_parallel=max_parallel,
+            estimator=estimator_factory(),
+            budget=budget_factory(),
+        )
+        for policy_cls in (policies or POLICIES).values()
+    ]
+
+
+def load_history(adapter=None, days: int = 30) -> list[SimulatedJob]:
+    """
+    Build a workload from completed workflows of the last ``days`` days.
+
+    Each workflow becomes one job arriving at its start time, grouped into
+    features by issue number, running for its recorded duration and cost.
+    """
+    adapter = adapter or get_database_adapter()
+    ph = adapter.placeholder()
+    since = (datetime.now() - timedelta(days=days)).isoformat()
+
+    with adapter.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT adw_id, issue_number, workflow_template, start_time, created_at,
+                   duration_seconds, actual_cost_total, total_tokens
+            FROM workflow_history
+            WHERE status = 'completed' AND duration_seconds > 0 AND created_at >= {ph}
+            ORDER BY created_at
+            """,
+            (since,),
+        )
+        rows = cursor.fetchall()
+
+    jobs = []
+    origin = None
+    for position, row in enumerate(rows):
+        started = _parse_time(row["start_time"]) or _parse_time(row["created_at"])
+        if started is None:
+            continue
+        origin = origin or started
+        jobs.append(SimulatedJob(
+            queue_id=row["adw_id"],
+            feature_id=row["issue_number"],
+            queue_position=position,
+            template=row["workflow_template"],
+            arrival=max(0.0, (started - origin).total_seconds()),
+            duration=float(row["duration_seconds"]),
+            cost_usd=float(row["actual_cost_total"] or 0.0),
+            tokens=int(row["total_tokens"] or 0),
+        ))
+    return jobs
+
+
+def _parse_time(value) -> datetime | None:
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare hopper scheduling policies on workflow history")
+    parser.add_argument("--days", type=int, default=30, help="History window to replay")
+    parser.add_argument("--max-parallel", type=int, default=3, help="Concurrent workflow slots")
+    parser.add_argument("--budget-usd", type=float, default=None, help="Spend limit per window")
+    parser.add_argument("--budget-tokens", type=int, default=None, help="Token limit per window")
+    parser.add_argument("--window-hours", type=float, default=1.0, help="Budget window length")
+    args = parser.parse_args()
+
+    jobs = load_history(days=args.days)
+    if not jobs:
+        print("No completed workflows in the selected window")
+        return
+
+    estimates = PhaseEstimator.from_history(days=args.days).estimates
+
+    def budget():
+        if args.budget_usd is None and args.budget_tokens is None:
+            return None
+        return CostBudget(args.budget_usd, args.budget_tokens, window_seconds=args.window_hours * 3600)
+
+    results = compare_policies(
+        jobs,
+        max_parallel=args.max_parallel,
+        estimator_factory=lambda: PhaseEstimator(estimates),
+        budget_factory=budget,
+    )
+
+    print(f"{len(jobs)} workflows, {args.max_parallel} slots")
+    print(f"{'Policy':<25} {'Done':>5} {'Makespan':>10} {'Per hour':>9} {'Mean wait':>10} {'P95 wait':>10}")
+    print("-" * 74)
+    for r in results:
+        print(
+            f"{r.policy:<25} {r.completed:>5} {r.makespan / 3600:>9.1f}h {r.throughput_per_hour:>9.2f} "
+            f"{r.mean_wait / 60:>9.1f}m {r.p95_wait / 60:>9.1f}m"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,32 @@ Key Features:
 - Parent grouping: Can run phases from different parents in parallel
 - FIFO within priority: Fair ordering for same-priority phases
 - Index-optimized queries: Fast even with large queues
+- Atomic claiming: claim_next_phases() never hands one phase to two dispatchers
+- Pluggable scheduling: PhaseScheduler combines a SchedulingPolicy (priority
+  FIFO, weighted fair queuing across features, shortest expected job first)
+  with learned per-template estimates and an optional $/token budget window.
+  services/hopper_simulator.py replays history to compare policies.
 """
 
+import json
 import logging
+import os
+import statistics
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 from database import get_database_adapter
 from database.sqlite_adapter import SQLiteAdapter
 from models.phase_queue_item import PhaseQueueItem
+from repositories.phase_queue_repository import (
+    DEFAULT_CLAIM_LEASE_SECONDS,
+    PhaseQueueRepository,
+    default_worker_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +53,15 @@ class HopperSorter:
     PRIORITY_LOW = 70
     PRIORITY_BACKGROUND = 90
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(self, db_path: str | None = None, scheduler: "PhaseScheduler | None" = None):
         """
         Initialize HopperSorter.
 
         Args:
             db_path: Optional path to SQLite database. If provided, uses SQLiteAdapter with this path.
                     Otherwise uses database adapter from factory (SQLite or PostgreSQL based on DB_TYPE env var).
+            scheduler: Optional PhaseScheduler deciding which phases claim_next_phases()
+                    takes. Without one, phases are claimed in priority/FIFO order.
         """
         if db_path:
             self.adapter = SQLiteAdapter(db_path=db_path)
@@ -48,6 +69,8 @@ class HopperSorter:
         else:
             self.adapter = get_database_adapter()
             logger.info("[INIT] HopperSorter initialized")
+        self.repository = PhaseQueueRepository(db_path=db_path)
+        self.scheduler = scheduler
 
     def get_next_phase_1(self) -> PhaseQueueItem | None:
         """
@@ -161,6 +184,52 @@ class HopperSorter:
             logger.error(f"[ERROR] Failed to get parallel Phase 1s: {str(e)}")
             raise
 
+    def claim_next_phases(
+        self,
+        worker_id: str | None = None,
+        max_parallel: int = 1,
+        lease_seconds: float = DEFAULT_CLAIM_LEASE_SECONDS,
+    ) -> list[PhaseQueueItem]:
+        """
+        Claim the next ready Phase 1s for this dispatcher.
+
+        Unlike get_next_phase_1() / get_next_phases_parallel(), which only
+        read, the selected phases are marked as claimed in the same statement,
+        so two dispatchers (or the webhook route and the coordinator) never
+        launch the same phase. Same ordering: priority, then queue position,
+        and like them only phases without a GitHub issue yet.
+
+        Args:
+            worker_id: Claiming dispatcher (default: this process)
+            max_parallel: Maximum number of phases to claim
+            lease_seconds: Claim lifetime unless renewed with a heartbeat
+
+        Returns:
+            Claimed Phase 1 items (empty if none are available)
+
+        Example:
+            >>> sorter = HopperSorter()
+            >>> for phase in sorter.claim_next_phases(max_parallel=3):
+            ...     launch_workflow(phase)
+        """
+        phases = claim_phases(
+            self.repository,
+            worker_id or default_worker_id(),
+            max_parallel=max_parallel,
+            lease_seconds=lease_seconds,
+            scheduler=self.scheduler,
+            phase_number=1,
+            without_issue=True,
+        )
+        if phases:
+            logger.info(
+                f"[SORTER] Claimed {len(phases)} Phase 1(s): "
+                f"{', '.join(f'feature #{p.feature_id}' for p in phases)}"
+            )
+        else:
+            logger.debug("[SORTER] No unclaimed ready Phase 1s")
+        return phases
+
     def get_running_parent_count(self) -> int:
         """
         Get count of parent issues that currently have running phases.
@@ -261,6 +330,537 @@ class HopperSorter:
             return {"by_priority": {}, "total_phase_1s": 0, "ready_phase_1s": 0}
 
 
+# ============================================================================
+# Pluggable scheduling
+# ============================================================================
+
+DEFAULT_TEMPLATE = "adw_sdlc_complete_iso"
+
+
+@dataclass(frozen=True)
+class PhaseEstimate:
+    """Expected duration and cost of running one phase."""
+
+    duration_seconds: float
+    cost_usd: float
+    tokens: int
+
+
+@dataclass
+class SchedulableJob:
+    """What a scheduling policy needs to know about a queued phase."""
+
+    queue_id: str
+    feature_id: int | None
+    priority: int = HopperSorter.PRIORITY_NORMAL
+    queue_position: int = 0
+    template: str | None = None
+
+    @classmethod
+    def from_item(cls, item: PhaseQueueItem) -> "SchedulableJob":
+        return cls(
+            queue_id=item.queue_id,
+            feature_id=item.feature_id,
+            priority=item.priority or HopperSorter.PRIORITY_NORMAL,
+            queue_position=item.queue_position or 0,
+            template=(item.phase_data or {}).get("workflow_type"),
+        )
+
+
+class PhaseEstimator:
+    """
+    Per-workflow-template duration/cost estimates.
+
+    Seeded from history (workflow_history durations, task_logs costs) and
+    refined online with observe(), using an exponentially weighted mean so
+    recent runs count more.
+    """
+
+    DEFAULT_ESTIMATE = PhaseEstimate(duration_seconds=1800.0, cost_usd=2.0, tokens=200_000)
+
+    def __init__(
+        self,
+        estimates: dict[str, PhaseEstimate] | None = None,
+        default: PhaseEstimate | None = None,
+        smoothing: float = 0.2,
+    ):
+        """
+        Args:
+            estimates: Initial estimates by workflow template
+            default: Estimate for templates without history
+            smoothing: Weight of each new observation (0-1)
+        """
+        self.estimates = dict(estimates or {})
+        self.default = default or self.DEFAULT_ESTIMATE
+        self.smoothing = smoothing
+
+    def estimate(self, template: str | None) -> PhaseEstimate:
+        """Get the estimate for a workflow template."""
+        return self.estimates.get(template or DEFAULT_TEMPLATE, self.default)
+
+    def observe(
+        self,
+        template: str | None,
+        duration_seconds: float,
+        cost_usd: float | None = None,
+        tokens: int | None = None,
+    ) -> None:
+        """Fold a finished run into its template's estimate (None = not reported, keep the estimate)."""
+        template = template or DEFAULT_TEMPLATE
+        current = self.estimates.get(template, self.default)
+        a = self.smoothing if template in self.estimates else 1.0
+
+        def blend(old: float, new: float | None) -> float:
+            return old if new is None else (1 - a) * old + a * new
+
+        self.estimates[template] = PhaseEstimate(
+            duration_seconds=blend(current.duration_seconds, duration_seconds),
+            cost_usd=blend(current.cost_usd, cost_usd),
+            tokens=round(blend(current.tokens, tokens)),
+        )
+
+    @classmethod
+    def from_history(cls, adapter=None, days: int = 30) -> "PhaseEstimator":
+        """
+        Build estimates from completed workflows of the last ``days`` days.
+
+        Durations come from workflow_history (sum of phase_durations, falling
+        back to duration_seconds); costs and tokens from task_logs, which
+        records them per phase. Medians are used so a few runaway workflows
+        do not skew the estimates.
+        """
+        adapter = adapter or get_database_adapter()
+        ph = adapter.placeholder()
+        since = (datetime.now() - timedelta(days=days)).isoformat()
+
+        durations: dict[str, list[float]] = defaultdict(list)
+        costs: dict[str, list[float]] = defaultdict(list)
+        tokens: dict[str, list[float]] = defaultdict(list)
+        try:
+            with adapter.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT workflow_template, duration_seconds, phase_durations
+                    FROM workflow_history
+                    WHERE status = 'completed' AND created_at >= {ph}
+                    """,
+                    (since,),
+                )
+                for row in cursor.fetchall():
+                    duration = _total_phase_duration(row["phase_durations"]) or row["duration_seconds"]
+                    if duration and duration > 0:
+                        durations[row["workflow_template"] or DEFAULT_TEMPLATE].append(float(duration))
+
+                cursor.execute(
+                    f"""
+                    SELECT workflow_template, adw_id,
+                           SUM(cost_usd) AS cost_usd, SUM(tokens_used) AS tokens_used
+                    FROM task_logs
+                    WHERE created_at >= {ph}
+                    GROUP BY workflow_template, adw_id
+                    """,
+                    (since,),
+                )
+                for row in cursor.fetchall():
+                    template = row["workflow_template"] or DEFAULT_TEMPLATE
+                    if row["cost_usd"]:
+                        costs[template].append(float(row["cost_usd"]))
+                    if row["tokens_used"]:
+                        tokens[template].append(float(row["tokens_used"]))
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Could not load history for estimates, using defaults: {e}")
+            return cls()
+
+        default = cls.DEFAULT_ESTIMATE
+        estimates = {
+            template: PhaseEstimate(
+                duration_seconds=statistics.median(durations[template]) if durations[template] else default.duration_seconds,
+                cost_usd=statistics.median(costs[template]) if costs[template] else default.cost_usd,
+                tokens=round(statistics.median(tokens[template])) if tokens[template] else default.tokens,
+            )
+            for template in durations.keys() | costs.keys() | tokens.keys()
+        }
+        logger.info(f"[SCHEDULER] Loaded estimates for {len(estimates)} workflow template(s)")
+        return cls(estimates)
+
+
+def _total_phase_duration(raw) -> float:
+    """Sum a phase_durations JSON object ({phase: seconds}); 0 if unusable."""
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError:
+            return 0.0
+    if not isinstance(raw, dict):
+        return 0.0
+    return sum(float(v) for v in raw.values() if isinstance(v, int | float) and v > 0)
+
+
+class SchedulingPolicy(ABC):
+    """Orders candidate phases; may keep state about what was dispatched."""
+
+    name = "policy"
+
+    @abstractmethod
+    def order(self, jobs: list[SchedulableJob], estimator: PhaseEstimator) -> list[SchedulableJob]:
+        """Return the jobs in dispatch order."""
+
+    def on_dispatch(self, job: SchedulableJob, estimate: PhaseEstimate) -> None:
+        """Called for each job the scheduler dispatches (stateless policies ignore it)."""
+        return None
+
+
+class PriorityFifoPolicy(SchedulingPolicy):
+    """The classic hopper order: priority, then queue position."""
+
+    name = "priority_fifo"
+
+    def order(self, jobs, estimator):
+        return sorted(jobs, key=lambda j: (j.priority, j.queue_position, j.queue_id))
+
+
+class ShortestExpectedJobFirstPolicy(SchedulingPolicy):
+    """Shortest estimated duration first; priority and FIFO break ties."""
+
+    name = "shortest_expected_first"
+
+    def order(self, jobs, estimator):
+        return sorted(
+            jobs,
+            key=lambda j: (estimator.estimate(j.template).duration_seconds, j.priority, j.queue_position, j.queue_id),
+        )
+
+
+class WeightedFairPolicy(SchedulingPolicy):
+    """
+    Weighted fair queuing across features (start-time fair queuing).
+
+    Each feature accrues virtual time as its phases are dispatched, at the
+    rate expected_duration / weight, and the job with the smallest virtual
+    start tag goes next. A feature with many queued phases therefore cannot
+    starve the others, and higher-priority features (larger weight) get a
+    proportionally larger share. Within a feature, priority/FIFO order holds.
+    """
+
+    name = "weighted_fair"
+
+    def __init__(self):
+        self._virtual_time = 0.0
+        self._finish_tags: dict[int | None, float] = {}
+
+    @staticmethod
+    def weight(job: SchedulableJob) -> float:
+        """Share of a job's feature: normal priority = 1, urgent = 5, background ~0.56."""
+        return HopperSorter.PRIORITY_NORMAL / max(job.priority, 1)
+
+    def order(self, jobs, estimator):
+        by_feature: dict[int | None, list[SchedulableJob]] = defaultdict(list)
+        for job in sorted(jobs, key=lambda j: (j.priority, j.queue_position, j.queue_id)):
+            by_feature[job.feature_id].append(job)
+
+        tagged = []
+        for feature_id, feature_jobs in by_feature.items():
+            finish = self._finish_tags.get(feature_id, 0.0)
+            for job in feature_jobs:
+                start = max(self._virtual_time, finish)
+                finish = start + estimator.estimate(job.template).duration_seconds / self.weight(job)
+                tagged.append((start, job.priority, job.queue_position, job.queue_id, job))
+        tagged.sort(key=lambda t: t[:4])
+        return [t[-1] for t in tagged]
+
+    def on_dispatch(self, job, estimate):
+        start = max(self._virtual_time, self._finish_tags.get(job.feature_id, 0.0))
+        self._finish_tags[job.feature_id] = start + estimate.duration_seconds / self.weight(job)
+        self._virtual_time = start
+
+
+POLICIES: dict[str, type[SchedulingPolicy]] = {
+    policy.name: policy
+    for policy in (PriorityFifoPolicy, ShortestExpectedJobFirstPolicy, WeightedFairPolicy)
+}
+
+
+class CostBudget:
+    """
+    Global spend limit per sliding time window ($ and/or tokens).
+
+    Dispatches record their estimated cost; a phase is admitted only if it
+    fits in what is left of the window. An empty window always admits, so a
+    single phase larger than the budget still runs rather than blocking the
+    queue forever.
+    """
+
+    def __init__(
+        self,
+        max_cost_usd: float | None = None,
+        max_tokens: int | None = None,
+        window_seconds: float = 3600.0,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            max_cost_usd: Dollar limit per window (None = unlimited)
+            max_tokens: Token limit per window (None = unlimited)
+            window_seconds: Length of the sliding window
+            clock: Time source when callers do not pass ``now``
+        """
+        self.max_cost_usd = max_cost_usd
+        self.max_tokens = max_tokens
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self._spend: deque[tuple[float, float, int]] = deque()  # (time, cost, tokens)
+
+    def _expire(self, now: float) -> None:
+        while self._spend and self._spend[0][0] <= now - self.window_seconds:
+            self._spend.popleft()
+
+    def spent(self, now: float | None = None) -> tuple[float, int]:
+        """($, tokens) recorded in the current window."""
+        now = self.clock() if now is None else now
+        self._expire(now)
+        return sum(s[1] for s in self._spend), sum(s[2] for s in self._spend)
+
+    def can_afford(
+        self, estimate: PhaseEstimate, now: float | None = None, pending: tuple[PhaseEstimate, ...] = ()
+    ) -> bool:
+        """Whether a phase with this estimate fits in the remaining budget, after ``pending`` phases."""
+        cost, tokens = self.spent(now)
+        if not self._spend and not pending:
+            return True
+        cost += sum(p.cost_usd for p in pending)
+        tokens += sum(p.tokens for p in pending)
+        over_cost = self.max_cost_usd is not None and cost + estimate.cost_usd > self.max_cost_usd
+        over_tokens = self.max_tokens is not None and tokens + estimate.tokens > self.max_tokens
+        return not (over_cost or over_tokens)
+
+    def record(self, estimate: PhaseEstimate, now: float | None = None) -> None:
+        """Charge a dispatched phase to the window."""
+        now = self.clock() if now is None else now
+        self._spend.append((now, estimate.cost_usd, estimate.tokens))
+
+    def next_release(self, now: float) -> float | None:
+        """When the oldest charge leaves the window (None if nothing is charged)."""
+        self._expire(now)
+        return self._spend[0][0] + self.window_seconds if self._spend else None
+
+
+class PhaseScheduler:
+    """
+    Picks which ready phases to dispatch: a policy orders them, the budget
+    admits them.
+
+    Admission stops at the first phase the budget cannot afford instead of
+    skipping to cheaper ones, so expensive phases are delayed, not starved.
+
+    Example:
+        >>> scheduler = PhaseScheduler(WeightedFairPolicy(), PhaseEstimator.from_history(),
+        ...                            CostBudget(max_cost_usd=50, window_seconds=3600))
+        >>> sorter = HopperSorter(scheduler=scheduler)
+        >>> sorter.claim_next_phases(max_parallel=3)
+
+    In the server the scheduler comes from get_phase_scheduler(), which
+    reads the HOPPER_* settings (see from_env()).
+    """
+
+    def __init__(
+        self,
+        policy: SchedulingPolicy | None = None,
+        estimator: PhaseEstimator | None = None,
+        budget: CostBudget | None = None,
+    ):
+        self.policy = policy or PriorityFifoPolicy()
+        self.estimator = estimator or PhaseEstimator()
+        self.budget = budget
+
+    def choose(self, jobs: list[SchedulableJob], slots: int, now: float | None = None) -> list[SchedulableJob]:
+        """
+        Choose up to ``slots`` jobs to dispatch, without recording them.
+
+        Call record_dispatch() with the jobs that were actually started.
+
+        Args:
+            jobs: Ready candidates
+            slots: Free execution slots
+            now: Current time for the budget window (default: budget clock)
+        """
+        chosen: list[SchedulableJob] = []
+        pending: list[PhaseEstimate] = []
+        if slots <= 0:
+            return chosen
+        for job in self.policy.order(jobs, self.estimator):
+            estimate = self.estimator.estimate(job.template)
+            if self.budget and not self.budget.can_afford(estimate, now, tuple(pending)):
+                logger.debug(f"[SCHEDULER] Budget exhausted, holding {job.queue_id} and later phases")
+                break
+            chosen.append(job)
+            pending.append(estimate)
+            if len(chosen) >= slots:
+                break
+        return chosen
+
+    def record_dispatch(self, jobs: list[SchedulableJob], now: float | None = None) -> None:
+        """Charge dispatched jobs to the policy's fair share and the budget window."""
+        for job in jobs:
+            estimate = self.estimator.estimate(job.template)
+            self.policy.on_dispatch(job, estimate)
+            if self.budget:
+                self.budget.record(estimate, now)
+
+    def select(self, jobs: list[SchedulableJob], slots: int, now: float | None = None) -> list[SchedulableJob]:
+        """choose() and record_dispatch() in one step, for callers that start every pick."""
+        chosen = self.choose(jobs, slots, now)
+        self.record_dispatch(chosen, now)
+        return chosen
+
+    @classmethod
+    def from_env(cls) -> "PhaseScheduler | None":
+        """
+        Build the scheduler configured through the environment.
+
+        HOPPER_SCHEDULING_POLICY: one of POLICIES (default priority_fifo)
+        HOPPER_BUDGET_USD / HOPPER_BUDGET_TOKENS: spend limit per window
+        HOPPER_BUDGET_WINDOW_SECONDS: budget window (default 3600)
+
+        Returns:
+            None when the plain priority/FIFO claim needs no scheduler
+        """
+        policy_name = os.getenv("HOPPER_SCHEDULING_POLICY", PriorityFifoPolicy.name)
+        if policy_name not in POLICIES:
+            logger.warning(f"[SCHEDULER] Unknown policy '{policy_name}', using {PriorityFifoPolicy.name}")
+            policy_name = PriorityFifoPolicy.name
+        max_cost_usd = _env_number("HOPPER_BUDGET_USD", float)
+        max_tokens = _env_number("HOPPER_BUDGET_TOKENS", int)
+
+        if policy_name == PriorityFifoPolicy.name and max_cost_usd is None and max_tokens is None:
+            return None
+
+        budget = None
+        if max_cost_usd is not None or max_tokens is not None:
+            budget = CostBudget(
+                max_cost_usd=max_cost_usd,
+                max_tokens=max_tokens,
+                window_seconds=_env_number("HOPPER_BUDGET_WINDOW_SECONDS", float) or 3600.0,
+            )
+        logger.info(
+            f"[SCHEDULER] Using {policy_name} scheduling"
+            f"{f' with budget ${max_cost_usd} / {max_tokens} tokens' if budget else ''}"
+        )
+        return cls(POLICIES[policy_name](), PhaseEstimator.from_history(), budget)
+
+
+def _env_number(name: str, kind: type):
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return kind(value)
+    except ValueError:
+        logger.warning(f"[SCHEDULER] Ignoring invalid {name}={value!r}")
+        return None
+
+
+_scheduler: PhaseScheduler | None = None
+_scheduler_loaded = False
+_scheduler_lock = threading.Lock()
+
+
+def get_phase_scheduler() -> PhaseScheduler | None:
+    """
+    Process-wide scheduler (PhaseScheduler.from_env), built on first use.
+
+    Shared so fair-share and budget state carry across dispatches, and so
+    completions reported through record_phase_completion() refine the
+    estimates the scheduler uses.
+    """
+    global _scheduler, _scheduler_loaded
+    with _scheduler_lock:
+        if not _scheduler_loaded:
+            _scheduler = PhaseScheduler.from_env()
+            _scheduler_loaded = True
+        return _scheduler
+
+
+def record_phase_completion(
+    item: PhaseQueueItem, duration_seconds: float | None = None, cost_usd: float | None = None
+) -> None:
+    """
+    Feed a finished phase into the scheduler's estimates.
+
+    Args:
+        item: The completed phase
+        duration_seconds: Reported run time (default: since the phase started)
+        cost_usd: Reported cost, if known
+    """
+    scheduler = get_phase_scheduler()
+    if scheduler is None:
+        return
+    if duration_seconds is None and item.started_timestamp:
+        started = item.started_timestamp
+        if isinstance(started, str):
+            started = datetime.fromisoformat(started)
+        # The database clock is UTC; SQLite returns it without an offset
+        if started.tzinfo is None:
+            started = started.replace(tzinfo=UTC)
+        duration_seconds = (datetime.now(UTC) - started).total_seconds()
+    if not duration_seconds or duration_seconds <= 0:
+        return
+    template = (item.phase_data or {}).get("workflow_type")
+    scheduler.estimator.observe(template, duration_seconds, cost_usd)
+
+
+def claim_phases(
+    repository: PhaseQueueRepository,
+    worker_id: str,
+    max_parallel: int = 1,
+    lease_seconds: float = DEFAULT_CLAIM_LEASE_SECONDS,
+    scheduler: PhaseScheduler | None = None,
+    **filters,
+) -> list[PhaseQueueItem]:
+    """
+    Claim up to max_parallel ready phases, letting the scheduler pick them.
+
+    Every dispatcher claims through here (the hopper's Phase 1s, the
+    coordinator's dependent phases, the workflow-complete webhook), so one
+    scheduler sees all dispatches. Fair share is kept per feature_id, the
+    queue's parent grouping.
+
+    Args:
+        repository: Queue to claim from
+        worker_id: Claiming dispatcher
+        max_parallel: Maximum number of phases to claim
+        lease_seconds: Claim lifetime unless renewed with a heartbeat
+        scheduler: Picks and charges the phases (None: priority/FIFO order)
+        **filters: statuses / phase_number / queue_ids / without_issue, as
+            for PhaseQueueRepository.claim_ready_phases()
+
+    Returns:
+        Claimed phases in dispatch order
+    """
+    if scheduler is None:
+        return repository.claim_ready_phases(
+            worker_id, limit=max_parallel, lease_seconds=lease_seconds, **filters
+        )
+
+    candidates = repository.find_claimable_phases(**filters)
+    chosen = scheduler.choose([SchedulableJob.from_item(item) for item in candidates], slots=max_parallel)
+    if not chosen:
+        return []
+
+    # Picks another dispatcher claimed in the meantime are simply dropped,
+    # and only the phases actually claimed count against budget and fair share
+    rank = {job.queue_id: n for n, job in enumerate(chosen)}
+    claimed = repository.claim_ready_phases(
+        worker_id,
+        limit=len(chosen),
+        lease_seconds=lease_seconds,
+        **{**filters, "queue_ids": list(rank)},
+    )
+    claimed.sort(key=lambda item: rank[item.queue_id])
+    scheduler.record_dispatch([chosen[rank[item.queue_id]] for item in claimed])
+    return claimed
+
+
 def get_priority_name(priority: int) -> str:
     """
     Get human-readable priority name.
@@ -52,9 +52,9 @@ class PatternReviewItem:
 class PatternReviewService:
     """Service for pattern review operations."""
 
-    def __init__(self):
+    def __init__(self, adapter=None):
         """Initialize PatternReviewService with database adapter."""
-        self.adapter = get_database_adapter()
+        self.adapter = adapter or get_database_adapter()
         logger.info("[INIT] PatternReviewService initialized")
 
     def get_pending_patterns(self, limit: int = 20) -> list[PatternReviewItem]:
@@ -464,7 +464,8 @@ class PatternReviewService:
         if not row:
             return None
 
-        # PostgreSQL with RealDictCursor returns dict rows
+        # RealDictCursor (PostgreSQL) or sqlite3.Row (SQLite)
+        row = dict(row)
         example_sessions_raw = row.get('example_sessions')
 
         # Parse example_sessions JSON if present and if it's a string
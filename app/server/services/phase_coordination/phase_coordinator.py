@@ -18,6 +18,9 @@ import json
 import logging
 from datetime import datetime, timedelta
 
+from repositories.phase_queue_repository import default_worker_id
+
+from services.hopper_sorter import claim_phases, get_phase_scheduler
 from services.phase_queue_service import PhaseQueueService
 
 from .phase_github_notifier import PhaseGitHubNotifier
@@ -38,6 +41,10 @@ class PhaseCoordinator:
     MAX_PHASE_LAUNCH_ATTEMPTS = 3
     PHASE_COOLDOWN_MINUTES = 30
 
+    # Full dependency graph check against the database, for writes made by
+    # other processes (webhook handler, ADW scripts, other server workers)
+    GRAPH_RECONCILE_MINUTES = 5
+
     def __init__(
         self,
         phase_queue_service: PhaseQueueService,
@@ -63,6 +70,12 @@ class PhaseCoordinator:
         self.github_poster = github_poster
         self._is_running = False
         self._task: asyncio.Task | None = None
+        # Identifies this coordinator in phase claims shared with other dispatchers
+        self.worker_id = default_worker_id()
+        # Shared with the hopper and webhook dispatchers (None: priority/FIFO order)
+        self.scheduler = get_phase_scheduler()
+
+        self._graph_reconciled_at: datetime | None = None
 
         # Loop prevention tracking: {queue_id: (attempt_count, last_failure_time)}
         self.phase_attempt_history: dict[str, tuple[int, datetime]] = {}
@@ -87,18 +100,20 @@ class PhaseCoordinator:
         self._is_running = True
         logger.info("[START] PhaseCoordinator started (event-driven mode)")
 
+        # Build the dependency graph, replacing any state left from before a restart
+        self._reconcile_dependency_graph()
+
         # Perform initial scan for ready phases on startup
         logger.info("[STARTUP] Performing initial scan for ready phases...")
         ready_phases = self.phase_queue_service.repository.find_ready_phases()
 
         if ready_phases:
-            logger.info(f"[STARTUP] Found {len(ready_phases)} ready phase(s) to process")
-            for phase in ready_phases:
-                logger.info(
-                    f"[STARTUP] Processing ready phase: queue_id={phase.queue_id}, "
-                    f"feature_id={phase.feature_id}, phase={phase.phase_number}"
-                )
-                await self._launch_phase(phase.to_dict())
+            available_slots = max(0, self.max_concurrent_adws - self._get_running_count())
+            logger.info(
+                f"[STARTUP] Found {len(ready_phases)} ready phase(s) to process, "
+                f"{available_slots} slot(s) available"
+            )
+            await self._launch_phases([phase.to_dict() for phase in ready_phases], available_slots)
         else:
             logger.info("[STARTUP] No ready phases found")
 
@@ -168,6 +183,10 @@ class PhaseCoordinator:
                         f"completed successfully. Attempt history cleared."
                     )
 
+            # The status may have been written by the ADW process itself
+            if queue_id and status:
+                self.phase_queue_service.repository.dependency_graph.set_status(queue_id, status)
+
             # Check if all phases for this feature are complete
             await self._check_feature_completion(feature_id)
 
@@ -191,15 +210,7 @@ class PhaseCoordinator:
             )
 
             # Launch phases in parallel (up to available slots)
-            launched = 0
-            for phase_row in ready_phases[:available_slots]:
-                try:
-                    await self._launch_phase(phase_row)
-                    launched += 1
-                except Exception as e:
-                    logger.error(
-                        f"[ERROR] Failed to launch phase {phase_row['phase_number']}: {e}"
-                    )
+            launched = await self._launch_phases(ready_phases, available_slots)
 
             if launched > 0:
                 logger.info(
@@ -344,84 +355,65 @@ class PhaseCoordinator:
         2. ALL phases in depends_on_phases are 'completed'
         3. No concurrency check (handled by caller)
 
+        Candidates come from the in-memory dependency graph; their rows are
+        then read in one query, which also drops any phase whose status moved
+        on without the graph seeing it. The graph only sees writes made
+        through this process, so when it has no candidates, or a stale one,
+        the feature is re-read from the database before giving up. The whole
+        graph is also reconciled every GRAPH_RECONCILE_MINUTES.
+
         Args:
             feature_id: Feature ID to check
 
         Returns:
             List of phase rows with queue_id, phase_number, depends_on_phases, phase_data
         """
-        with self.phase_queue_service.repository.adapter.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Get all queued phases for this feature
-            cursor.execute(
-                """
-                SELECT queue_id, phase_number, depends_on_phases, phase_data
-                FROM phase_queue
-                WHERE feature_id = %s AND status = 'queued'
-                """,
-                (feature_id,)
-            )
-            queued_phases = cursor.fetchall()
-
-            ready_phases = []
-            for phase in queued_phases:
-                dependencies_json = phase["depends_on_phases"]
-
-                # Parse dependencies (JSONB → Python list)
-                if dependencies_json is None or dependencies_json == '[]':
-                    dependencies = []
-                else:
-                    try:
-                        if isinstance(dependencies_json, str):
-                            dependencies = json.loads(dependencies_json)
-                        elif isinstance(dependencies_json, list):
-                            dependencies = dependencies_json
-                        else:
-                            dependencies = []
-                    except (json.JSONDecodeError, TypeError):
-                        logger.warning(
-                            f"[WARN] Failed to parse depends_on_phases for "
-                            f"phase {phase['phase_number']}: {dependencies_json}"
-                        )
-                        dependencies = []
-
-                # No dependencies → always ready
-                if not dependencies:
-                    logger.debug(
-                        f"[READY] Phase {phase['phase_number']} has no dependencies → READY"
-                    )
-                    ready_phases.append(phase)
-                    continue
+        if self._graph_reconciled_at is None or (
+            datetime.now() - self._graph_reconciled_at > timedelta(minutes=self.GRAPH_RECONCILE_MINUTES)
+        ):
+            self._reconcile_dependency_graph()
+
+        ready_phases, stale = self._ready_phases_from_graph(feature_id)
+        if not ready_phases or stale:
+            if self.phase_queue_service.repository.dependency_graph.resync_feature(feature_id):
+                ready_phases, _ = self._ready_phases_from_graph(feature_id)
+        return ready_phases
+
+    def _ready_phases_from_graph(self, feature_id: int) -> tuple[list[dict], bool]:
+        """
+        Read the graph's ready phases for a feature from the database.
 
-                # Check if ALL dependencies are completed
-                all_complete = True
-                for dep_phase_num in dependencies:
-                    cursor.execute(
-                        """
-                        SELECT status FROM phase_queue
-                        WHERE feature_id = %s AND phase_number = %s
-                        """,
-                        (feature_id, dep_phase_num)
-                    )
-                    dep_row = cursor.fetchone()
-
-                    # Dependency not found OR not completed → block
-                    if not dep_row or dep_row["status"] != "completed":
-                        all_complete = False
-                        logger.debug(
-                            f"[BLOCKED] Phase {phase['phase_number']} waiting for "
-                            f"Phase {dep_phase_num} (status: {dep_row['status'] if dep_row else 'NOT_FOUND'})"
-                        )
-                        break
+        Returns:
+            (phase rows still queued in the database, whether any candidate was stale)
+        """
+        repository = self.phase_queue_service.repository
+        candidates = repository.dependency_graph.ready_phases(feature_id)
+        if not candidates:
+            return [], False
+
+        items = repository.get_by_ids(candidates)
+        ready_phases = []
+        stale = len(items) < len(candidates)  # Deleted without the graph seeing it
+        for item in items:
+            if item.status != "queued":
+                stale = True
+                logger.debug(
+                    f"[BLOCKED] Phase {item.phase_number} is {item.status} in database, "
+                    f"skipping stale graph entry"
+                )
+                continue
+            logger.debug(f"[READY] Phase {item.phase_number} dependencies met → READY")
+            ready_phases.append(item.to_dict())
 
-                if all_complete:
-                    logger.debug(
-                        f"[READY] Phase {phase['phase_number']} dependencies met → READY"
-                    )
-                    ready_phases.append(phase)
+        ready_phases.sort(key=lambda row: row["phase_number"])
+        return ready_phases, stale
 
-            return ready_phases
+    def _reconcile_dependency_graph(self) -> None:
+        """Compare the whole dependency graph with the database and rebuild it if they differ."""
+        problems = self.phase_queue_service.repository.dependency_graph.check_consistency()
+        self._graph_reconciled_at = datetime.now()
+        if problems:
+            logger.info(f"[DEP_GRAPH] Rebuilt phase dependency graph ({len(problems)} stale entries)")
 
     def _get_running_count(self) -> int:
         """
@@ -442,7 +434,61 @@ class PhaseCoordinator:
             row = cursor.fetchone()
             return row["count"] if row else 0
 
-    async def _launch_phase(self, phase_row: dict):
+    async def _launch_phases(self, phase_rows: list[dict], slots: int) -> int:
+        """
+        Claim up to ``slots`` of the given ready phases, then launch them.
+
+        The scheduler (if configured) picks which phases get the slots and
+        charges them to its fair share and budget. The claim is atomic across
+        dispatchers (other coordinator processes, the webhook route), so a
+        phase is launched at most once. It only covers the launch itself: a
+        started phase is 'running' and no longer claimable, and a failed
+        launch should be retryable straight away.
+
+        Args:
+            phase_rows: Database rows with queue_id, phase_number, depends_on_phases, phase_data
+            slots: Free execution slots
+
+        Returns:
+            Number of phases launched
+        """
+        if not phase_rows or slots <= 0:
+            return 0
+        rows = {row["queue_id"]: row for row in phase_rows}
+        repository = self.phase_queue_service.repository
+
+        claimed = claim_phases(
+            repository,
+            self.worker_id,
+            max_parallel=slots,
+            scheduler=self.scheduler,
+            queue_ids=list(rows),
+            statuses=("queued", "ready"),
+        )
+        held = len(rows) - len(claimed)
+        if held:
+            logger.info(
+                f"[CLAIM] {held} ready phase(s) not claimed "
+                f"(no free slot, held by the scheduler, or claimed elsewhere)"
+            )
+
+        launched = 0
+        for item in claimed:
+            phase_row = rows[item.queue_id]
+            try:
+                # Earlier launches can be slow; make sure the claim is still ours
+                if not repository.heartbeat_claim(item.queue_id, self.worker_id):
+                    logger.info(f"[CLAIM] Lost claim on queue_id={item.queue_id}, skipping")
+                    continue
+                await self._launch_claimed_phase(phase_row)
+                launched += 1
+            except Exception as e:
+                logger.error(f"[ERROR] Failed to launch phase {phase_row['phase_number']}: {e}")
+            finally:
+                repository.release_claim(item.queue_id, self.worker_id)
+        return launched
+
+    async def _launch_claimed_phase(self, phase_row: dict):
         """
         Launch a single phase: create isolated issue + start ADW.
 
@@ -515,6 +561,9 @@ class PhaseCoordinator:
             logger.error(f"[ERROR] Failed to create issue for Phase {phase_number}")
             return
 
+        # Issue creation can be slow; keep the claim alive for the start
+        self.phase_queue_service.repository.heartbeat_claim(queue_id, self.worker_id)
+
         # 2. Start ADW workflow
         await self._auto_start_phase(queue_id, issue_number, phase_data)
 
@@ -52,7 +52,11 @@ def init_phase_queue_db():
                     priority INTEGER DEFAULT 50,
                     queue_position INTEGER,
                     ready_timestamp TIMESTAMP,
-                    started_timestamp TIMESTAMP
+                    started_timestamp TIMESTAMP,
+                    claimed_by TEXT,
+                    claimed_at TIMESTAMP,
+                    heartbeat_at TIMESTAMP,
+                    lease_expires_at TIMESTAMP
                 )
             """)
         else:  # sqlite
@@ -73,10 +77,17 @@ def init_phase_queue_db():
                     priority INTEGER DEFAULT 50,
                     queue_position INTEGER,
                     ready_timestamp TIMESTAMP,
-                    started_timestamp TIMESTAMP
+                    started_timestamp TIMESTAMP,
+                    claimed_by TEXT,
+                    claimed_at TIMESTAMP,
+                    heartbeat_at TIMESTAMP,
+                    lease_expires_at TIMESTAMP
                 )
             """)
 
+        # Dispatcher claim columns for tables created before they existed
+        _add_claim_columns(cursor, db_type)
+
         # Create indexes
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_phase_queue_status ON phase_queue(status)
@@ -94,6 +105,11 @@ def init_phase_queue_db():
             CREATE INDEX IF NOT EXISTS idx_phase_queue_adw_id ON phase_queue(adw_id)
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_phase_queue_claim
+            ON phase_queue(status, priority, queue_position)
+        """)
+
         # Create queue_config table for global queue settings
         cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS queue_config (
@@ -111,3 +127,21 @@ def init_phase_queue_db():
         """)
 
         logger.info(f"[DB] Phase queue database initialized (type: {db_type})")
+
+
+CLAIM_COLUMNS = ("claimed_by TEXT", "claimed_at TIMESTAMP", "heartbeat_at TIMESTAMP", "lease_expires_at TIMESTAMP")
+
+
+def _add_claim_columns(cursor, db_type: str) -> None:
+    """Add the phase claim/lease columns to an existing phase_queue table."""
+    if db_type == "postgresql":
+        for column in CLAIM_COLUMNS:
+            cursor.execute(f"ALTER TABLE phase_queue ADD COLUMN IF NOT EXISTS {column}")
+        return
+
+    # SQLite has no ADD COLUMN IF NOT EXISTS
+    cursor.execute("PRAGMA table_info(phase_queue)")
+    existing = {row[1] for row in cursor.fetchall()}
+    for column in CLAIM_COLUMNS:
+        if column.split()[0] not in existing:
+            cursor.execute(f"ALTER TABLE phase_queue ADD COLUMN {column}")
@@ -20,6 +20,7 @@ from typing import Any
 
 from core.models import PlannedFeature, PlannedFeatureCreate, PlannedFeatureUpdate
 from database import get_database_adapter
+from database.change_bus import notify_change
 
 logger = logging.getLogger(__name__)
 
@@ -79,28 +80,34 @@ class PlannedFeaturesService:
             cursor.execute(query, tuple(params))
             rows = cursor.fetchall()
 
-            features = [self._row_to_model(row) for row in rows]
-
-            # Sort in Python (faster for small result sets than complex CASE statements)
-            # Order by: status (in_progress → planned → completed → cancelled)
-            #          priority (high → medium → low)
-            #          created_at (newest first)
-            from datetime import datetime
-
-            status_order = {'in_progress': 1, 'planned': 2, 'completed': 3, 'cancelled': 4}
-            priority_order = {'high': 1, 'medium': 2, 'low': 3}
-
-            features.sort(key=lambda f: (
-                status_order.get(f.status, 5),
-                priority_order.get(f.priority, 4),
-                # Parse ISO string and negate timestamp for DESC order
-                -(datetime.fromisoformat(f.created_at).timestamp() if f.created_at else 0)
-            ))
+            features = self.sort_features([self._row_to_model(row) for row in rows])
             logger.info(
                 f"[{self.__class__.__name__}] Retrieved {len(features)} planned features (offset: {offset})"
             )
             return features
 
+    @staticmethod
+    def sort_features(features: list[PlannedFeature]) -> list[PlannedFeature]:
+        """
+        Sort features for display.
+
+        Sorted in Python (faster for small result sets than complex CASE statements)
+        Order by: status (in_progress → planned → completed → cancelled)
+                  priority (high → medium → low)
+                  created_at (newest first)
+        """
+        from datetime import datetime
+
+        status_order = {'in_progress': 1, 'planned': 2, 'completed': 3, 'cancelled': 4}
+        priority_order = {'high': 1, 'medium': 2, 'low': 3}
+
+        return sorted(features, key=lambda f: (
+            status_order.get(f.status, 5),
+            priority_order.get(f.priority, 4),
+            # Parse ISO string and negate timestamp for DESC order
+            -(datetime.fromisoformat(f.created_at).timestamp() if f.created_at else 0)
+        ))
+
     def get_by_id(self, feature_id: int) -> PlannedFeature | None:
         """
         Get single planned feature by ID.
@@ -130,6 +137,27 @@ class PlannedFeaturesService:
                 )
                 return None
 
+    def get_by_ids(self, feature_ids: list[int]) -> list[PlannedFeature]:
+        """
+        Get several planned features in one query.
+
+        Args:
+            feature_ids: Feature IDs to fetch
+
+        Returns:
+            PlannedFeature objects that exist (missing IDs are omitted)
+        """
+        if not feature_ids:
+            return []
+        with self.adapter.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join(self.adapter.placeholder() for _ in feature_ids)
+            cursor.execute(
+                f"SELECT * FROM planned_features WHERE id IN ({placeholders})",
+                tuple(feature_ids),
+            )
+            return [self._row_to_model(row) for row in cursor.fetchall()]
+
     def get_by_session(self, session_number: int) -> PlannedFeature | None:
         """
         Get planned feature by session number.
@@ -208,6 +236,7 @@ class PlannedFeaturesService:
             logger.info(
                 f"[{self.__class__.__name__}] Created feature {feature_id}: {feature_data.title}"
             )
+        notify_change("planned_features", feature_id)
 
         # Fetch and return the created feature
         return self.get_by_id(feature_id)
@@ -297,6 +326,7 @@ class PlannedFeaturesService:
             conn.commit()
 
         logger.info(f"[{self.__class__.__name__}] Updated feature {feature_id}")
+        notify_change("planned_features", feature_id)
 
         # Trigger post-session hook if session completed
         if (
@@ -0,0 +1,460 @@
+"""
+Per-file QC facts with incremental refresh.
+
+QCMetricsService used to walk the project several times per refresh (one
+rglob per extension, filtering venv/node_modules only after descending into
+them), read every source file to count lines and lint the whole tree. This
+module walks once, pruning skipped directories, and caches per-file facts:
+
+- size and line count
+- naming verdict
+- lint diagnostics (ruff for backend/adws, eslint for frontend)
+
+Facts are keyed by (mtime_ns, size); a file whose stat changed is re-hashed,
+and lint results are kept when the content hash is unchanged (e.g. after a
+checkout that only touched mtimes). Only files without current lint results
+are passed to the linters, split into chunks that run concurrently (each
+chunk is its own linter process). Reading and hashing many changed files, as
+on a cold start, is fanned out over a process pool.
+
+The cache is saved as JSON so a server restart does not re-lint everything.
+
+Example:
+    cache = get_qc_file_cache(project_root)
+    cache.refresh()
+    cache.lint()
+    for facts in cache.files():
+        ...
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Files that QC metrics look at
+QC_SUFFIXES = (".py", ".ts", ".tsx", ".js", ".jsx")
+
+# Directory names never descended into
+SKIP_DIRS = frozenset({
+    ".git", "venv", ".venv", "node_modules", "__pycache__", "dist", "coverage",
+    ".pytest_cache", ".mypy_cache", ".ruff_cache",
+})
+
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("QC_CACHE_DIR") or Path.home() / ".cache" / "tac-webbuilder" / "qc_metrics"
+)
+
+# Below this many changed files, reading them inline beats starting a pool
+PARALLEL_READ_THRESHOLD = 64
+LINT_CHUNK_SIZE = 200
+LINT_TIMEOUT_SECONDS = 30
+
+NAMING_PATTERNS = {
+    "python_file": re.compile(r"^[a-z][a-z0-9_]*\.py$"),
+    "typescript_component": re.compile(r"^[A-Z][A-Za-z0-9]*\.tsx?$"),
+    "typescript_util": re.compile(r"^[a-z][a-zA-Z0-9]*\.tsx?$"),
+}
+
+
+@dataclass(frozen=True)
+class LintTarget:
+    """A subtree linted by one tool."""
+
+    name: str
+    cwd: str  # relative to the project root; the linter runs here
+    source_dir: str  # relative to the project root
+    suffixes: tuple[str, ...]
+    tool: str  # "ruff" or "eslint"
+    config_files: tuple[str, ...]  # relative to the project root
+
+
+LINT_TARGETS = (
+    LintTarget("backend", "app/server", "app/server", (".py",), "ruff",
+               ("ruff.toml", "app/server/pyproject.toml", "app/server/ruff.toml")),
+    LintTarget("adws", "adws", "adws", (".py",), "ruff",
+               ("ruff.toml", "adws/pyproject.toml", "adws/ruff.toml")),
+    LintTarget("frontend", "app/client", "app/client/src", (".ts", ".tsx", ".js", ".jsx"), "eslint",
+               ("app/client/eslint.config.js", "app/client/package.json")),
+)
+
+
+@dataclass
+class FileFacts:
+    """Cached facts about one source file."""
+
+    path: str  # relative to the project root, forward slashes
+    mtime_ns: int
+    size: int
+    sha1: str = ""
+    lines: int | None = None  # None if the file is not valid UTF-8
+    naming_issue: str | None = None
+    naming_severity: str | None = None
+    lint_sha1: str | None = None  # content hash the lint counts belong to
+    lint_errors: int = 0
+    lint_warnings: int = 0
+
+    @property
+    def size_kb(self) -> float:
+        return self.size / 1024
+
+    @property
+    def naming_checked(self) -> bool:
+        return self.path.endswith((".py", ".ts", ".tsx"))
+
+    @property
+    def lint_current(self) -> bool:
+        return self.lint_sha1 is not None and self.lint_sha1 == self.sha1
+
+
+@dataclass
+class LintTotals:
+    """Lint counts for one target."""
+
+    errors: int = 0
+    warnings: int = 0
+
+    @property
+    def issues(self) -> int:
+        return self.errors + self.warnings
+
+
+@dataclass
+class _CacheState:
+    files: dict[str, FileFacts] = field(default_factory=dict)
+    lint_config: dict[str, list] = field(default_factory=dict)
+
+
+def naming_verdict(filename: str) -> tuple[str | None, str | None]:
+    """
+    Check a file name against the naming conventions.
+
+    Returns:
+        (issue, severity), or (None, None) if compliant or not checked
+    """
+    if filename.endswith(".py"):
+        if NAMING_PATTERNS["python_file"].match(filename):
+            return None, None
+        return "Python file should use snake_case", "warning"
+    if filename.endswith(".tsx"):
+        if NAMING_PATTERNS["typescript_component"].match(filename):
+            return None, None
+        return "React component should use PascalCase", "warning"
+    if filename.endswith(".ts"):
+        if NAMING_PATTERNS["typescript_component"].match(filename) or NAMING_PATTERNS["typescript_util"].match(filename):
+            return None, None
+        return "TypeScript file should use camelCase or PascalCase", "info"
+    return None, None
+
+
+def count_lines(data: bytes) -> int | None:
+    """Count lines the way iterating a text-mode file does (universal newlines)."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
+
+def _read_facts(args: tuple[str, str]) -> tuple[str, str, int | None]:
+    """Hash a file and count its lines (runs in worker processes)."""
+    path, full_path = args
+    try:
+        with open(full_path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        logger.warning(f"Error reading file {full_path}: {e}")
+        return path, "", None
+    return path, hashlib.sha1(data).hexdigest(), count_lines(data)
+
+
+class QCFileCache:
+    """Thread-safe cache of per-file QC facts for one project."""
+
+    def __init__(self, project_root: Path, cache_path: Path | str | None = None, max_workers: int | None = None):
+        """
+        Args:
+            project_root: Root directory of the project
+            cache_path: JSON file for the cache (None = a file named after the
+                root in DEFAULT_CACHE_DIR, "" = do not persist)
+            max_workers: Worker processes/linter runs in parallel (None = CPU count)
+        """
+        self.project_root = Path(project_root).resolve()
+        if cache_path is None:
+            digest = hashlib.sha256(str(self.project_root).encode()).hexdigest()[:16]
+            cache_path = DEFAULT_CACHE_DIR / f"{self.project_root.name}-{digest}.json"
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self._lock = threading.RLock()
+        self._state = self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> _CacheState:
+        if self.cache_path is None or not self.cache_path.exists():
+            return _CacheState()
+        try:
+            data = json.loads(self.cache_path.read_text())
+            if data.get("version") != CACHE_VERSION:
+                return _CacheState()
+            return _CacheState(
+                files={entry["path"]: FileFacts(**entry) for entry in data["files"]},
+                lint_config=data.get("lint_config", {}),
+            )
+        except Exception as e:
+            logger.warning(f"[QC_CACHE] Ignoring unreadable cache {self.cache_path}: {e}")
+            return _CacheState()
+
+    def save(self) -> None:
+        """Write the cache to disk (atomically)."""
+        if self.cache_path is None:
+            return
+        with self._lock:
+            data = {
+                "version": CACHE_VERSION,
+                "files": [asdict(facts) for facts in self._state.files.values()],
+                "lint_config": self._state.lint_config,
+            }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"[QC_CACHE] Could not save {self.cache_path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> set[str]:
+        """
+        Walk the project and update facts for added or changed files.
+
+        Returns:
+            Relative paths that were added, changed or removed
+        """
+        with self._lock:
+            files = self._state.files
+            current = self._walk()
+            changed = {path for path, key in current.items()
+                       if path not in files or (files[path].mtime_ns, files[path].size) != key}
+            removed = set(files) - set(current)
+
+            for path in removed:
+                del files[path]
+
+            for path, sha1, lines in self._read_all(sorted(changed)):
+                mtime_ns, size = current[path]
+                facts = files.get(path)
+                if facts is None:
+                    issue, severity = naming_verdict(path.rsplit("/", 1)[-1])
+                    facts = files[path] = FileFacts(
+                        path=path, mtime_ns=mtime_ns, size=size,
+                        naming_issue=issue, naming_severity=severity,
+                    )
+                facts.mtime_ns, facts.size, facts.sha1, facts.lines = mtime_ns, size, sha1, lines
+                if not sha1:
+                    facts.mtime_ns = -1  # unreadable: retry on the next refresh
+
+            if changed or removed:
+                logger.debug(f"[QC_CACHE] {len(changed)} changed, {len(removed)} removed")
+                self.save()
+            return changed | removed
+
+    def _walk(self) -> dict[str, tuple[int, int]]:
+        stats: dict[str, tuple[int, int]] = {}
+        root = str(self.project_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            for name in filenames:
+                if not name.endswith(QC_SUFFIXES):
+                    continue
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                stats[prefix + name] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def _read_all(self, paths: list[str]) -> Iterable[tuple[str, str, int | None]]:
+        jobs = [(path, str(self.project_root / path)) for path in paths]
+        if len(jobs) < PARALLEL_READ_THRESHOLD or self.max_workers < 2:
+            return [_read_facts(job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(_read_facts, jobs, chunksize=32))
+
+    # ------------------------------------------------------------------
+    # Linting
+    # ------------------------------------------------------------------
+
+    def lint(self) -> dict[str, LintTotals]:
+        """
+        Lint files without current results and total diagnostics per target.
+
+        Files whose linter run fails keep no result and are retried on the
+        next call; they count as clean meanwhile.
+
+        Returns:
+            {target name: LintTotals}
+        """
+        with self._lock:
+            pending: list[tuple[LintTarget, list[str]]] = []
+            for target in LINT_TARGETS:
+                files = self._target_files(target)
+                fingerprint = self._config_fingerprint(target)
+                if self._state.lint_config.get(target.name) != fingerprint:
+                    # Linter configuration changed: every result is stale
+                    for facts in files:
+                        facts.lint_sha1 = None
+                    self._state.lint_config[target.name] = fingerprint
+                stale = [facts.path for facts in files if not facts.lint_current]
+                for start in range(0, len(stale), LINT_CHUNK_SIZE):
+                    pending.append((target, stale[start:start + LINT_CHUNK_SIZE]))
+
+            if pending:
+                # Each chunk is a separate linter process, so threads are enough to run them in parallel
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    outcomes = list(pool.map(lambda job: self._run_linter(*job), pending))
+                for (_target, chunk), counts in zip(pending, outcomes, strict=True):
+                    if counts is None:
+                        continue
+                    for path in chunk:
+                        facts = self._state.files.get(path)
+                        if facts is not None:
+                            facts.lint_errors, facts.lint_warnings = counts.get(path, (0, 0))
+                            facts.lint_sha1 = facts.sha1
+                self.save()
+
+            totals = {}
+            for target in LINT_TARGETS:
+                total = LintTotals()
+                for facts in self._target_files(target):
+                    if facts.lint_current:
+                        total.errors += facts.lint_errors
+                        total.warnings += facts.lint_warnings
+                totals[target.name] = total
+            return totals
+
+    def _target_files(self, target: LintTarget) -> list[FileFacts]:
+        prefix = target.source_dir + "/"
+        return [
+            facts for path, facts in self._state.files.items()
+            if path.startswith(prefix) and path.endswith(target.suffixes) and facts.sha1
+        ]
+
+    def _config_fingerprint(self, target: LintTarget) -> list:
+        fingerprint = []
+        for config_file in target.config_files:
+            try:
+                st = (self.project_root / config_file).stat()
+                fingerprint.append([config_file, st.st_mtime_ns, st.st_size])
+            except OSError:
+                fingerprint.append([config_file, None, None])
+        return fingerprint
+
+    def _run_linter(self, target: LintTarget, paths: list[str]) -> dict[str, tuple[int, int]] | None:
+        """
+        Lint some files of one target.
+
+        Returns:
+            {path: (errors, warnings)} for files with diagnostics, or None if
+            the linter could not be run or its output not parsed
+        """
+        cwd = self.project_root / target.cwd
+        relative = [os.path.relpath(self.project_root / path, cwd) for path in paths]
+        if target.tool == "ruff":
+            command = ["uv", "run", "ruff", "check", "--output-format=json", "--force-exclude", *relative]
+        else:
+            command = ["npx", "eslint", "--format=json", *relative]
+
+        try:
+            result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, timeout=LINT_TIMEOUT_SECONDS)
+            output = json.loads(result.stdout) if result.stdout else None
+        except json.JSONDecodeError:
+            logger.warning(f"Could not parse {target.tool} output")
+            return None
+        except Exception as e:
+            logger.error(f"Error running {target.tool}: {e}")
+            return None
+        if output is None:
+            if result.returncode != 0:
+                logger.error(f"Error running {target.tool}: {result.stderr.strip()[:500]}")
+                return None
+            output = []
+
+        counts: dict[str, tuple[int, int]] = {}
+        if target.tool == "ruff":
+            # Ruff doesn't distinguish errors/warnings, consider all as warnings
+            for diagnostic in output:
+                path = self._relative(diagnostic.get("filename", ""))
+                errors, warnings = counts.get(path, (0, 0))
+                counts[path] = (errors, warnings + 1)
+        else:
+            for file_result in output:
+                path = self._relative(file_result.get("filePath", ""))
+                errors = warnings = 0
+                for message in file_result.get("messages", []):
+                    if message.get("message", "").startswith("File ignored"):
+                        continue
+                    if message.get("severity") == 2:
+                        errors += 1
+                    else:
+                        warnings += 1
+                counts[path] = (errors, warnings)
+        return counts
+
+    def _relative(self, filename: str) -> str:
+        try:
+            return Path(filename).resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return filename
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def files(self) -> list[FileFacts]:
+        """All cached facts, ordered by path."""
+        with self._lock:
+            return [self._state.files[path] for path in sorted(self._state.files)]
+
+
+# Shared caches, one per project root
+_caches: dict[str, QCFileCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_qc_file_cache(project_root: Path | str) -> QCFileCache:
+    """
+    Get the shared file cache for a project.
+
+    Args:
+        project_root: Root directory of the project
+
+    Returns:
+        QCFileCache shared by all callers using the same root
+    """
+    key = os.path.realpath(str(project_root))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = QCFileCache(Path(key))
+            _caches[key] = cache
+        return cache
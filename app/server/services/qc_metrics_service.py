@@ -17,6 +17,8 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from services.qc_file_cache import QCFileCache, get_qc_file_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,11 +82,13 @@ class QCMetrics:
 class QCMetricsService:
     """Service for analyzing codebase quality metrics."""
 
-    def __init__(self, project_root: Path | None = None):
+    def __init__(self, project_root: Path | None = None, file_cache: QCFileCache | None = None):
         """Initialize QC metrics service.
 
         Args:
             project_root: Root directory of the project. Defaults to tac-webbuilder root.
+            file_cache: Per-file facts cache. Defaults to the one shared by all
+                services for project_root.
         """
         if project_root is None:
             # Default to the tac-webbuilder root (3 levels up from this file)
@@ -92,6 +96,8 @@ class QCMetricsService:
         else:
             self.project_root = Path(project_root)
 
+        self.file_cache = file_cache or get_qc_file_cache(self.project_root)
+
         logger.info(f"QCMetricsService initialized with project root: {self.project_root}")
 
     async def get_coverage_metrics(self) -> CoverageMetrics:
@@ -432,72 +438,21 @@ class QCMetricsService:
         Checks:
         - Python files use snake_case
         - TypeScript/React files use PascalCase for components, camelCase for utils
-        - Folders use kebab-case or snake_case
 
         Returns:
             Naming convention compliance metrics
         """
-        violations = []
-        total_files = 0
-        compliant_files = 0
-
-        # Define naming patterns
-        patterns = {
-            'python_file': re.compile(r'^[a-z][a-z0-9_]*\.py$'),
-            'typescript_component': re.compile(r'^[A-Z][A-Za-z0-9]*\.tsx?$'),
-            'typescript_util': re.compile(r'^[a-z][a-zA-Z0-9]*\.tsx?$'),
-            'folder': re.compile(r'^[a-z][a-z0-9_-]*$'),
-        }
-
-        # Check Python files (excluding venv/node_modules BEFORE enumeration)
-        for py_file in self.project_root.rglob('*.py'):
-            # Fast path filtering - check string representation for exclusions
-            file_str = str(py_file)
-            if any(exclude in file_str for exclude in ['venv', '.venv', 'node_modules', '__pycache__', '.git']):
-                continue
-
-            total_files += 1
-            filename = py_file.name
-
-            if patterns['python_file'].match(filename):
-                compliant_files += 1
-            else:
-                violations.append({
-                    'file': str(py_file.relative_to(self.project_root)),
-                    'issue': 'Python file should use snake_case',
-                    'severity': 'warning'
-                })
-
-        # Check TypeScript/React files (excluding node_modules BEFORE enumeration)
-        for ts_file in self.project_root.rglob('*.ts*'):
-            # Fast path filtering - check string representation for exclusions
-            file_str = str(ts_file)
-            if any(exclude in file_str for exclude in ['node_modules', 'venv', '.venv', 'dist', 'coverage', '.git']):
-                continue
-
-            total_files += 1
-            filename = ts_file.name
-
-            # Components should be PascalCase
-            if filename.endswith('.tsx'):
-                if patterns['typescript_component'].match(filename):
-                    compliant_files += 1
-                else:
-                    violations.append({
-                        'file': str(ts_file.relative_to(self.project_root)),
-                        'issue': 'React component should use PascalCase',
-                        'severity': 'warning'
-                    })
-            # Utils can be camelCase or PascalCase
-            else:
-                if patterns['typescript_component'].match(filename) or patterns['typescript_util'].match(filename):
-                    compliant_files += 1
-                else:
-                    violations.append({
-                        'file': str(ts_file.relative_to(self.project_root)),
-                        'issue': 'TypeScript file should use camelCase or PascalCase',
-                        'severity': 'info'
-                    })
+        self.file_cache.refresh()
+        checked = [facts for facts in self.file_cache.files() if facts.naming_checked]
+
+        # Python violations first, then TypeScript
+        violations = [
+            {'file': facts.path, 'issue': facts.naming_issue, 'severity': facts.naming_severity}
+            for facts in sorted(checked, key=lambda facts: not facts.path.endswith('.py'))
+            if facts.naming_issue
+        ]
+        total_files = len(checked)
+        compliant_files = total_files - len(violations)
 
         compliance_rate = (compliant_files / total_files * 100) if total_files > 0 else 100.0
 
@@ -514,52 +469,35 @@ class QCMetricsService:
         Returns:
             File structure metrics including oversized files and misplaced files
         """
-        total_files = 0
         oversized_files = []
         long_files = []
-        total_size = 0
 
         # Define thresholds
         MAX_FILE_SIZE_KB = 500  # 500 KB
         MAX_FILE_LINES = 1000   # 1000 lines
 
-        # Check all code files (excluding venv/node_modules BEFORE enumeration)
-        for ext in ['*.py', '*.ts', '*.tsx', '*.js', '*.jsx']:
-            for file in self.project_root.rglob(ext):
-                # Fast path filtering - check string representation for exclusions
-                file_str = str(file)
-                if any(exclude in file_str for exclude in ['venv', '.venv', 'node_modules', 'dist', 'coverage', '__pycache__', '.git']):
-                    continue
-
-                total_files += 1
-
-                # Check file size
-                size_kb = file.stat().st_size / 1024
-                total_size += size_kb
-
-                if size_kb > MAX_FILE_SIZE_KB:
-                    oversized_files.append({
-                        'file': str(file.relative_to(self.project_root)),
-                        'size_kb': round(size_kb, 2)
-                    })
-
-                # Check line count
-                try:
-                    with open(file, encoding='utf-8') as f:
-                        line_count = sum(1 for _ in f)
-
-                    if line_count > MAX_FILE_LINES:
-                        long_files.append({
-                            'file': str(file.relative_to(self.project_root)),
-                            'lines': line_count
-                        })
-                except Exception as e:
-                    logger.warning(f"Error reading file {file}: {e}")
-
-        avg_size = (total_size / total_files) if total_files > 0 else 0.0
+        self.file_cache.refresh()
+        files = self.file_cache.files()
+        total_size = sum(facts.size_kb for facts in files)
+
+        for facts in files:
+            if facts.size_kb > MAX_FILE_SIZE_KB:
+                oversized_files.append({
+                    'file': facts.path,
+                    'size_kb': round(facts.size_kb, 2)
+                })
+
+            # Line count is None for files that are not valid UTF-8
+            if facts.lines is not None and facts.lines > MAX_FILE_LINES:
+                long_files.append({
+                    'file': facts.path,
+                    'lines': facts.lines
+                })
+
+        avg_size = (total_size / len(files)) if files else 0.0
 
         return FileStructureMetrics(
-            total_files=total_files,
+            total_files=len(files),
             oversized_files=oversized_files[:20],  # Top 20 largest
             long_files=sorted(long_files, key=lambda x: x['lines'], reverse=True)[:20],  # Top 20 longest
             misplaced_files=[],  # Could add logic to detect misplaced files
@@ -567,74 +505,29 @@ class QCMetricsService:
         )
 
     def get_linting_metrics(self) -> LintingMetrics:
-        """Get linting issue counts from backend and frontend.
+        """Get linting issue counts from backend, ADWs and frontend.
+
+        Only files changed since their last lint are passed to ruff/eslint;
+        see QCFileCache.lint().
 
         Returns:
-            Linting metrics from ruff/mypy (backend) and eslint (frontend)
+            Linting metrics from ruff (backend, ADWs) and eslint (frontend)
         """
-        backend_issues = 0
-        backend_errors = 0
-        backend_warnings = 0
-        frontend_issues = 0
-        frontend_errors = 0
-        frontend_warnings = 0
-
-        # Backend: Ruff check
-        try:
-            result = subprocess.run(
-                ["uv", "run", "ruff", "check", ".", "--output-format=json"],
-                cwd=self.project_root / "app" / "server",
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.stdout:
-                try:
-                    issues = json.loads(result.stdout)
-                    backend_issues = len(issues)
-                    # Ruff doesn't distinguish errors/warnings, consider all as warnings
-                    backend_warnings = backend_issues
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse ruff output")
-
-        except Exception as e:
-            logger.error(f"Error running ruff: {e}")
-
-        # Frontend: ESLint
-        try:
-            result = subprocess.run(
-                ["npx", "eslint", "src/", "--format=json"],
-                cwd=self.project_root / "app" / "client",
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.stdout:
-                try:
-                    eslint_results = json.loads(result.stdout)
-                    for file_result in eslint_results:
-                        for message in file_result.get('messages', []):
-                            frontend_issues += 1
-                            if message.get('severity') == 2:
-                                frontend_errors += 1
-                            else:
-                                frontend_warnings += 1
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse eslint output")
-
-        except Exception as e:
-            logger.error(f"Error running eslint: {e}")
+        self.file_cache.refresh()
+        totals = self.file_cache.lint()
+        backend, adws, frontend = totals['backend'], totals['adws'], totals['frontend']
 
         return LintingMetrics(
-            backend_issues=backend_issues,
-            frontend_issues=frontend_issues,
-            backend_errors=backend_errors,
-            backend_warnings=backend_warnings,
-            frontend_errors=frontend_errors,
-            frontend_warnings=frontend_warnings,
-            total_issues=backend_issues + frontend_issues
+            backend_issues=backend.issues,
+            frontend_issues=frontend.issues,
+            adws_issues=adws.issues,
+            backend_errors=backend.errors,
+            backend_warnings=backend.warnings,
+            frontend_errors=frontend.errors,
+            frontend_warnings=frontend.warnings,
+            adws_errors=adws.errors,
+            adws_warnings=adws.warnings,
+            total_issues=backend.issues + frontend.issues + adws.issues
         )
 
     def calculate_overall_score(
@@ -697,12 +590,12 @@ class QCMetricsService:
 
         logger.info("Gathering all QC metrics (parallelized)...")
 
-        # Run coverage async, others are CPU-bound file operations
+        # Run coverage async, others read the shared file cache (refreshed once, under its lock)
         coverage, naming, file_structure, linting = await asyncio.gather(
             self.get_coverage_metrics(),  # async - parallelizes subprocesses
-            asyncio.to_thread(self.get_naming_convention_metrics),  # CPU-bound - run in thread
-            asyncio.to_thread(self.get_file_structure_metrics),  # CPU-bound - run in thread
-            asyncio.to_thread(self.get_linting_metrics),  # CPU-bound with subprocess
+            asyncio.to_thread(self.get_naming_convention_metrics),  # cached file facts - run in thread
+            asyncio.to_thread(self.get_file_structure_metrics),  # cached file facts - run in thread
+            asyncio.to_thread(self.get_linting_metrics),  # lints changed files only
             return_exceptions=True
         )
 
@@ -718,7 +611,7 @@ class QCMetricsService:
             file_structure = FileStructureMetrics(0, [], [], [], 0.0)
         if isinstance(linting, Exception):
             logger.error(f"Linting metrics failed: {linting}")
-            linting = LintingMetrics(0, 0, 0, 0, 0, 0, 0)
+            linting = LintingMetrics(0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
 
         overall_score = self.calculate_overall_score(
             coverage, naming, file_structure, linting
@@ -0,0 +1,137 @@
+"""
+JSON Patch Deltas for Broadcast State
+
+Produces RFC 6902 style operations ("add", "remove", "replace") that turn one
+JSON-compatible value into another. Used by ConnectionManager.publish() to send
+dashboards only what changed between two versions of a channel.
+
+Lists are diffed by trimming the common prefix and suffix, so inserting or
+removing items at either end of a long list (new workflow at the top, oldest
+one dropping off the bottom) produces a handful of operations instead of a
+replace for every shifted index.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value deterministically (sorted keys, compact separators)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def content_hash(serialized: str) -> str:
+    """Return a short content digest of a serialized payload."""
+    return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+
+def _escape(token: str | int) -> str:
+    """Escape a JSON Pointer reference token."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[dict]:
+    """
+    Compute the operations that transform ``old`` into ``new``.
+
+    Args:
+        old: Previous value
+        new: Current value
+        path: JSON Pointer of the values being compared (root is "")
+
+    Returns:
+        List of {"op", "path", ["value"]} dicts, applied in order
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old.keys() - new.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_lists(old, new, path)
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _diff_lists(old: list, new: list, path: str) -> list[dict]:
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]
+    ):
+        suffix += 1
+
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+
+    if len(old_mid) == len(new_mid):
+        ops = []
+        for offset, (before, after) in enumerate(zip(old_mid, new_mid, strict=True)):
+            ops.extend(diff(before, after, f"{path}/{prefix + offset}"))
+        return ops
+
+    # Length changed: update the overlap in place, then remove or add the rest
+    common = min(len(old_mid), len(new_mid))
+    ops = []
+    for offset in range(common):
+        ops.extend(diff(old_mid[offset], new_mid[offset], f"{path}/{prefix + offset}"))
+    # Remove from the highest index down so earlier indices stay valid
+    for offset in range(len(old_mid) - 1, common - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{prefix + offset}"})
+    for offset in range(common, len(new_mid)):
+        ops.append({"op": "add", "path": f"{path}/{prefix + offset}", "value": new_mid[offset]})
+    return ops
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply_patch(value: Any, ops: list[dict]) -> Any:
+    """
+    Apply operations produced by diff() to a deep copy of ``value``.
+
+    This mirrors the client-side implementation and is used in tests and
+    benchmarks to verify round trips.
+    """
+    doc = json.loads(json.dumps(value, default=str))
+    for op in ops:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = op.get("value")
+            continue
+
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
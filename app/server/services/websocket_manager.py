@@ -19,15 +19,164 @@ Usage:
 
     # Broadcasting updates
     await manager.broadcast({"type": "workflow_update", "data": {...}})
+
+    # Publishing watched state (versioned, deduplicated, delta-encoded)
+    await manager.publish("queue_update", queue_data)
+
+Delivery:
+    Every connection has a bounded outbound queue drained by its own writer
+    task, so broadcast() and publish() only serialize the message once and
+    enqueue it; they never wait on a client's network. A slow consumer's
+    queue coalesces versioned channel messages (only the newest state of a
+    channel is kept, as a full snapshot) and drops the oldest plain events
+    once it reaches WS_CLIENT_QUEUE_SIZE. A send that takes longer than
+    WS_SEND_TIMEOUT_SECONDS disconnects the client. queue_stats() reports
+    per-client queue depth and drop/coalesce counters.
+
+Versioned channels:
+    publish() keeps one channel per message type with a monotonically
+    increasing version and a content hash of the last state. Unchanged state
+    is dropped after one serialization. Changed state is sent as a full
+    message ({"type", "data", "version"}) to ordinary clients, and as a
+    {"type": "delta", "channel", "version", "base_version", "ops"} patch to
+    clients that sent {"type": "client_ready", "deltas": true}. Delta clients
+    that see a version gap send {"type": "resync", "channel"} and get a full
+    snapshot back. Payloads are serialized once per publish, not per client.
 """
 
+import asyncio
 import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
 
 from fastapi import WebSocket
 
+from services.state_delta import canonical_json, content_hash, diff
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ChannelState:
+    """Last published state of a versioned channel."""
+
+    version: int
+    digest: str
+    data: Any
+    snapshot_json: str
+
+
+class ClientQueue:
+    """
+    Bounded outbound queue and writer task for one WebSocket connection.
+
+    Entries are pre-serialized payloads with an optional coalesce key. A new
+    entry with the same key as a pending one replaces it in place, so a slow
+    client only ever has the newest state of each channel waiting. When the
+    queue is full the oldest unkeyed entry is dropped.
+    """
+
+    def __init__(self, websocket: WebSocket, max_depth: int, send_timeout: float, on_failure):
+        self.websocket = websocket
+        self.max_depth = max_depth
+        self.send_timeout = send_timeout
+        self.pending: deque[tuple[str | None, str]] = deque()
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_water = 0
+        self._on_failure = on_failure
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    def put(self, payload: str, key: str | None = None, standalone: str | None = None) -> None:
+        """
+        Queue a payload for this connection.
+
+        Args:
+            payload: Serialized message
+            key: Coalesce key (channel name) or None for plain events
+            standalone: Self-contained replacement used when coalescing a
+                payload that depends on the entry it replaces (deltas)
+        """
+        if self._closed:
+            return
+
+        if key is not None:
+            for index, (pending_key, _) in enumerate(self.pending):
+                if pending_key == key:
+                    self.pending[index] = (key, standalone or payload)
+                    self.coalesced += 1
+                    return
+
+        if len(self.pending) >= self.max_depth:
+            self._drop_oldest()
+        self.pending.append((key, payload))
+        self.high_water = max(self.high_water, len(self.pending))
+
+        self._idle.clear()
+        self._wakeup.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def _drop_oldest(self) -> None:
+        for index, (pending_key, _) in enumerate(self.pending):
+            if pending_key is None:
+                del self.pending[index]
+                break
+        else:
+            self.pending.popleft()
+        self.dropped += 1
+        logger.debug(f"[WS] Client queue full ({self.max_depth}), dropped oldest message")
+
+    async def _run(self) -> None:
+        while not self._closed:
+            if not self.pending:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            _, payload = self.pending.popleft()
+            try:
+                async with asyncio.timeout(self.send_timeout):
+                    await self.websocket.send_text(payload)
+            except Exception as e:
+                logger.error(f"[WS] Error broadcasting to client: {e!r}")
+                self._on_failure(self.websocket)
+                return
+            self.sent += 1
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued payload has been sent (or the queue closed)."""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the writer task and discard pending payloads."""
+        self._closed = True
+        self.pending.clear()
+        self._idle.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def stats(self) -> dict:
+        client = getattr(self.websocket, "client", None)
+        return {
+            "client": f"{client.host}:{client.port}" if client else None,
+            "depth": len(self.pending),
+            "max_depth": self.max_depth,
+            "high_water": self.high_water,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections and broadcasts messages to all active clients.
@@ -47,6 +196,9 @@ class ConnectionManager:
         last_history_state: Last broadcast history state (used to prevent redundant broadcasts)
         last_adw_monitor_state: Last broadcast ADW monitor state (used to prevent redundant broadcasts)
         event_subscribers: Dict mapping event types to lists of async handler callables
+        channels: Dict mapping message types to their last published ChannelState
+        delta_connections: Connections that asked for delta updates
+        client_queues: Dict mapping connections to their outbound ClientQueue
 
     Example:
         >>> manager = ConnectionManager()
@@ -59,8 +211,15 @@ class ConnectionManager:
         >>> manager.subscribe("workflow_completed", my_handler)
     """
 
-    def __init__(self):
-        """Initialize the ConnectionManager with empty connection set and state tracking."""
+    def __init__(self, max_queue_depth: int | None = None, send_timeout: float | None = None):
+        """
+        Initialize the ConnectionManager with empty connection set and state tracking.
+
+        Args:
+            max_queue_depth: Per-client outbound queue bound (default WS_CLIENT_QUEUE_SIZE or 64)
+            send_timeout: Seconds a single send may take before the client is
+                dropped (default WS_SEND_TIMEOUT_SECONDS or 10)
+        """
         self.active_connections: set[WebSocket] = set()
         self.last_workflow_state: dict | None = None
         self.last_routes_state: dict | None = None
@@ -70,6 +229,15 @@ class ConnectionManager:
         # Event subscription system for internal listeners (e.g., PhaseCoordinator)
         self.event_subscribers: dict[str, list[callable]] = {}
 
+        # Versioned state channels for publish()
+        self.channels: dict[str, ChannelState] = {}
+        self.delta_connections: set[WebSocket] = set()
+
+        # Per-connection outbound queues drained by writer tasks
+        self.client_queues: dict[WebSocket, ClientQueue] = {}
+        self.max_queue_depth = max_queue_depth or int(os.environ.get("WS_CLIENT_QUEUE_SIZE", "64"))
+        self.send_timeout = send_timeout or float(os.environ.get("WS_SEND_TIMEOUT_SECONDS", "10"))
+
     async def connect(self, websocket: WebSocket) -> None:
         """
         Accept and register a new WebSocket connection.
@@ -105,6 +273,10 @@ class ConnectionManager:
             [WS] Client disconnected. Total connections: 0
         """
         self.active_connections.discard(websocket)
+        self.delta_connections.discard(websocket)
+        queue = self.client_queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
         logger.debug(f"[WS] Client disconnected. Total connections: {len(self.active_connections)}")
 
     def subscribe(self, event_type: str, handler: callable) -> None:
@@ -139,11 +311,10 @@ class ConnectionManager:
         """
         Broadcast a message to all active WebSocket connections AND event subscribers.
 
-        This method attempts to send the provided message to all connected clients.
-        If a send operation fails (e.g., due to a disconnected client), the error
-        is logged and the problematic connection is tracked for cleanup. After
-        attempting to send to all clients, any disconnected clients are automatically
-        removed from the active connections set.
+        The message is serialized once and queued for every connected client;
+        each client's writer task delivers it independently, so a slow or
+        stalled client never delays the others or the caller. Clients whose
+        send fails or times out are removed from the active connections set.
 
         Additionally, the message is dispatched to any registered event subscribers
         based on the message type.
@@ -155,36 +326,27 @@ class ConnectionManager:
             >>> await manager.broadcast({"type": "workflow_completed", "data": {...}})
             [WS] Broadcasting message to 3 clients
             [WS] Dispatching to 2 workflow_completed subscribers
-            [WS] Broadcast successful to 3 clients
 
         Note:
-            - Failed connections are automatically cleaned up
+            - Failed connections are automatically cleaned up by their writer task
             - Individual client errors don't prevent broadcasts to other clients
-            - All exceptions during broadcast are logged with full details
-            - Event subscribers are called asynchronously and errors are logged
+            - Event subscribers run right after queueing, independent of client delivery
+            - Use flush() to wait until queued messages have been sent
         """
-        # 1. Broadcast to WebSocket clients (existing logic)
+        # 1. Queue for WebSocket clients
         if self.active_connections:
             logger.debug(f"[WS] Broadcasting message to {len(self.active_connections)} clients")
-            disconnected = set()
-
-            # Create a snapshot to avoid "Set changed size during iteration" error
-            # if connections are added/removed concurrently
+            payload = canonical_json(message)
             for connection in list(self.active_connections):
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.error(f"[WS] Error broadcasting to client: {e}")
-                    disconnected.add(connection)
-
-            # Clean up disconnected clients
-            for connection in disconnected:
-                self.disconnect(connection)
-
-            if not disconnected:
-                logger.debug(f"[WS] Broadcast successful to {len(self.active_connections)} clients")
+                self._queue_for(connection).put(payload)
+            # Let writer tasks pick the message up before a burst of broadcasts fills their queues
+            await asyncio.sleep(0)
 
         # 2. Dispatch to event subscribers
+        await self._dispatch_to_subscribers(message)
+
+    async def _dispatch_to_subscribers(self, message: dict) -> None:
+        """Invoke event subscribers registered for the message type."""
         event_type = message.get("type")
 
         if event_type and event_type in self.event_subscribers:
@@ -201,6 +363,126 @@ class ConnectionManager:
                         exc_info=True
                     )
 
+    def enable_deltas(self, websocket: WebSocket) -> None:
+        """Send delta messages instead of full payloads to this connection."""
+        self.delta_connections.add(websocket)
+        logger.debug("[WS] Client opted in to delta updates")
+
+    def _advance(self, channel: str, data: Any) -> tuple[ChannelState, list[dict] | None] | None:
+        """
+        Record new channel state if its content changed.
+
+        Returns:
+            None if unchanged, otherwise (new state, ops from the previous
+            version or None when there is no previous version)
+        """
+        snapshot_json = canonical_json({"type": channel, "data": data})
+        digest = content_hash(snapshot_json)
+        previous = self.channels.get(channel)
+        if previous and previous.digest == digest:
+            return None
+
+        version = previous.version + 1 if previous else 1
+        state = ChannelState(
+            version=version,
+            digest=digest,
+            data=data,
+            # Versioned full message, built once and reused for every client
+            snapshot_json=snapshot_json[:-1] + f',"version":{version}}}',
+        )
+        self.channels[channel] = state
+        return state, (diff(previous.data, data) if previous else None)
+
+    def _queue_for(self, websocket: WebSocket) -> ClientQueue:
+        """Return the outbound queue of a connection, creating it on first use."""
+        queue = self.client_queues.get(websocket)
+        if queue is None:
+            queue = ClientQueue(websocket, self.max_queue_depth, self.send_timeout, self.disconnect)
+            self.client_queues[websocket] = queue
+        return queue
+
+    def send(self, websocket: WebSocket, message: dict) -> None:
+        """Queue a message for a single connection, behind anything already queued."""
+        self._queue_for(websocket).put(canonical_json(message))
+
+    async def flush(self) -> None:
+        """Wait until every client queue has been drained."""
+        await asyncio.gather(*(queue.wait_idle() for queue in list(self.client_queues.values())))
+
+    def queue_stats(self) -> list[dict]:
+        """Outbound queue depth and delivery counters for each connection."""
+        return [queue.stats() for queue in list(self.client_queues.values())]
+
+    async def publish(self, channel: str, data: Any, exclude: WebSocket | None = None) -> bool:
+        """
+        Publish the current state of a channel if it changed.
+
+        Ordinary clients receive the full versioned message. Delta clients
+        receive the operations from the previous version, or the full message
+        when that is smaller (or when there is no previous version).
+
+        Args:
+            channel: Message type, e.g. "queue_update"
+            data: JSON-compatible channel state
+            exclude: Connection to skip (used when it gets its own snapshot)
+
+        Returns:
+            True if the state changed and was published, False if unchanged
+        """
+        advanced = self._advance(channel, data)
+        if advanced is None:
+            return False
+        state, ops = advanced
+
+        connections = [c for c in list(self.active_connections) if c is not exclude]
+        if connections:
+            payload = state.snapshot_json
+            delta_payload = payload
+            if ops is not None:
+                delta_json = canonical_json({
+                    "type": "delta",
+                    "channel": channel,
+                    "version": state.version,
+                    "base_version": state.version - 1,
+                    "ops": ops,
+                })
+                if len(delta_json) < len(payload):
+                    delta_payload = delta_json
+
+            delta_clients = 0
+            for connection in connections:
+                if connection in self.delta_connections:
+                    self._queue_for(connection).put(delta_payload, key=channel, standalone=payload)
+                    delta_clients += 1
+                else:
+                    self._queue_for(connection).put(payload, key=channel)
+            await asyncio.sleep(0)
+            logger.debug(
+                f"[WS] Published {channel} v{state.version} to {len(connections)} clients "
+                f"({delta_clients} delta, {len(delta_payload)}/{len(payload)} bytes)"
+            )
+
+        await self._dispatch_to_subscribers({"type": channel, "data": data})
+        return True
+
+    async def send_snapshot(self, websocket: WebSocket, channel: str, data: Any | None = None) -> None:
+        """
+        Send a full versioned snapshot of a channel to one connection.
+
+        Used on connect (with freshly loaded ``data``) and on resync requests
+        (``data`` omitted, last published state is sent). Fresh data that
+        differs from the last published state is published to the other
+        clients first, so every client stays on the same version sequence.
+        """
+        if data is not None:
+            await self.publish(channel, data, exclude=websocket)
+
+        state = self.channels.get(channel)
+        if state is None:
+            logger.debug(f"[WS] No published state for channel '{channel}', skipping snapshot")
+            return
+        self._queue_for(websocket).put(state.snapshot_json, key=channel)
+
 
 # Global singleton instance
 # This ensures all imports use the same instance across module reloads
@@ -8,12 +8,13 @@ This service is responsible for:
 - Running background sync worker for workflow history
 """
 
-import json
 import logging
 import os
 import threading
 import time
+from pathlib import Path
 
+from core.agents_index import get_agents_index
 from core.data_models import (
     CostPrediction,
     Route,
@@ -183,19 +184,18 @@ class WorkflowService:
             )
             return []
 
-        # Scan for workflow directories
-        for adw_id in os.listdir(self.agents_dir):
-            adw_dir = os.path.join(self.agents_dir, adw_id)
-            state_file = os.path.join(adw_dir, "adw_state.json")
+        # Shared incremental index: only changed state files are re-read
+        index = get_agents_index(Path(self.agents_dir))
+        index.refresh()
 
-            # Skip if not a directory or no state file
-            if not os.path.isdir(adw_dir) or not os.path.exists(state_file):
-                continue
+        for entry in index.entries():
+            adw_id = entry.adw_id
 
-            # Read state file
+            # Process cached state
             try:
-                with open(state_file) as f:
-                    state = json.load(f)
+                if entry.error is not None:
+                    raise entry.error
+                state = entry.state
 
                 # Validate issue_number - must be convertible to int
                 issue_num_raw = state.get("issue_number", 0)
@@ -208,13 +208,12 @@ class WorkflowService:
                     )
                     continue
 
-                # Determine current phase by checking which phase directories exist
+                # Determine current phase from the cached phase directory listing
                 phase_order = ["plan", "build", "test", "review", "document", "ship"]
                 current_phase = "plan"  # Default
 
                 for phase in reversed(phase_order):
-                    phase_dir = os.path.join(adw_dir, f"adw_{phase}_iso")
-                    if os.path.exists(phase_dir):
+                    if f"adw_{phase}_iso" in entry.phase_dirs:
                         current_phase = phase
                         break
 
@@ -514,6 +514,7 @@ def cleanup_phase_queue_data(request):
     # Import here to avoid circular dependencies during test collection
     try:
         from database import get_database_adapter
+        from repositories.phase_dependency_graph import get_dependency_graph
 
         # Clean before test
         try:
@@ -527,6 +528,8 @@ def cleanup_phase_queue_data(request):
                 else:
                     cursor.execute("DELETE FROM phase_queue")
                 conn.commit()
+            # Raw SQL bypasses the repository, so drop the in-memory graph too
+            get_dependency_graph(adapter).invalidate()
         except Exception as e:
             # Table might not exist yet for some tests, that's OK
             # But log the error for debugging
@@ -549,6 +552,8 @@ def cleanup_phase_queue_data(request):
                 else:
                     cursor.execute("DELETE FROM phase_queue")
                 conn.commit()
+            # Raw SQL bypasses the repository, so drop the in-memory graph too
+            get_dependency_graph(adapter).invalidate()
         except Exception as e:
             # Ignore cleanup errors (database might be closed)
             import sys
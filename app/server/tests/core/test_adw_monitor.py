@@ -18,6 +18,7 @@ from unittest.mock import Mock, patch
 
 from core.adw_monitor import (
     aggregate_adw_monitor_data,
+    batch_check_running_processes,
     build_workflow_status,
     calculate_phase_progress,
     determine_status,
@@ -128,32 +129,54 @@ class TestScanAdwStates:
 class TestProcessChecking:
     """Test process checking functionality"""
 
-    def test_is_process_running_true(self):
+    def _table(self, tmp_path, cmdlines):
+        from core.process_table import ProcessTable
+
+        for pid, cmdline in cmdlines.items():
+            (tmp_path / str(pid)).mkdir()
+            (tmp_path / str(pid) / "cmdline").write_bytes(cmdline.replace(" ", "\0").encode() + b"\0")
+        return ProcessTable(proc_root=tmp_path)
+
+    def test_is_process_running_true(self, tmp_path):
         """Test when process is running"""
-        mock_result = Mock()
-        mock_result.stdout = "user 1234 python aider.py abc123"
+        table = self._table(tmp_path, {1234: "uv run adw_sdlc_iso.py 42 abc123"})
 
-        with patch('subprocess.run', return_value=mock_result):
+        with patch('core.adw_monitor.get_process_table', return_value=table):
             assert is_process_running("abc123") is True
 
-    def test_is_process_running_false(self):
+    def test_is_process_running_false(self, tmp_path):
         """Test when process is not running"""
-        mock_result = Mock()
-        mock_result.stdout = "user 1234 python other_script.py"
+        table = self._table(tmp_path, {1234: "python other_script.py"})
 
-        with patch('subprocess.run', return_value=mock_result):
+        with patch('core.adw_monitor.get_process_table', return_value=table):
             assert is_process_running("abc123") is False
 
-    def test_is_process_running_timeout(self):
-        """Test process check timeout handling"""
-        from subprocess import TimeoutExpired
+    def test_is_process_running_requires_adw_command(self, tmp_path):
+        """Test that a non-ADW process mentioning the id does not count"""
+        table = self._table(tmp_path, {1234: "tail -f agents/abc123/error.log"})
 
-        with patch('subprocess.run', side_effect=TimeoutExpired("ps", 5)):
+        with patch('core.adw_monitor.get_process_table', return_value=table):
             assert is_process_running("abc123") is False
 
+    def test_batch_matches_single_check(self, tmp_path):
+        """Test that batch and single checks give the same answers"""
+        table = self._table(tmp_path, {
+            1: "uv run adw_plan_iso.py 1 abc123",
+            2: "python aider.py def456",
+            3: "vim ghi789.txt",
+        })
+
+        with patch('core.adw_monitor.get_process_table', return_value=table):
+            batch = batch_check_running_processes(["abc123", "def456", "ghi789", "abc12"])
+            assert batch == {adw_id: is_process_running(adw_id) for adw_id in batch}
+            assert batch == {"abc123": True, "def456": True, "ghi789": False, "abc12": False}
+
     def test_is_process_running_exception(self):
         """Test process check exception handling"""
-        with patch('subprocess.run', side_effect=Exception("Process check failed")):
+        table = Mock()
+        table.is_adw_running.side_effect = Exception("Process check failed")
+
+        with patch('core.adw_monitor.get_process_table', return_value=table):
             assert is_process_running("abc123") is False
 
 
@@ -504,3 +527,75 @@ class TestAggregateAdwMonitorData:
 
             # Should be the same cached data
             assert timestamp1 == timestamp2
+
+
+class TestBulkAggregation:
+    """Test that aggregation loads task_logs data for all workflows at once"""
+
+    def _write_states(self, agents_dir, statuses):
+        for i, status in enumerate(statuses):
+            adw_dir = agents_dir / f"wf{i:04d}"
+            adw_dir.mkdir()
+            (adw_dir / "adw_state.json").write_text(json.dumps({
+                "status": status,
+                "start_time": f"2025-01-01T10:{i % 60:02d}:00",
+            }))
+
+    def _clear_caches(self):
+        from core.adw_monitor import _monitor_cache, _state_scan_cache
+        _monitor_cache["data"] = None
+        _monitor_cache["timestamp"] = None
+        _state_scan_cache["states"] = None
+        _state_scan_cache["timestamp"] = None
+
+    def test_single_task_log_query_for_all_workflows(self, tmp_path):
+        """Progress and cost come from one grouped query, not one per workflow"""
+        from core.models.observability import AdwPhaseSummary
+
+        self._clear_caches()
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        self._write_states(agents_dir, ["completed"] * 50)
+
+        repo = Mock()
+        repo.get_phase_summaries.return_value = {
+            "wf0001": AdwPhaseSummary(
+                adw_id="wf0001", completed_phases=["plan", "build"], total_cost=1.5
+            ),
+        }
+
+        with patch('core.adw_monitor.get_agents_directory', return_value=agents_dir), \
+             patch('core.adw_monitor.batch_check_running_processes', return_value={}), \
+             patch('repositories.task_log_repository.TaskLogRepository', return_value=repo):
+            data = aggregate_adw_monitor_data(use_cache=False)
+
+        assert repo.get_phase_summaries.call_count == 1
+        assert len(repo.get_phase_summaries.call_args.args[0]) == 50
+        assert not repo.get_by_adw_id.called
+
+        workflow = next(w for w in data["workflows"] if w["adw_id"] == "wf0001")
+        assert workflow["phases_completed"] == ["plan", "build"]
+        assert workflow["phase_progress"] == 22.2
+        assert workflow["current_cost"] == 1.5
+
+    def test_status_filter_and_pagination(self, tmp_path):
+        """Filtering and paging happen server-side; the summary still counts everything"""
+        self._clear_caches()
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        self._write_states(agents_dir, ["completed", "failed"] * 10)
+
+        repo = Mock()
+        repo.get_phase_summaries.return_value = {}
+
+        with patch('core.adw_monitor.get_agents_directory', return_value=agents_dir), \
+             patch('core.adw_monitor.batch_check_running_processes', return_value={}), \
+             patch('repositories.task_log_repository.TaskLogRepository', return_value=repo):
+            data = aggregate_adw_monitor_data(status="failed", limit=3, offset=2, use_cache=False)
+
+        assert data["summary"]["total"] == 20
+        assert data["summary"]["failed"] == 10
+        assert len(repo.get_phase_summaries.call_args.args[0]) == 10
+        assert [w["status"] for w in data["workflows"]] == ["failed"] * 3
+        # Most recent first: failed workflows are wf0019, wf0017, ... → page skips two
+        assert [w["adw_id"] for w in data["workflows"]] == ["wf0015", "wf0013", "wf0011"]
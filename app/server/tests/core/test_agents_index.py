@@ -0,0 +1,162 @@
+"""
+Tests for the incremental agents directory index.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from core.agents_index import AgentsDirectoryIndex, get_agents_index
+
+
+def _write_state(agents_dir, adw_id, state):
+    adw_dir = agents_dir / adw_id
+    adw_dir.mkdir(exist_ok=True)
+    state_file = adw_dir / "adw_state.json"
+    state_file.write_text(json.dumps(state))
+    return state_file
+
+
+def _bump_mtime(path, seconds=10):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def agents_dir(tmp_path):
+    path = tmp_path / "agents"
+    path.mkdir()
+    return path
+
+
+class TestRefresh:
+    """Incremental refresh behaviour."""
+
+    def test_initial_refresh_reports_all_added(self, agents_dir):
+        _write_state(agents_dir, "a1", {"issue_number": 1})
+        _write_state(agents_dir, "a2", {"issue_number": 2})
+        (agents_dir / "no-state").mkdir()
+        (agents_dir / "README.md").write_text("not an adw")
+
+        index = AgentsDirectoryIndex(agents_dir)
+        changes = index.refresh()
+
+        assert changes.added == {"a1", "a2"}
+        assert not changes.modified
+        assert {e.adw_id for e in index.entries()} == {"a1", "a2"}
+
+    def test_unchanged_files_are_not_reparsed(self, agents_dir):
+        _write_state(agents_dir, "a1", {"issue_number": 1})
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+
+        with patch("core.agents_index.json.load") as mock_load:
+            changes = index.refresh()
+
+        mock_load.assert_not_called()
+        assert not changes.has_changes
+        assert index.version == 1
+
+    def test_modified_file_is_reparsed(self, agents_dir):
+        state_file = _write_state(agents_dir, "a1", {"status": "running"})
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+
+        state_file.write_text(json.dumps({"status": "completed"}))
+        _bump_mtime(state_file)
+        changes = index.refresh()
+
+        assert changes.modified == {"a1"}
+        assert index.get("a1").state == {"status": "completed"}
+
+    def test_removed_directory_reported(self, agents_dir):
+        state_file = _write_state(agents_dir, "a1", {})
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+
+        state_file.unlink()
+        changes = index.refresh()
+
+        assert changes.removed == {"a1"}
+        assert index.get("a1") is None
+
+    def test_malformed_json_recorded_as_error(self, agents_dir):
+        (agents_dir / "bad").mkdir()
+        (agents_dir / "bad" / "adw_state.json").write_text("{not json")
+
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+
+        entry = index.get("bad")
+        assert entry.state is None
+        assert isinstance(entry.error, json.JSONDecodeError)
+
+
+class TestLayout:
+    """Cached phase directories and error.log tracking."""
+
+    def test_phase_dirs_tracked(self, agents_dir):
+        _write_state(agents_dir, "a1", {})
+        (agents_dir / "a1" / "adw_plan_iso").mkdir()
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+        assert index.get("a1").phase_dirs == ("adw_plan_iso",)
+
+        (agents_dir / "a1" / "adw_build_iso").mkdir()
+        _bump_mtime(agents_dir / "a1")
+        changes = index.refresh()
+
+        assert changes.modified == {"a1"}
+        assert index.get("a1").phase_dirs == ("adw_build_iso", "adw_plan_iso")
+
+    def test_error_log_detected(self, agents_dir):
+        _write_state(agents_dir, "a1", {})
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+        assert not index.get("a1").has_error_log
+
+        (agents_dir / "a1" / "error.log").write_text("boom")
+        changes = index.refresh()
+
+        assert changes.modified == {"a1"}
+        assert index.get("a1").has_error_log
+
+
+class TestChangesSince:
+    """Version-based change sets for multiple consumers."""
+
+    def test_consumers_track_versions_independently(self, agents_dir):
+        _write_state(agents_dir, "a1", {})
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+        consumer_a = index.changes_since(0)
+        assert consumer_a.added == {"a1"}
+
+        state_file = _write_state(agents_dir, "a2", {})
+        _bump_mtime(state_file)
+        index.refresh()
+        (agents_dir / "a1" / "adw_state.json").unlink()
+        index.refresh()
+
+        # Consumer A only sees what happened after its version
+        delta = index.changes_since(consumer_a.version)
+        assert delta.added == {"a2"}
+        assert delta.removed == {"a1"}
+
+        # Consumer B has never synced and sees the current state only
+        full = index.changes_since(0)
+        assert full.added == {"a2"}
+
+    def test_up_to_date_consumer_sees_no_changes(self, agents_dir):
+        _write_state(agents_dir, "a1", {})
+        index = AgentsDirectoryIndex(agents_dir)
+        index.refresh()
+        index.refresh()
+
+        assert not index.changes_since(index.version).has_changes
+
+
+def test_shared_index_per_directory(agents_dir):
+    same = agents_dir / ".." / "agents"
+    assert get_agents_index(agents_dir) is get_agents_index(same)
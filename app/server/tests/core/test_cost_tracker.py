@@ -0,0 +1,145 @@
+"""
+Tests for the cost tracker transcript reader and its per-file cache.
+"""
+
+import json
+import os
+
+import pytest
+from core import cost_tracker
+from core.cost_tracker import clear_transcript_cache, get_transcript_cache_stats, parse_jsonl_file
+
+
+def _result(input_tokens, model="claude-sonnet-4-5"):
+    return {"type": "result", "model": model, "usage": {"input_tokens": input_tokens, "output_tokens": 1}}
+
+
+def _write(path, messages, trailing_newline=True):
+    text = "\n".join(json.dumps(m) for m in messages)
+    path.write_text(text + ("\n" if trailing_newline else ""))
+
+
+def _append(path, messages):
+    with open(path, "a") as f:
+        for m in messages:
+            f.write(json.dumps(m) + "\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _filler(count, size=200):
+    return [{"type": "assistant", "message": {"content": "x" * size}} for _ in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_transcript_cache()
+    yield
+    clear_transcript_cache()
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Force multi-block reads on small files."""
+    monkeypatch.setattr(cost_tracker, "TAIL_BLOCK_SIZE", 97)
+
+
+class TestTailReader:
+    """Reverse-seeking search for the last result message."""
+
+    def test_last_result_wins(self, tmp_path, small_blocks):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, [_result(1), *_filler(20), _result(2), *_filler(3)])
+
+        assert parse_jsonl_file(path)["input_tokens"] == 2
+
+    def test_only_tail_is_read(self, tmp_path):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, [*_filler(5000), _result(7)])
+
+        assert parse_jsonl_file(path)["input_tokens"] == 7
+        assert get_transcript_cache_stats()["bytes_read"] <= cost_tracker.TAIL_BLOCK_SIZE
+        assert path.stat().st_size > 10 * cost_tracker.TAIL_BLOCK_SIZE
+
+    def test_result_line_spanning_blocks(self, tmp_path, small_blocks):
+        path = tmp_path / "raw_output.jsonl"
+        big = {**_result(3), "result": "y" * 1000}
+        _write(path, [*_filler(3), big], trailing_newline=False)
+
+        assert parse_jsonl_file(path)["input_tokens"] == 3
+
+    def test_no_result_and_bad_lines(self, tmp_path, small_blocks):
+        path = tmp_path / "raw_output.jsonl"
+        path.write_text('{"type": "result", broken\n' + json.dumps({"type": "assistant"}) + "\n")
+
+        assert parse_jsonl_file(path) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert parse_jsonl_file(tmp_path / "missing.jsonl") is None
+
+
+class TestTranscriptCache:
+    """(path, mtime, size) keyed cache with incremental rescans."""
+
+    def test_unchanged_file_not_reread(self, tmp_path):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, [*_filler(10), _result(1)])
+        parse_jsonl_file(path)
+        bytes_after_first = get_transcript_cache_stats()["bytes_read"]
+
+        assert parse_jsonl_file(path)["input_tokens"] == 1
+        stats = get_transcript_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["bytes_read"] == bytes_after_first
+
+    def test_returned_stats_are_copies(self, tmp_path):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, [_result(1)])
+        parse_jsonl_file(path)["input_tokens"] = 99
+
+        assert parse_jsonl_file(path)["input_tokens"] == 1
+
+    def test_growing_transcript_scans_only_new_bytes(self, tmp_path, small_blocks):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, _filler(50))
+        assert parse_jsonl_file(path) is None
+        first_size = path.stat().st_size
+
+        _append(path, _filler(2))
+        assert parse_jsonl_file(path) is None
+        stats = get_transcript_cache_stats()
+        assert stats["incremental_scans"] == 1
+        assert stats["bytes_read"] < first_size + 2 * 300
+
+        _append(path, [_result(5)])
+        assert parse_jsonl_file(path)["input_tokens"] == 5
+
+    def test_append_without_result_keeps_cached_result(self, tmp_path, small_blocks):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, [*_filler(5), _result(4)])
+        parse_jsonl_file(path)
+
+        _append(path, _filler(5))
+
+        assert parse_jsonl_file(path)["input_tokens"] == 4
+
+    def test_rewritten_file_rescanned(self, tmp_path):
+        path = tmp_path / "raw_output.jsonl"
+        _write(path, [*_filler(5), _result(4)])
+        parse_jsonl_file(path)
+
+        _write(path, [_result(8)])
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert parse_jsonl_file(path)["input_tokens"] == 8
+        assert get_transcript_cache_stats()["full_scans"] == 2
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cost_tracker, "TRANSCRIPT_CACHE_MAX_ENTRIES", 2)
+        for i in range(3):
+            path = tmp_path / f"{i}.jsonl"
+            _write(path, [_result(i)])
+            parse_jsonl_file(path)
+
+        assert get_transcript_cache_stats()["entries"] == 2
@@ -0,0 +1,25 @@
+"""Tests for the worktree slot count in preflight checks."""
+
+from unittest.mock import MagicMock, patch
+
+from core.preflight_checks import check_worktree_availability
+
+
+def _worktree_list(*paths):
+    lines = ["/repo  abc1234 [main]"]
+    lines += [f"{path}  def5678 (detached HEAD)" for path in paths]
+    return MagicMock(returncode=0, stdout="\n".join(lines) + "\n")
+
+
+def test_warm_pool_worktrees_are_not_counted():
+    listing = _worktree_list(
+        "/repo/trees/adw-11111111",
+        "/repo/trees/.warm/warm-aaaa",
+        "/repo/trees/.warm/warm-bbbb",
+    )
+    with patch("core.preflight_checks.subprocess.run", return_value=listing):
+        result = check_worktree_availability()
+
+    assert result["passed"] is True
+    assert result["active_count"] == 1
+    assert result["available"] == result["max_worktrees"] - 1
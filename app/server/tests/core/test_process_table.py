@@ -0,0 +1,83 @@
+"""
+Unit tests for the shared process table snapshot.
+"""
+
+from unittest.mock import patch
+
+from core.process_table import ProcessTable
+
+
+def write_process(proc_root, pid, args, stat=None):
+    proc_dir = proc_root / str(pid)
+    proc_dir.mkdir()
+    (proc_dir / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in args) + b"\0" if args else b"")
+    if stat:
+        (proc_dir / "stat").write_text(stat)
+
+
+class TestProcessTable:
+    """Test /proc scanning and ADW lookups"""
+
+    def test_find_matches_whole_tokens(self, tmp_path):
+        write_process(tmp_path, 10, ["uv", "run", "adw_sdlc_iso.py", "42", "abc12345"])
+        write_process(tmp_path, 11, ["bash", "-c", "cd trees/abc12345 && make"])
+        write_process(tmp_path, 12, ["python", "abc1234"])
+        table = ProcessTable(proc_root=tmp_path)
+
+        assert [p.pid for p in table.find("abc12345")] == [10, 11]
+        assert table.find("abc1") == []
+
+    def test_adw_lookup_requires_adw_command(self, tmp_path):
+        write_process(tmp_path, 10, ["uv", "run", "adw_build_iso.py", "7", "abc12345"])
+        write_process(tmp_path, 11, ["tail", "-f", "agents/abc12345/error.log"])
+        table = ProcessTable(proc_root=tmp_path)
+
+        assert table.adw_pids("abc12345") == [10]
+        assert table.running_adws(["abc12345", "def67890"]) == {"abc12345": True, "def67890": False}
+
+    def test_skips_kernel_threads_and_non_pid_entries(self, tmp_path):
+        write_process(tmp_path, 2, [])
+        (tmp_path / "self").mkdir()
+        (tmp_path / "uptime").write_text("100.0 50.0\n")
+        table = ProcessTable(proc_root=tmp_path)
+
+        table.refresh()
+        assert table._processes == {}
+
+    def test_snapshot_reused_within_ttl(self, tmp_path):
+        write_process(tmp_path, 10, ["uv", "run", "adw_plan_iso.py", "abc12345"])
+        table = ProcessTable(ttl_seconds=60, proc_root=tmp_path)
+        assert table.is_adw_running("abc12345")
+
+        (tmp_path / "10" / "cmdline").unlink()
+        (tmp_path / "10").rmdir()
+        assert table.is_adw_running("abc12345")
+
+        table.refresh(force=True)
+        assert not table.is_adw_running("abc12345")
+
+    def test_resource_usage(self, tmp_path):
+        # utime=300, stime=100 ticks; started at tick 1000; rss=2560 pages
+        fields = ["S"] + ["0"] * 10 + ["300", "100"] + ["0"] * 6 + ["1000", "0", "2560"]
+        write_process(tmp_path, 10, ["python", "x"], stat=f"10 (python x) {' '.join(fields)}")
+        (tmp_path / "uptime").write_text("30.0 10.0\n")
+        (tmp_path / "meminfo").write_text("MemTotal:       1024000 kB\n")
+        table = ProcessTable(proc_root=tmp_path)
+
+        with patch("core.process_table.os.sysconf", side_effect=lambda name: {"SC_CLK_TCK": 100, "SC_PAGE_SIZE": 4096}[name]):
+            cpu, memory = table.resource_usage(10)
+
+        # 4 CPU seconds over 20 s elapsed; 10 MB of 1000 MB
+        assert round(cpu, 1) == 20.0
+        assert round(memory, 1) == 1.0
+        assert table.resource_usage(99) is None
+
+    def test_falls_back_to_ps_without_proc(self, tmp_path):
+        table = ProcessTable(proc_root=tmp_path / "missing")
+
+        class Result:
+            stdout = "  10 uv run adw_plan_iso.py abc12345\n  11 -zsh\n"
+
+        with patch("core.process_table.subprocess.run", return_value=Result()) as run:
+            assert table.adw_pids("abc12345") == [10]
+            assert run.call_count == 1
@@ -0,0 +1,159 @@
+"""
+Unit tests for streaming tool-sequence mining.
+
+Tests cover:
+- Exact n-gram counts when the sketch has room
+- Space-Saving guarantees once counters are evicted
+- Example sessions and session boundaries
+- Streaming hook_events from SQLite
+"""
+
+import random
+import sqlite3
+from collections import Counter
+
+import pytest
+from core.sequence_mining import (
+    SequenceMiner,
+    SpaceSaving,
+    ToolInterner,
+    iter_tool_event_rows,
+    stream_tool_events,
+)
+
+
+def brute_force(sessions, min_length, max_length):
+    counts = Counter()
+    for tools in sessions.values():
+        for length in range(min_length, max_length + 1):
+            for i in range(len(tools) - length + 1):
+                counts[tuple(tools[i:i + length])] += 1
+    return counts
+
+
+def mine(sessions, **kwargs):
+    miner = SequenceMiner(**kwargs)
+    for session_id, tools in sessions.items():
+        for tool in tools:
+            miner.add(session_id, tool)
+    return miner
+
+
+def test_counts_match_brute_force_when_sketch_has_room():
+    rng = random.Random(7)
+    tools = ["Read", "Edit", "Bash", "Grep", "Write"]
+    sessions = {f"s{n}": [rng.choice(tools) for _ in range(rng.randint(0, 30))] for n in range(50)}
+
+    miner = mine(sessions, min_length=2, max_length=5)
+
+    expected = brute_force(sessions, 2, 5)
+    found = {seq.tools: seq.count for seq in miner.top()}
+    assert found == dict(expected)
+    assert all(seq.error == 0 for seq in miner.top())
+    assert miner.events == sum(len(t) for t in sessions.values())
+
+
+def test_ngrams_do_not_cross_sessions():
+    miner = mine({"a": ["Read", "Edit"], "b": ["Bash", "Read"]}, min_length=2, max_length=3)
+
+    assert [seq.tools for seq in miner.top()] == [("Bash", "Read"), ("Read", "Edit")]
+    assert miner.sessions == 2
+
+
+def test_examples_are_distinct_and_bounded():
+    sessions = {f"s{n}": ["Read", "Edit", "Bash"] * 2 for n in range(5)}
+
+    top = mine(sessions, min_length=3, max_length=3, max_examples=2).top(min_count=10)
+
+    assert top[0].tools == ("Read", "Edit", "Bash")
+    assert top[0].count == 10
+    assert top[0].examples == ["s0", "s1"]
+
+
+def test_heavy_hitters_survive_eviction():
+    rng = random.Random(3)
+    # Two frequent patterns buried in noise from many rare tools
+    events = []
+    for n in range(3000):
+        if n % 6 == 0:
+            events += ["Read", "Edit", "Bash"]
+        elif n % 6 == 3:
+            events += ["Grep", "Read", "Edit"]
+        else:
+            events.append(f"tool{rng.randint(0, 500)}")
+    miner = mine({"s": events}, min_length=3, max_length=3, capacity=200)
+
+    assert len(miner.sketch) <= 200
+    top = miner.top(limit=2)
+    assert {seq.tools for seq in top} == {("Read", "Edit", "Bash"), ("Grep", "Read", "Edit")}
+    true_counts = brute_force({"s": events}, 3, 3)
+    for seq in top:
+        assert seq.count - seq.error <= true_counts[seq.tools] <= seq.count
+
+
+def test_space_saving_replaces_minimum():
+    sketch = SpaceSaving(capacity=2)
+    for key in [1, 1, 1, 2, 3]:
+        sketch.offer(key)
+
+    counts = {key: (count, error) for key, count, error, _ in sketch.items()}
+    assert counts == {1: (3, 0), 3: (2, 1)}
+
+
+def test_interner_overflow_shares_one_id():
+    interner = ToolInterner(max_tools=3)
+    ids = [interner.intern(name) for name in ["Read", "Edit", "Bash", "Grep", "Read"]]
+
+    assert ids[0] == ids[4] == 1
+    assert ids[3] == interner.intern("Write")
+    assert interner.name(ids[3]) == "<other>"
+
+
+def test_invalid_lengths_rejected():
+    with pytest.raises(ValueError):
+        SequenceMiner(min_length=4, max_length=3)
+
+
+@pytest.fixture
+def hook_db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE hook_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id TEXT,
+            event_type TEXT,
+            session_id TEXT,
+            workflow_id TEXT,
+            timestamp TEXT,
+            tool_name TEXT
+        )
+    """)
+    rows = [
+        ("PreToolUse", "s2", None, "2025-01-01 10:00:02", "Edit"),
+        ("PreToolUse", "s1", None, "2025-01-01 10:00:01", "Bash"),
+        ("PreToolUse", "s1", None, "2025-01-01 10:00:00", "Read"),
+        ("PostToolUse", "s1", None, "2025-01-01 10:00:00", "Read"),
+        ("PreToolUse", None, "wf1", "2025-01-01 10:00:00", "Grep"),
+        ("PreToolUse", None, None, "2025-01-01 10:00:00", "Grep"),
+        ("Stop", "s1", None, "2025-01-01 10:00:03", None),
+    ]
+    conn.executemany(
+        "INSERT INTO hook_events (event_type, session_id, workflow_id, timestamp, tool_name) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    yield conn
+    conn.close()
+
+
+def test_stream_groups_by_session_in_time_order(hook_db):
+    events = list(stream_tool_events(hook_db, "sqlite"))
+
+    assert events == [("s1", "Read"), ("s1", "Bash"), ("s2", "Edit"), ("wf1", "Grep")]
+
+
+def test_stream_filters_event_types_and_window(hook_db):
+    events = list(stream_tool_events(hook_db, "sqlite", event_types=("PreToolUse", "PostToolUse")))
+    assert events.count(("s1", "Read")) == 2
+
+    assert list(iter_tool_event_rows(hook_db, "sqlite", since_hours=1)) == []
@@ -1286,41 +1286,53 @@ class TestGetWorkflowHistory:
 class TestGetHistoryAnalytics:
     """Tests for get_history_analytics() function."""
 
+    @staticmethod
+    def _summary(**overrides):
+        """Row returned by the single conditional-aggregation query."""
+        row = {
+            "total": 0,
+            "avg_duration": None,
+            "avg_cost": None,
+            "total_cost": None,
+            "avg_cost_per_completion": None,
+            "avg_cost_7day_current": None,
+            "avg_cost_7day_previous": None,
+            "avg_cost_30day_current": None,
+            "avg_cost_30day_previous": None,
+            "avg_tokens": None,
+            "avg_cache_efficiency": None,
+        }
+        row.update(overrides)
+        return row
+
     def test_analytics_with_workflows(self, mock_get_db_connection, caplog):
         """Test calculating analytics with existing workflows."""
         mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
 
-        # Mock query results in order (9 fetchone calls total)
-        mock_cursor.fetchone.side_effect = [
-            {"total": 100},  # 1. Total workflows
-            {"avg_duration": 450.5},  # 2. Average duration
-            {"avg_cost": 0.35, "total_cost": 35.0},  # 3. Cost analytics
-            {"avg_cost_per_completion": 0.38},  # 4. Avg cost per completion (NEW!)
-            {"avg_cost": 0.40},  # 5. Last 7 days avg cost
-            {"avg_cost": 0.36},  # 6. Previous 7 days avg cost
-            {"avg_cost": 0.37},  # 7. Last 30 days avg cost
-            {"avg_cost": 0.34},  # 8. Previous 30 days avg cost
-            {"avg_tokens": 5500.0, "avg_cache_efficiency": 65.5},  # 9. Token analytics
-        ]
+        mock_cursor.fetchone.return_value = self._summary(
+            total=100,
+            avg_duration=450.5,
+            avg_cost=0.35,
+            total_cost=35.0,
+            avg_cost_per_completion=0.38,
+            avg_cost_7day_current=0.40,
+            avg_cost_7day_previous=0.36,
+            avg_cost_30day_current=0.37,
+            avg_cost_30day_previous=0.34,
+            avg_tokens=5500.0,
+            avg_cache_efficiency=65.5,
+        )
 
-        # Mock status counts (3 fetchall calls total)
-        mock_cursor.fetchall.side_effect = [
-            [
-                {"status": "completed", "count": 70},
-                {"status": "failed", "count": 20},
-                {"status": "running", "count": 8},
-                {"status": "pending", "count": 2},
-            ],
-            # Mock workflows by model
-            [
-                {"model_used": "claude-sonnet-4-5", "count": 80},
-                {"model_used": "gpt-4", "count": 20},
-            ],
-            # Mock workflows by template
-            [
-                {"workflow_template": "adw_sdlc_iso", "count": 60},
-                {"workflow_template": "adw_basic", "count": 40},
-            ],
+        # (dimension, value, count) breakdown rows
+        mock_cursor.fetchall.return_value = [
+            {"dimension": "status", "value": "completed", "count": 70},
+            {"dimension": "status", "value": "failed", "count": 20},
+            {"dimension": "status", "value": "running", "count": 8},
+            {"dimension": "status", "value": "pending", "count": 2},
+            {"dimension": "model", "value": "claude-sonnet-4-5", "count": 80},
+            {"dimension": "model", "value": "gpt-4", "count": 20},
+            {"dimension": "template", "value": "adw_sdlc_iso", "count": 60},
+            {"dimension": "template", "value": "adw_basic", "count": 40},
         ]
 
         with caplog.at_level(logging.DEBUG):
@@ -1336,6 +1348,8 @@ class TestGetHistoryAnalytics:
         assert analytics["avg_cost_per_completion"] == 0.38
         assert analytics["avg_tokens"] == 5500.0
         assert analytics["avg_cache_efficiency"] == 65.5
+        assert analytics["cost_trend_7day"] == pytest.approx((0.40 - 0.36) / 0.36 * 100)
+        assert analytics["cost_trend_30day"] == pytest.approx((0.37 - 0.34) / 0.34 * 100)
 
         assert analytics["workflows_by_status"] == {
             "completed": 70,
@@ -1357,29 +1371,26 @@ class TestGetHistoryAnalytics:
         # Verify logging
         assert any("Generated analytics" in record.message for record in caplog.records)
 
+    def test_analytics_uses_two_queries(self, mock_get_db_connection):
+        """Test all metrics come from one aggregate query plus one breakdown."""
+        mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
+        mock_cursor.fetchone.return_value = self._summary(total=1)
+        mock_cursor.fetchall.return_value = []
+
+        get_history_analytics()
+
+        assert mock_cursor.execute.call_count == 2
+        breakdown_query = mock_cursor.execute.call_args_list[1][0][0]
+        assert "GROUP BY status" in breakdown_query
+        assert "GROUP BY model_used" in breakdown_query
+        assert "GROUP BY workflow_template" in breakdown_query
+
     def test_analytics_with_no_workflows(self, mock_get_db_connection):
         """Test calculating analytics with no workflows returns zeros."""
         mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
 
-        # Mock empty results (9 fetchone calls total)
-        mock_cursor.fetchone.side_effect = [
-            {"total": 0},  # 1. No workflows
-            {"avg_duration": None},  # 2. No duration
-            {"avg_cost": None, "total_cost": None},  # 3. No cost
-            {"avg_cost_per_completion": None},  # 4. No completion cost
-            {"avg_cost": None},  # 5. No 7-day current
-            {"avg_cost": None},  # 6. No 7-day previous
-            {"avg_cost": None},  # 7. No 30-day current
-            {"avg_cost": None},  # 8. No 30-day previous
-            {"avg_tokens": None, "avg_cache_efficiency": None},  # 9. No tokens
-        ]
-
-        # Mock empty counts (3 fetchall calls total)
-        mock_cursor.fetchall.side_effect = [
-            [],  # No status counts
-            [],  # No model counts
-            [],  # No template counts
-        ]
+        mock_cursor.fetchone.return_value = self._summary()
+        mock_cursor.fetchall.return_value = []
 
         analytics = get_history_analytics()
 
@@ -1391,6 +1402,8 @@ class TestGetHistoryAnalytics:
         assert analytics["avg_cost"] == 0.0
         assert analytics["total_cost"] == 0.0
         assert analytics["avg_cost_per_completion"] == 0.0
+        assert analytics["cost_trend_7day"] == 0.0
+        assert analytics["cost_trend_30day"] == 0.0
         assert analytics["avg_tokens"] == 0.0
         assert analytics["avg_cache_efficiency"] == 0.0
         assert analytics["workflows_by_status"] == {}
@@ -1401,27 +1414,10 @@ class TestGetHistoryAnalytics:
         """Test success rate is calculated correctly."""
         mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
 
-        # Mock query results (9 fetchone calls total)
-        mock_cursor.fetchone.side_effect = [
-            {"total": 200},  # 1. Total workflows
-            {"avg_duration": 300.0},  # 2. Avg duration
-            {"avg_cost": 0.25, "total_cost": 50.0},  # 3. Cost analytics
-            {"avg_cost_per_completion": 0.26},  # 4. Avg cost per completion
-            {"avg_cost": 0.27},  # 5. Last 7 days
-            {"avg_cost": 0.25},  # 6. Previous 7 days
-            {"avg_cost": 0.26},  # 7. Last 30 days
-            {"avg_cost": 0.24},  # 8. Previous 30 days
-            {"avg_tokens": 4000.0, "avg_cache_efficiency": 50.0},  # 9. Token analytics
-        ]
-
-        # Mock counts (3 fetchall calls total)
-        mock_cursor.fetchall.side_effect = [
-            [
-                {"status": "completed", "count": 150},  # 150/200 = 75%
-                {"status": "failed", "count": 50},
-            ],
-            [],  # Empty models
-            [],  # Empty templates
+        mock_cursor.fetchone.return_value = self._summary(total=200)
+        mock_cursor.fetchall.return_value = [
+            {"dimension": "status", "value": "completed", "count": 150},  # 150/200 = 75%
+            {"dimension": "status", "value": "failed", "count": 50},
         ]
 
         analytics = get_history_analytics()
@@ -1435,93 +1431,36 @@ class TestGetHistoryAnalytics:
         """Test that average duration only includes completed workflows."""
         mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
 
-        # Mock query results (9 fetchone calls total)
-        mock_cursor.fetchone.side_effect = [
-            {"total": 100},  # 1. Total
-            {"avg_duration": 500.0},  # 2. Only from completed workflows
-            {"avg_cost": 0.30, "total_cost": 30.0},  # 3. Cost
-            {"avg_cost_per_completion": 0.31},  # 4. Completion cost
-            {"avg_cost": 0.32},  # 5. Last 7 days
-            {"avg_cost": 0.29},  # 6. Previous 7 days
-            {"avg_cost": 0.31},  # 7. Last 30 days
-            {"avg_cost": 0.28},  # 8. Previous 30 days
-            {"avg_tokens": 5000.0, "avg_cache_efficiency": 60.0},  # 9. Tokens
-        ]
-
-        # Mock counts (3 fetchall calls total)
-        mock_cursor.fetchall.side_effect = [
-            [{"status": "completed", "count": 50}],
-            [],
-            [],
-        ]
+        mock_cursor.fetchone.return_value = self._summary(total=100, avg_duration=500.0)
+        mock_cursor.fetchall.return_value = []
 
         get_history_analytics()
 
-        # Verify query filters for completed status (2nd query executed - after COUNT)
-        # Query execution order: 1. COUNT(*) 2. GROUP BY status 3. AVG(duration) for completed
-        avg_duration_query = mock_cursor.execute.call_args_list[2][0][0]
-        assert "WHERE status = 'completed'" in avg_duration_query
-        assert "duration_seconds IS NOT NULL" in avg_duration_query
+        summary_query = mock_cursor.execute.call_args_list[0][0][0]
+        assert "WHEN status = 'completed' AND duration_seconds IS NOT NULL" in summary_query
 
     def test_analytics_filters_zero_costs_and_tokens(self, mock_get_db_connection):
         """Test that analytics filters out zero/null costs and tokens."""
         mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
 
-        # Mock query results (9 fetchone calls total)
-        mock_cursor.fetchone.side_effect = [
-            {"total": 50},  # 1. Total
-            {"avg_duration": 400.0},  # 2. Duration
-            {"avg_cost": 0.40, "total_cost": 20.0},  # 3. Cost
-            {"avg_cost_per_completion": 0.42},  # 4. Completion cost
-            {"avg_cost": 0.43},  # 5. Last 7 days
-            {"avg_cost": 0.39},  # 6. Previous 7 days
-            {"avg_cost": 0.41},  # 7. Last 30 days
-            {"avg_cost": 0.38},  # 8. Previous 30 days
-            {"avg_tokens": 6000.0, "avg_cache_efficiency": 70.0},  # 9. Tokens
-        ]
-
-        # Mock counts (3 fetchall calls total)
-        mock_cursor.fetchall.side_effect = [
-            [{"status": "completed", "count": 40}],
-            [],
-            [],
-        ]
+        mock_cursor.fetchone.return_value = self._summary(total=50)
+        mock_cursor.fetchall.return_value = []
 
         get_history_analytics()
 
-        # Verify cost query filters (6th query executed)
-        # Query order: 1.COUNT 2.status 3.duration 4.model 5.template 6.cost 7.completion_cost 8.trends 9.tokens
-        cost_query = mock_cursor.execute.call_args_list[5][0][0]
-        assert "actual_cost_total IS NOT NULL" in cost_query
-        assert "actual_cost_total > 0" in cost_query
-
-        # Verify token query filters (last query executed)
-        token_query = mock_cursor.execute.call_args_list[-1][0][0]
-        assert "total_tokens IS NOT NULL" in token_query
-        assert "total_tokens > 0" in token_query
+        summary_query = mock_cursor.execute.call_args_list[0][0][0]
+        assert "actual_cost_total IS NOT NULL AND actual_cost_total > 0" in summary_query
+        assert "total_tokens IS NOT NULL AND total_tokens > 0" in summary_query
 
     def test_analytics_returns_all_required_keys(self, mock_get_db_connection):
         """Test that analytics returns all expected keys in the dictionary."""
         mock_get_conn, mock_conn, mock_cursor = mock_get_db_connection
 
-        # Minimal mock data (9 fetchone calls total)
-        mock_cursor.fetchone.side_effect = [
-            {"total": 1},  # 1. Total
-            {"avg_duration": 100.0},  # 2. Duration
-            {"avg_cost": 0.10, "total_cost": 0.10},  # 3. Cost
-            {"avg_cost_per_completion": 0.10},  # 4. Completion cost
-            {"avg_cost": 0.11},  # 5. Last 7 days
-            {"avg_cost": 0.09},  # 6. Previous 7 days
-            {"avg_cost": 0.10},  # 7. Last 30 days
-            {"avg_cost": 0.09},  # 8. Previous 30 days
-            {"avg_tokens": 1000.0, "avg_cache_efficiency": 50.0},  # 9. Tokens
-        ]
-
-        # Mock counts (3 fetchall calls total)
-        mock_cursor.fetchall.side_effect = [
-            [{"status": "completed", "count": 1}],
-            [{"model_used": "test-model", "count": 1}],
-            [{"workflow_template": "test-template", "count": 1}],
+        mock_cursor.fetchone.return_value = self._summary(total=1, avg_duration=100.0)
+        mock_cursor.fetchall.return_value = [
+            {"dimension": "status", "value": "completed", "count": 1},
+            {"dimension": "model", "value": "test-model", "count": 1},
+            {"dimension": "template", "value": "test-template", "count": 1},
         ]
 
         analytics = get_history_analytics()
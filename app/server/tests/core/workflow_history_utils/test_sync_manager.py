@@ -0,0 +1,210 @@
+"""
+Tests for the batched workflow history sync.
+
+Uses a temporary SQLite database; enrichment is stubbed so only the
+read/diff/write pipeline is exercised.
+"""
+
+from unittest.mock import patch
+
+import core.workflow_history_utils.database.mutations as mutations_module
+import core.workflow_history_utils.database.queries as queries_module
+import core.workflow_history_utils.database.schema as schema_module
+import core.workflow_history_utils.sync_manager as sync_manager_module
+import pytest
+from core.workflow_history_utils.database import (
+    bulk_upsert_workflow_history,
+    get_workflow_by_adw_id,
+    get_workflows_by_adw_ids,
+    init_db,
+    insert_workflow_history,
+)
+from core.workflow_history_utils.sync_manager import sync_workflow_history
+from database.sqlite_adapter import SQLiteAdapter
+
+
+@pytest.fixture
+def adapter(tmp_path, monkeypatch):
+    test_adapter = SQLiteAdapter(db_path=str(tmp_path / "history.db"))
+    for module in (schema_module, mutations_module, queries_module, sync_manager_module):
+        monkeypatch.setattr(module, "_get_adapter", lambda: test_adapter)
+    monkeypatch.setattr(sync_manager_module, "_pattern_processed_adw_ids", set())
+
+    init_db()
+    with test_adapter.get_connection() as conn:
+        conn.execute("""
+            CREATE TABLE pattern_occurrences (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                pattern_id INTEGER NOT NULL,
+                workflow_id TEXT NOT NULL
+            )
+        """)
+    yield test_adapter
+    test_adapter.close()
+
+
+def _workflow(adw_id, status="running", **fields):
+    return {
+        "adw_id": adw_id,
+        "issue_number": 1,
+        "nl_input": f"input {adw_id}",
+        "status": status,
+        "current_phase": "build",
+        **fields,
+    }
+
+
+def _sync(workflows, process_result=None):
+    """Run a sync over the given scan result with enrichment stubbed out."""
+    with (
+        patch.object(sync_manager_module, "scan_agents_directory", return_value=workflows),
+        patch.object(sync_manager_module, "enrich_workflow", return_value=None),
+        patch(
+            "core.pattern_persistence.process_and_persist_workflow",
+            return_value=process_result or {"patterns_detected": 0},
+        ) as mock_process,
+    ):
+        synced = sync_workflow_history()
+    return synced, mock_process
+
+
+class TestBatchedSync:
+    """One bulk read, in-memory diff and one bulk write per sync."""
+
+    def test_new_workflows_inserted(self, adapter):
+        synced, _ = _sync([_workflow("a1"), _workflow("a2")])
+
+        assert synced == 2
+        assert set(get_workflows_by_adw_ids(["a1", "a2"])) == {"a1", "a2"}
+
+    def test_insight_history_loaded_once_per_sync(self, adapter):
+        with patch.object(
+            sync_manager_module, "get_workflow_history", return_value=([], 0)
+        ) as mock_history:
+            _sync([_workflow(f"a{i}") for i in range(5)])
+
+        mock_history.assert_called_once()
+
+    def test_no_per_row_lookups(self, adapter):
+        insert_workflow_history(adw_id="a1", status="running", current_phase="plan")
+
+        with patch.object(sync_manager_module, "get_workflow_by_adw_id") as mock_lookup:
+            synced, _ = _sync([_workflow("a1", current_phase="build"), _workflow("a2")])
+
+        mock_lookup.assert_not_called()
+        assert synced == 2
+        assert get_workflow_by_adw_id("a1")["current_phase"] == "build"
+
+    def test_unchanged_workflows_not_written(self, adapter):
+        _sync([_workflow("a1")])
+
+        with patch.object(
+            sync_manager_module, "bulk_upsert_workflow_history", return_value=(0, 0)
+        ) as mock_write:
+            synced, _ = _sync([_workflow("a1")])
+
+        assert synced == 0
+        mock_write.assert_called_once_with([], {})
+
+
+class TestPatternLearning:
+    """Set-based "already analyzed" lookup."""
+
+    def test_analyzed_workflows_skipped(self, adapter):
+        insert_workflow_history(adw_id="done", status="completed", end_time="2025-01-01T00:00:00")
+        row_id = get_workflow_by_adw_id("done")["id"]
+        with adapter.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO pattern_occurrences (pattern_id, workflow_id) VALUES (1, ?)",
+                (str(row_id),),
+            )
+
+        _, mock_process = _sync([
+            _workflow("done", status="completed"),
+            _workflow("new", status="completed"),
+        ])
+
+        processed = [call.args[0]["adw_id"] for call in mock_process.call_args_list]
+        assert processed == ["new"]
+        # Stored row is passed so occurrences can be linked by row id
+        assert mock_process.call_args.args[0]["id"]
+
+    def test_workflows_without_patterns_processed_once(self, adapter):
+        workflows = [_workflow("done", status="completed")]
+        _, first = _sync(workflows)
+        _, second = _sync(workflows)
+
+        assert first.call_count == 1
+        second.assert_not_called()
+
+
+class TestSimilarity:
+    """Finished workflows are indexed and get similar_workflow_ids on sync."""
+
+    @pytest.fixture
+    def similarity_column(self, adapter):
+        with adapter.get_connection() as conn:
+            conn.execute("ALTER TABLE workflow_history ADD COLUMN similar_workflow_ids TEXT")
+
+    def test_finished_workflows_get_similar_ids(self, adapter, similarity_column):
+        _sync([
+            _workflow("a1", status="completed", nl_input="add login page", workflow_template="adw_sdlc"),
+            _workflow("a2", status="completed", nl_input="add login form", workflow_template="adw_sdlc"),
+            _workflow("a3", status="running", nl_input="add login page", workflow_template="adw_sdlc"),
+        ])
+
+        assert get_workflow_by_adw_id("a1")["similar_workflow_ids"] == ["a2"]
+        assert get_workflow_by_adw_id("a2")["similar_workflow_ids"] == ["a1"]
+        assert get_workflow_by_adw_id("a3")["similar_workflow_ids"] is None
+
+    def test_scored_once_and_index_grows_incrementally(self, adapter, similarity_column):
+        _sync([_workflow("a1", status="completed", workflow_template="adw_sdlc")])
+
+        with patch.object(
+            sync_manager_module, "bulk_upsert_workflow_history", wraps=bulk_upsert_workflow_history
+        ) as mock_write:
+            _sync([
+                _workflow("a1", status="completed", workflow_template="adw_sdlc"),
+                _workflow("a4", status="completed", workflow_template="adw_sdlc"),
+            ])
+
+        similarity_writes = [call.args[1] for call in mock_write.call_args_list if call.args[1]]
+        assert [list(updates) for updates in similarity_writes] == [["a4"]]
+        assert get_workflow_by_adw_id("a4")["similar_workflow_ids"] == ["a1"]
+        assert len(sync_manager_module._get_similarity_index(adapter)) == 2
+
+    def test_skipped_without_column(self, adapter):
+        _sync([_workflow("a1", status="completed")])
+
+        assert adapter not in sync_manager_module._similarity_indexes
+
+
+class TestBulkOperations:
+    """Bulk read and write helpers."""
+
+    def test_bulk_read_spans_batches(self, adapter):
+        ids = [f"adw-{i}" for i in range(queries_module.IN_CLAUSE_BATCH_SIZE + 10)]
+        bulk_upsert_workflow_history([{"adw_id": adw_id, "status": "running"} for adw_id in ids])
+
+        rows = get_workflows_by_adw_ids([*ids, "missing"])
+
+        assert len(rows) == len(ids)
+        assert "missing" not in rows
+
+    def test_upsert_updates_conflicting_rows(self, adapter):
+        insert_workflow_history(adw_id="a1", status="pending")
+
+        inserted, _ = bulk_upsert_workflow_history([{"adw_id": "a1", "status": "running"}])
+
+        assert inserted == 1
+        assert get_workflow_by_adw_id("a1")["status"] == "running"
+
+    def test_updates_serialize_json_and_skip_unknown_columns(self, adapter):
+        insert_workflow_history(adw_id="a1", status="running")
+
+        _, updated = bulk_upsert_workflow_history(updates={
+            "a1": {"cost_breakdown": {"by_phase": {"plan": 0.5}}, "not_a_column": 1},
+        })
+
+        assert updated == 1
+        assert get_workflow_by_adw_id("a1")["cost_breakdown"] == {"by_phase": {"plan": 0.5}}
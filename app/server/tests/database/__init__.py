@@ -0,0 +1 @@
+"""Tests for database adapters and connection pooling."""
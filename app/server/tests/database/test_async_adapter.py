@@ -0,0 +1,137 @@
+"""
+Tests for AsyncDatabaseAdapter and AsyncRepository.
+
+The loop-lag tests simulate slow queries and measure how late a ticker
+coroutine wakes up while concurrent requests are in flight.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from database.async_adapter import AsyncDatabaseAdapter, AsyncRepository
+from database.sqlite_adapter import SQLiteAdapter
+
+QUERY_SECONDS = 0.05
+CONCURRENT_REQUESTS = 20
+TICK_SECONDS = 0.005
+
+
+class SlowAdapter(SQLiteAdapter):
+    """SQLite adapter whose queries block for a fixed time, like a slow database."""
+
+    def execute_query(self, query, params=None):
+        time.sleep(QUERY_SECONDS)
+        return [("ok",)]
+
+
+class SlowRepository:
+    """Repository stand-in with a blocking method."""
+
+    def __init__(self):
+        self.threads = set()
+        self.label = "slow"
+
+    def get_all(self, limit=10):
+        self.threads.add(threading.get_ident())
+        time.sleep(QUERY_SECONDS)
+        return list(range(limit))
+
+    def fail(self):
+        raise ValueError("bad input")
+
+
+async def _measure_max_loop_lag(workload) -> float:
+    """Run workload while a ticker records the worst event-loop scheduling delay."""
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(time.perf_counter() - expected)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        await workload()
+    finally:
+        done.set()
+        await ticker_task
+    return max(lags) if lags else 0.0
+
+
+@pytest.fixture
+def db(tmp_path):
+    adapter = AsyncDatabaseAdapter(SlowAdapter(db_path=str(tmp_path / "lag.db")), max_workers=CONCURRENT_REQUESTS)
+    yield adapter
+    adapter.close()
+
+
+class TestLoopLag:
+    """Event-loop responsiveness under concurrent database requests."""
+
+    async def test_blocking_calls_stall_the_loop(self, db):
+        async def blocking_workload():
+            for _ in range(5):
+                db.adapter.execute_query("SELECT 1")
+
+        lag = await _measure_max_loop_lag(blocking_workload)
+        assert lag >= QUERY_SECONDS * 4
+
+    async def test_async_adapter_keeps_loop_responsive(self, db):
+        async def concurrent_workload():
+            results = await asyncio.gather(
+                *(db.execute_query("SELECT 1") for _ in range(CONCURRENT_REQUESTS))
+            )
+            assert all(r == [("ok",)] for r in results)
+
+        start = time.perf_counter()
+        lag = await _measure_max_loop_lag(concurrent_workload)
+        elapsed = time.perf_counter() - start
+
+        assert lag < QUERY_SECONDS
+        # Requests overlap instead of running back-to-back
+        assert elapsed < QUERY_SECONDS * CONCURRENT_REQUESTS / 2
+
+    async def test_executor_bounds_concurrency(self, tmp_path):
+        db = AsyncDatabaseAdapter(SlowAdapter(db_path=str(tmp_path / "b.db")), max_workers=2)
+        try:
+            peak = 0
+
+            async def sample():
+                nonlocal peak
+                while True:
+                    peak = max(peak, db.get_pool_stats()["async_executor"]["in_flight"])
+                    await asyncio.sleep(0.001)
+
+            sampler = asyncio.create_task(sample())
+            await asyncio.gather(*(db.execute_query("SELECT 1") for _ in range(6)))
+            sampler.cancel()
+            assert peak <= 2
+        finally:
+            db.close()
+
+
+class TestAsyncRepository:
+    """Async proxy over synchronous repositories."""
+
+    async def test_methods_run_off_the_event_loop(self, db):
+        repo = SlowRepository()
+        proxy = AsyncRepository(repo, db)
+
+        results = await asyncio.gather(proxy.get_all(limit=3), proxy.get_all(limit=2))
+
+        assert results == [[0, 1, 2], [0, 1]]
+        assert threading.get_ident() not in repo.threads
+
+    async def test_exceptions_propagate(self, db):
+        proxy = AsyncRepository(SlowRepository(), db)
+        with pytest.raises(ValueError, match="bad input"):
+            await proxy.fail()
+
+    def test_non_callable_attributes_pass_through(self, db):
+        proxy = AsyncRepository(SlowRepository(), db)
+        assert proxy.label == "slow"
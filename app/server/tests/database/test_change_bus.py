@@ -0,0 +1,118 @@
+"""
+Tests for ChangeBus and PostgresChangeListener notification handling.
+"""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from database.change_bus import ChangeBus, PostgresChangeListener
+
+
+@pytest.fixture
+async def bus():
+    bus = ChangeBus(settle_seconds=0.01)
+    bus.attach()
+    return bus
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_changed_keys(bus):
+    waiter = asyncio.create_task(bus.wait(("phase_queue",), timeout=1))
+    await asyncio.sleep(0)
+    bus.notify("phase_queue", ["a"])
+    bus.notify("phase_queue", ["b"])
+
+    assert await waiter == {"phase_queue": {"a", "b"}}
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_without_notifications(bus):
+    assert await bus.wait(("phase_queue",), timeout=0.02) == {}
+
+
+@pytest.mark.asyncio
+async def test_unknown_keys_override_known_keys(bus):
+    bus.notify("planned_features", [1])
+    bus.notify("planned_features")
+    bus.notify("planned_features", [2])
+
+    assert await bus.wait(("planned_features",), timeout=1) == {"planned_features": None}
+
+
+@pytest.mark.asyncio
+async def test_other_tables_stay_pending(bus):
+    bus.notify("planned_features", [7])
+
+    assert await bus.wait(("phase_queue",), timeout=0.02) == {}
+    assert await bus.wait(("planned_features",), timeout=1) == {"planned_features": {"7"}}
+
+
+@pytest.mark.asyncio
+async def test_notify_from_worker_thread_wakes_waiter(bus):
+    waiter = asyncio.create_task(bus.wait(("queue_config",), timeout=1))
+    await asyncio.sleep(0)
+    thread = threading.Thread(target=bus.notify, args=("queue_config", ["queue_paused"]))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(waiter, timeout=1) == {"queue_config": {"queue_paused"}}
+
+
+def test_notify_without_loop_only_records():
+    bus = ChangeBus()
+    bus.notify("phase_queue", ["a"])
+
+    assert bus._take(("phase_queue",)) == {"phase_queue": {"a"}}
+
+
+@pytest.mark.asyncio
+async def test_listener_forwards_notifications(bus):
+    notifies = [
+        SimpleNamespace(payload=json.dumps({"table": "phase_queue", "key": "q1"})),
+        SimpleNamespace(payload="not json"),
+        SimpleNamespace(payload=json.dumps({"key": "q2"})),
+        SimpleNamespace(payload=json.dumps(["phase_queue"])),
+        SimpleNamespace(payload=json.dumps({"table": "planned_features", "key": None})),
+    ]
+    listener = PostgresChangeListener(bus, adapter=None)
+    listener._conn = SimpleNamespace(poll=lambda: None, notifies=notifies)
+
+    listener._on_readable()
+
+    assert bus._take(("phase_queue", "planned_features")) == {
+        "phase_queue": {"q1"},
+        "planned_features": None,
+    }
+
+
+class _FakeCursor:
+    def __init__(self, installed_triggers):
+        self.installed_triggers = installed_triggers
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def fetchone(self):
+        return (self.installed_triggers,)
+
+
+@pytest.mark.parametrize("installed, applies_migration", [(3, False), (1, True)])
+def test_listener_applies_triggers_only_when_missing(bus, installed, applies_migration):
+    cursor = _FakeCursor(installed)
+    conn = SimpleNamespace(cursor=lambda: cursor)
+    listener = PostgresChangeListener(bus, adapter=SimpleNamespace(connect_listener=lambda: conn))
+
+    assert listener._open() is conn
+
+    assert any("CREATE TRIGGER" in sql for sql in cursor.statements) is applies_migration
+    assert cursor.statements[-1] == "LISTEN table_changes"
@@ -0,0 +1,220 @@
+"""
+Unit tests for BoundedConnectionPool.
+
+Uses fake connections so the pool can be exercised without a PostgreSQL server.
+"""
+
+import threading
+import time
+
+import pytest
+from database.pool import BoundedConnectionPool, PoolClosedError, PoolTimeoutError
+
+
+class FakeConnection:
+    """Minimal stand-in for a driver connection."""
+
+    def __init__(self, conn_id: int):
+        self.conn_id = conn_id
+        self.closed = 0
+        self.healthy = True
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeConnector:
+    """Connection factory that records every connection it creates."""
+
+    def __init__(self):
+        self.created: list[FakeConnection] = []
+
+    def __call__(self) -> FakeConnection:
+        conn = FakeConnection(len(self.created))
+        self.created.append(conn)
+        return conn
+
+
+def _validate(conn: FakeConnection) -> None:
+    if not conn.healthy:
+        raise RuntimeError("server closed the connection unexpectedly")
+
+
+@pytest.fixture
+def connector():
+    return FakeConnector()
+
+
+class TestCheckout:
+    """Checkout and return behaviour."""
+
+    def test_prefills_minconn(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=2, maxconn=4)
+        stats = pool.stats()
+        assert len(connector.created) == 2
+        assert stats["size"] == 2
+        assert stats["idle"] == 2
+
+    def test_reuses_returned_connection(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=2)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        assert pool.getconn() is conn
+        assert len(connector.created) == 1
+
+    def test_in_use_metrics(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=3)
+        first = pool.getconn()
+        pool.getconn()
+        stats = pool.stats()
+        assert stats["in_use"] == 2
+        assert stats["checkouts"] == 2
+        pool.putconn(first)
+        assert pool.stats()["in_use"] == 1
+
+    def test_putconn_rejects_foreign_connection(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1)
+        with pytest.raises(ValueError, match="not checked out"):
+            pool.putconn(FakeConnection(99))
+
+    def test_discard_closes_connection(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1)
+        conn = pool.getconn()
+        pool.putconn(conn, discard=True)
+        stats = pool.stats()
+        assert conn.closed
+        assert stats["size"] == 0
+        assert stats["connections_discarded"] == 1
+
+
+class TestBoundedWait:
+    """Timeout and overflow behaviour when the pool is exhausted."""
+
+    def test_timeout_when_exhausted(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1, timeout=0.05)
+        pool.getconn()
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn()
+        assert pool.stats()["timeouts"] == 1
+
+    def test_waiter_receives_released_connection(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1, timeout=2.0)
+        conn = pool.getconn()
+
+        def release():
+            time.sleep(0.05)
+            pool.putconn(conn)
+
+        releaser = threading.Thread(target=release)
+        releaser.start()
+        assert pool.getconn() is conn
+        releaser.join()
+
+        stats = pool.stats()
+        assert stats["waits"] == 1
+        assert stats["wait_time_max_ms"] > 0
+
+    def test_overflow_connections_are_closed_on_return(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1, max_overflow=1)
+        base = pool.getconn()
+        extra = pool.getconn()
+
+        stats = pool.stats()
+        assert stats["overflow"] == 1
+        assert stats["overflow_total"] == 1
+
+        pool.putconn(extra)
+        pool.putconn(base)
+        assert extra.closed
+        assert not base.closed
+        assert pool.stats()["size"] == 1
+
+    def test_concurrent_checkouts_never_exceed_limit(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=3, timeout=5.0)
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                conn = pool.getconn()
+                with lock:
+                    peak.append(pool.stats()["in_use"])
+                pool.putconn(conn)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) <= 3
+        assert len(connector.created) <= 3
+        assert pool.stats()["checkouts"] == 160
+        assert pool.stats()["in_use"] == 0
+
+
+class TestHealth:
+    """Validation and lifetime recycling."""
+
+    def test_stale_connection_replaced_on_checkout(self, connector):
+        pool = BoundedConnectionPool(
+            connector, minconn=1, maxconn=1, validate=_validate, validate_after_idle=0
+        )
+        stale = connector.created[0]
+        stale.healthy = False
+
+        conn = pool.getconn()
+        assert conn is not stale
+        assert stale.closed
+        assert pool.stats()["connections_invalidated"] == 1
+
+    def test_recently_used_connection_skips_validation(self, connector):
+        calls = []
+        pool = BoundedConnectionPool(
+            connector, minconn=0, maxconn=1, validate=calls.append, validate_after_idle=60
+        )
+        pool.putconn(pool.getconn())
+        pool.getconn()
+        assert calls == []
+
+    def test_expired_connection_recycled(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1, max_lifetime=0.01)
+        conn = pool.getconn()
+        time.sleep(0.02)
+        pool.putconn(conn)
+
+        assert conn.closed
+        assert pool.stats()["connections_recycled"] == 1
+        assert pool.getconn() is not conn
+
+    def test_connect_failure_releases_slot(self, connector):
+        attempts = {"count": 0}
+
+        def flaky_connect():
+            attempts["count"] += 1
+            if attempts["count"] == 1:
+                raise RuntimeError("connection refused")
+            return connector()
+
+        pool = BoundedConnectionPool(flaky_connect, minconn=0, maxconn=1, timeout=0.05)
+        with pytest.raises(RuntimeError, match="connection refused"):
+            pool.getconn()
+        assert pool.getconn() is connector.created[0]
+
+
+class TestClose:
+    """Pool shutdown."""
+
+    def test_closeall_closes_idle_and_rejects_checkout(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=2, maxconn=2)
+        pool.closeall()
+        assert all(conn.closed for conn in connector.created)
+        with pytest.raises(PoolClosedError):
+            pool.getconn()
+
+    def test_checked_out_connection_closed_on_return_after_closeall(self, connector):
+        pool = BoundedConnectionPool(connector, minconn=0, maxconn=1)
+        conn = pool.getconn()
+        pool.closeall()
+        pool.putconn(conn)
+        assert conn.closed
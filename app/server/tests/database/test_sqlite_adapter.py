@@ -0,0 +1,127 @@
+"""
+Unit tests for SQLiteAdapter connection reuse and tuning.
+"""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+from database.sqlite_adapter import SQLiteAdapter
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "test.db")
+
+
+@pytest.fixture
+def adapter(db_path):
+    adapter = SQLiteAdapter(db_path=db_path)
+    yield adapter
+    adapter.close()
+
+
+class TestThreadMode:
+    """Persistent per-thread connections."""
+
+    def test_connection_reused_within_thread(self, adapter):
+        with adapter.get_connection() as first:
+            pass
+        with adapter.get_connection() as second:
+            pass
+
+        assert first is second
+        stats = adapter.get_pool_stats()
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 1
+
+    def test_pragmas_applied(self, adapter):
+        with adapter.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_commit_and_rollback_semantics(self, adapter):
+        with adapter.get_connection() as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.execute("INSERT INTO items (name) VALUES ('kept')")
+
+        def failing_insert():
+            with adapter.get_connection() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('discarded')")
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            failing_insert()
+
+        rows = adapter.execute_query("SELECT name FROM items")
+        assert [row["name"] for row in rows] == ["kept"]
+
+    def test_nested_call_uses_separate_connection(self, adapter):
+        with adapter.get_connection() as outer:
+            outer.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+            with adapter.get_connection() as inner:
+                assert inner is not outer
+
+    def test_threads_get_distinct_connections(self, adapter):
+        seen = []
+
+        def worker():
+            with adapter.get_connection() as conn:
+                seen.append(id(conn))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(seen)) == 3
+
+    def test_reopens_when_database_file_replaced(self, adapter, db_path):
+        with adapter.get_connection() as conn:
+            conn.execute("CREATE TABLE old_table (id INTEGER)")
+
+        adapter.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.unlink(db_path + suffix)
+        sqlite3.connect(db_path).close()
+
+        with adapter.get_connection() as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        assert tables == []
+
+    def test_reopens_after_external_close(self, adapter):
+        with adapter.get_connection() as conn:
+            pass
+        conn.close()
+
+        with adapter.get_connection() as conn2:
+            assert conn2.execute("SELECT 1").fetchone()[0] == 1
+        assert adapter.get_pool_stats()["connections_reopened"] == 1
+
+    def test_close_releases_all_connections(self, adapter):
+        with adapter.get_connection():
+            pass
+        adapter.close()
+        assert adapter.get_pool_stats()["open_connections"] == 0
+
+
+class TestLegacyMode:
+    """pool_mode='none' keeps the original per-call behaviour."""
+
+    def test_new_connection_each_call(self, db_path):
+        adapter = SQLiteAdapter(db_path=db_path, pool_mode="none")
+        with adapter.get_connection() as first:
+            pass
+        with adapter.get_connection() as second:
+            pass
+
+        assert first is not second
+        assert adapter.get_pool_stats()["connections_opened"] == 2
+
+    def test_invalid_mode_rejected(self, db_path):
+        with pytest.raises(ValueError, match="pool_mode"):
+            SQLiteAdapter(db_path=db_path, pool_mode="bogus")
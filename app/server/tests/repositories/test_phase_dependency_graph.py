@@ -0,0 +1,170 @@
+"""
+Unit tests for the in-memory phase dependency graph.
+"""
+
+import json
+
+from repositories.phase_dependency_graph import PhaseDependencyGraph
+
+
+def phase_row(queue_id, phase_number, depends_on=(), status="queued", feature_id=1):
+    return {
+        "queue_id": queue_id,
+        "feature_id": feature_id,
+        "phase_number": phase_number,
+        "status": status,
+        "depends_on_phases": json.dumps(list(depends_on)),
+    }
+
+
+class ListLoader:
+    """Loader over a list of rows that counts how often it was called."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.rows)
+
+
+def diamond():
+    # 1 -> (2, 3) -> 4, plus an independent phase 5
+    return [
+        phase_row("q1", 1),
+        phase_row("q2", 2, [1]),
+        phase_row("q3", 3, [1]),
+        phase_row("q4", 4, [2, 3]),
+        phase_row("q5", 5),
+    ]
+
+
+class TestPhaseDependencyGraph:
+    """Test readiness tracking as phases change status"""
+
+    def test_loads_lazily_with_one_query(self):
+        loader = ListLoader(diamond())
+        graph = PhaseDependencyGraph(loader)
+        assert not graph.loaded
+        assert loader.calls == 0
+
+        assert graph.ready_phases(1) == ["q1", "q5"]
+        assert graph.ready_phases(2) == []
+        assert loader.calls == 1
+
+    def test_completion_returns_newly_ready_phases(self):
+        graph = PhaseDependencyGraph(ListLoader(diamond()))
+        graph.ensure_loaded()
+
+        graph.set_status("q1", "running")
+        assert sorted(graph.set_status("q1", "completed")) == ["q2", "q3"]
+        assert graph.ready_phases(1) == ["q2", "q3", "q5"]
+
+        assert graph.set_status("q2", "completed") == []
+        assert graph.set_status("q3", "completed") == ["q4"]
+        assert graph.get("q4").unmet == 0
+
+    def test_fan_in_waits_for_every_dependency(self):
+        rows = diamond()
+        rows[0]["status"] = "completed"
+        rows[1]["status"] = "completed"
+        graph = PhaseDependencyGraph(ListLoader(rows))
+
+        assert graph.ready_phases(1) == ["q3", "q5"]
+        assert graph.get("q4").unmet == 1
+
+    def test_missing_dependency_blocks(self):
+        graph = PhaseDependencyGraph(ListLoader([phase_row("q2", 2, [1])]))
+        assert graph.ready_phases(1) == []
+
+        graph.add_phase("q1", 1, 1, "completed", [])
+        assert graph.ready_phases(1) == ["q2"]
+
+        graph.remove_phase("q1")
+        assert graph.ready_phases(1) == []
+
+    def test_leaving_completed_blocks_dependents_again(self):
+        rows = diamond()
+        rows[0]["status"] = "completed"
+        graph = PhaseDependencyGraph(ListLoader(rows))
+        assert "q2" in graph.ready_phases(1)
+
+        graph.set_status("q1", "failed")
+        assert graph.ready_phases(1) == ["q5"]
+        assert graph.get("q2").unmet == 1
+
+    def test_requeued_phase_is_reported_ready(self):
+        graph = PhaseDependencyGraph(ListLoader([phase_row("q1", 1, status="failed")]))
+        graph.ensure_loaded()
+
+        assert graph.set_status("q1", "queued") == ["q1"]
+
+    def test_features_are_independent(self):
+        rows = [phase_row("a1", 1, feature_id=1), phase_row("b2", 2, [1], feature_id=2)]
+        graph = PhaseDependencyGraph(ListLoader(rows))
+        graph.set_status("a1", "completed")
+
+        assert graph.ready_phases(2) == []
+
+    def test_hooks_ignored_before_load(self):
+        loader = ListLoader([phase_row("q1", 1)])
+        graph = PhaseDependencyGraph(loader)
+
+        graph.add_phase("q9", 1, 9, "queued", [])
+        assert graph.set_status("q1", "completed") == []
+        assert loader.calls == 0
+        assert graph.get("q9") is None
+
+
+class TestConsistencyCheck:
+    """Test detection of writes that bypassed the repository"""
+
+    def test_consistent_graph_reports_nothing(self):
+        graph = PhaseDependencyGraph(ListLoader(diamond()))
+        graph.set_status("q1", "completed")
+
+        assert graph.check_consistency() == []
+
+    def test_out_of_band_changes_are_detected_and_rebuilt(self):
+        rows = diamond()
+        loader = ListLoader(rows)
+        graph = PhaseDependencyGraph(loader)
+        graph.ensure_loaded()
+
+        rows[0]["status"] = "completed"
+        rows.append(phase_row("q6", 6, [5]))
+        problems = graph.check_consistency()
+
+        assert any(p.startswith("q1:") for p in problems)
+        assert "q6: missing from graph" in problems
+        assert graph.ready_phases(1) == ["q2", "q3", "q5"]
+        assert graph.check_consistency() == []
+
+    def test_check_without_rebuild_keeps_graph(self):
+        rows = diamond()
+        graph = PhaseDependencyGraph(ListLoader(rows))
+        graph.ensure_loaded()
+        del rows[4]
+
+        assert graph.check_consistency(rebuild=False) == [
+            "q5: no longer in database",
+            "feature 1: ready set differs",
+        ]
+        assert graph.ready_phases(1) == ["q1", "q5"]
+
+    def test_resync_feature_picks_up_out_of_band_writes(self):
+        rows = diamond() + [phase_row("other", 1, feature_id=2)]
+        loader = ListLoader(rows)
+        graph = PhaseDependencyGraph(loader)
+        graph.ensure_loaded()
+
+        # Another process completes q1 and q5 without going through this graph
+        rows[0]["status"] = "completed"
+        rows[4]["status"] = "completed"
+        assert graph.ready_phases(1) == ["q1", "q5"]
+
+        assert graph.resync_feature(1) is True
+        assert graph.ready_phases(1) == ["q2", "q3"]
+        assert graph.ready_phases(2) == ["other"]
+        assert graph.resync_feature(1) is False
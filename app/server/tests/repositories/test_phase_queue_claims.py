@@ -0,0 +1,162 @@
+"""
+Tests for atomic phase claiming in PhaseQueueRepository (SQLite).
+
+Covers:
+- Claim order and limits
+- Exclusive claims between workers, including concurrent threads
+- Lease expiry, heartbeat and release
+"""
+
+import sqlite3
+import threading
+
+import pytest
+from models.phase_queue_item import PhaseQueueItem
+from repositories.phase_queue_repository import PhaseQueueRepository
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary database with the current phase_queue schema"""
+    path = str(tmp_path / "claims.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE phase_queue (
+            queue_id TEXT PRIMARY KEY,
+            feature_id INTEGER,
+            phase_number INTEGER NOT NULL,
+            issue_number INTEGER,
+            status TEXT DEFAULT 'queued',
+            current_phase TEXT DEFAULT 'init',
+            depends_on_phases TEXT DEFAULT '[]',
+            phase_data TEXT,
+            created_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            error_message TEXT,
+            adw_id TEXT,
+            pr_number INTEGER,
+            priority INTEGER DEFAULT 50,
+            queue_position INTEGER,
+            ready_timestamp TIMESTAMP,
+            started_timestamp TIMESTAMP,
+            claimed_by TEXT,
+            claimed_at TIMESTAMP,
+            heartbeat_at TIMESTAMP,
+            lease_expires_at TIMESTAMP
+        )
+    """)
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def repo(db_path):
+    return PhaseQueueRepository(db_path=db_path)
+
+
+def enqueue(repo, queue_id, feature_id, phase_number=1, status="ready", priority=50):
+    repo.create(PhaseQueueItem(
+        queue_id=queue_id,
+        feature_id=feature_id,
+        phase_number=phase_number,
+        status=status,
+        priority=priority,
+        phase_data={"title": queue_id},
+    ))
+
+
+def test_claims_in_priority_order_up_to_limit(repo):
+    enqueue(repo, "normal", 1)
+    enqueue(repo, "urgent", 2, priority=10)
+    enqueue(repo, "later", 3)
+    enqueue(repo, "phase2", 4, phase_number=2)
+    enqueue(repo, "waiting", 5, status="queued")
+
+    claimed = repo.claim_ready_phases("worker-a", limit=2, phase_number=1)
+
+    assert [item.queue_id for item in claimed] == ["urgent", "normal"]
+    assert all(item.claimed_by == "worker-a" and item.lease_expires_at for item in claimed)
+
+
+def test_claimed_phases_are_not_handed_out_again(repo):
+    enqueue(repo, "a", 1)
+    enqueue(repo, "b", 2)
+
+    first = repo.claim_ready_phases("worker-a", limit=5)
+    second = repo.claim_ready_phases("worker-b", limit=5)
+
+    assert [item.queue_id for item in first] == ["a", "b"]
+    assert second == []
+
+
+def test_expired_lease_can_be_reclaimed(repo):
+    enqueue(repo, "a", 1)
+    assert repo.claim_ready_phases("worker-a", lease_seconds=-60)
+
+    reclaimed = repo.claim_ready_phases("worker-b")
+
+    assert [item.claimed_by for item in reclaimed] == ["worker-b"]
+    # The original owner lost the claim and cannot renew or release it
+    assert not repo.heartbeat_claim("a", "worker-a")
+    assert not repo.release_claim("a", "worker-a")
+
+
+def test_heartbeat_extends_lease_and_release_frees_phase(repo):
+    enqueue(repo, "a", 1)
+    repo.claim_ready_phases("worker-a", lease_seconds=-60)
+
+    assert repo.heartbeat_claim("a", "worker-a", lease_seconds=300)
+    assert repo.claim_ready_phases("worker-b") == []
+
+    assert repo.release_claim("a", "worker-a")
+    assert [item.claimed_by for item in repo.claim_ready_phases("worker-b")] == ["worker-b"]
+
+
+def test_claim_by_queue_id_and_status(repo):
+    enqueue(repo, "a", 1, status="queued")
+    enqueue(repo, "b", 1, phase_number=2, status="running")
+
+    assert repo.claim_ready_phases("w", queue_ids=["a", "b"]) == []
+    claimed = repo.claim_ready_phases("w", queue_ids=["a", "b"], statuses=("queued", "ready"))
+
+    assert [item.queue_id for item in claimed] == ["a"]
+    assert repo.claim_ready_phases("w", queue_ids=[]) == []
+
+
+def test_concurrent_workers_never_claim_the_same_phase(db_path):
+    setup = PhaseQueueRepository(db_path=db_path)
+    for n in range(40):
+        enqueue(setup, f"q{n:02d}", n)
+
+    claims: dict[str, list[str]] = {}
+    errors = []
+
+    def worker(name):
+        repo = PhaseQueueRepository(db_path=db_path)
+        claims[name] = []
+        try:
+            while batch := repo.claim_ready_phases(name, limit=3):
+                claims[name].extend(item.queue_id for item in batch)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    claimed = [queue_id for ids in claims.values() for queue_id in ids]
+    assert sorted(claimed) == [f"q{n:02d}" for n in range(40)]
+
+
+def test_find_claimable_skips_live_claims(repo):
+    enqueue(repo, "a", 1)
+    enqueue(repo, "b", 2)
+    enqueue(repo, "c", 3)
+    repo.claim_ready_phases("worker-a", queue_ids=["a"])
+    repo.claim_ready_phases("worker-a", queue_ids=["b"], lease_seconds=-60)
+
+    assert [item.queue_id for item in repo.find_claimable_phases()] == ["b", "c"]
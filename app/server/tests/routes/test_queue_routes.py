@@ -4,9 +4,14 @@ Tests for queue routes validation.
 Tests the EnqueueRequest model validators to ensure data integrity
 and prevent invalid data from entering the phase queue.
 """
+from types import SimpleNamespace
+
 import pytest
+from models.phase_queue_item import PhaseQueueItem
 from pydantic import ValidationError
-from routes.queue_routes import EnqueueRequest
+from routes.queue_routes import EnqueueRequest, _find_next_phase
+
+from tests.repositories.test_phase_queue_claims import db_path, repo  # noqa: F401 (fixtures)
 
 
 def test_enqueue_request_valid():
@@ -293,3 +298,25 @@ def test_enqueue_request_boundary_values():
     assert request.parent_issue == 999999
     assert request.phase_number == 20
     assert request.depends_on_phase == 19
+
+
+def test_webhook_next_phase_is_claimed(repo):  # noqa: F811
+    """Test that the webhook claims the same-parent next phase before launching it."""
+    repo.create(PhaseQueueItem(
+        queue_id="p2", feature_id=7, phase_number=2, status="queued",
+        depends_on_phases=[1], phase_data={"title": "p2"},
+    ))
+    service = SimpleNamespace(repository=repo)
+    request = SimpleNamespace(parent_issue=7, phase_number=1)
+
+    next_phase = _find_next_phase(service, request, "webhook")
+    assert next_phase.queue_id == "p2"
+    assert next_phase.claimed_by == "webhook"
+
+    # The coordinator loses the race, and so does a duplicate webhook
+    assert repo.claim_ready_phases("coordinator", queue_ids=["p2"], statuses=("queued", "ready")) == []
+    assert _find_next_phase(service, request, "webhook-2") is None
+
+    # Released after the launch attempt, so a failed launch is retryable at once
+    assert repo.release_claim("p2", "webhook")
+    assert _find_next_phase(service, request, "webhook-2").claimed_by == "webhook-2"
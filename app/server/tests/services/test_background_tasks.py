@@ -0,0 +1,144 @@
+"""
+Tests for the change-driven snapshots kept by BackgroundTaskManager watchers.
+"""
+
+from types import SimpleNamespace
+
+from services.background_tasks import PlannedFeaturesSnapshot, QueueSnapshot
+
+
+class FakeQueueRepository:
+    """PhaseQueueRepository stand-in that records which reads were made."""
+
+    def __init__(self, rows):
+        self.rows = {row.queue_id: row for row in rows}
+        self.paused = "false"
+        self.calls = []
+
+    def get_all(self, limit=100):
+        self.calls.append("get_all")
+        rows = sorted(self.rows.values(), key=lambda r: (r.feature_id, r.phase_number))
+        return rows[:limit]
+
+    def get_by_ids(self, queue_ids):
+        self.calls.append(("get_by_ids", tuple(queue_ids)))
+        return [self.rows[q] for q in queue_ids if q in self.rows]
+
+    def get_config_value(self, key):
+        self.calls.append("get_config_value")
+        return self.paused
+
+
+def queue_item(queue_id, feature_id, phase_number, status="queued"):
+    item = SimpleNamespace(
+        queue_id=queue_id, feature_id=feature_id, phase_number=phase_number, status=status
+    )
+    item.to_dict = lambda: {"queue_id": item.queue_id, "status": item.status}
+    return item
+
+
+def test_queue_snapshot_rereads_only_changed_rows():
+    repo = FakeQueueRepository([queue_item("a", 1, 1), queue_item("b", 1, 2)])
+    snapshot = QueueSnapshot(repo)
+    snapshot.refresh({})
+    repo.calls.clear()
+
+    repo.rows["b"] = queue_item("b", 1, 2, status="running")
+    repo.rows["c"] = queue_item("c", 0, 1)
+    del repo.rows["a"]
+    data = snapshot.refresh({"phase_queue": {"a", "b", "c"}})
+
+    assert repo.calls == [("get_by_ids", ("a", "b", "c"))]
+    assert data == {
+        "phases": [{"queue_id": "c", "status": "queued"}, {"queue_id": "b", "status": "running"}],
+        "total": 2,
+        "paused": False,
+    }
+
+
+def test_queue_snapshot_config_change_rereads_paused_flag_only():
+    repo = FakeQueueRepository([queue_item("a", 1, 1)])
+    snapshot = QueueSnapshot(repo)
+    snapshot.refresh({})
+    repo.calls.clear()
+
+    repo.paused = "true"
+    data = snapshot.refresh({"queue_config": {"queue_paused"}})
+
+    assert repo.calls == ["get_config_value"]
+    assert data["paused"] is True
+
+
+def test_queue_snapshot_reloads_when_window_is_full():
+    repo = FakeQueueRepository([queue_item(str(n), 1, n) for n in range(3)])
+    snapshot = QueueSnapshot(repo, limit=2)
+    snapshot.refresh({})
+    repo.calls.clear()
+
+    del repo.rows["0"]
+    data = snapshot.refresh({"phase_queue": {"0"}})
+
+    assert repo.calls == ["get_all"]
+    assert [p["queue_id"] for p in data["phases"]] == ["1", "2"]
+
+
+class FakeFeaturesService:
+    """PlannedFeaturesService stand-in over a dict of features."""
+
+    def __init__(self, features):
+        self.features = {f.id: f for f in features}
+        self.calls = []
+
+    def get_all(self, limit=100):
+        self.calls.append("get_all")
+        return list(self.features.values())[:limit]
+
+    def get_by_ids(self, feature_ids):
+        self.calls.append(("get_by_ids", tuple(feature_ids)))
+        return [self.features[i] for i in feature_ids if i in self.features]
+
+    def get_statistics(self):
+        self.calls.append("get_statistics")
+        return {"total": len(self.features)}
+
+    @staticmethod
+    def sort_features(features):
+        return sorted(features, key=lambda f: f.id)
+
+
+def feature(feature_id, status="planned"):
+    return SimpleNamespace(
+        id=feature_id, status=status, model_dump=lambda: {"id": feature_id, "status": status}
+    )
+
+
+def test_planned_features_snapshot_applies_changed_features():
+    service = FakeFeaturesService([feature(1), feature(2)])
+    snapshot = PlannedFeaturesSnapshot(service)
+    snapshot.refresh({})
+    service.calls.clear()
+
+    service.features[2] = feature(2, status="completed")
+    service.features[3] = feature(3)
+    data = snapshot.refresh({"planned_features": {"2", "3"}})
+
+    assert service.calls == [("get_by_ids", (2, 3)), "get_statistics"]
+    assert data == {
+        "features": [
+            {"id": 1, "status": "planned"},
+            {"id": 2, "status": "completed"},
+            {"id": 3, "status": "planned"},
+        ],
+        "stats": {"total": 3},
+    }
+
+
+def test_planned_features_snapshot_full_reload_on_unknown_changes():
+    service = FakeFeaturesService([feature(1)])
+    snapshot = PlannedFeaturesSnapshot(service)
+    snapshot.refresh({})
+    service.calls.clear()
+
+    snapshot.refresh({"planned_features": None})
+
+    assert service.calls == ["get_all", "get_statistics"]
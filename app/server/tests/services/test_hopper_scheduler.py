@@ -0,0 +1,206 @@
+"""
+Tests for the pluggable hopper scheduler and its simulator.
+"""
+
+import pytest
+from services.hopper_simulator import SimulatedJob, compare_policies, simulate
+from services.hopper_sorter import (
+    CostBudget,
+    HopperSorter,
+    PhaseEstimate,
+    PhaseEstimator,
+    PhaseScheduler,
+    PriorityFifoPolicy,
+    SchedulableJob,
+    ShortestExpectedJobFirstPolicy,
+    WeightedFairPolicy,
+)
+
+from tests.repositories.test_phase_queue_claims import db_path, enqueue  # noqa: F401 (fixture)
+
+ESTIMATES = PhaseEstimator({
+    "short": PhaseEstimate(duration_seconds=60, cost_usd=1.0, tokens=1000),
+    "long": PhaseEstimate(duration_seconds=600, cost_usd=5.0, tokens=9000),
+})
+
+
+def job(queue_id, feature_id, position, template="short", priority=50):
+    return SchedulableJob(queue_id, feature_id, priority=priority, queue_position=position, template=template)
+
+
+def ids(jobs):
+    return [j.queue_id for j in jobs]
+
+
+class TestPolicies:
+    """Test how each policy orders the same candidates"""
+
+    def test_priority_fifo(self):
+        jobs = [job("a", 1, 2), job("b", 2, 1), job("c", 3, 3, priority=10)]
+
+        assert ids(PriorityFifoPolicy().order(jobs, ESTIMATES)) == ["c", "b", "a"]
+
+    def test_shortest_expected_first(self):
+        jobs = [job("a", 1, 1, template="long"), job("b", 2, 2), job("c", 3, 3, template="unknown")]
+
+        # unknown templates use the default estimate (30 min)
+        assert ids(ShortestExpectedJobFirstPolicy().order(jobs, ESTIMATES)) == ["b", "a", "c"]
+
+    def test_weighted_fair_interleaves_features(self):
+        # Feature 1 enqueued four phases before feature 2 enqueued two
+        jobs = [job(f"a{n}", 1, n) for n in range(4)] + [job(f"b{n}", 2, 10 + n) for n in range(2)]
+        policy = WeightedFairPolicy()
+        scheduler = PhaseScheduler(policy, ESTIMATES)
+
+        dispatched = []
+        while jobs:
+            picked = scheduler.select(jobs, slots=1)
+            dispatched += ids(picked)
+            jobs = [j for j in jobs if j not in picked]
+
+        assert dispatched == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+    def test_weighted_fair_favours_higher_priority_feature(self):
+        jobs = [job(f"u{n}", 1, n, priority=25) for n in range(4)] + [job(f"n{n}", 2, 10 + n) for n in range(4)]
+        scheduler = PhaseScheduler(WeightedFairPolicy(), ESTIMATES)
+
+        first_six = []
+        for _ in range(6):
+            picked = scheduler.select(jobs, slots=1)
+            first_six += ids(picked)
+            jobs = [j for j in jobs if j not in picked]
+
+        # Weight 2 vs 1: the urgent feature gets about twice the share
+        assert sum(1 for q in first_six if q.startswith("u")) == 4
+
+
+class TestEstimatorAndBudget:
+    """Test learned estimates and budget admission"""
+
+    def test_observe_smooths_towards_new_runs(self):
+        estimator = PhaseEstimator(smoothing=0.5)
+        estimator.observe("t", 100, cost_usd=2.0, tokens=10)
+        estimator.observe("t", 200, cost_usd=4.0, tokens=30)
+
+        assert estimator.estimate("t") == PhaseEstimate(150, 3.0, 20)
+
+    def test_observe_keeps_unreported_fields(self):
+        estimator = PhaseEstimator(smoothing=0.5)
+        estimator.observe("t", 100, cost_usd=2.0, tokens=10)
+        estimator.observe("t", 200)
+        estimator.observe("new", 300)
+
+        assert estimator.estimate("t") == PhaseEstimate(150, 2.0, 10)
+        assert estimator.estimate("new") == PhaseEstimate(300, 2.0, 200_000)
+
+    def test_budget_holds_later_phases(self):
+        budget = CostBudget(max_cost_usd=7.0, window_seconds=100)
+        scheduler = PhaseScheduler(PriorityFifoPolicy(), ESTIMATES, budget)
+        jobs = [job("a", 1, 1, "long"), job("b", 2, 2), job("c", 3, 3, "long"), job("d", 4, 4)]
+
+        assert ids(scheduler.select(jobs, slots=4, now=0)) == ["a", "b"]
+        assert scheduler.select(jobs[2:], slots=4, now=50) == []
+        assert budget.next_release(50) == 100
+        assert ids(scheduler.select(jobs[2:], slots=4, now=100)) == ["c", "d"]
+
+    def test_empty_window_admits_oversized_phase(self):
+        budget = CostBudget(max_cost_usd=1.0)
+
+        assert budget.can_afford(PhaseEstimate(60, 5.0, 0), now=0)
+
+
+class TestScheduledClaims:
+    """Test that only phases actually claimed are charged"""
+
+    def test_lost_claims_are_not_charged(self, db_path, monkeypatch):  # noqa: F811
+        budget = CostBudget(max_cost_usd=100, window_seconds=3600)
+        policy = WeightedFairPolicy()
+        sorter = HopperSorter(db_path=db_path, scheduler=PhaseScheduler(policy, ESTIMATES, budget))
+        enqueue(sorter.repository, "a", 1)
+        enqueue(sorter.repository, "b", 2)
+
+        # Another dispatcher claims "b" after the candidates were read
+        find = sorter.repository.find_claimable_phases
+
+        def find_then_lose_b(**kwargs):
+            candidates = find(**kwargs)
+            sorter.repository.claim_ready_phases("other", queue_ids=["b"])
+            return candidates
+
+        monkeypatch.setattr(sorter.repository, "find_claimable_phases", find_then_lose_b)
+        claimed = sorter.claim_next_phases(worker_id="me", max_parallel=2)
+
+        assert ids(claimed) == ["a"]
+        assert budget.spent()[0] == PhaseEstimator.DEFAULT_ESTIMATE.cost_usd  # one phase charged, not two
+        assert set(policy._finish_tags) == {1}
+
+    @pytest.mark.parametrize("scheduled", [False, True])
+    def test_phase_1s_with_an_issue_are_not_claimed(self, db_path, scheduled):  # noqa: F811
+        scheduler = PhaseScheduler(PriorityFifoPolicy(), ESTIMATES) if scheduled else None
+        sorter = HopperSorter(db_path=db_path, scheduler=scheduler)
+        enqueue(sorter.repository, "started", 1, priority=10)
+        enqueue(sorter.repository, "fresh", 2)
+        sorter.repository.update_issue_number("started", 101)
+
+        assert ids(sorter.claim_next_phases(worker_id="me", max_parallel=2)) == ["fresh"]
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("HOPPER_SCHEDULING_POLICY", raising=False)
+        monkeypatch.delenv("HOPPER_BUDGET_USD", raising=False)
+        monkeypatch.delenv("HOPPER_BUDGET_TOKENS", raising=False)
+        assert PhaseScheduler.from_env() is None
+
+        monkeypatch.setenv("HOPPER_SCHEDULING_POLICY", "weighted_fair")
+        monkeypatch.setenv("HOPPER_BUDGET_USD", "25")
+        monkeypatch.setattr(PhaseEstimator, "from_history", classmethod(lambda cls: cls()))
+        scheduler = PhaseScheduler.from_env()
+
+        assert isinstance(scheduler.policy, WeightedFairPolicy)
+        assert scheduler.budget.max_cost_usd == 25.0
+
+
+class TestSimulator:
+    """Test the discrete-event replay"""
+
+    def workload(self):
+        # One feature floods the queue with long phases, others bring short ones
+        jobs = [
+            SimulatedJob(f"big{n}", 1, queue_position=n, template="long", arrival=0, duration=600, cost_usd=5)
+            for n in range(4)
+        ]
+        jobs += [
+            SimulatedJob(f"small{n}", 2 + n, queue_position=10 + n, template="short", arrival=10, duration=60, cost_usd=1)
+            for n in range(4)
+        ]
+        return jobs
+
+    def test_simulate_fifo(self):
+        result = simulate(self.workload(), PriorityFifoPolicy(), max_parallel=2, estimator=ESTIMATES)
+
+        assert result.completed == 8
+        # Two slots: big phases run 0-1200, then the four small ones 1200-1320
+        assert result.makespan == 1320
+        assert result.total_cost_usd == 24
+
+    def test_shortest_first_cuts_waiting(self):
+        results = {
+            r.policy: r
+            for r in compare_policies(self.workload(), max_parallel=2, estimator_factory=lambda: ESTIMATES)
+        }
+
+        assert all(r.completed == 8 for r in results.values())
+        assert results["shortest_expected_first"].mean_wait < results["priority_fifo"].mean_wait
+        assert results["weighted_fair"].mean_wait < results["priority_fifo"].mean_wait
+
+    def test_budget_stretches_makespan(self):
+        unlimited = simulate(self.workload(), PriorityFifoPolicy(), max_parallel=2, estimator=ESTIMATES)
+        limited = simulate(
+            self.workload(),
+            PriorityFifoPolicy(),
+            max_parallel=2,
+            estimator=ESTIMATES,
+            budget=CostBudget(max_cost_usd=10, window_seconds=3600),
+        )
+
+        assert limited.completed == 8
+        assert limited.makespan > unlimited.makespan
@@ -21,6 +21,8 @@ import pytest
 from services.phase_coordinator import PhaseCoordinator
 from services.phase_queue_service import PhaseQueueService
 
+from tests.repositories.test_phase_queue_claims import db_path, enqueue  # noqa: F401 (fixture)
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -646,3 +648,63 @@ def test_get_ready_phases(phase_coordinator, phase_queue_service):
     assert len(ready_phases) == 1
     assert ready_phases[0].queue_id == ready_id
     assert ready_phases[0].status == "ready"
+
+
+@pytest.mark.unit
+def test_ready_phases_fall_back_to_database_when_graph_is_stale():
+    """Test that phases completed by another process are found by re-reading the feature"""
+    from types import SimpleNamespace
+
+    from models.phase_queue_item import PhaseQueueItem
+    from repositories.phase_dependency_graph import PhaseDependencyGraph
+
+    rows = [
+        {"queue_id": "q1", "feature_id": 7, "phase_number": 1, "status": "running", "depends_on_phases": "[]"},
+        {"queue_id": "q2", "feature_id": 7, "phase_number": 2, "status": "queued", "depends_on_phases": "[1]"},
+    ]
+    graph = PhaseDependencyGraph(lambda: [dict(row) for row in rows])
+    repository = SimpleNamespace(
+        dependency_graph=graph,
+        get_by_ids=lambda ids: [
+            PhaseQueueItem(queue_id=r["queue_id"], feature_id=7, phase_number=r["phase_number"], status=r["status"])
+            for r in rows if r["queue_id"] in ids
+        ],
+    )
+    coordinator = PhaseCoordinator(SimpleNamespace(repository=repository))
+    assert coordinator._find_newly_ready_phases(7) == []
+
+    # The ADW process marks phase 1 completed; this process's graph never sees the write
+    rows[0]["status"] = "completed"
+
+    assert [row["queue_id"] for row in coordinator._find_newly_ready_phases(7)] == ["q2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_launches_go_through_the_scheduler(db_path):  # noqa: F811
+    """Test that dependent phases are picked and charged by the hopper scheduler"""
+    from types import SimpleNamespace
+
+    from repositories.phase_queue_repository import PhaseQueueRepository
+    from services.hopper_sorter import PhaseScheduler, WeightedFairPolicy
+
+    repository = PhaseQueueRepository(db_path=db_path)
+    for queue_id, feature_id in [("a1", 1), ("a2", 1), ("a3", 1), ("b1", 2)]:
+        enqueue(repository, queue_id, feature_id, phase_number=2, status="queued")
+    coordinator = PhaseCoordinator(SimpleNamespace(repository=repository))
+    policy = WeightedFairPolicy()
+    coordinator.scheduler = PhaseScheduler(policy)
+    launched = []
+
+    async def launch(phase_row):
+        launched.append(phase_row["queue_id"])
+
+    coordinator._launch_claimed_phase = launch
+    rows = [item.to_dict() for item in repository.get_by_ids(["a1", "a2", "a3", "b1"])]
+
+    assert await coordinator._launch_phases(rows, slots=2) == 2
+
+    # One phase per feature, not feature 1's first two
+    assert sorted(launched) == ["a1", "b1"]
+    assert set(policy._finish_tags) == {1, 2}
+    assert all(item.claimed_by is None for item in repository.get_by_ids(["a1", "b1"]))
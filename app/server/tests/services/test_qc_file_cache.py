@@ -0,0 +1,249 @@
+"""
+Tests for the incremental QC file cache and the metrics built on it.
+
+Tests verify:
+- One walk with directory pruning
+- Only changed files are re-read and re-linted
+- Lint results survive mtime-only changes and reset on linter config changes
+- Persistence across cache instances
+- QCMetricsService naming, file structure and linting metrics
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from services import qc_file_cache
+from services.qc_file_cache import QCFileCache, count_lines, naming_verdict
+from services.qc_metrics_service import QCMetricsService
+
+
+def _write(root: Path, relative: str, content: str) -> Path:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _bump_mtime(path: Path, seconds: int = 10) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class FakeLinter:
+    """Stands in for QCFileCache._run_linter, recording what gets linted."""
+
+    def __init__(self, counts=None, fail=False):
+        self.counts = counts or {}
+        self.fail = fail
+        self.calls = []
+
+    def __call__(self, target, paths):
+        self.calls.append((target.name, sorted(paths)))
+        if self.fail:
+            return None
+        return {path: self.counts[path] for path in paths if path in self.counts}
+
+    @property
+    def linted(self):
+        return sorted(path for _, paths in self.calls for path in paths)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    _write(root, "app/server/core/good_module.py", "x = 1\n" * 5)
+    _write(root, "app/server/core/BadModule.py", "x = 1\n")
+    _write(root, "app/server/.venv/lib/site.py", "x = 1\n")
+    _write(root, "adws/adw_build.py", "x = 1\n")
+    _write(root, "app/client/src/components/Panel.tsx", "export const a = 1;\n")
+    _write(root, "app/client/src/components/panel_utils.ts", "export const b = 2;\n")
+    _write(root, "app/client/node_modules/react/index.js", "module.exports = {};\n")
+    _write(root, "app/client/coverage/report.js", "var x;\n")
+    _write(root, "README.md", "not a source file\n")
+    return root
+
+
+@pytest.fixture
+def cache(project, tmp_path):
+    cache = QCFileCache(project, cache_path=tmp_path / "qc_cache.json", max_workers=1)
+    cache.refresh()
+    return cache
+
+
+class TestFileFacts:
+    """Line counting and naming verdicts."""
+
+    def test_count_lines_matches_text_mode_iteration(self, tmp_path):
+        for data in [b"", b"a", b"a\n", b"a\nb", b"a\r\nb\r\n", b"a\rb", b"\n\n"]:
+            path = tmp_path / "f.txt"
+            path.write_bytes(data)
+            with open(path, encoding="utf-8") as f:
+                assert count_lines(data) == sum(1 for _ in f)
+        assert count_lines(b"\xff\xfe") is None
+
+    def test_naming_verdicts(self):
+        assert naming_verdict("good_module.py") == (None, None)
+        assert naming_verdict("BadModule.py") == ("Python file should use snake_case", "warning")
+        assert naming_verdict("panel.tsx")[1] == "warning"
+        assert naming_verdict("api-client.ts")[1] == "info"
+        assert naming_verdict("index.js") == (None, None)
+
+
+class TestRefresh:
+    """Walking and incremental refresh."""
+
+    def test_walk_prunes_skipped_directories(self, cache):
+        assert [facts.path for facts in cache.files()] == [
+            "adws/adw_build.py",
+            "app/client/src/components/Panel.tsx",
+            "app/client/src/components/panel_utils.ts",
+            "app/server/core/BadModule.py",
+            "app/server/core/good_module.py",
+        ]
+
+    def test_only_changed_files_are_reread(self, project, cache):
+        path = _write(project, "app/server/core/good_module.py", "x = 1\n" * 7)
+        _bump_mtime(path)
+
+        with patch.object(qc_file_cache, "_read_facts", wraps=qc_file_cache._read_facts) as read:
+            changed = cache.refresh()
+
+        assert changed == {"app/server/core/good_module.py"}
+        assert [call.args[0][0] for call in read.call_args_list] == ["app/server/core/good_module.py"]
+        assert {f.path: f.lines for f in cache.files()}["app/server/core/good_module.py"] == 7
+
+    def test_removed_files_are_dropped(self, project, cache):
+        (project / "adws" / "adw_build.py").unlink()
+
+        assert cache.refresh() == {"adws/adw_build.py"}
+        assert "adws/adw_build.py" not in {f.path for f in cache.files()}
+
+    def test_many_changes_use_a_process_pool(self, project, tmp_path):
+        for n in range(5):
+            _write(project, f"app/server/gen/mod_{n}.py", "x = 1\n" * n)
+        cache = QCFileCache(project, cache_path="", max_workers=2)
+
+        with patch.object(qc_file_cache, "PARALLEL_READ_THRESHOLD", 2):
+            cache.refresh()
+
+        lines = {f.path: f.lines for f in cache.files()}
+        assert [lines[f"app/server/gen/mod_{n}.py"] for n in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_cache_persists_across_instances(self, project, cache, tmp_path):
+        linter = FakeLinter({"app/server/core/BadModule.py": (0, 3)})
+        with patch.object(QCFileCache, "_run_linter", linter):
+            cache.lint()
+
+        reopened = QCFileCache(project, cache_path=tmp_path / "qc_cache.json", max_workers=1)
+        linter = FakeLinter()
+        with patch.object(qc_file_cache, "_read_facts") as read, patch.object(QCFileCache, "_run_linter", linter):
+            assert reopened.refresh() == set()
+            totals = reopened.lint()
+
+        read.assert_not_called()
+        assert linter.calls == []
+        assert totals["backend"].warnings == 3
+
+
+class TestLint:
+    """Incremental linting."""
+
+    def test_first_lint_covers_every_target(self, cache):
+        linter = FakeLinter({
+            "app/server/core/BadModule.py": (0, 2),
+            "adws/adw_build.py": (0, 1),
+            "app/client/src/components/Panel.tsx": (1, 1),
+        })
+        with patch.object(QCFileCache, "_run_linter", linter):
+            totals = cache.lint()
+
+        assert {name for name, _ in linter.calls} == {"backend", "adws", "frontend"}
+        assert (totals["backend"].warnings, totals["adws"].warnings) == (2, 1)
+        assert (totals["frontend"].errors, totals["frontend"].warnings) == (1, 1)
+
+    def test_only_changed_files_are_relinted(self, project, cache):
+        with patch.object(QCFileCache, "_run_linter", FakeLinter()):
+            cache.lint()
+
+        path = _write(project, "app/server/core/good_module.py", "import os\n")
+        _bump_mtime(path)
+        _bump_mtime(project / "adws" / "adw_build.py")  # touched, content unchanged
+        cache.refresh()
+
+        linter = FakeLinter({"app/server/core/good_module.py": (0, 1)})
+        with patch.object(QCFileCache, "_run_linter", linter):
+            totals = cache.lint()
+
+        assert linter.linted == ["app/server/core/good_module.py"]
+        assert totals["backend"].warnings == 1
+
+    def test_config_change_relints_target(self, project, cache):
+        with patch.object(QCFileCache, "_run_linter", FakeLinter()):
+            cache.lint()
+
+        _write(project, "ruff.toml", "line-length = 100\n")
+        linter = FakeLinter()
+        with patch.object(QCFileCache, "_run_linter", linter):
+            cache.lint()
+
+        assert {name for name, _ in linter.calls} == {"backend", "adws"}
+
+    def test_failed_runs_are_retried(self, cache):
+        with patch.object(QCFileCache, "_run_linter", FakeLinter(fail=True)):
+            assert cache.lint()["backend"].issues == 0
+
+        linter = FakeLinter()
+        with patch.object(QCFileCache, "_run_linter", linter):
+            cache.lint()
+
+        assert len(linter.linted) == 5
+
+    def test_parses_linter_output(self, project, cache):
+        target = qc_file_cache.LINT_TARGETS[0]
+        bad = str(project / "app/server/core/BadModule.py")
+        output = f'[{{"filename": "{bad}", "code": "F401"}}, {{"filename": "{bad}", "code": "E501"}}]'
+
+        with patch.object(qc_file_cache.subprocess, "run") as run:
+            run.return_value.stdout = output
+            run.return_value.returncode = 1
+            counts = cache._run_linter(target, ["app/server/core/BadModule.py", "app/server/core/good_module.py"])
+
+        assert counts == {"app/server/core/BadModule.py": (0, 2)}
+        assert run.call_args.args[0][-2:] == ["core/BadModule.py", "core/good_module.py"]
+
+
+class TestQCMetricsService:
+    """Metrics computed from the file cache."""
+
+    def test_naming_and_file_structure(self, project, cache):
+        _write(project, "app/server/core/huge_module.py", "x = 1\n" * 1200)
+        service = QCMetricsService(project_root=project, file_cache=cache)
+
+        naming = service.get_naming_convention_metrics()
+        structure = service.get_file_structure_metrics()
+
+        assert naming.total_files_checked == 6
+        # Python violations are listed first
+        assert [v["file"] for v in naming.violations] == [
+            "app/server/core/BadModule.py",
+            "app/client/src/components/panel_utils.ts",
+        ]
+        assert naming.compliance_rate == 66.67
+        assert structure.total_files == 6
+        assert structure.long_files == [{"file": "app/server/core/huge_module.py", "lines": 1200}]
+
+    def test_linting_metrics(self, project, cache):
+        service = QCMetricsService(project_root=project, file_cache=cache)
+        linter = FakeLinter({
+            "app/server/core/BadModule.py": (0, 2),
+            "app/client/src/components/Panel.tsx": (1, 0),
+            "adws/adw_build.py": (1, 0),
+        })
+
+        with patch.object(QCFileCache, "_run_linter", linter):
+            linting = service.get_linting_metrics()
+
+        assert (linting.backend_issues, linting.frontend_errors, linting.adws_issues) == (2, 1, 1)
+        assert linting.total_issues == 4
@@ -0,0 +1,53 @@
+"""
+Tests for JSON patch deltas used by versioned WebSocket channels.
+"""
+
+import pytest
+from services.state_delta import apply_patch, canonical_json, content_hash, diff
+
+
+class TestDiff:
+    """diff() produces minimal operations that apply_patch() reverses."""
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ({"a": 1, "b": 2}, {"a": 1, "b": 3}),
+            ({"a": 1, "b": 2}, {"a": 1, "c": 2}),
+            ([1, 2, 3, 4], [0, 1, 2, 3, 4]),
+            ([1, 2, 3, 4], [1, 2, 4]),
+            ([1, 2, 3], [9, 8]),
+            ([{"id": 1, "s": "a"}, {"id": 2, "s": "b"}], [{"id": 1, "s": "a"}, {"id": 2, "s": "c"}]),
+            ({"nested": {"list": [1, {"x": None}]}}, {"nested": {"list": [1, {"x": 5}, 2]}}),
+            ({"a~b/c": 1}, {"a~b/c": 2}),
+            ([], [1, 2]),
+            ({"a": 1}, [1]),
+        ],
+    )
+    def test_round_trip(self, old, new):
+        assert apply_patch(old, diff(old, new)) == new
+
+    def test_equal_values_have_no_ops(self):
+        assert diff({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+    def test_insert_at_front_is_one_add(self):
+        old = [{"id": i} for i in range(100)]
+        new = [{"id": -1}, *old]
+
+        assert diff(old, new) == [{"op": "add", "path": "/0", "value": {"id": -1}}]
+
+    def test_drop_from_end_is_one_remove(self):
+        old = [{"id": i} for i in range(50)]
+
+        assert diff(old, old[:-1]) == [{"op": "remove", "path": "/49"}]
+
+    def test_pointer_tokens_escaped(self):
+        assert diff({"a/b": 1}, {"a/b": 2}) == [{"op": "replace", "path": "/a~1b", "value": 2}]
+
+
+class TestHashing:
+    def test_canonical_json_ignores_key_order(self):
+        assert canonical_json({"b": 1, "a": 2}) == canonical_json({"a": 2, "b": 1})
+
+    def test_content_hash_changes_with_content(self):
+        assert content_hash(canonical_json([1])) != content_hash(canonical_json([2]))
@@ -0,0 +1,132 @@
+"""
+Load tests for ConnectionManager fan-out.
+
+Simulates hundreds of WebSocket clients, a share of them on slow or stalled
+links, and checks that broadcasts, publishes and event subscribers are not
+held back by them while per-client queues stay bounded.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from services.state_delta import apply_patch
+from services.websocket_manager import ConnectionManager
+
+CLIENTS = 500
+SLOW_CLIENTS = 25
+STALLED_CLIENTS = 5
+MESSAGES = 40
+
+
+class SimulatedSocket:
+    """WebSocket stand-in with a fixed per-send latency (None = never completes)."""
+
+    def __init__(self, latency: float | None = 0.0):
+        self.latency = latency
+        self.received: list[str] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, payload: str) -> None:
+        if self.latency is None:
+            await asyncio.Event().wait()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.received.append(payload)
+
+
+@pytest.fixture
+async def loaded_manager():
+    manager = ConnectionManager(max_queue_depth=16, send_timeout=0.5)
+    sockets = (
+        [SimulatedSocket() for _ in range(CLIENTS - SLOW_CLIENTS - STALLED_CLIENTS)]
+        + [SimulatedSocket(latency=0.05) for _ in range(SLOW_CLIENTS)]
+        + [SimulatedSocket(latency=None) for _ in range(STALLED_CLIENTS)]
+    )
+    for socket in sockets:
+        await manager.connect(socket)
+    yield manager, sockets
+    for socket in sockets:
+        manager.disconnect(socket)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_fan_out_is_not_held_back_by_slow_clients(loaded_manager):
+    manager, sockets = loaded_manager
+    fast = sockets[: CLIENTS - SLOW_CLIENTS - STALLED_CLIENTS]
+    slow = sockets[len(fast): len(fast) + SLOW_CLIENTS]
+    stalled = sockets[-STALLED_CLIENTS:]
+
+    handler_latency = []
+
+    async def handler(event_data):
+        handler_latency.append(time.perf_counter() - event_data["sent_at"])
+
+    manager.subscribe("load_event", handler)
+
+    start = time.perf_counter()
+    for n in range(MESSAGES):
+        await manager.broadcast({"type": "load_event", "data": {"n": n, "sent_at": time.perf_counter()}})
+    broadcast_seconds = time.perf_counter() - start
+
+    # Sequential delivery would spend SLOW_CLIENTS * 50ms per message on slow links alone
+    assert broadcast_seconds < 0.5
+    assert max(handler_latency) < 0.25
+
+    # Queues never exceed their bound, whatever the client's speed
+    assert max(stats["depth"] for stats in manager.queue_stats()) <= 16
+
+    await asyncio.wait_for(manager.flush(), timeout=5)
+
+    for socket in fast:
+        assert [json.loads(p)["data"]["n"] for p in socket.received] == list(range(MESSAGES))
+    for socket in slow:
+        numbers = [json.loads(p)["data"]["n"] for p in socket.received]
+        # Slow clients lose the oldest events but always get the newest ones, in order
+        assert numbers == sorted(numbers)
+        assert numbers[-1] == MESSAGES - 1
+    for socket in stalled:
+        assert socket not in manager.active_connections
+    assert len(manager.active_connections) == CLIENTS - STALLED_CLIENTS
+
+
+@pytest.mark.asyncio
+async def test_publish_fan_out_coalesces_for_slow_clients(loaded_manager):
+    manager, sockets = loaded_manager
+    for socket in sockets:
+        manager.enable_deltas(socket)
+
+    features = [{"id": i, "status": "planned", "title": f"Feature {i}"} for i in range(200)]
+    start = time.perf_counter()
+    for n in range(MESSAGES):
+        features = [dict(f) for f in features]
+        features[n]["status"] = "completed"
+        await manager.publish("planned_features_update", {"features": features})
+    publish_seconds = time.perf_counter() - start
+
+    assert publish_seconds < 1.0
+    await asyncio.wait_for(manager.flush(), timeout=5)
+
+    latest = {"features": features}
+    fast = sockets[: CLIENTS - SLOW_CLIENTS - STALLED_CLIENTS]
+    slow = sockets[len(fast): len(fast) + SLOW_CLIENTS]
+    for socket in fast[::25] + slow:
+        state = None
+        version = 0
+        for payload in socket.received:
+            message = json.loads(payload)
+            if message["type"] == "delta":
+                assert message["base_version"] == version
+                state = apply_patch(state, message["ops"])
+            else:
+                state = message["data"]
+            version = message["version"]
+        # Every live client converges on the newest version without gaps
+        assert (version, state) == (MESSAGES, latest)
+
+    slow_stats = [manager.client_queues[socket].stats() for socket in slow]
+    assert all(stats["coalesced"] > 0 for stats in slow_stats)
+    assert all(stats["dropped"] == 0 for stats in slow_stats)
@@ -6,6 +6,8 @@ which handles WebSocket connection lifecycle management, message broadcasting,
 and automatic cleanup of disconnected clients.
 """
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -17,7 +19,7 @@ def mock_websocket():
     """Create a mock WebSocket object for testing."""
     websocket = Mock()
     websocket.accept = AsyncMock()
-    websocket.send_json = AsyncMock()
+    websocket.send_text = AsyncMock()
     return websocket
 
 
@@ -106,11 +108,11 @@ class TestConnectionManager:
     async def test_broadcast_sends_to_all_connections(self, connection_manager):
         """Test that broadcast sends messages to all connected clients."""
         websocket1 = Mock()
-        websocket1.send_json = AsyncMock()
+        websocket1.send_text = AsyncMock()
         websocket2 = Mock()
-        websocket2.send_json = AsyncMock()
+        websocket2.send_text = AsyncMock()
         websocket3 = Mock()
-        websocket3.send_json = AsyncMock()
+        websocket3.send_text = AsyncMock()
 
         connection_manager.active_connections.add(websocket1)
         connection_manager.active_connections.add(websocket2)
@@ -118,10 +120,11 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "hello"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
-        websocket1.send_json.assert_called_once_with(message)
-        websocket2.send_json.assert_called_once_with(message)
-        websocket3.send_json.assert_called_once_with(message)
+        assert _sent(websocket1) == message
+        assert _sent(websocket2) == message
+        assert _sent(websocket3) == message
 
     @pytest.mark.asyncio
     async def test_broadcast_with_single_connection(self, connection_manager, mock_websocket):
@@ -130,8 +133,9 @@ class TestConnectionManager:
 
         message = {"type": "update", "status": "running"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
-        mock_websocket.send_json.assert_called_once_with(message)
+        assert _sent(mock_websocket) == message
 
     @pytest.mark.asyncio
     async def test_broadcast_with_empty_connection_set(self, connection_manager):
@@ -154,19 +158,20 @@ class TestConnectionManager:
             }
         }
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
-        mock_websocket.send_json.assert_called_once_with(message)
+        assert _sent(mock_websocket) == message
 
     # Tests for broadcast error handling
     @pytest.mark.asyncio
     async def test_broadcast_continues_on_client_failure(self, connection_manager):
         """Test that broadcast continues to other clients when one fails."""
         websocket1 = Mock()
-        websocket1.send_json = AsyncMock(side_effect=Exception("Connection error"))
+        websocket1.send_text = AsyncMock(side_effect=Exception("Connection error"))
         websocket2 = Mock()
-        websocket2.send_json = AsyncMock()
+        websocket2.send_text = AsyncMock()
         websocket3 = Mock()
-        websocket3.send_json = AsyncMock()
+        websocket3.send_text = AsyncMock()
 
         connection_manager.active_connections.add(websocket1)
         connection_manager.active_connections.add(websocket2)
@@ -174,19 +179,20 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "hello"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
         # All three should have been attempted
-        websocket1.send_json.assert_called_once_with(message)
-        websocket2.send_json.assert_called_once_with(message)
-        websocket3.send_json.assert_called_once_with(message)
+        assert _sent(websocket1) == message
+        assert _sent(websocket2) == message
+        assert _sent(websocket3) == message
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_disconnected_clients(self, connection_manager):
         """Test that disconnected clients are removed during broadcast."""
         websocket1 = Mock()
-        websocket1.send_json = AsyncMock(side_effect=Exception("Disconnected"))
+        websocket1.send_text = AsyncMock(side_effect=Exception("Disconnected"))
         websocket2 = Mock()
-        websocket2.send_json = AsyncMock()
+        websocket2.send_text = AsyncMock()
 
         connection_manager.active_connections.add(websocket1)
         connection_manager.active_connections.add(websocket2)
@@ -195,6 +201,7 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "hello"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
         # websocket1 should be removed, websocket2 should remain
         assert websocket1 not in connection_manager.active_connections
@@ -205,11 +212,11 @@ class TestConnectionManager:
     async def test_broadcast_handles_multiple_failures(self, connection_manager):
         """Test broadcast with multiple client failures during single operation."""
         websocket1 = Mock()
-        websocket1.send_json = AsyncMock(side_effect=Exception("Error 1"))
+        websocket1.send_text = AsyncMock(side_effect=Exception("Error 1"))
         websocket2 = Mock()
-        websocket2.send_json = AsyncMock(side_effect=Exception("Error 2"))
+        websocket2.send_text = AsyncMock(side_effect=Exception("Error 2"))
         websocket3 = Mock()
-        websocket3.send_json = AsyncMock()
+        websocket3.send_text = AsyncMock()
 
         connection_manager.active_connections.add(websocket1)
         connection_manager.active_connections.add(websocket2)
@@ -219,6 +226,7 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "hello"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
         # Failed connections should be removed, successful one remains
         assert websocket1 not in connection_manager.active_connections
@@ -230,15 +238,16 @@ class TestConnectionManager:
     async def test_broadcast_all_clients_fail(self, connection_manager):
         """Test broadcast when all clients fail."""
         websocket1 = Mock()
-        websocket1.send_json = AsyncMock(side_effect=Exception("Error 1"))
+        websocket1.send_text = AsyncMock(side_effect=Exception("Error 1"))
         websocket2 = Mock()
-        websocket2.send_json = AsyncMock(side_effect=Exception("Error 2"))
+        websocket2.send_text = AsyncMock(side_effect=Exception("Error 2"))
 
         connection_manager.active_connections.add(websocket1)
         connection_manager.active_connections.add(websocket2)
 
         message = {"type": "test", "data": "hello"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
         # All connections should be cleaned up
         assert len(connection_manager.active_connections) == 0
@@ -291,6 +300,7 @@ class TestConnectionManager:
 
         message = {"type": "update", "data": "test"}
         await connection_manager.broadcast(message)
+        await connection_manager.flush()
 
         # State should remain unchanged after broadcast
         assert connection_manager.last_workflow_state == {"status": "completed"}
@@ -301,13 +311,13 @@ class TestConnectionManager:
         """Test concurrent operations: connect, disconnect, and broadcast."""
         websocket1 = Mock()
         websocket1.accept = AsyncMock()
-        websocket1.send_json = AsyncMock()
+        websocket1.send_text = AsyncMock()
         websocket2 = Mock()
         websocket2.accept = AsyncMock()
-        websocket2.send_json = AsyncMock()
+        websocket2.send_text = AsyncMock()
         websocket3 = Mock()
         websocket3.accept = AsyncMock()
-        websocket3.send_json = AsyncMock()
+        websocket3.send_text = AsyncMock()
 
         # Connect three clients
         await connection_manager.connect(websocket1)
@@ -318,6 +328,7 @@ class TestConnectionManager:
         # Broadcast to all
         message1 = {"type": "test1", "data": "first"}
         await connection_manager.broadcast(message1)
+        await connection_manager.flush()
 
         # Disconnect one client
         connection_manager.disconnect(websocket2)
@@ -326,10 +337,227 @@ class TestConnectionManager:
         # Broadcast to remaining clients
         message2 = {"type": "test2", "data": "second"}
         await connection_manager.broadcast(message2)
+        await connection_manager.flush()
 
         # Verify websocket1 and websocket3 received both messages
-        assert websocket1.send_json.call_count == 2
-        assert websocket3.send_json.call_count == 2
+        assert websocket1.send_text.call_count == 2
+        assert websocket3.send_text.call_count == 2
 
         # Verify websocket2 only received first message
-        assert websocket2.send_json.call_count == 1
+        assert websocket2.send_text.call_count == 1
+
+
+def _text_client():
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+def _sent(websocket, call=-1):
+    return json.loads(websocket.send_text.call_args_list[call][0][0])
+
+
+class TestVersionedChannels:
+    """Tests for publish(), delta opt-in and snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_publish_sends_versioned_full_message(self, connection_manager):
+        client = _text_client()
+        await connection_manager.connect(client)
+
+        assert await connection_manager.publish("queue_update", {"phases": [1]}) is True
+        await connection_manager.flush()
+
+        assert _sent(client) == {"type": "queue_update", "data": {"phases": [1]}, "version": 1}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_not_republished(self, connection_manager):
+        client = _text_client()
+        await connection_manager.connect(client)
+
+        await connection_manager.publish("queue_update", {"phases": [1]})
+        await connection_manager.flush()
+        assert await connection_manager.publish("queue_update", {"phases": [1]}) is False
+
+        assert client.send_text.call_count == 1
+        assert connection_manager.channels["queue_update"].version == 1
+
+    @pytest.mark.asyncio
+    async def test_delta_clients_receive_ops(self, connection_manager):
+        legacy, delta = _text_client(), _text_client()
+        await connection_manager.connect(legacy)
+        await connection_manager.connect(delta)
+        connection_manager.enable_deltas(delta)
+
+        features = [{"id": i, "status": "planned", "title": "x" * 50} for i in range(20)]
+        await connection_manager.publish("planned_features_update", {"features": features})
+        await connection_manager.flush()
+        changed = [dict(f) for f in features]
+        changed[3]["status"] = "completed"
+        await connection_manager.publish("planned_features_update", {"features": changed})
+        await connection_manager.flush()
+
+        assert _sent(legacy)["data"] == {"features": changed}
+        message = _sent(delta)
+        assert message["type"] == "delta"
+        assert message["channel"] == "planned_features_update"
+        assert (message["base_version"], message["version"]) == (1, 2)
+        assert message["ops"] == [
+            {"op": "replace", "path": "/features/3/status", "value": "completed"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delta_clients_get_full_message_when_smaller(self, connection_manager):
+        delta = _text_client()
+        await connection_manager.connect(delta)
+        connection_manager.enable_deltas(delta)
+
+        await connection_manager.publish("routes_update", [1, 2, 3])
+        await connection_manager.flush()
+        await connection_manager.publish("routes_update", [4, 5, 6])
+        await connection_manager.flush()
+
+        assert _sent(delta) == {"type": "routes_update", "data": [4, 5, 6], "version": 2}
+
+    @pytest.mark.asyncio
+    async def test_send_snapshot_publishes_fresh_data_to_others(self, connection_manager):
+        existing, joining = _text_client(), _text_client()
+        await connection_manager.connect(existing)
+        await connection_manager.publish("queue_update", {"phases": []})
+        await connection_manager.flush()
+        await connection_manager.connect(joining)
+
+        await connection_manager.send_snapshot(joining, "queue_update", {"phases": [7]})
+        await connection_manager.flush()
+
+        assert _sent(joining) == {"type": "queue_update", "data": {"phases": [7]}, "version": 2}
+        assert _sent(existing)["version"] == 2
+        assert joining.send_text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_resync_snapshot_uses_last_state(self, connection_manager):
+        client = _text_client()
+        await connection_manager.publish("queue_update", {"phases": [1]})
+
+        await connection_manager.send_snapshot(client, "queue_update")
+        await connection_manager.send_snapshot(client, "unknown_channel")
+        await connection_manager.flush()
+
+        assert client.send_text.call_count == 1
+        assert _sent(client)["version"] == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_dispatches_to_subscribers(self, connection_manager):
+        handler = AsyncMock()
+        handler.__name__ = "handler"
+        connection_manager.subscribe("queue_update", handler)
+
+        await connection_manager.publish("queue_update", {"phases": [1]})
+
+        handler.assert_awaited_once_with({"phases": [1]})
+
+    @pytest.mark.asyncio
+    async def test_failed_delta_client_is_dropped(self, connection_manager):
+        client = _text_client()
+        client.send_text.side_effect = Exception("closed")
+        await connection_manager.connect(client)
+        connection_manager.enable_deltas(client)
+
+        await connection_manager.publish("queue_update", {"phases": [1]})
+        await connection_manager.flush()
+
+        assert client not in connection_manager.active_connections
+        assert client not in connection_manager.delta_connections
+
+
+def _gated_client(gate):
+    """Client whose sends block until the gate is set."""
+    async def send_text(payload):
+        await gate.wait()
+
+    websocket = _text_client()
+    websocket.send_text.side_effect = send_text
+    return websocket
+
+
+class TestClientQueues:
+    """Tests for per-connection outbound queues and slow consumers."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_client(self, connection_manager):
+        gate = asyncio.Event()
+        slow, fast = _gated_client(gate), _text_client()
+        await connection_manager.connect(slow)
+        await connection_manager.connect(fast)
+
+        await asyncio.wait_for(connection_manager.broadcast({"type": "test", "data": 1}), timeout=1)
+        await asyncio.wait_for(connection_manager.client_queues[fast].wait_idle(), timeout=1)
+
+        assert _sent(fast) == {"type": "test", "data": 1}
+        gate.set()
+        await connection_manager.flush()
+        assert slow.send_text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_message_serialized_once_for_all_clients(self, connection_manager):
+        clients = [_text_client() for _ in range(3)]
+        for client in clients:
+            await connection_manager.connect(client)
+
+        await connection_manager.broadcast({"type": "test", "data": [1, 2]})
+        await connection_manager.flush()
+
+        payloads = [client.send_text.call_args[0][0] for client in clients]
+        assert all(payload is payloads[0] for payload in payloads)
+
+    @pytest.mark.asyncio
+    async def test_slow_client_coalesces_channel_updates(self, connection_manager):
+        gate = asyncio.Event()
+        client = _gated_client(gate)
+        await connection_manager.connect(client)
+        connection_manager.enable_deltas(client)
+
+        features = [{"id": i, "title": "x" * 50} for i in range(20)]
+        await connection_manager.publish("planned_features_update", features)
+        await asyncio.sleep(0)  # writer picks up v1 and blocks on the gate
+        for version in range(2, 6):
+            features = features + [{"id": 100 + version}]
+            await connection_manager.publish("planned_features_update", features)
+
+        stats = connection_manager.queue_stats()[0]
+        assert (stats["depth"], stats["coalesced"]) == (1, 3)
+
+        gate.set()
+        await connection_manager.flush()
+        # The pending delta was replaced by a full snapshot of the newest version
+        assert _sent(client) == {"type": "planned_features_update", "data": features, "version": 5}
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_event(self):
+        manager = ConnectionManager(max_queue_depth=3)
+        gate = asyncio.Event()
+        client = _gated_client(gate)
+        await manager.connect(client)
+
+        await manager.broadcast({"type": "event", "n": 0})
+        await asyncio.sleep(0)
+        for n in range(1, 6):
+            await manager.broadcast({"type": "event", "n": n})
+
+        assert manager.queue_stats()[0]["dropped"] == 2
+        gate.set()
+        await manager.flush()
+        assert [json.loads(c[0][0])["n"] for c in client.send_text.call_args_list] == [0, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_stalled_send_times_out_and_disconnects(self):
+        manager = ConnectionManager(send_timeout=0.01)
+        client = _gated_client(asyncio.Event())
+        await manager.connect(client)
+
+        await manager.broadcast({"type": "test"})
+        await manager.flush()
+
+        assert client not in manager.active_connections
+        assert manager.queue_stats() == []
@@ -0,0 +1,113 @@
+"""
+Unit tests for the incremental workflow similarity index.
+
+Tests cover:
+- Tokenization and stemming
+- The multi-factor score and 70-point threshold of find_similar_workflows
+- Incremental add/replace/remove
+"""
+import random
+
+from core.workflow_analytics import WorkflowSimilarityIndex, detect_complexity
+from core.workflow_analytics.similarity_index import stem, tokenize
+
+
+def make_workflow(adw_id, nl_input, classification='feature', template='adw_plan_build_test', duration=100):
+    return {
+        'adw_id': adw_id,
+        'classification_type': classification,
+        'workflow_template': template,
+        'nl_input': nl_input,
+        'duration_seconds': duration,
+        'error_count': 0,
+    }
+
+
+class TestTokenize:
+    """Test suite for tokenize() and stem()."""
+
+    def test_stems_related_forms_together(self):
+        assert stem('authentication') == stem('authenticate')
+        assert stem('testing') == stem('tests') == 'test'
+        assert stem('queries') == 'query'
+
+    def test_drops_stop_words_and_punctuation(self):
+        assert tokenize("Add the login-page, and fix tests!") == ['add', 'login', 'page', 'fix', 'test']
+        assert tokenize(None) == []
+
+
+class TestWorkflowSimilarityIndex:
+    """Test suite for WorkflowSimilarityIndex."""
+
+    def test_matches_bruteforce_scoring_rules(self):
+        rng = random.Random(11)
+        words = ['auth', 'login', 'user', 'dashboard', 'chart', 'api', 'cache', 'queue', 'button', 'export']
+        history = [
+            make_workflow(
+                f'adw-{n}',
+                ' '.join(rng.sample(words, 3)),
+                classification=rng.choice(['feature', 'bug']),
+                template=rng.choice(['adw_plan_build', 'adw_plan_build_test']),
+                duration=rng.choice([100, 600, 2000]),
+            )
+            for n in range(200)
+        ]
+        index = WorkflowSimilarityIndex()
+        index.add_many(history)
+
+        target = history[0]
+        found = {r.adw_id: r for r in index.query(target, k=len(history))}
+
+        assert 'adw-0' not in found
+        for workflow in history[1:]:
+            points = (
+                30 * (workflow['classification_type'] == target['classification_type'])
+                + 30 * (workflow['workflow_template'] == target['workflow_template'])
+                + 20 * (detect_complexity(workflow) == detect_complexity(target))
+            )
+            if points >= 70:
+                assert workflow['adw_id'] in found
+                assert found[workflow['adw_id']].score >= points
+            elif points < 50:
+                assert workflow['adw_id'] not in found
+
+    def test_text_similarity_ranks_candidates(self):
+        index = WorkflowSimilarityIndex()
+        index.add(make_workflow('a', 'implement user authentication flow'))
+        index.add(make_workflow('b', 'render dashboard chart colors'))
+        index.add(make_workflow('c', 'authenticate users on login'))
+
+        results = index.query(make_workflow('new', 'add authentication for users'))
+
+        assert {r.adw_id for r in results[:2]} == {'a', 'c'}
+        assert results[0].score > results[-1].score >= 80
+        assert results[-1].adw_id == 'b' and results[-1].text_similarity == 0.0
+
+    def test_requires_two_matching_categories(self):
+        index = WorkflowSimilarityIndex()
+        index.add(make_workflow('bug-other', 'fix login', classification='bug', template='adw_patch'))
+        index.add(make_workflow('bug-same-template', 'fix login', classification='bug'))
+
+        results = index.query(make_workflow('new', 'fix login'))
+
+        # Only template + complexity match (50) + identical text (20) reaches 70
+        assert [r.adw_id for r in results] == ['bug-same-template']
+        assert results[0].score == 70.0
+
+    def test_add_replaces_and_remove_forgets(self):
+        index = WorkflowSimilarityIndex()
+        index.add(make_workflow('a', 'export csv report'))
+        index.add(make_workflow('a', 'export csv report', template='adw_patch', classification='bug'))
+
+        assert len(index) == 1
+        assert index.similar_ids(make_workflow('new', 'export csv report')) == []
+
+        index.remove('a')
+        assert 'a' not in index
+        assert index.similar_ids(make_workflow('new', 'export csv')) == []
+
+    def test_top_k_limit(self):
+        index = WorkflowSimilarityIndex()
+        index.add_many(make_workflow(f'w{n}', f'task {n}') for n in range(30))
+
+        assert len(index.similar_ids(make_workflow('new', 'task'), k=10)) == 10
@@ -0,0 +1,215 @@
+"""
+Tests for the persistent codebase content index.
+
+Tests verify:
+- Tokenization into identifier parts and symbol extraction
+- Incremental refresh (only changed files are re-read) and persistence
+- Keyword prefix lookups scoped by directory and suffix
+- CodebaseAnalyzer and ContextReviewAgent using the shared index
+"""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from utils.codebase_analyzer import CodebaseAnalyzer
+from utils.codebase_analyzer.content_index import CodebaseIndex, extract_symbols, tokenize
+
+
+def _write(root: Path, relative: str, content: str) -> Path:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _bump_mtime(path: Path, seconds: int = 10) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    _write(root, "app/server/services/workflow_history.py", (
+        "class WorkflowHistoryService:\n"
+        "    def get_history(self, workflow_id):\n"
+        "        return self.load_workflow(workflow_id)\n"
+        "\n"
+        "async def sync_history():\n"
+        "    pass\n"
+    ))
+    _write(root, "app/server/services/__init__.py", "from .workflow_history import WorkflowHistoryService\n")
+    _write(root, "app/server/utils/auth.py", "def authenticate_user(token):\n    return token\n")
+    _write(root, "app/client/src/components/HistoryPanel.tsx", (
+        "export function HistoryPanel() {}\n"
+        "export const useHistory = async (id: string) => fetchHistory(id);\n"
+        "class HistoryStore {}\n"
+    ))
+    _write(root, "app/client/node_modules/lib/history.ts", "export function history() {}\n")
+    _write(root, ".github/workflows/history.yml", "name: history\n")
+    _write(root, "README.md", "Workflow history\n")
+    return root
+
+
+@pytest.fixture
+def index(project, tmp_path):
+    index = CodebaseIndex(project, index_path=tmp_path / "index.sqlite3")
+    index.refresh()
+    yield index
+    index.close()
+
+
+class TestTokenize:
+    """Identifier splitting and symbol extraction."""
+
+    def test_splits_snake_and_camel_case(self):
+        assert tokenize("getUserName(user_id) HTTPServer x") == [
+            "get", "user", "name", "user", "id", "http", "server",
+        ]
+
+    def test_digits_stay_with_their_letters(self):
+        assert tokenize("S3Client oauth2_token HTTP2Server api_v2 2024") == [
+            "s3", "client", "oauth2", "token", "http2", "server", "api", "v2", "2024",
+        ]
+
+    def test_python_symbols_from_ast(self):
+        symbols = extract_symbols("a.py", "class A:\n    def run(self):\n        pass\n\nasync def go():\n    pass\n")
+
+        assert sorted(symbols) == [("A", "class", 1), ("go", "function", 5), ("run", "function", 2)]
+
+    def test_python_symbols_fall_back_to_regex(self):
+        symbols = extract_symbols("broken.py", "def ok():\n    pass\ndef broken(:\n")
+
+        assert symbols == [("ok", "function", 1), ("broken", "function", 3)]
+
+    def test_typescript_symbols(self):
+        symbols = extract_symbols("a.tsx", (
+            "export default function App() {}\n"
+            "const handler = (e: Event) => e;\n"
+            "export abstract class Base {}\n"
+        ))
+
+        assert symbols == [("App", "function", 1), ("handler", "function", 2), ("Base", "class", 3)]
+
+
+class TestRefresh:
+    """Incremental refresh and persistence."""
+
+    def test_skipped_directories_are_pruned(self, index):
+        paths = index.paths()
+
+        assert "app/client/node_modules/lib/history.ts" not in paths
+        # Only whole directory names are skipped, so .github is kept
+        assert ".github/workflows/history.yml" in paths
+        assert "README.md" in paths
+
+    def test_unchanged_files_are_not_reread(self, index):
+        with patch.object(Path, "read_text") as mock_read:
+            changes = index.refresh()
+
+        mock_read.assert_not_called()
+        assert not changes.has_changes
+
+    def test_modified_and_removed_files(self, project, index):
+        auth = _write(project, "app/server/utils/auth.py", "def login_user():\n    pass\n")
+        _bump_mtime(auth)
+        (project / "README.md").unlink()
+        _write(project, "app/server/new_module.py", "def login():\n    pass\n")
+
+        changes = index.refresh()
+
+        assert changes.modified == {"app/server/utils/auth.py"}
+        assert changes.removed == {"README.md"}
+        assert changes.added == {"app/server/new_module.py"}
+        assert index.keyword_counts(["authenticate"]) == {}
+        assert set(index.keyword_counts(["login"])) == {"app/server/utils/auth.py", "app/server/new_module.py"}
+
+    def test_max_age_skips_the_walk(self, project, index):
+        _write(project, "app/server/late.py", "x = 1\n")
+
+        assert not index.refresh(max_age=60).has_changes
+        assert index.refresh().added == {"app/server/late.py"}
+
+    def test_index_persists_across_instances(self, project, index, tmp_path):
+        index.close()
+        reopened = CodebaseIndex(project, index_path=tmp_path / "index.sqlite3")
+
+        with patch.object(Path, "read_text") as mock_read:
+            assert not reopened.refresh().has_changes
+        mock_read.assert_not_called()
+        assert "app/server/utils/auth.py" in reopened.keyword_counts(["auth"])
+        reopened.close()
+
+
+class TestQueries:
+    """Keyword and symbol lookups."""
+
+    def test_keywords_match_token_prefixes(self, index):
+        counts = index.keyword_counts(["auth", "workflow"])
+
+        assert counts["app/server/utils/auth.py"] == {"auth": 1}
+        assert counts["app/server/services/workflow_history.py"] == {"workflow": 4}
+
+    def test_multi_part_keyword_counts_rarest_part(self, index):
+        counts = index.keyword_counts(["workflow_id"])
+
+        assert counts == {"app/server/services/workflow_history.py": {"workflow_id": 2}}
+
+    def test_digit_bearing_keywords(self, project, index):
+        _write(project, "app/server/utils/storage.py", (
+            "def upload_s3(s3_client, oauth2_token):\n"
+            "    return s3_client.put(oauth2_token), HTTP2Connection()\n"
+        ))
+        index.refresh()
+
+        counts = index.keyword_counts(["s3", "oauth2", "http2", "v2"])
+
+        assert counts == {"app/server/utils/storage.py": {"s3": 3, "oauth2": 2, "http2": 1}}
+
+    def test_scoped_by_directory_and_suffix(self, index):
+        assert set(index.keyword_counts(["history"], under="app/client", suffixes=(".tsx",))) == {
+            "app/client/src/components/HistoryPanel.tsx",
+        }
+        assert index.paths(under="app/server", suffixes=(".py",)) == [
+            "app/server/services/__init__.py",
+            "app/server/services/workflow_history.py",
+            "app/server/utils/auth.py",
+        ]
+
+    def test_find_symbols(self, index):
+        symbols = index.find_symbols(["history"], under="app/server", kinds=("function",))
+
+        assert [(s.path, s.name, s.line) for s in symbols] == [
+            ("app/server/services/workflow_history.py", "get_history", 2),
+            ("app/server/services/workflow_history.py", "sync_history", 5),
+        ]
+
+
+class TestConsumers:
+    """CodebaseAnalyzer and ContextReviewAgent on top of the index."""
+
+    def test_codebase_analyzer_uses_index(self, project, index):
+        analyzer = CodebaseAnalyzer(project_root=project, index=index)
+        feature = SimpleNamespace(title="Workflow history panel", description="Show history", item_type="feature")
+
+        result = analyzer.find_relevant_files(feature)
+
+        assert result["backend_files"][0][0] == "app/server/services/workflow_history.py"
+        assert [path for path, _ in result["frontend_files"]] == ["app/client/src/components/HistoryPanel.tsx"]
+        assert ("app/server/services/workflow_history.py", "get_history") in result["related_functions"]
+
+    def test_context_review_agent_uses_index(self, project, index):
+        from core.context_review_agent import ContextReviewAgent
+
+        with patch("core.context_review_agent.Anthropic"), \
+             patch("core.context_review_agent.ContextReviewRepository"), \
+             patch("core.context_review_agent.get_codebase_index", return_value=index):
+            agent = ContextReviewAgent(anthropic_api_key="test-key")
+            files = agent.identify_relevant_files("Fix workflow history sync", str(project))
+
+        assert files[0] == "app/server/services/workflow_history.py"
+        assert ".github/workflows/history.yml" in files
+        assert not any("node_modules" in path for path in files)
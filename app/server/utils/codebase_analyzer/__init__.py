@@ -1,5 +1,6 @@
 """Codebase analyzer for intelligent file/function discovery."""
 
 from .analyzer import CodebaseAnalyzer
+from .content_index import CodebaseIndex, get_codebase_index
 
-__all__ = ["CodebaseAnalyzer"]
+__all__ = ["CodebaseAnalyzer", "CodebaseIndex", "get_codebase_index"]
@@ -8,6 +8,11 @@ import re
 from pathlib import Path
 from typing import Any
 
+from .content_index import CodebaseIndex, get_codebase_index
+
+# Reuse an index refreshed this recently instead of re-stat'ing the tree
+INDEX_MAX_AGE_SECONDS = 5.0
+
 # Common English stopwords to filter out from keyword extraction
 STOPWORDS = {
     "a", "an", "and", "are", "as", "at", "be", "by", "for", "from",
@@ -20,12 +25,13 @@ STOPWORDS = {
 class CodebaseAnalyzer:
     """Analyzes codebase to discover relevant files and functions for a feature."""
 
-    def __init__(self, project_root: Path | None = None):
+    def __init__(self, project_root: Path | None = None, index: CodebaseIndex | None = None):
         """
         Initialize analyzer.
 
         Args:
             project_root: Root directory of project (defaults to repo root)
+            index: Content index of project_root (defaults to the shared one)
         """
         if project_root is None:
             # Default to repo root
@@ -33,9 +39,10 @@ class CodebaseAnalyzer:
             # So we need to go up 5 levels: analyzer.py -> codebase_analyzer -> utils -> server -> app -> project_root
             project_root = Path(__file__).parent.parent.parent.parent.parent
 
-        self.project_root = Path(project_root)
+        self.project_root = Path(project_root).resolve()
         self.backend_root = self.project_root / "app" / "server"
         self.frontend_root = self.project_root / "app" / "client"
+        self.index = index or get_codebase_index(self.project_root)
 
     def find_relevant_files(self, feature: Any) -> dict[str, Any]:
         """
@@ -55,6 +62,9 @@ class CodebaseAnalyzer:
         # Extract keywords from title and description
         keywords = self._extract_keywords(feature.title, feature.description or "")
 
+        # Pick up files changed since the last request
+        self.index.refresh(max_age=INDEX_MAX_AGE_SECONDS)
+
         # Search for relevant files
         backend_files = self._search_python_files(keywords)
         frontend_files = self._search_ts_files(keywords)
@@ -93,10 +103,11 @@ class CodebaseAnalyzer:
         # Extract words (alphanumeric + underscores)
         words = re.findall(r'\w+', text)
 
-        # Filter out stopwords and short words
+        # Filter out stopwords and short words (two characters are kept when
+        # one is a digit, e.g. "s3", "v2")
         keywords = [
             word for word in words
-            if word not in STOPWORDS and len(word) > 2
+            if word not in STOPWORDS and (len(word) > 2 or (len(word) == 2 and not word.isalpha()))
         ]
 
         # Count frequency and take top 10 most common
@@ -123,36 +134,12 @@ class CodebaseAnalyzer:
         if not self.backend_root.exists():
             return []
 
-        results: list[tuple[str, float]] = []
-
-        # Search in key backend directories
-        search_patterns = [
-            "**/*.py",
+        # Skip __init__.py files (usually not implementation files)
+        paths = [
+            path for path in self.index.paths(under=self._relative(self.backend_root), suffixes=(".py",))
+            if not path.endswith("/__init__.py")
         ]
-
-        # Directories to exclude
-        exclude_dirs = {"__pycache__", ".venv", "venv", "node_modules", ".git", ".pytest_cache"}
-
-        for pattern in search_patterns:
-            for file_path in self.backend_root.glob(pattern):
-                # Skip excluded directories
-                if any(excluded in file_path.parts for excluded in exclude_dirs):
-                    continue
-
-                # Skip __init__.py files (usually not implementation files)
-                if file_path.name == "__init__.py":
-                    continue
-
-                # Calculate relevance score
-                score = self._calculate_file_score(file_path, keywords)
-
-                if score > 0:
-                    relative_path = str(file_path.relative_to(self.project_root))
-                    results.append((relative_path, score))
-
-        # Sort by score (highest first) and limit to top 10
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:10]
+        return self._rank_files(paths, keywords, under=self._relative(self.backend_root), suffixes=(".py",))
 
     def _search_ts_files(self, keywords: list[str]) -> list[tuple[str, float]]:
         """
@@ -167,54 +154,51 @@ class CodebaseAnalyzer:
         if not self.frontend_root.exists():
             return []
 
-        results: list[tuple[str, float]] = []
+        suffixes = (".ts", ".tsx")
+        paths = self.index.paths(under=self._relative(self.frontend_root), suffixes=suffixes)
+        return self._rank_files(paths, keywords, under=self._relative(self.frontend_root), suffixes=suffixes)
 
-        # Search for TypeScript and TSX files
-        search_patterns = [
-            "**/*.ts",
-            "**/*.tsx",
-        ]
-
-        # Directories to exclude
-        exclude_dirs = {"node_modules", ".git", "dist", "build", ".next"}
-
-        for pattern in search_patterns:
-            for file_path in self.frontend_root.glob(pattern):
-                # Skip excluded directories
-                if any(excluded in file_path.parts for excluded in exclude_dirs):
-                    continue
-
-                # Calculate relevance score
-                score = self._calculate_file_score(file_path, keywords)
+    def _rank_files(
+        self,
+        paths: list[str],
+        keywords: list[str],
+        under: str,
+        suffixes: tuple[str, ...],
+    ) -> list[tuple[str, float]]:
+        """Score candidate files from the content index and keep the top 10."""
+        keyword_counts = self.index.keyword_counts(keywords, under=under, suffixes=suffixes)
 
-                if score > 0:
-                    relative_path = str(file_path.relative_to(self.project_root))
-                    results.append((relative_path, score))
+        results: list[tuple[str, float]] = []
+        for path in paths:
+            score = self._calculate_file_score(path, keywords, keyword_counts.get(path, {}))
+            if score > 0:
+                results.append((path, score))
 
         # Sort by score (highest first) and limit to top 10
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:10]
 
-    def _calculate_file_score(self, file_path: Path, keywords: list[str]) -> float:
+    def _calculate_file_score(
+        self,
+        relative_path: str,
+        keywords: list[str],
+        keyword_counts: dict[str, int],
+    ) -> float:
         """
         Calculate relevance score for a file based on keywords.
 
         Args:
-            file_path: Path to file
+            relative_path: Path of the file relative to the project root
             keywords: Keywords to search for
+            keyword_counts: Occurrences of each keyword in the file
 
         Returns:
             Relevance score (0.0 = no match, higher = more relevant)
         """
-        try:
-            content = file_path.read_text(errors='ignore').lower()
-        except Exception:
-            return 0.0
-
         score = 0.0
 
         # Check filename (higher weight)
-        filename = file_path.stem.lower()
+        filename = Path(relative_path).stem.lower()
         for keyword in keywords:
             if keyword in filename:
                 score += 3.0  # Filename match is highly relevant
@@ -222,7 +206,7 @@ class CodebaseAnalyzer:
         # Check file content
         for keyword in keywords:
             # Count occurrences (diminishing returns after 5 mentions)
-            occurrences = content.count(keyword)
+            occurrences = keyword_counts.get(keyword, 0)
             score += min(occurrences * 0.5, 2.5)
 
         return score
@@ -240,40 +224,19 @@ class CodebaseAnalyzer:
         if not self.backend_root.exists():
             return []
 
-        results: list[tuple[str, str]] = []
-
-        # Search Python files for function definitions
-        exclude_dirs = {"__pycache__", ".venv", "venv", "node_modules", ".git"}
-
-        for file_path in self.backend_root.glob("**/*.py"):
-            # Skip excluded directories
-            if any(excluded in file_path.parts for excluded in exclude_dirs):
-                continue
-
-            try:
-                content = file_path.read_text(errors='ignore')
-            except Exception:
-                continue
-
-            # Find function/method definitions
-            # Matches: def function_name(...):
-            function_pattern = r'^[ \t]*def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-            matches = re.finditer(function_pattern, content, re.MULTILINE)
-
-            relative_path = str(file_path.relative_to(self.project_root))
-
-            for match in matches:
-                function_name = match.group(1)
-
-                # Check if function name contains any keyword
-                function_lower = function_name.lower()
-                for keyword in keywords:
-                    if keyword in function_lower:
-                        results.append((relative_path, function_name))
-                        break  # Only add once per function
+        symbols = self.index.find_symbols(
+            keywords,
+            under=self._relative(self.backend_root),
+            suffixes=(".py",),
+            kinds=("function",),
+        )
 
         # Limit to top 15 results
-        return results[:15]
+        return [(symbol.path, symbol.name) for symbol in symbols[:15]]
+
+    def _relative(self, path: Path) -> str:
+        """Path relative to the project root, as used by the content index."""
+        return path.relative_to(self.project_root).as_posix()
 
     def _suggest_test_files(
         self,
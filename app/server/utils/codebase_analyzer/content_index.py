@@ -0,0 +1,447 @@
+"""
+Persistent, incrementally refreshed content index of a source tree.
+
+Shared by CodebaseAnalyzer and ContextReviewAgent so that planning and
+context-review requests stop re-reading the whole tree. The index lives in a
+SQLite file outside the tree and holds:
+
+- files: every non-skipped file with its (mtime_ns, size)
+- postings: token -> {file: occurrences} for Python/TypeScript sources
+- symbols: functions and classes (``ast`` for Python, regex for TypeScript)
+
+A refresh walks the tree (pruning skipped directories instead of filtering
+every path), stats each file and only re-reads files whose (mtime_ns, size)
+changed, so a warm refresh costs one stat per file and a query is a handful of
+indexed lookups. The index survives process restarts, which matters for the
+short-lived planning scripts.
+
+Tokens are identifier parts: ``getUserName`` and ``get_user_name`` both index
+as ``get``, ``user``, ``name``; digits stay with the letters before them, so
+``S3Client`` indexes as ``s3``, ``client``. Keywords are tokenized the same way
+and match token prefixes, so "auth" finds ``authenticate`` and ``AuthService``
+and "oauth" finds ``oauth2``.
+
+Example:
+    index = get_codebase_index(project_root)
+    index.refresh(max_age=5.0)
+    counts = index.keyword_counts(["workflow", "history"], under="app/server")
+    symbols = index.find_symbols(["history"], under="app/server", suffixes=(".py",))
+"""
+
+import ast
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = "2"
+
+# Directory names never descended into
+SKIP_DIRS = frozenset({
+    ".git", "__pycache__", "node_modules", ".venv", "venv", ".pytest_cache",
+    ".mypy_cache", ".ruff_cache", "dist", "build", ".next",
+})
+SKIP_FILES = frozenset({".DS_Store"})
+
+# Files whose contents are tokenized; everything else is only listed
+CONTENT_SUFFIXES = (".py", ".ts", ".tsx")
+MAX_CONTENT_BYTES = 1_000_000
+
+DEFAULT_INDEX_DIR = Path(
+    os.getenv("CODEBASE_INDEX_DIR") or Path.home() / ".cache" / "tac-webbuilder" / "codebase_index"
+)
+
+# Digits stay attached to the letters before them (s3, oauth2, HTTP2Server -> http2)
+_TOKEN_RE = re.compile(r"(?:[A-Z]+(?![a-z])|[A-Z]?[a-z]+)\d*|\d+")
+
+_TS_SYMBOL_PATTERNS = (
+    ("function", re.compile(r"^[ \t]*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*([A-Za-z_$][\w$]*)", re.MULTILINE)),
+    ("function", re.compile(r"^[ \t]*(?:export\s+)?(?:const|let)\s+([A-Za-z_$][\w$]*)\s*(?::[^=]+)?=\s*(?:async\s+)?(?:\([^)]*\)|[A-Za-z_$][\w$]*)\s*(?::[^=]+)?=>", re.MULTILINE)),
+    ("class", re.compile(r"^[ \t]*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+([A-Za-z_$][\w$]*)", re.MULTILINE)),
+)
+_PY_DEF_RE = re.compile(r"^[ \t]*(?:async\s+)?(def|class)\s+([A-Za-z_][A-Za-z0-9_]*)", re.MULTILINE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    path TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (token, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_path ON postings(path);
+CREATE TABLE IF NOT EXISTS symbols (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path);
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase identifier parts of two or more characters.
+
+    Examples:
+        >>> tokenize("getUserName(user_id) HTTPServer s3_bucket oauth2")
+        ['get', 'user', 'name', 'user', 'id', 'http', 'server', 's3', 'bucket', 'oauth2']
+    """
+    return [token.lower() for token in _TOKEN_RE.findall(text) if len(token) > 1]
+
+
+def extract_symbols(path: str, content: str) -> list[tuple[str, str, int]]:
+    """
+    Find function and class definitions in a source file.
+
+    Python files are parsed with ``ast`` (falling back to a regex when the
+    file does not parse); TypeScript files use regexes.
+
+    Returns:
+        List of (name, kind, line) with kind "function" or "class"
+    """
+    if path.endswith(".py"):
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError, RecursionError):
+            return [
+                (match.group(2), "class" if match.group(1) == "class" else "function",
+                 content.count("\n", 0, match.start()) + 1)
+                for match in _PY_DEF_RE.finditer(content)
+            ]
+        return [
+            (node.name, "class" if isinstance(node, ast.ClassDef) else "function", node.lineno)
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        ]
+
+    symbols = []
+    for kind, pattern in _TS_SYMBOL_PATTERNS:
+        for match in pattern.finditer(content):
+            symbols.append((match.group(1), kind, content.count("\n", 0, match.start()) + 1))
+    symbols.sort(key=lambda symbol: symbol[2])
+    return symbols
+
+
+@dataclass(frozen=True)
+class CodeSymbol:
+    """A function or class definition."""
+
+    path: str
+    name: str
+    kind: str
+    line: int
+
+
+@dataclass
+class IndexChanges:
+    """Relative paths that changed during a refresh."""
+
+    added: set[str] = field(default_factory=set)
+    modified: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class CodebaseIndex:
+    """
+    Thread-safe content index of one directory tree.
+
+    Paths are relative to ``root`` and use forward slashes.
+    """
+
+    def __init__(self, root: Path, index_path: Path | str | None = None):
+        """
+        Args:
+            root: Directory to index
+            index_path: SQLite file for the index (defaults to a file named
+                after ``root`` in DEFAULT_INDEX_DIR; ":memory:" keeps it in memory)
+        """
+        self.root = Path(root).resolve()
+        self.index_path = str(index_path) if index_path is not None else _default_index_path(self.root)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._stats: dict[str, tuple[int, int]] = {
+            row[0]: (row[1], row[2]) for row in self._conn.execute("SELECT path, mtime_ns, size FROM files")
+        }
+        self._paths: list[str] = sorted(self._stats)
+        self._refreshed_at: float | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.index_path != ":memory:":
+            try:
+                Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"[CODEBASE_INDEX] Cannot create {self.index_path}, using memory: {e}")
+                self.index_path = ":memory:"
+
+        conn = sqlite3.connect(self.index_path, timeout=30.0, check_same_thread=False)
+        try:
+            version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        except sqlite3.OperationalError:
+            version = None  # new file
+        except sqlite3.DatabaseError as e:
+            # Not a database (e.g. truncated); it is only a cache, so start over
+            logger.warning(f"[CODEBASE_INDEX] Rebuilding unreadable index {self.index_path}: {e}")
+            conn.close()
+            os.remove(self.index_path)
+            conn = sqlite3.connect(self.index_path, timeout=30.0, check_same_thread=False)
+            version = None
+        if version is None or version[0] != SCHEMA_VERSION:
+            with conn:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS files; "
+                    "DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS symbols;"
+                )
+                conn.executescript(_SCHEMA)
+                conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (SCHEMA_VERSION,))
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, max_age: float = 0.0) -> IndexChanges:
+        """
+        Bring the index up to date with the tree.
+
+        Args:
+            max_age: Skip the walk if the last refresh was less than this many
+                seconds ago
+
+        Returns:
+            Paths added, modified or removed by this refresh
+        """
+        with self._lock:
+            changes = IndexChanges()
+            now = time.monotonic()
+            if self._refreshed_at is not None and now - self._refreshed_at < max_age:
+                return changes
+
+            current = self._walk()
+            for path, stat_key in current.items():
+                previous = self._stats.get(path)
+                if previous is None:
+                    changes.added.add(path)
+                elif previous != stat_key:
+                    changes.modified.add(path)
+            changes.removed = set(self._stats) - set(current)
+
+            if changes.has_changes:
+                self._apply(changes, current)
+                self._stats = current
+                self._paths = sorted(current)
+                logger.debug(
+                    f"[CODEBASE_INDEX] {self.root}: +{len(changes.added)} "
+                    f"~{len(changes.modified)} -{len(changes.removed)}"
+                )
+            self._refreshed_at = now
+            return changes
+
+    def _walk(self) -> dict[str, tuple[int, int]]:
+        """Stat every non-skipped file under root."""
+        stats: dict[str, tuple[int, int]] = {}
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            for name in filenames:
+                if name in SKIP_FILES:
+                    continue
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                stats[prefix + name] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def _apply(self, changes: IndexChanges, current: dict[str, tuple[int, int]]) -> None:
+        """Re-read changed source files and write everything in one transaction."""
+        with self._conn:
+            # Added paths too: another process sharing the file may have indexed them
+            for path in changes.added | changes.modified | changes.removed:
+                self._conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+                self._conn.execute("DELETE FROM symbols WHERE path = ?", (path,))
+            self._conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in changes.removed))
+
+            for path in changes.added | changes.modified:
+                mtime_ns, size = current[path]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                    (path, mtime_ns, size),
+                )
+                if not path.endswith(CONTENT_SUFFIXES) or size > MAX_CONTENT_BYTES:
+                    continue
+                try:
+                    content = (self.root / path).read_text(errors="ignore")
+                except OSError as e:
+                    logger.debug(f"[CODEBASE_INDEX] Cannot read {path}: {e}")
+                    continue
+
+                self._conn.executemany(
+                    "INSERT INTO postings (token, path, count) VALUES (?, ?, ?)",
+                    ((token, path, count) for token, count in Counter(tokenize(content)).items()),
+                )
+                self._conn.executemany(
+                    "INSERT INTO symbols (path, name, name_lower, kind, line) VALUES (?, ?, ?, ?, ?)",
+                    ((path, name, name.lower(), kind, line) for name, kind, line in extract_symbols(path, content)),
+                )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def paths(self, under: str | None = None, suffixes: tuple[str, ...] | None = None) -> list[str]:
+        """
+        List indexed files.
+
+        Args:
+            under: Only files below this relative directory
+            suffixes: Only files ending with one of these suffixes
+        """
+        with self._lock:
+            paths = self._paths
+        prefix = _dir_prefix(under)
+        return [
+            path for path in paths
+            if path.startswith(prefix) and (suffixes is None or path.endswith(suffixes))
+        ]
+
+    def keyword_counts(
+        self,
+        keywords: list[str],
+        under: str | None = None,
+        suffixes: tuple[str, ...] | None = None,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Count keyword occurrences per file.
+
+        A keyword matches every token it is a prefix of. Keywords made of
+        several parts (``user_id``) count the rarest part.
+
+        Returns:
+            {path: {keyword: occurrences}} for files with at least one match
+        """
+        results: dict[str, dict[str, int]] = {}
+        prefix = _dir_prefix(under)
+
+        with self._lock:
+            for keyword in keywords:
+                per_path: dict[str, int] | None = None
+                for part in dict.fromkeys(tokenize(keyword)):
+                    # The token range is selective; filtering on path in SQL
+                    # makes SQLite prefer the path index and scan every posting
+                    rows = self._conn.execute(
+                        "SELECT path, SUM(count) FROM postings WHERE token >= ? AND token < ? GROUP BY path",
+                        _prefix_range(part),
+                    ).fetchall()
+                    counts = dict(rows)
+                    if per_path is None:
+                        per_path = counts
+                    else:
+                        per_path = {path: min(n, counts[path]) for path, n in per_path.items() if path in counts}
+                for path, count in (per_path or {}).items():
+                    if path.startswith(prefix) and (suffixes is None or path.endswith(suffixes)):
+                        results.setdefault(path, {})[keyword] = count
+
+        return results
+
+    def find_symbols(
+        self,
+        keywords: list[str],
+        under: str | None = None,
+        suffixes: tuple[str, ...] | None = None,
+        kinds: tuple[str, ...] | None = None,
+    ) -> list[CodeSymbol]:
+        """
+        Find symbols whose name contains any keyword (case-insensitive).
+
+        Returns:
+            Matching symbols ordered by path and line
+        """
+        keywords = [keyword.lower() for keyword in keywords if keyword]
+        if not keywords:
+            return []
+        low, high = _prefix_range(_dir_prefix(under))
+        name_match = " OR ".join("instr(name_lower, ?) > 0" for _ in keywords)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT path, name, kind, line FROM symbols
+                WHERE path >= ? AND path < ? AND ({name_match})
+                ORDER BY path, line
+                """,
+                (low, high, *keywords),
+            ).fetchall()
+
+        return [
+            CodeSymbol(path=path, name=name, kind=kind, line=line)
+            for path, name, kind, line in rows
+            if (suffixes is None or path.endswith(suffixes)) and (kinds is None or kind in kinds)
+        ]
+
+
+def _default_index_path(root: Path) -> str:
+    digest = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+    return str(DEFAULT_INDEX_DIR / f"{root.name}-{digest}.sqlite3")
+
+
+def _dir_prefix(under: str | None) -> str:
+    if not under:
+        return ""
+    return under.replace(os.sep, "/").strip("/") + "/"
+
+
+def _prefix_range(prefix: str) -> tuple[str, str]:
+    """Bounds [low, high) covering every string that starts with prefix."""
+    if not prefix:
+        return "", "\U0010ffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+# Shared indexes, one per root directory
+_indexes: dict[str, CodebaseIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_codebase_index(root: Path | str) -> CodebaseIndex:
+    """
+    Get the shared index for a directory tree.
+
+    Args:
+        root: Directory to index
+
+    Returns:
+        CodebaseIndex shared by all callers using the same root
+    """
+    key = os.path.realpath(str(root))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = CodebaseIndex(Path(key))
+            _indexes[key] = index
+        return index
@@ -19,8 +19,9 @@ import json
 import logging
 import sys
 from collections import Counter, defaultdict
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import groupby
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -29,11 +30,15 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "app" / "server"))
 
+from core.sequence_mining import iter_hook_events_after, iter_tool_event_rows
 from database import get_database_adapter
 from services.pattern_review_service import PatternReviewService
 
 logger = logging.getLogger(__name__)
 
+# Row in pattern_analysis_state used by incremental runs
+STATE_NAME = 'daily_patterns'
+
 
 @dataclass
 class ToolSequence:
@@ -59,21 +64,67 @@ class PatternMetrics:
     status: str  # 'auto-approved', 'pending', 'auto-rejected'
 
 
+@dataclass
+class AnalysisState:
+    """Progress of incremental analysis, persisted in pattern_analysis_state."""
+    last_event_id: int = 0
+    last_event_timestamp: Optional[str] = None
+    # ids within rescan_window below last_event_id that were already processed
+    recent_event_ids: List[int] = field(default_factory=list)
+    total_sessions: int = 0
+    # session_id -> {'tools': [...], 'first_seen': str, 'last_seen': str}
+    open_sessions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # tool_sequence -> {'count': int, 'examples': [...]} below min_occurrences
+    pending_patterns: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def _pattern_id(pattern_seq: str) -> str:
+    return hashlib.sha256(pattern_seq.encode()).hexdigest()[:16]
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
 class DailyPatternAnalyzer:
     """Analyzes hook events to discover automation patterns."""
 
-    def __init__(self, window_hours: int = 24, min_occurrences: int = 2):
+    def __init__(
+        self,
+        window_hours: int = 24,
+        min_occurrences: int = 2,
+        adapter=None,
+        idle_minutes: int = 60,
+        max_pending_patterns: int = 10000,
+        rescan_window: int = 1000
+    ):
         """
         Initialize analyzer.
 
         Args:
             window_hours: Analysis window in hours (default: 24)
             min_occurrences: Minimum pattern occurrences to consider (default: 2)
+            adapter: Database adapter (default: get_database_adapter())
+            idle_minutes: Incremental mode closes a session after this long
+                without events (default: 60)
+            max_pending_patterns: Incremental mode keeps at most this many
+                below-threshold patterns between runs (default: 10000)
+            rescan_window: Incremental mode re-reads this many ids below the
+                high-water mark to pick up rows committed out of id order
+                (default: 1000)
         """
         self.window_hours = window_hours
         self.min_occurrences = min_occurrences
-        self.adapter = get_database_adapter()
-        self.service = PatternReviewService()
+        self.idle_minutes = idle_minutes
+        self.max_pending_patterns = max_pending_patterns
+        self.rescan_window = rescan_window
+        self.adapter = adapter or get_database_adapter()
+        self.service = PatternReviewService(self.adapter)
 
         # Destructive operations that should be auto-rejected
         self.destructive_tools = [
@@ -107,8 +158,30 @@ class DailyPatternAnalyzer:
             analyzed_patterns.append(metrics)
 
         # 4. Deduplicate and save
+        results = self.save_patterns(analyzed_patterns, total_sessions=len(sequences))
+
+        logger.info(f"[ANALYZE] Analysis complete: {results}")
+        return results
+
+    def save_patterns(
+        self,
+        analyzed_patterns: List[PatternMetrics],
+        total_sessions: int,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Save analyzed patterns and tally the results.
+
+        Args:
+            analyzed_patterns: Patterns to create or add to
+            total_sessions: Sessions the patterns were found in
+            dry_run: Only tally, without writing to pattern_approvals
+
+        Returns:
+            Dictionary with analysis results and statistics
+        """
         results = {
-            'total_sessions': len(sequences),
+            'total_sessions': total_sessions,
             'patterns_found': len(analyzed_patterns),
             'new_patterns': 0,
             'updated_patterns': 0,
@@ -118,8 +191,11 @@ class DailyPatternAnalyzer:
             'total_savings': 0.0
         }
 
+        if dry_run:
+            existing = self._existing_pattern_ids([pattern.pattern_id for pattern in analyzed_patterns])
+
         for pattern in analyzed_patterns:
-            is_new = self.save_pattern(pattern)
+            is_new = pattern.pattern_id not in existing if dry_run else self.save_pattern(pattern)
 
             if is_new:
                 results['new_patterns'] += 1
@@ -136,7 +212,6 @@ class DailyPatternAnalyzer:
 
             results['total_savings'] += pattern.estimated_savings_usd
 
-        logger.info(f"[ANALYZE] Analysis complete: {results}")
         return results
 
     def extract_tool_sequences(self) -> List[ToolSequence]:
@@ -146,59 +221,29 @@ class DailyPatternAnalyzer:
         Returns:
             List of ToolSequence objects
         """
-        with self.adapter.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # PostgreSQL version - using string_agg instead of GROUP_CONCAT
-            placeholder = self.adapter.placeholder()
-
-            # First, get all tool events in the time window
-            cursor.execute(f"""
-                SELECT
-                    session_id,
-                    tool_name,
-                    timestamp
-                FROM hook_events
-                WHERE timestamp >= NOW() - INTERVAL '{self.window_hours} hours'
-                AND event_type = 'PreToolUse'
-                AND tool_name IS NOT NULL
-                AND session_id IS NOT NULL
-                ORDER BY session_id, timestamp
-            """)
+        sequences = []
+        session_count = 0
 
-            rows = cursor.fetchall()
-
-            # Group by session_id and build sequences
-            sessions = defaultdict(list)
-            session_times = {}
+        with self.adapter.get_connection() as conn:
+            # Rows arrive ordered by session, so only one session is held at a time
+            rows = iter_tool_event_rows(conn, self.adapter.get_db_type(), since_hours=self.window_hours)
+            for session_id, session_rows in groupby(rows, key=lambda row: row['session_key']):
+                session_rows = list(session_rows)
+                session_count += 1
+                if len(session_rows) < 2:  # Only sequences with 2+ tools
+                    continue
+
+                tools = [row['tool_name'] for row in session_rows]
+                sequences.append(ToolSequence(
+                    session_id=session_id,
+                    tool_sequence='→'.join(tools),
+                    tool_names=tools,
+                    event_count=len(tools),
+                    first_seen=str(session_rows[0]['timestamp']),
+                    last_seen=str(session_rows[-1]['timestamp'])
+                ))
 
-            for row in rows:
-                session_id = row['session_id']
-                tool_name = row['tool_name']
-                timestamp = row['timestamp']
-
-                sessions[session_id].append(tool_name)
-
-                if session_id not in session_times:
-                    session_times[session_id] = {'first': timestamp, 'last': timestamp}
-                else:
-                    session_times[session_id]['last'] = timestamp
-
-            # Convert to ToolSequence objects
-            sequences = []
-            for session_id, tools in sessions.items():
-                if len(tools) >= 2:  # Only sequences with 2+ tools
-                    tool_sequence = '→'.join(tools)
-                    sequences.append(ToolSequence(
-                        session_id=session_id,
-                        tool_sequence=tool_sequence,
-                        tool_names=tools,
-                        event_count=len(tools),
-                        first_seen=str(session_times[session_id]['first']),
-                        last_seen=str(session_times[session_id]['last'])
-                    ))
-
-            logger.info(f"[EXTRACT] Found {len(sequences)} tool sequences from {len(sessions)} sessions")
+            logger.info(f"[EXTRACT] Found {len(sequences)} tool sequences from {session_count} sessions")
             return sequences
 
     def find_repeated_patterns(self, sequences: List[ToolSequence]) -> Dict[str, List[ToolSequence]]:
@@ -243,9 +288,32 @@ class DailyPatternAnalyzer:
         Returns:
             PatternMetrics object
         """
-        occurrence_count = len(occurrences)
-        total_sessions = len(all_sequences)
+        return self.build_metrics(
+            pattern_seq,
+            occurrence_count=len(occurrences),
+            example_sessions=[occ.session_id for occ in occurrences[:10]],  # Max 10 examples
+            total_sessions=len(all_sequences)
+        )
 
+    def build_metrics(
+        self,
+        pattern_seq: str,
+        occurrence_count: int,
+        example_sessions: List[str],
+        total_sessions: int
+    ) -> PatternMetrics:
+        """
+        Score and classify a pattern from its counts.
+
+        Args:
+            pattern_seq: The tool sequence pattern
+            occurrence_count: Times the pattern occurred
+            example_sessions: Sessions it occurred in
+            total_sessions: Sessions analyzed
+
+        Returns:
+            PatternMetrics object
+        """
         # Calculate confidence score
         confidence = self.calculate_confidence(occurrence_count, total_sessions)
 
@@ -256,15 +324,12 @@ class DailyPatternAnalyzer:
         status = self.auto_classify(pattern_seq, confidence, occurrence_count, savings)
 
         # Generate pattern ID
-        pattern_id = hashlib.sha256(pattern_seq.encode()).hexdigest()[:16]
+        pattern_id = _pattern_id(pattern_seq)
 
         # Build context
         tools = pattern_seq.split('→')
         pattern_context = f"Sequence of {len(tools)} tools: {', '.join(tools)}"
 
-        # Get example sessions
-        example_sessions = [occ.session_id for occ in occurrences[:10]]  # Max 10 examples
-
         return PatternMetrics(
             pattern_id=pattern_id,
             tool_sequence=pattern_seq,
@@ -409,6 +474,237 @@ class DailyPatternAnalyzer:
             self.service.create_pattern(pattern_data)
             return True  # New pattern
 
+    # ------------------------------------------------------------------
+    # Incremental analysis
+    # ------------------------------------------------------------------
+
+    def analyze_incremental(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Analyze only hook events added since the last incremental run.
+
+        Events above the stored high-water mark are appended to per-session
+        partial sequences. Sessions that ended (SessionEnd) or went idle for
+        idle_minutes are finalized and their sequences merged into the
+        pattern_approvals counts; sessions still open are carried over to the
+        next run, as are patterns seen fewer than min_occurrences times.
+
+        ids are assigned when a row is inserted, not when it commits, so a
+        concurrent writer can commit a lower id after a run has passed it.
+        Each run therefore re-reads rescan_window ids below the high-water
+        mark and skips the ones recorded in recent_event_ids.
+
+        Args:
+            dry_run: Report what would be saved without writing patterns or
+                advancing the stored state
+
+        Returns:
+            Dictionary with analysis results and statistics
+        """
+        state = self.load_state()
+        start_id = state.last_event_id
+        seen = set(state.recent_event_ids)
+        events = 0
+
+        with self.adapter.get_connection() as conn:
+            rows = iter_hook_events_after(
+                conn,
+                self.adapter.get_db_type(),
+                after_id=max(state.last_event_id - self.rescan_window, 0),
+                event_types=('PreToolUse', 'SessionEnd')
+            )
+            closed = []
+            for row in rows:
+                if row['id'] in seen:
+                    continue
+                seen.add(row['id'])
+                events += 1
+                session_id = row['session_key']
+                timestamp = str(row['timestamp'])
+                if row['id'] > state.last_event_id:
+                    state.last_event_id = row['id']
+                    state.last_event_timestamp = timestamp
+
+                if row['event_type'] == 'SessionEnd':
+                    session = state.open_sessions.pop(session_id, None)
+                    if session:
+                        closed.append((session_id, session))
+                    continue
+                if not row['tool_name']:
+                    continue
+
+                session = state.open_sessions.setdefault(
+                    session_id, {'tools': [], 'first_seen': timestamp, 'last_seen': timestamp}
+                )
+                session['tools'].append(row['tool_name'])
+                session['last_seen'] = timestamp
+
+        state.recent_event_ids = sorted(
+            event_id for event_id in seen if event_id > state.last_event_id - self.rescan_window
+        )
+        closed.extend(self._pop_idle_sessions(state))
+        sequences = [
+            ToolSequence(
+                session_id=session_id,
+                tool_sequence='→'.join(session['tools']),
+                tool_names=session['tools'],
+                event_count=len(session['tools']),
+                first_seen=session['first_seen'],
+                last_seen=session['last_seen']
+            )
+            for session_id, session in closed
+            if len(session['tools']) >= 2  # Only sequences with 2+ tools
+        ]
+        state.total_sessions += len(sequences)
+
+        analyzed_patterns = self.merge_sequences(state, sequences)
+        results = self.save_patterns(analyzed_patterns, total_sessions=len(sequences), dry_run=dry_run)
+        # Saved after the patterns: a crash in between re-counts this batch
+        # on the next run rather than losing it
+        if not dry_run:
+            self.save_state(state)
+
+        results.update({
+            'events_processed': events,
+            'last_event_id': state.last_event_id,
+            'open_sessions': len(state.open_sessions),
+            'pending_patterns': len(state.pending_patterns),
+        })
+        logger.info(f"[INCREMENTAL] Events {start_id + 1}..{state.last_event_id}: {results}")
+        return results
+
+    def _pop_idle_sessions(self, state: AnalysisState) -> List[tuple]:
+        """Remove and return sessions idle for idle_minutes before the newest event."""
+        newest = _parse_timestamp(state.last_event_timestamp)
+        if newest is None:
+            return []
+
+        cutoff = newest - timedelta(minutes=self.idle_minutes)
+        idle = [
+            session_id for session_id, session in state.open_sessions.items()
+            if (_parse_timestamp(session['last_seen']) or newest) <= cutoff
+        ]
+        return [(session_id, state.open_sessions.pop(session_id)) for session_id in idle]
+
+    def merge_sequences(self, state: AnalysisState, sequences: List[ToolSequence]) -> List[PatternMetrics]:
+        """
+        Add finished session sequences to the pending pattern counts.
+
+        Returns:
+            Patterns to save: those already in pattern_approvals (with just the
+            new occurrences) and those that reached min_occurrences
+        """
+        touched = {}
+        for seq in sequences:
+            entry = state.pending_patterns.pop(seq.tool_sequence, None) or {'count': 0, 'examples': []}
+            entry['count'] += 1
+            if len(entry['examples']) < 10 and seq.session_id not in entry['examples']:
+                entry['examples'].append(seq.session_id)
+            # Re-inserted so the dict stays ordered by last activity
+            state.pending_patterns[seq.tool_sequence] = entry
+            touched[seq.tool_sequence] = _pattern_id(seq.tool_sequence)
+
+        existing = self._existing_pattern_ids(list(touched.values()))
+        to_save = []
+        for pattern_seq, pattern_id in touched.items():
+            entry = state.pending_patterns[pattern_seq]
+            if pattern_id in existing or entry['count'] >= self.min_occurrences:
+                del state.pending_patterns[pattern_seq]
+                to_save.append(self.build_metrics(
+                    pattern_seq, entry['count'], entry['examples'], state.total_sessions
+                ))
+
+        # Forget the least recently seen patterns beyond the cap
+        overflow = len(state.pending_patterns) - self.max_pending_patterns
+        for pattern_seq in list(state.pending_patterns)[:max(overflow, 0)]:
+            del state.pending_patterns[pattern_seq]
+
+        return to_save
+
+    def _existing_pattern_ids(self, pattern_ids: List[str]) -> set:
+        if not pattern_ids:
+            return set()
+
+        placeholder = self.adapter.placeholder()
+        with self.adapter.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT pattern_id FROM pattern_approvals WHERE pattern_id IN "
+                f"({', '.join(placeholder for _ in pattern_ids)})",
+                tuple(pattern_ids)
+            )
+            return {row['pattern_id'] for row in cursor.fetchall()}
+
+    def ensure_state_table(self):
+        """Create pattern_analysis_state if it does not exist (see migration 024)."""
+        with self.adapter.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pattern_analysis_state (
+                    name TEXT PRIMARY KEY,
+                    last_event_id BIGINT NOT NULL DEFAULT 0,
+                    last_event_timestamp TEXT,
+                    recent_event_ids TEXT,
+                    total_sessions INTEGER NOT NULL DEFAULT 0,
+                    open_sessions TEXT,
+                    pending_patterns TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+    def load_state(self) -> AnalysisState:
+        """Load incremental progress (a fresh state if there is none yet)."""
+        self.ensure_state_table()
+        placeholder = self.adapter.placeholder()
+
+        with self.adapter.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT * FROM pattern_analysis_state WHERE name = {placeholder}",
+                (STATE_NAME,)
+            )
+            row = cursor.fetchone()
+
+        if not row:
+            return AnalysisState()
+        return AnalysisState(
+            last_event_id=row['last_event_id'],
+            last_event_timestamp=row['last_event_timestamp'],
+            recent_event_ids=json.loads(row['recent_event_ids']) if row['recent_event_ids'] else [],
+            total_sessions=row['total_sessions'],
+            open_sessions=json.loads(row['open_sessions']) if row['open_sessions'] else {},
+            pending_patterns=json.loads(row['pending_patterns']) if row['pending_patterns'] else {}
+        )
+
+    def save_state(self, state: AnalysisState):
+        """Persist incremental progress."""
+        placeholder = self.adapter.placeholder()
+
+        with self.adapter.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                INSERT INTO pattern_analysis_state
+                    (name, last_event_id, last_event_timestamp, recent_event_ids,
+                     total_sessions, open_sessions, pending_patterns, updated_at)
+                VALUES ({placeholder}, {placeholder}, {placeholder}, {placeholder},
+                        {placeholder}, {placeholder}, {placeholder}, CURRENT_TIMESTAMP)
+                ON CONFLICT (name) DO UPDATE SET
+                    last_event_id = excluded.last_event_id,
+                    last_event_timestamp = excluded.last_event_timestamp,
+                    recent_event_ids = excluded.recent_event_ids,
+                    total_sessions = excluded.total_sessions,
+                    open_sessions = excluded.open_sessions,
+                    pending_patterns = excluded.pending_patterns,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (
+                STATE_NAME,
+                state.last_event_id,
+                state.last_event_timestamp,
+                json.dumps(state.recent_event_ids),
+                state.total_sessions,
+                json.dumps(state.open_sessions),
+                json.dumps(state.pending_patterns)
+            ))
+
     def get_new_pending_patterns(self) -> List[PatternMetrics]:
         """
         Get patterns that are pending and were created in this analysis window.
@@ -419,10 +715,15 @@ class DailyPatternAnalyzer:
         with self.adapter.get_connection() as conn:
             cursor = conn.cursor()
 
+            if self.adapter.get_db_type() == 'postgresql':
+                since = f"NOW() - INTERVAL '{self.window_hours} hours'"
+            else:
+                since = f"datetime('now', '-{self.window_hours} hours')"
+
             cursor.execute(f"""
                 SELECT * FROM pattern_approvals
                 WHERE status = 'pending'
-                AND created_at >= NOW() - INTERVAL '{self.window_hours} hours'
+                AND created_at >= {since}
                 ORDER BY (confidence_score * occurrence_count * estimated_savings_usd) DESC
             """)
 
@@ -457,7 +758,8 @@ class DailyPatternAnalysisCLI:
         self.args = args
         self.analyzer = DailyPatternAnalyzer(
             window_hours=args.hours,
-            min_occurrences=args.min_occurrences
+            min_occurrences=args.min_occurrences,
+            idle_minutes=args.idle_minutes
         )
 
     def run_analysis(self):
@@ -466,7 +768,10 @@ class DailyPatternAnalysisCLI:
             print("\n🔍 DRY RUN MODE - No database changes will be made\n")
 
         # Run analysis
-        results = self.analyzer.analyze_patterns()
+        if self.args.incremental:
+            results = self.analyzer.analyze_incremental(dry_run=self.args.dry_run)
+        else:
+            results = self.analyzer.analyze_patterns()
 
         # Print summary
         self.print_analysis_summary(results)
@@ -486,7 +791,11 @@ class DailyPatternAnalysisCLI:
         print("\n" + "=" * 80)
         print("DAILY PATTERN ANALYSIS SUMMARY")
         print("=" * 80)
-        print(f"Analysis Window:     {self.args.hours} hours")
+        if self.args.incremental:
+            print(f"New Events:          {results['events_processed']} (through id {results['last_event_id']})")
+            print(f"Open Sessions:       {results['open_sessions']}")
+        else:
+            print(f"Analysis Window:     {self.args.hours} hours")
         print(f"Total Sessions:      {results['total_sessions']}")
         print(f"Patterns Discovered: {results['patterns_found']}")
         print(f"  - New Patterns:    {results['new_patterns']}")
@@ -599,6 +908,9 @@ Examples:
 
   # With notifications
   python scripts/analyze_daily_patterns.py --notify
+
+  # Only events added since the last incremental run (for cron)
+  python scripts/analyze_daily_patterns.py --incremental
         """
     )
 
@@ -616,7 +928,19 @@ Examples:
         help='Minimum pattern occurrences to consider (default: 2)'
     )
 
+    parser.add_argument(
+        '--idle-minutes',
+        type=int,
+        default=60,
+        help='Incremental mode: close sessions idle this long (default: 60)'
+    )
+
     # Operation modes
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Process only events added since the last incremental run'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -9,11 +9,16 @@ predictably, wasting tokens on orchestration that could be code.
 import sys
 import sqlite3
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import defaultdict
 import json
 
 project_root = Path(__file__).parent.parent
 db_path = project_root / "app" / "server" / "db" / "workflow_history.db"
+sys.path.insert(0, str(project_root / "app" / "server"))
+
+from core.sequence_mining import SequenceMiner, stream_tool_events  # noqa: E402
+
+TOOL_EVENT_TYPES = ('PreToolUse', 'PostToolUse')
 
 
 def extract_tool_sequences(events):
@@ -40,7 +45,7 @@ def extract_tool_sequences(events):
     return sequences
 
 
-def find_common_sequences(sequences, min_length=3, min_occurrences=5):
+def find_common_sequences(sequences, min_length=3, min_occurrences=5, max_length=9):
     """
     Find tool sequences that occur frequently.
 
@@ -48,38 +53,35 @@ def find_common_sequences(sequences, min_length=3, min_occurrences=5):
         sequences: Dict of session_id -> list of tool events
         min_length: Minimum sequence length to consider
         min_occurrences: Minimum times a sequence must occur
+        max_length: Maximum sequence length to consider
 
     Returns:
         List of (sequence_pattern, count, example_sessions)
     """
-    # Extract tool-only sequences
-    tool_patterns = []
-
+    miner = SequenceMiner(min_length=min_length, max_length=max_length)
     for session_id, events in sequences.items():
-        # Get just the tool names in order
-        tools = [e['tool'] for e in events]
-
-        # Extract subsequences of various lengths
-        for length in range(min_length, min(len(tools) + 1, 10)):
-            for i in range(len(tools) - length + 1):
-                subseq = tuple(tools[i:i+length])
-                tool_patterns.append((subseq, session_id))
+        for event in events:
+            miner.add(session_id, event['tool'])
+    return _as_patterns(miner, min_occurrences)
 
-    # Count occurrences
-    pattern_counts = Counter([p[0] for p in tool_patterns])
 
-    # Filter by min_occurrences
-    common_patterns = []
-    for pattern, count in pattern_counts.items():
-        if count >= min_occurrences:
-            # Find example sessions
-            examples = [s for p, s in tool_patterns if p == pattern][:3]
-            common_patterns.append((pattern, count, examples))
+def _as_patterns(miner, min_occurrences):
+    return [(seq.tools, seq.count, seq.examples) for seq in miner.top(min_count=min_occurrences)]
 
-    # Sort by frequency
-    common_patterns.sort(key=lambda x: x[1], reverse=True)
 
-    return common_patterns
+def load_sessions(conn, session_ids):
+    """Load the tool events of a few sessions (for pattern context)."""
+    if not session_ids:
+        return {}
+    placeholders = ', '.join('?' for _ in session_ids)
+    cursor = conn.execute(f"""
+        SELECT event_id, event_type, session_id, workflow_id, timestamp, tool_name, payload
+        FROM hook_events
+        WHERE event_type IN ('PreToolUse', 'PostToolUse')
+          AND COALESCE(session_id, workflow_id) IN ({placeholders})
+        ORDER BY timestamp ASC
+    """, tuple(session_ids))
+    return extract_tool_sequences(cursor)
 
 
 def analyze_pattern_context(pattern_tuple, sequences, example_sessions):
@@ -130,48 +132,28 @@ def main():
 
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    # Get all hook events
-    cursor.execute("""
-        SELECT
-            event_id,
-            event_type,
-            session_id,
-            workflow_id,
-            timestamp,
-            tool_name,
-            payload
-        FROM hook_events
-        WHERE event_type IN ('PreToolUse', 'PostToolUse')
-        ORDER BY timestamp ASC
-    """)
-
-    events = [dict(row) for row in cursor.fetchall()]
-    total = len(events)
-
-    print(f"📊 Total hook events: {total:,}")
-    print()
 
-    # Extract sequences
-    print("🔄 Extracting tool sequences...")
-    sequences = extract_tool_sequences(events)
-    print(f"   Found {len(sequences):,} unique sessions")
-    print()
-
-    # Find common patterns
+    # Stream events through the miner instead of loading them all
     print("🔎 Finding repeated patterns (min 5 occurrences, min length 3)...")
-    patterns = find_common_sequences(sequences, min_length=3, min_occurrences=5)
+    miner = SequenceMiner(min_length=3, max_length=9)
+    miner.feed(stream_tool_events(conn, "sqlite", event_types=TOOL_EVENT_TYPES))
+    patterns = _as_patterns(miner, min_occurrences=5)
+
+    print(f"📊 Total hook events: {miner.events:,}")
+    print(f"   Found {miner.sessions:,} unique sessions")
     print(f"   Found {len(patterns):,} repeated patterns")
     print()
 
+    top_patterns = patterns[:20]
+    sequences = load_sessions(conn, sorted({s for _, _, examples in top_patterns for s in examples}))
+
     # Display top patterns
     print("=" * 80)
     print("TOP 20 ORCHESTRATION PATTERNS")
     print("=" * 80)
     print()
 
-    for i, (pattern, count, examples) in enumerate(patterns[:20], 1):
+    for i, (pattern, count, examples) in enumerate(top_patterns, 1):
         print(f"{i:2}. Pattern (occurs {count} times):")
         print(f"    Sequence: {' → '.join(pattern)}")
         print(f"    Example sessions: {', '.join(examples[:3])}")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental daily pattern analysis (--incremental).
+
+Runs against a temporary SQLite database, so no PostgreSQL is needed:
+    python -m pytest scripts/tests/test_incremental_pattern_analysis.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add paths for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "app" / "server"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from analyze_daily_patterns import DailyPatternAnalyzer
+from database.sqlite_adapter import SQLiteAdapter
+
+MIGRATIONS = project_root / "app" / "server" / "db" / "migrations"
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    """SQLite adapter with hook_events and the pattern review tables."""
+    adapter = SQLiteAdapter(db_path=str(tmp_path / "patterns.db"), pool_mode="none")
+    with adapter.get_connection() as conn:
+        conn.execute("""
+            CREATE TABLE hook_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id TEXT,
+                event_type TEXT NOT NULL,
+                session_id TEXT,
+                workflow_id TEXT,
+                timestamp TEXT,
+                tool_name TEXT
+            )
+        """)
+        conn.executescript((MIGRATIONS / "016_add_pattern_approvals.sql").read_text())
+    return adapter
+
+
+@pytest.fixture
+def analyzer(adapter):
+    return DailyPatternAnalyzer(min_occurrences=2, adapter=adapter, idle_minutes=30)
+
+
+def add_events(adapter, session_id, tools, start_minute, end=False):
+    """Insert PreToolUse events one minute apart, optionally followed by SessionEnd."""
+    events = [("PreToolUse", tool) for tool in tools]
+    if end:
+        events.append(("SessionEnd", None))
+    with adapter.get_connection() as conn:
+        for offset, (event_type, tool) in enumerate(events):
+            minute = start_minute + offset
+            conn.execute(
+                "INSERT INTO hook_events (event_type, session_id, timestamp, tool_name) VALUES (?, ?, ?, ?)",
+                (event_type, session_id, f"2025-01-01 {minute // 60:02d}:{minute % 60:02d}:00", tool),
+            )
+
+
+def occurrence_counts(adapter):
+    with adapter.get_connection() as conn:
+        rows = conn.execute("SELECT tool_sequence, occurrence_count FROM pattern_approvals").fetchall()
+    return {row["tool_sequence"]: row["occurrence_count"] for row in rows}
+
+
+def test_pattern_created_once_threshold_is_reached(adapter, analyzer):
+    add_events(adapter, "s1", ["Read", "Edit"], 0, end=True)
+    first = analyzer.analyze_incremental()
+
+    assert first["events_processed"] == 3
+    assert first["patterns_found"] == 0
+    assert first["pending_patterns"] == 1
+    assert occurrence_counts(adapter) == {}
+
+    add_events(adapter, "s2", ["Read", "Edit"], 10, end=True)
+    second = analyzer.analyze_incremental()
+
+    assert second["events_processed"] == 3
+    assert second["new_patterns"] == 1
+    assert occurrence_counts(adapter) == {"Read→Edit": 2}
+
+
+def test_open_sessions_carry_over_between_runs(adapter, analyzer):
+    add_events(adapter, "s1", ["Read", "Edit"], 0)
+    add_events(adapter, "s2", ["Read", "Edit", "Bash"], 0, end=True)
+    assert analyzer.analyze_incremental()["open_sessions"] == 1
+
+    # s1 continues in the next batch and is counted as one whole sequence
+    add_events(adapter, "s1", ["Bash"], 5, end=True)
+    results = analyzer.analyze_incremental()
+
+    assert results["events_processed"] == 2
+    assert results["open_sessions"] == 0
+    assert occurrence_counts(adapter) == {"Read→Edit→Bash": 2}
+
+
+def test_existing_patterns_only_receive_new_occurrences(adapter, analyzer):
+    for n in range(3):
+        add_events(adapter, f"s{n}", ["Grep", "Read"], n * 5, end=True)
+    analyzer.analyze_incremental()
+    assert occurrence_counts(adapter) == {"Grep→Read": 3}
+
+    # Nothing new: counts must not be added again
+    assert analyzer.analyze_incremental()["events_processed"] == 0
+    assert occurrence_counts(adapter) == {"Grep→Read": 3}
+
+    add_events(adapter, "s9", ["Grep", "Read"], 30, end=True)
+    results = analyzer.analyze_incremental()
+
+    assert results["updated_patterns"] == 1
+    assert occurrence_counts(adapter) == {"Grep→Read": 4}
+
+
+def test_idle_sessions_are_closed(adapter, analyzer):
+    add_events(adapter, "s1", ["Read", "Write"], 0)
+    add_events(adapter, "s2", ["Read", "Write"], 1)
+    assert analyzer.analyze_incremental()["open_sessions"] == 2
+
+    # An event 45 minutes later closes both sessions (idle_minutes=30)
+    add_events(adapter, "s3", ["Bash"], 46)
+    results = analyzer.analyze_incremental()
+
+    assert results["open_sessions"] == 1
+    assert occurrence_counts(adapter) == {"Read→Write": 2}
+
+
+def test_state_survives_a_new_analyzer(adapter, analyzer):
+    add_events(adapter, "s1", ["Read", "Edit"], 0, end=True)
+    analyzer.analyze_incremental()
+
+    state = DailyPatternAnalyzer(adapter=adapter).load_state()
+
+    assert state.last_event_id == 3
+    assert state.total_sessions == 1
+    assert state.pending_patterns == {"Read→Edit": {"count": 1, "examples": ["s1"]}}
+
+
+def test_pending_patterns_are_capped(adapter):
+    analyzer = DailyPatternAnalyzer(min_occurrences=5, adapter=adapter, max_pending_patterns=2)
+    for n, tools in enumerate([["A", "B"], ["B", "C"], ["C", "D"]]):
+        add_events(adapter, f"s{n}", tools, n * 5, end=True)
+
+    analyzer.analyze_incremental()
+
+    assert list(analyzer.load_state().pending_patterns) == ["B→C", "C→D"]
+
+
+def add_events_with_ids(adapter, session_id, first_id, tools, start_minute):
+    """Insert a whole session (tools + SessionEnd) with explicit ids, as a late commit would."""
+    events = [("PreToolUse", tool) for tool in tools] + [("SessionEnd", None)]
+    with adapter.get_connection() as conn:
+        for offset, (event_type, tool) in enumerate(events):
+            conn.execute(
+                "INSERT INTO hook_events (id, event_type, session_id, timestamp, tool_name) VALUES (?, ?, ?, ?, ?)",
+                (first_id + offset, event_type, session_id, f"2025-01-01 00:{start_minute + offset:02d}:00", tool),
+            )
+
+
+def test_rows_committed_below_the_high_water_mark_are_picked_up(adapter, analyzer):
+    add_events_with_ids(adapter, "s1", 1, ["Read", "Edit"], 0)
+    add_events_with_ids(adapter, "s2", 7, ["Read", "Edit"], 10)
+    assert analyzer.analyze_incremental()["events_processed"] == 6
+    assert occurrence_counts(adapter) == {"Read→Edit": 2}
+
+    # ids 4-6 were reserved by a transaction that commits only now
+    add_events_with_ids(adapter, "s3", 4, ["Read", "Edit"], 5)
+    results = analyzer.analyze_incremental()
+
+    assert results["events_processed"] == 3
+    assert results["last_event_id"] == 9
+    assert occurrence_counts(adapter) == {"Read→Edit": 3}
+    assert analyzer.analyze_incremental()["events_processed"] == 0
+
+
+def test_dry_run_writes_nothing(adapter, analyzer):
+    for n in range(2):
+        add_events(adapter, f"s{n}", ["Read", "Edit"], n * 5, end=True)
+
+    results = analyzer.analyze_incremental(dry_run=True)
+
+    assert results["new_patterns"] == 1
+    assert occurrence_counts(adapter) == {}
+    assert analyzer.load_state().last_event_id == 0
+    assert analyzer.analyze_incremental()["events_processed"] == 6